@@ -0,0 +1,66 @@
+"""HR 원천 수집 워터마크 테이블 및 동기화 처리량 컬럼 추가
+
+Revision ID: a4b5c6d7e8f9
+Revises: z3a4b5c6d7e8
+Create Date: 2026-03-18 00:00:00.000000
+
+변경 사항:
+1. hr_sync_source_state 테이블 생성 (source_name, sync_type, watermark, last_sync_id)
+   - 커넥터/동기화 타입별 마지막 반영 변경분의 워터마크 → 주기 수집은 이후 변경분만 조회
+2. hr_sync_history에 처리량/원천 컬럼 추가
+   - elapsed_ms, rows_per_second: 반영 소요 시간과 처리 속도
+   - source_name, source_watermark: 주기 수집 커넥터와 반영한 변경분 (API 호출은 NULL)
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4b5c6d7e8f9"
+down_revision: Union[str, None] = "z3a4b5c6d7e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "hr_sync_source_state",
+        sa.Column("source_name", sa.String(length=50), nullable=False, comment="수집 커넥터 이름"),
+        sa.Column("sync_type", sa.String(length=20), nullable=False, comment="동기화 타입 (employees/departments)"),
+        sa.Column(
+            "watermark",
+            sa.String(length=300),
+            nullable=True,
+            comment="마지막으로 반영한 변경분의 워터마크 (수정 시각/순번 등 커넥터 정의)",
+        ),
+        sa.Column("last_sync_id", sa.Integer(), nullable=True, comment="마지막 동기화 이력 ID"),
+        sa.Column("up_date", sa.DateTime(), nullable=False, comment="수정일시"),
+        sa.PrimaryKeyConstraint("source_name", "sync_type"),
+    )
+
+    op.add_column("hr_sync_history", sa.Column("elapsed_ms", sa.Integer(), nullable=True, comment="반영 소요 시간(ms)"))
+    op.add_column("hr_sync_history", sa.Column("rows_per_second", sa.Float(), nullable=True, comment="처리 속도 (건/초)"))
+    op.add_column(
+        "hr_sync_history",
+        sa.Column("source_name", sa.String(length=50), nullable=True, comment="수집 커넥터 이름 (NULL: API 호출)"),
+    )
+    op.add_column(
+        "hr_sync_history",
+        sa.Column(
+            "source_watermark",
+            sa.String(length=300),
+            nullable=True,
+            comment="이 동기화로 반영한 변경분의 워터마크",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("hr_sync_history", "source_watermark")
+    op.drop_column("hr_sync_history", "source_name")
+    op.drop_column("hr_sync_history", "rows_per_second")
+    op.drop_column("hr_sync_history", "elapsed_ms")
+    op.drop_table("hr_sync_source_state")
@@ -0,0 +1,117 @@
+"""STT 트랜스크립트 구간 테이블 분리 (tb_meeting_transcript_segment)
+
+Revision ID: s6t7u8v9w0x1
+Revises: r5s6t7u8v9w0
+Create Date: 2026-03-09 00:00:00.000000
+
+변경 사항:
+1. tb_meeting_transcript_segment 테이블 생성
+   - STT 결과를 구간(row) 단위로 저장 (tb_meeting_record.stt_transcript 분리)
+   - (meeting_id, seq) UNIQUE, (meeting_id, start_time) 인덱스
+
+2. 기존 tb_meeting_record.stt_transcript JSON 데이터를 구간 테이블로 이관
+   - stt_transcript 컬럼은 하위 호환을 위해 유지 (ORM에서 deferred 처리)
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "s6t7u8v9w0x1"
+down_revision: Union[str, None] = "r5s6t7u8v9w0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ── 1. tb_meeting_transcript_segment ─────────────────────────────────────
+    op.create_table(
+        "tb_meeting_transcript_segment",
+        sa.Column(
+            "segment_id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            nullable=False,
+            comment="구간 ID (UUID)",
+        ),
+        sa.Column(
+            "meeting_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tb_meeting.meeting_id", ondelete="CASCADE"),
+            nullable=False,
+            comment="미팅 ID",
+        ),
+        sa.Column(
+            "seq",
+            sa.Integer(),
+            nullable=False,
+            comment="구간 순번 (0부터 시작, STT 결과 순서)",
+        ),
+        sa.Column(
+            "start_time",
+            sa.Float(),
+            nullable=False,
+            comment="구간 시작 시간 (녹음 시작 기준 상대 초)",
+        ),
+        sa.Column(
+            "end_time",
+            sa.Float(),
+            nullable=True,
+            comment="구간 종료 시간 (녹음 시작 기준 상대 초)",
+        ),
+        sa.Column(
+            "speaker",
+            sa.String(20),
+            nullable=True,
+            comment="화자 (LEADER / MEMBER, 화자 분리 전이면 NULL)",
+        ),
+        sa.Column(
+            "text",
+            sa.Text(),
+            nullable=False,
+            comment="구간 발화 텍스트",
+        ),
+        sa.UniqueConstraint(
+            "meeting_id",
+            "seq",
+            name="uq_transcript_segment_seq",
+        ),
+    )
+    op.create_index(
+        "ix_transcript_segment_meeting_start",
+        "tb_meeting_transcript_segment",
+        ["meeting_id", "start_time"],
+    )
+
+    # ── 2. 기존 stt_transcript JSON → 구간 테이블 이관 ─────────────────────────
+    op.execute(
+        """
+        INSERT INTO tb_meeting_transcript_segment
+            (segment_id, meeting_id, seq, start_time, end_time, speaker, text)
+        SELECT
+            gen_random_uuid(),
+            r.meeting_id,
+            (seg.ord - 1)::int,
+            COALESCE((seg.value ->> 'start')::float, 0),
+            (seg.value ->> 'end')::float,
+            seg.value ->> 'speaker',
+            COALESCE(seg.value ->> 'text', '')
+        FROM tb_meeting_record r
+        CROSS JOIN LATERAL jsonb_array_elements(r.stt_transcript)
+            WITH ORDINALITY AS seg(value, ord)
+        WHERE r.stt_transcript IS NOT NULL
+          AND jsonb_typeof(r.stt_transcript) = 'array'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_transcript_segment_meeting_start",
+        table_name="tb_meeting_transcript_segment",
+    )
+    op.drop_table("tb_meeting_transcript_segment")
@@ -0,0 +1,131 @@
+"""미팅 검색 문서 테이블 생성 (tb_meeting_search_document)
+
+Revision ID: t7u8v9w0x1y2
+Revises: s6t7u8v9w0x1
+Create Date: 2026-03-10 00:00:00.000000
+
+변경 사항:
+1. pg_trgm 확장 활성화
+2. tb_meeting_search_document 테이블 생성
+   - search_text: ai_summary + 타임라인 segment_summary + STT 트랜스크립트
+   - (leader_emp_no, completed_at), (member_emp_no, completed_at) 인덱스 — 검색 범위 필터
+   - search_text GIN(gin_trgm_ops) 인덱스 — 부분 문자열(ILIKE) 검색
+3. 기존 COMPLETED 미팅 검색 문서 일괄 생성
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "t7u8v9w0x1y2"
+down_revision: Union[str, None] = "s6t7u8v9w0x1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ── 1. pg_trgm ───────────────────────────────────────────────────────────
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # ── 2. tb_meeting_search_document ────────────────────────────────────────
+    op.create_table(
+        "tb_meeting_search_document",
+        sa.Column(
+            "meeting_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tb_meeting.meeting_id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+            comment="미팅 ID (1:1 관계)",
+        ),
+        sa.Column(
+            "leader_emp_no",
+            sa.String(20),
+            nullable=False,
+            comment="리더 사번 (검색 범위 필터)",
+        ),
+        sa.Column(
+            "member_emp_no",
+            sa.String(20),
+            nullable=False,
+            comment="팀원 사번 (검색 범위 필터)",
+        ),
+        sa.Column(
+            "completed_at",
+            sa.DateTime(),
+            nullable=True,
+            comment="미팅 종료일시 (UTC, 동점 정렬용)",
+        ),
+        sa.Column(
+            "search_text",
+            sa.Text(),
+            nullable=False,
+            comment="검색 대상 텍스트 (요약 + 구간 요약 + 트랜스크립트)",
+        ),
+        sa.Column(
+            "up_date",
+            sa.DateTime(),
+            nullable=False,
+            comment="색인 갱신일시 (UTC)",
+        ),
+    )
+    op.create_index(
+        "ix_meeting_search_leader",
+        "tb_meeting_search_document",
+        ["leader_emp_no", "completed_at"],
+    )
+    op.create_index(
+        "ix_meeting_search_member",
+        "tb_meeting_search_document",
+        ["member_emp_no", "completed_at"],
+    )
+    op.create_index(
+        "ix_meeting_search_text_trgm",
+        "tb_meeting_search_document",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+    # ── 3. 기존 COMPLETED 미팅 색인 ───────────────────────────────────────────
+    op.execute(
+        """
+        INSERT INTO tb_meeting_search_document
+            (meeting_id, leader_emp_no, member_emp_no, completed_at, search_text, up_date)
+        SELECT
+            m.meeting_id,
+            m.leader_emp_no,
+            m.member_emp_no,
+            m.completed_at,
+            concat_ws(
+                ' ',
+                r.ai_summary,
+                (
+                    SELECT string_agg(t.segment_summary, ' ' ORDER BY t.start_time)
+                    FROM tb_meeting_timeline t
+                    WHERE t.meeting_id = m.meeting_id
+                ),
+                (
+                    SELECT string_agg(s.text, ' ' ORDER BY s.seq)
+                    FROM tb_meeting_transcript_segment s
+                    WHERE s.meeting_id = m.meeting_id
+                )
+            ),
+            now() AT TIME ZONE 'utc'
+        FROM tb_meeting m
+        LEFT JOIN tb_meeting_record r ON r.meeting_id = m.meeting_id
+        WHERE m.status = 'COMPLETED'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_meeting_search_text_trgm", table_name="tb_meeting_search_document")
+    op.drop_index("ix_meeting_search_member", table_name="tb_meeting_search_document")
+    op.drop_index("ix_meeting_search_leader", table_name="tb_meeting_search_document")
+    op.drop_table("tb_meeting_search_document")
+    # pg_trgm 확장은 다른 객체가 사용할 수 있으므로 유지
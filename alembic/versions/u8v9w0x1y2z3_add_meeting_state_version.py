@@ -0,0 +1,40 @@
+"""미팅 상태 버전 컬럼 추가 (tb_meeting.state_version)
+
+Revision ID: u8v9w0x1y2z3
+Revises: t7u8v9w0x1y2
+Create Date: 2026-03-11 00:00:00.000000
+
+변경 사항:
+1. tb_meeting.state_version 컬럼 추가
+   - 미팅 실행 화면 변경(아젠다/Action Item/타임라인/메모)마다 +1
+   - 일괄 변경(ops) 응답 및 실행 화면 조회 시 클라이언트 동기화 기준으로 사용
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "u8v9w0x1y2z3"
+down_revision: Union[str, None] = "t7u8v9w0x1y2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tb_meeting",
+        sa.Column(
+            "state_version",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="미팅 실행 화면 상태 버전 (아젠다/Action Item/타임라인/메모 변경 시 +1)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tb_meeting", "state_version")
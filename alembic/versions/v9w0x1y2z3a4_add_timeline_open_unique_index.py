@@ -0,0 +1,55 @@
+"""미팅당 활성 타임라인 카드 1개 보장 (uq_timeline_open_per_meeting)
+
+Revision ID: v9w0x1y2z3a4
+Revises: u8v9w0x1y2z3
+Create Date: 2026-03-12 00:00:00.000000
+
+변경 사항:
+1. 기존 데이터 정리: 한 미팅에 end_time IS NULL 카드가 여러 개면
+   가장 늦게 시작한 카드만 남기고 나머지는 그 카드의 start_time으로 마감
+2. tb_meeting_timeline (meeting_id) WHERE end_time IS NULL 부분 유니크 인덱스 생성
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "v9w0x1y2z3a4"
+down_revision: Union[str, None] = "u8v9w0x1y2z3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ── 1. 중복 활성 카드 마감 ─────────────────────────────────────────────────
+    op.execute(
+        """
+        UPDATE tb_meeting_timeline t
+        SET end_time = latest.start_time
+        FROM (
+            SELECT DISTINCT ON (meeting_id) meeting_id, timeline_id, start_time
+            FROM tb_meeting_timeline
+            WHERE end_time IS NULL
+            ORDER BY meeting_id, start_time DESC, timeline_id DESC
+        ) latest
+        WHERE t.meeting_id = latest.meeting_id
+          AND t.end_time IS NULL
+          AND t.timeline_id <> latest.timeline_id
+        """
+    )
+
+    # ── 2. 부분 유니크 인덱스 ──────────────────────────────────────────────────
+    op.create_index(
+        "uq_timeline_open_per_meeting",
+        "tb_meeting_timeline",
+        ["meeting_id"],
+        unique=True,
+        postgresql_where=sa.text("end_time IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_timeline_open_per_meeting", table_name="tb_meeting_timeline")
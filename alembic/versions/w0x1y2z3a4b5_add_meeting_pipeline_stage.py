@@ -0,0 +1,39 @@
+"""미팅 AI 파이프라인 진행 단계 컬럼 추가 (tb_meeting.pipeline_stage)
+
+Revision ID: w0x1y2z3a4b5
+Revises: v9w0x1y2z3a4
+Create Date: 2026-03-13 00:00:00.000000
+
+변경 사항:
+1. tb_meeting.pipeline_stage 컬럼 추가
+   - PROCESSING 중 AI 파이프라인 단계 (DOWNLOAD | STT | SUMMARY)
+   - 진행 상황 SSE(/coaching/meetings/{id}/events) 연결 시 현재 단계 전송에 사용
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "w0x1y2z3a4b5"
+down_revision: Union[str, None] = "v9w0x1y2z3a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tb_meeting",
+        sa.Column(
+            "pipeline_stage",
+            sa.String(20),
+            nullable=True,
+            comment="AI 파이프라인 진행 단계: DOWNLOAD | STT | SUMMARY (PROCESSING 중에만 의미)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tb_meeting", "pipeline_stage")
@@ -0,0 +1,49 @@
+"""미팅 녹음 분할 업로드 세션 컬럼 추가 (tb_meeting.upload_total_bytes, upload_part_bytes)
+
+Revision ID: x1y2z3a4b5c6
+Revises: w0x1y2z3a4b5
+Create Date: 2026-03-14 00:00:00.000000
+
+변경 사항:
+1. tb_meeting.upload_total_bytes, tb_meeting.upload_part_bytes 컬럼 추가
+   - POST /coaching/meetings/{id}/upload-session 에서 기록
+   - 파트 수신 현황 계산 및 미팅 종료 시 최종 객체 크기 검증에 사용
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "x1y2z3a4b5c6"
+down_revision: Union[str, None] = "w0x1y2z3a4b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tb_meeting",
+        sa.Column(
+            "upload_total_bytes",
+            sa.BigInteger(),
+            nullable=True,
+            comment="분할 업로드 세션의 녹음 파일 전체 크기(바이트) — 종료 시 최종 객체 크기 검증",
+        ),
+    )
+    op.add_column(
+        "tb_meeting",
+        sa.Column(
+            "upload_part_bytes",
+            sa.Integer(),
+            nullable=True,
+            comment="분할 업로드 세션의 파트 크기(바이트) — 마지막 파트만 더 작음",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tb_meeting", "upload_part_bytes")
+    op.drop_column("tb_meeting", "upload_total_bytes")
@@ -0,0 +1,68 @@
+"""부서 계층 클로저 테이블 추가 (cm_department_closure)
+
+Revision ID: y2z3a4b5c6d7
+Revises: x1y2z3a4b5c6
+Create Date: 2026-03-16 00:00:00.000000
+
+변경 사항:
+1. cm_department_closure 테이블 생성 (ancestor_dept_code, descendant_dept_code, depth)
+   - 사용 중인 부서(use_yn='Y')의 모든 상위-하위 쌍 (자기 자신 depth=0 포함)
+   - sync_departments 실행 시 전체 재구성
+   - R&R 팀 조회, 상위 R&R 조회, 코칭 대시보드의 재귀 조회를 대체
+2. 기존 cm_department 데이터로 초기 적재 (WITH RECURSIVE 1회)
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "y2z3a4b5c6d7"
+down_revision: Union[str, None] = "x1y2z3a4b5c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cm_department_closure",
+        sa.Column("ancestor_dept_code", sa.String(length=20), nullable=False, comment="상위 부서 코드"),
+        sa.Column("descendant_dept_code", sa.String(length=20), nullable=False, comment="하위 부서 코드"),
+        sa.Column("depth", sa.Integer(), nullable=False, comment="계층 거리 (0: 자기 자신, 1: 직속 하위)"),
+        sa.PrimaryKeyConstraint("ancestor_dept_code", "descendant_dept_code"),
+    )
+    op.create_index(
+        "idx_cm_dept_closure_descendant",
+        "cm_department_closure",
+        ["descendant_dept_code", "depth"],
+        unique=False,
+    )
+
+    # 초기 적재: 사용 중인 부서 사이의 경로만 연결 (미사용 부서에서 경로가 끊김)
+    # 순환 참조는 시작 부서로 되돌아오는 경로를 막아 종료
+    op.execute(
+        """
+        INSERT INTO cm_department_closure (ancestor_dept_code, descendant_dept_code, depth)
+        WITH RECURSIVE closure (ancestor_dept_code, descendant_dept_code, depth) AS (
+            SELECT dept_code, dept_code, 0
+            FROM cm_department
+            WHERE use_yn = 'Y'
+            UNION ALL
+            SELECT c.ancestor_dept_code, d.dept_code, c.depth + 1
+            FROM closure c
+            INNER JOIN cm_department d ON d.upper_dept_code = c.descendant_dept_code
+            WHERE d.use_yn = 'Y'
+              AND d.dept_code <> c.ancestor_dept_code
+        )
+        SELECT ancestor_dept_code, descendant_dept_code, MIN(depth)
+        FROM closure
+        GROUP BY ancestor_dept_code, descendant_dept_code
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_cm_dept_closure_descendant", table_name="cm_department_closure")
+    op.drop_table("cm_department_closure")
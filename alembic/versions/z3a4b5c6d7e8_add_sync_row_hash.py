@@ -0,0 +1,56 @@
+"""동기화 변경 감지 해시 및 이력 건수 컬럼 추가
+
+Revision ID: z3a4b5c6d7e8
+Revises: y2z3a4b5c6d7
+Create Date: 2026-03-17 00:00:00.000000
+
+변경 사항:
+1. hr_mgnt / hr_mgnt_concur / cm_department.row_hash 컬럼 추가
+   - 동기화 요청 내용의 SHA-256 해시 (SyncCalculator가 계산)
+   - 해시가 같은 행은 동기화 시 쓰기를 생략
+   - 기존 행은 NULL → 첫 동기화 때 한 번 다시 쓰여 해시가 채워짐
+2. hr_sync_history에 inserted_count / updated_count / unchanged_count / deleted_count 추가
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "z3a4b5c6d7e8"
+down_revision: Union[str, None] = "y2z3a4b5c6d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROW_HASH_TABLES = ("hr_mgnt", "hr_mgnt_concur", "cm_department")
+
+SYNC_COUNT_COLUMNS = (
+    ("inserted_count", "신규 등록 건수"),
+    ("updated_count", "변경 건수"),
+    ("unchanged_count", "변경 없음 건수 (쓰기 생략)"),
+    ("deleted_count", "삭제 건수 (해제된 겸직 등)"),
+)
+
+
+def upgrade() -> None:
+    for table in ROW_HASH_TABLES:
+        op.add_column(
+            table,
+            sa.Column("row_hash", sa.String(length=64), nullable=True, comment="동기화 내용 해시 (SHA-256)"),
+        )
+
+    for column, comment in SYNC_COUNT_COLUMNS:
+        op.add_column(
+            "hr_sync_history",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0", comment=comment),
+        )
+
+
+def downgrade() -> None:
+    for column, _ in SYNC_COUNT_COLUMNS:
+        op.drop_column("hr_sync_history", column)
+
+    for table in ROW_HASH_TABLES:
+        op.drop_column(table, "row_hash")
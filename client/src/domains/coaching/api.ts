@@ -37,7 +37,7 @@ import type {
 /**
  * 대시보드 조회 (팀원 목록 + 면담 현황 통계)
  *
- * @param params - 필터 파라미터 (dept_code, search_name)
+ * @param params - 필터 파라미터 (dept_code, search_name, include_sub_depts)
  * @returns 대시보드 응답 (summary + items)
  */
 export async function getDashboard(params?: GetDashboardParams): Promise<DashboardResponse> {
@@ -82,6 +82,8 @@ export interface DashboardResponse {
 export interface GetDashboardParams {
   dept_code?: string;
   search_name?: string;
+  /** true이면 리더 부서의 하위 부서 팀원까지 포함 */
+  include_sub_depts?: boolean;
 }
 
 // =============================================
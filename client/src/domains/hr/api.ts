@@ -16,12 +16,15 @@ import type {
   DepartmentListParams,
   OrgTreeNode,
   OrgTreeResponse,
+  OrgSubtreeResponse,
   DepartmentDetail,
   DepartmentEmployeesResponse,
   EmployeeSyncRequest,
   DepartmentSyncRequest,
   SyncExecutionResponse,
   SyncHistoryListResponse,
+  SyncJobResponse,
+  SyncProgressResponse,
 } from './types';
 
 // =============================================
@@ -147,6 +150,28 @@ export async function getOrgTree(year?: number): Promise<OrgTreeNode[]> {
   return response.data.tree;
 }
 
+/**
+ * 조직도 하위 트리 조회 (지연 펼치기)
+ *
+ * 부서 기준으로 depth 단계까지의 하위 트리만 조회합니다.
+ * children이 비어 있고 has_children이 true인 노드는 펼칠 때 다시 조회합니다.
+ *
+ * @param deptCode - 기준 부서 코드
+ * @param depth - 포함할 하위 단계 수 (기본값: 1)
+ * @param stdYear - 기준 연도 (선택, 기본값: 최신 연도)
+ * @returns 하위 트리 및 상위 부서 경로
+ */
+export async function getOrgSubtree(
+  deptCode: string,
+  depth = 1,
+  stdYear?: string
+): Promise<OrgSubtreeResponse> {
+  const response = await apiClient.get<OrgSubtreeResponse>(`/v1/hr/org-tree/${deptCode}`, {
+    params: { depth, ...(stdYear ? { std_year: stdYear } : {}) },
+  });
+  return response.data;
+}
+
 /**
  * 부서 상세 조회 (확장)
  *
@@ -224,6 +249,40 @@ export async function syncDepartments(
   return response.data;
 }
 
+/**
+ * 동기화 작업 접수 (NDJSON 파일 업로드)
+ *
+ * 한 줄에 한 건인 NDJSON 파일을 업로드하고 즉시 sync_id를 받습니다.
+ * 실제 반영은 서버 백그라운드 작업으로 진행되며 getSyncProgress로 진행 현황을 조회합니다.
+ *
+ * @param syncType - 동기화 타입
+ * @param file - NDJSON 파일
+ * @returns 작업 접수 결과
+ */
+export async function startSyncJob(
+  syncType: 'employees' | 'departments',
+  file: Blob
+): Promise<SyncJobResponse> {
+  const formData = new FormData();
+  formData.append('file', file);
+  const response = await apiClient.post<SyncJobResponse>(
+    `/v1/hr/sync/${syncType}/jobs`,
+    formData
+  );
+  return response.data;
+}
+
+/**
+ * 동기화 작업 진행 현황 조회
+ *
+ * @param syncId - 동기화 이력 ID
+ * @returns 처리 건수, 진행률, 처리 속도, 오류
+ */
+export async function getSyncProgress(syncId: number): Promise<SyncProgressResponse> {
+  const response = await apiClient.get<SyncProgressResponse>(`/v1/hr/sync/jobs/${syncId}`);
+  return response.data;
+}
+
 /**
  * 동기화 이력 조회
  *
@@ -89,6 +89,18 @@ export interface ConcurrentPosition {
 // 부서 관련 타입
 // =============================================
 
+/**
+ * 조직도 하위 트리 조회 응답
+ *
+ * depth 단계까지만 children이 채워지며, 그 아래는 has_children/child_count로 표시됩니다.
+ */
+export interface OrgSubtreeResponse {
+  std_year: string;
+  depth: number;
+  ancestor_codes: string[];
+  node: OrgTreeNode;
+}
+
 /**
  * 부서 상세 정보
  */
@@ -129,6 +141,12 @@ export interface OrgTreeNode {
   dept_head_emp_no: string | null;
   dept_head_name?: string | null;
   employee_count: number;
+  main_employee_count: number;
+  concurrent_employee_count: number;
+  subtree_employee_count: number;
+  has_children: boolean;
+  child_count: number;
+  subtree_dept_count: number;
   children: OrgTreeNode[];
 }
 
@@ -212,6 +230,14 @@ export interface SyncHistory {
   total_count: number;
   success_count: number;
   failure_count: number;
+  inserted_count: number;
+  updated_count: number;
+  unchanged_count: number;
+  deleted_count: number;
+  elapsed_ms: number | null;
+  rows_per_second: number | null;
+  source_name: string | null;
+  source_watermark: string | null;
   error_message: string | null;
   sync_start_time: string;
   sync_end_time: string | null;
@@ -237,5 +263,43 @@ export interface SyncExecutionResponse {
   total_count: number;
   success_count: number;
   failure_count: number;
+  inserted_count: number;
+  updated_count: number;
+  unchanged_count: number;
+  deleted_count: number;
   message: string;
 }
+
+/**
+ * 동기화 작업 접수 응답
+ */
+export interface SyncJobResponse {
+  sync_id: number;
+  sync_type: 'employees' | 'departments';
+  sync_status: string;
+  total_count: number;
+  message: string;
+}
+
+/**
+ * 동기화 작업 진행 현황 응답
+ */
+export interface SyncProgressResponse {
+  sync_id: number;
+  sync_type: string;
+  sync_status: 'success' | 'failure' | 'partial' | 'in_progress';
+  total_count: number;
+  processed_count: number;
+  success_count: number;
+  failure_count: number;
+  inserted_count: number;
+  updated_count: number;
+  unchanged_count: number;
+  deleted_count: number;
+  progress_rate: number;
+  elapsed_seconds: number;
+  rows_per_second: number;
+  error_message: string | null;
+  sync_start_time: string;
+  sync_end_time: string | null;
+}
@@ -177,6 +177,22 @@ class Settings(BaseSettings):
         description="GCS 서비스 계정 JSON 파일 경로 (비어있으면 ADC 사용)"
     )
 
+    # ====================
+    # Storage Settings (오디오 파일 저장소)
+    # ====================
+    STORAGE_BACKEND: str = Field(
+        default="gcs",
+        description="스토리지 백엔드: gcs | local (로컬 디스크/NFS, 온프레미스 배포)"
+    )
+    LOCAL_STORAGE_ROOT: str = Field(
+        default=".local/storage",
+        description="local 백엔드 객체 저장 디렉토리 (NFS 마운트 경로 가능)"
+    )
+    LOCAL_STORAGE_PUBLIC_URL: str = Field(
+        default="http://localhost:8000",
+        description="local 백엔드 서명 URL의 호스트 (브라우저가 직접 업로드/재생하는 API 서버 주소)"
+    )
+
     # ====================
     # OpenAI Settings
     # ====================
@@ -184,6 +200,109 @@ class Settings(BaseSettings):
         default="",
         description="OpenAI API 키 (Whisper STT, GPT-4o 사용)"
     )
+    OPENAI_MAX_CONCURRENCY: int = Field(
+        default=4,
+        description="프로세스 전체 LLM 동시 호출 수 상한 (초과 요청은 타임아웃 내 대기)"
+    )
+    OPENAI_TIMEOUT_SECONDS: float = Field(
+        default=15.0,
+        description="OpenAI 호출 기본 제한 시간(초) — 호출별로 더 길게 지정 가능 (STT 등)"
+    )
+
+    # ====================
+    # Resilience Settings (외부 호출 Circuit Breaker / Bulkhead)
+    # ====================
+    CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        default=5,
+        description="연속 실패(타임아웃 포함) 수가 이 값에 도달하면 circuit open (즉시 실패)"
+    )
+    CIRCUIT_RESET_SECONDS: float = Field(
+        default=30.0,
+        description="circuit open 유지 시간(초) — 이후 시험 호출 1건으로 복구 여부 판단"
+    )
+    GOOGLE_OAUTH_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        description="Google OAuth 호출 제한 시간(초)"
+    )
+    GOOGLE_OAUTH_MAX_CONCURRENCY: int = Field(
+        default=20,
+        description="Google OAuth 동시 호출 수 상한"
+    )
+    GCS_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        description="GCS 호출 제한 시간(초) — 파일 다운로드는 호출별로 더 길게 지정"
+    )
+    GCS_MAX_CONCURRENCY: int = Field(
+        default=16,
+        description="GCS 동시 호출 수 상한 (블로킹 SDK 호출은 스레드에서 실행)"
+    )
+
+    # ====================
+    # Fake External Services (로컬 부하 테스트용 — 운영 사용 금지)
+    # ====================
+    FAKE_EXTERNAL_SERVICES: bool = Field(
+        default=False,
+        description="OpenAI / Google OAuth를 프로세스 내 가짜 서비스로, GCS를 local 스토리지 백엔드로 대체 (server/app/core/fakes)"
+    )
+    FAKE_OPENAI_LATENCY_MS: int = Field(
+        default=800,
+        description="가짜 OpenAI 응답 기본 지연(ms)"
+    )
+    FAKE_OPENAI_JITTER_MS: int = Field(
+        default=400,
+        description="가짜 OpenAI 응답 지연 편차(ms) — 0 ~ 이 값 사이 무작위 추가"
+    )
+
+    # ====================
+    # Coaching Settings
+    # ====================
+    MEMO_AUTOSAVE_FLUSH_SECONDS: float = Field(
+        default=3.0,
+        description="메모 자동 저장 버퍼를 DB에 반영하는 주기(초) — 그 사이 변경은 마지막 값만 기록"
+    )
+    AUDIO_UPLOAD_PART_BYTES: int = Field(
+        default=8 * 1024 * 1024,
+        description="녹음 파일 분할 업로드 파트 크기(바이트) — 실패 시 이 단위로만 재전송"
+    )
+    AUDIO_UPLOAD_MAX_BYTES: int = Field(
+        default=2 * 1024 * 1024 * 1024,
+        description="녹음 파일 최대 크기(바이트)"
+    )
+
+    # ====================
+    # HR Sync Settings
+    # ====================
+    HR_SYNC_CHUNK_SIZE: int = Field(
+        default=1000,
+        ge=1,
+        le=10000,
+        description=(
+            "HR 동기화 청크 크기(행, 1~10000) — 청크마다 Bulk Upsert 후 커밋 (트랜잭션 크기 상한). "
+            "청크의 키 조회(IN)가 bind parameter 한도(32767)를 넘지 않도록 상한을 둠"
+        )
+    )
+
+    HR_SYNC_JOB_SHUTDOWN_SECONDS: float = Field(
+        default=30.0,
+        description="워커 종료 시 실행 중인 HR 동기화 작업 완료 대기 시간(초) — 초과 시 취소 후 failure 기록"
+    )
+    HR_SYNC_STALE_MINUTES: int = Field(
+        default=120,
+        ge=1,
+        description="in_progress 상태로 이 시간(분)을 넘긴 동기화 이력은 워커 비정상 종료로 보고 failure 처리"
+    )
+    HR_SOURCE_CONNECTOR: str = Field(
+        default="",
+        description="HR 원천 데이터 주기 수집 커넥터 (빈 값: 사용 안 함, directory: CSV/NDJSON 디렉토리)"
+    )
+    HR_SOURCE_DIR: str = Field(
+        default="./data/hr_source",
+        description="directory 커넥터 루트 — employees/, departments/ 하위의 *.ndjson, *.jsonl, *.csv 변경분 파일"
+    )
+    HR_SOURCE_PULL_INTERVAL_MINUTES: int = Field(
+        default=60,
+        description="HR 원천 데이터 수집 주기(분)"
+    )
 
     # ====================
     # Domain Plugin Settings
@@ -45,34 +45,25 @@ async def get_database_session() -> AsyncSession:
 reusable_oauth2 = HTTPBearer()
 
 
-async def get_current_user_id(
-    token: HTTPAuthorizationCredentials = Depends(reusable_oauth2),
-    db: AsyncSession = Depends(get_database_session)
-) -> str:
+async def authenticate_access_token(token: str, db: AsyncSession) -> str:
     """
-    JWT 토큰 및 세션을 검증하고 user_id를 반환합니다.
+    액세스 토큰 문자열과 세션을 검증하고 user_id를 반환합니다.
 
-    사용법:
-        @router.get("/protected")
-        async def protected_route(user_id: str = Depends(get_current_user_id)):
-            return {"user_id": user_id}
+    HTTP 의존성(get_current_user_id)과 헤더를 쓸 수 없는 WebSocket 핸들러가 공유합니다.
 
     Args:
-        token: HTTPAuthorizationCredentials (FastAPI가 자동으로 Bearer 토큰 파싱)
+        token: JWT 액세스 토큰 문자열
         db: 데이터베이스 세션
 
     Returns:
         str: 검증된 사용자 ID
 
     Raises:
-        HTTPException: 토큰이 유효하지 않은 경우
+        HTTPException: 토큰 또는 세션이 유효하지 않은 경우
     """
-    # 1. Authorization 헤더 및 스킴 확인 (HTTPBearer가 처리)
-    # token.credentials에 실제 토큰 문자열이 들어있음
-
-    # 3. JWT 디코딩 및 검증
+    # 1. JWT 디코딩 및 검증
     try:
-        payload = decode_access_token(token.credentials)
+        payload = decode_access_token(token)
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -80,7 +71,7 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # 4. user_id 및 session_id 추출
+    # 2. user_id 및 session_id 추출
     user_id: str = payload.get("user_id")
     session_id: str = payload.get("session_id")  # refresh_token 문자열
 
@@ -91,7 +82,7 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # 5. RefreshToken 테이블에서 세션 검증 (session_id로 정확히 매칭)
+    # 3. RefreshToken 테이블에서 세션 검증 (session_id로 정확히 매칭)
     if session_id:
         # session_id(refresh_token)로 정확한 세션 조회
         result = await db.execute(
@@ -164,7 +155,7 @@ async def get_current_user_id(
                     headers={"WWW-Authenticate": "Bearer"},
                 )
 
-    # 6. 세션 만료 확인
+    # 4. 세션 만료 확인
     if session.is_expired():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -175,7 +166,7 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # 7. Idle timeout 확인 (15분)
+    # 5. Idle timeout 확인 (15분)
     if session.is_idle(idle_minutes=15):
         # 세션 폐기
         session.revoke()
@@ -189,14 +180,41 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # 8. 세션 활동 시간 업데이트
+    # 6. 세션 활동 시간 업데이트
     session.update_activity()
     await db.commit()
 
-    # 9. user_id 반환
+    # 7. user_id 반환
     return user_id
 
 
+async def get_current_user_id(
+    token: HTTPAuthorizationCredentials = Depends(reusable_oauth2),
+    db: AsyncSession = Depends(get_database_session)
+) -> str:
+    """
+    JWT 토큰 및 세션을 검증하고 user_id를 반환합니다.
+
+    사용법:
+        @router.get("/protected")
+        async def protected_route(user_id: str = Depends(get_current_user_id)):
+            return {"user_id": user_id}
+
+    Args:
+        token: HTTPAuthorizationCredentials (FastAPI가 자동으로 Bearer 토큰 파싱)
+        db: 데이터베이스 세션
+
+    Returns:
+        str: 검증된 사용자 ID
+
+    Raises:
+        HTTPException: 토큰이 유효하지 않은 경우
+    """
+    # Authorization 헤더 및 스킴 확인은 HTTPBearer가 처리
+    # token.credentials에 실제 토큰 문자열이 들어있음
+    return await authenticate_access_token(token.credentials, db)
+
+
 async def get_current_session_id(
     token: HTTPAuthorizationCredentials = Depends(reusable_oauth2),
     db: AsyncSession = Depends(get_database_session)
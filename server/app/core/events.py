@@ -0,0 +1,269 @@
+"""
+프로세스 내 이벤트 허브 (pub/sub fan-out)
+
+기능:
+- 채널별 구독자 큐로 이벤트 fan-out (WebSocket / SSE 핸들러가 구독)
+- 채널별 최근 이벤트 버퍼 — 재연결 클라이언트가 놓친 이벤트를 state_version 기준으로 재전송
+
+이벤트 형식:
+    {"type": str, "state_version": int, "data": dict, ...}
+
+느린 구독자:
+    구독자 큐가 가득 차면 대기 이벤트를 비우고 {"type": "resync"} 하나만 남깁니다.
+    구독자는 이를 받으면 스냅샷으로 재동기화합니다.
+
+버퍼 수명:
+    채널의 마지막 이벤트(미팅 COMPLETED/FAILED 등)는 final=True로 발행하면 버퍼를 비웁니다.
+    종료 이벤트 없이 버려진 채널을 위해 버퍼를 가진 채널 수도 max_channels로 제한합니다.
+    (가장 오래 이벤트가 없던, 구독자 없는 채널부터 정리)
+
+제약:
+    허브는 워커 프로세스 단위입니다. 다른 프로세스에서 발생한 이벤트는 전달되지 않으므로
+    재전송이 불가능하면(버퍼에 없는 버전) 호출 측이 스냅샷으로 재동기화해야 합니다.
+
+프로세스 간 전달 (PgEventBridge):
+    AI 파이프라인처럼 다른 프로세스에서 발생하는 이벤트는 Postgres NOTIFY로 보내고,
+    각 워커의 LISTEN 연결이 받아 자기 허브에 publish합니다. (자기 프로세스가 보낸 알림은 무시)
+"""
+
+import asyncio
+import contextlib
+import json
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Optional
+
+from sqlalchemy import text
+
+from server.app.core.database import engine
+from server.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class EventHub:
+    """
+    채널 단위 프로세스 내 이벤트 허브
+    """
+
+    def __init__(
+        self, history_size: int = 200, queue_size: int = 256, max_channels: int = 1000
+    ) -> None:
+        """
+        Args:
+            history_size: 채널별 보관할 최근 이벤트 수 (재연결 재전송용)
+            queue_size: 구독자별 대기 이벤트 상한
+            max_channels: 최근 이벤트 버퍼를 보관할 최대 채널 수
+        """
+        self._history_size = history_size
+        self._queue_size = queue_size
+        self._max_channels = max_channels
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        # 최근 이벤트 순서 (가장 오래 이벤트가 없던 채널이 앞)
+        self._history: OrderedDict[str, deque[dict[str, Any]]] = OrderedDict()
+
+    def subscribe(self, channel: str) -> asyncio.Queue:
+        """
+        채널을 구독합니다.
+
+        Returns:
+            asyncio.Queue: 이벤트가 전달될 구독자 큐
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.setdefault(channel, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        """구독을 해제합니다. 마지막 구독자가 나가도 최근 이벤트 버퍼는 유지합니다."""
+        subscribers = self._subscribers.get(channel)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[channel]
+
+    def publish(self, channel: str, event: dict[str, Any], final: bool = False) -> int:
+        """
+        이벤트를 채널 구독자 전원에게 전달하고 최근 이벤트 버퍼에 기록합니다. (non-blocking)
+
+        Args:
+            channel: 채널 이름
+            event: 이벤트 dict
+            final: 채널의 마지막 이벤트 여부 (True면 전달 후 버퍼를 비움 → 이후 재연결은 스냅샷)
+
+        Returns:
+            int: 전달된 구독자 수
+        """
+        if final:
+            self._history.pop(channel, None)
+        else:
+            history = self._history.get(channel)
+            if history is None:
+                history = self._history[channel] = deque(maxlen=self._history_size)
+                self._evict_idle_channels()
+            else:
+                self._history.move_to_end(channel)
+            history.append(event)
+
+        delivered = 0
+        for queue in self._subscribers.get(channel, ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(
+                    "이벤트 구독자 큐 초과 — 재동기화 요청으로 대체",
+                    extra={"channel": channel},
+                )
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync"})
+            delivered += 1
+        return delivered
+
+    def replay(self, channel: str, since_version: int) -> Optional[list[dict[str, Any]]]:
+        """
+        since_version 이후 이벤트를 버퍼에서 돌려줍니다.
+
+        Args:
+            channel: 채널 이름
+            since_version: 클라이언트가 마지막으로 반영한 state_version
+
+        Returns:
+            list | None: 재전송할 이벤트 목록 (버퍼에 연속으로 남아 있지 않으면 None → 스냅샷 필요)
+        """
+        history = self._history.get(channel)
+        if not history or history[0]["state_version"] > since_version + 1:
+            return None
+
+        return [event for event in history if event["state_version"] > since_version]
+
+    def _evict_idle_channels(self) -> None:
+        """
+        버퍼 채널 수가 상한을 넘으면 가장 오래 이벤트가 없던 채널의 버퍼부터 정리합니다.
+
+        구독자가 있는 채널은 가능한 한 유지합니다. (모두 구독 중이면 가장 오래된 채널 정리)
+        """
+        while len(self._history) > self._max_channels:
+            idle = next(
+                (channel for channel in self._history if channel not in self._subscribers),
+                next(iter(self._history)),
+            )
+            del self._history[idle]
+
+
+# 프로세스 전역 이벤트 허브
+event_hub = EventHub()
+
+
+class PgEventBridge:
+    """
+    Postgres LISTEN/NOTIFY 기반 프로세스 간 이벤트 전달
+
+    NOTIFY payload 상한(8000 bytes)이 있으므로 상태/진행 단계 같은 작은 이벤트만 보냅니다.
+    LISTEN 연결은 커넥션 풀에서 하나를 계속 점유합니다.
+    """
+
+    # 연결 끊김 감지 주기 / 재연결 대기 (초)
+    _HEALTH_CHECK_SECONDS = 30
+    _RECONNECT_SECONDS = 5
+
+    def __init__(self, hub: EventHub, pg_channel: str = "app_events") -> None:
+        """
+        Args:
+            hub: 수신한 이벤트를 publish할 프로세스 내 허브
+            pg_channel: Postgres NOTIFY 채널 이름
+        """
+        self._hub = hub
+        self._pg_channel = pg_channel
+        self._origin = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+
+    async def notify(self, channel: str, event: dict[str, Any], final: bool = False) -> None:
+        """
+        다른 프로세스의 허브로 이벤트를 보냅니다. (Postgres가 아니면 생략)
+
+        호출 측 세션의 트랜잭션과 섞이지 않도록 풀에서 별도 커넥션을 잠깐 빌려 전송합니다.
+        알림은 즉시 전달되므로, 수신 측이 다시 조회할 변경은 호출 전에 커밋되어 있어야 합니다.
+        알림 전송 실패는 호출 측 처리에 영향을 주지 않도록 로그만 남깁니다.
+
+        Args:
+            channel: 허브 채널 이름
+            event: 이벤트 dict
+            final: 채널의 마지막 이벤트 여부 (EventHub.publish 참고)
+        """
+        if engine.dialect.name != "postgresql":
+            return
+
+        payload = json.dumps(
+            {"origin": self._origin, "channel": channel, "event": event, "final": final},
+            default=str,
+        )
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    text("SELECT pg_notify(:pg_channel, :payload)"),
+                    {"pg_channel": self._pg_channel, "payload": payload},
+                )
+        except Exception as exc:
+            logger.warning(
+                "이벤트 NOTIFY 실패",
+                extra={"channel": channel, "error": str(exc)},
+            )
+
+    def start(self) -> None:
+        """LISTEN 태스크를 시작합니다. (Postgres가 아니면 생략)"""
+        if self._task is not None or engine.dialect.name != "postgresql":
+            return
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """LISTEN 태스크를 종료합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _listen(self) -> None:
+        """LISTEN 연결을 유지하며, 끊기면 재연결합니다."""
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    raw_conn = await conn.get_raw_connection()
+                    listener = raw_conn.driver_connection
+                    await listener.add_listener(self._pg_channel, self._on_notification)
+                    logger.info("이벤트 LISTEN 시작", extra={"pg_channel": self._pg_channel})
+                    try:
+                        while True:
+                            await asyncio.sleep(self._HEALTH_CHECK_SECONDS)
+                            await listener.execute("SELECT 1")
+                    finally:
+                        with contextlib.suppress(Exception):
+                            await listener.remove_listener(
+                                self._pg_channel, self._on_notification
+                            )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "이벤트 LISTEN 연결 끊김 — 재연결 대기",
+                    extra={"pg_channel": self._pg_channel, "error": str(exc)},
+                )
+                await asyncio.sleep(self._RECONNECT_SECONDS)
+
+    def _on_notification(self, connection: Any, pid: int, pg_channel: str, payload: str) -> None:
+        """NOTIFY 수신 콜백 — 다른 프로세스가 보낸 이벤트를 허브에 publish합니다."""
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("이벤트 NOTIFY payload 파싱 실패", extra={"pg_channel": pg_channel})
+            return
+
+        if message.get("origin") == self._origin:
+            return
+        self._hub.publish(message["channel"], message["event"], final=message.get("final", False))
+
+
+# 프로세스 전역 이벤트 브리지
+pg_event_bridge = PgEventBridge(event_hub)
@@ -0,0 +1,45 @@
+"""
+가짜 외부 서비스 (로컬 부하 테스트용)
+
+FAKE_EXTERNAL_SERVICES=true 이면 외부 의존성을 프로세스 내 가짜 서비스로 대체합니다.
+호출 측 코드(OpenAI SDK, httpx, StorageBackend 인터페이스)와 resilience 정책은 그대로 사용하므로
+run_ai_pipeline, get_pre_meeting_data, 로그인, get_audio_url을 실제 코드 경로로 측정할 수 있습니다.
+
+구성:
+    - openai        : Chat Completion(지연 + 편차), Whisper STT — httpx ASGI transport
+    - google_oauth  : 토큰 교환, 사용자 정보 (code = 로그인할 이메일) — httpx ASGI transport
+    - storage       : LocalStorageBackend (LOCAL_STORAGE_ROOT) — get_storage()가 GCS 대신 반환
+
+운영 환경에서는 사용하지 마세요.
+"""
+
+from typing import Optional
+
+import httpx
+from fastapi import FastAPI
+
+from server.app.core.config import settings
+from server.app.core.fakes import google_oauth_app, openai_app
+
+_FAKE_APPS: dict[str, FastAPI] = {
+    "openai": openai_app.app,
+    "google_oauth": google_oauth_app.app,
+}
+
+
+def fake_transport(service: str) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    가짜 서비스 httpx transport를 반환합니다.
+
+    Args:
+        service: "openai" | "google_oauth"
+
+    Returns:
+        httpx.AsyncBaseTransport | None: 가짜 서비스 미사용 시 None (기본 네트워크 transport)
+    """
+    if not settings.FAKE_EXTERNAL_SERVICES:
+        return None
+    return httpx.ASGITransport(app=_FAKE_APPS[service])
+
+
+__all__ = ["fake_transport"]
@@ -0,0 +1,61 @@
+"""
+가짜 Google OAuth API (ASGI 앱)
+
+httpx transport로 연결되어 GoogleAuthService의 실제 코드 경로를 그대로 사용합니다.
+
+규칙:
+    authorization code = 로그인할 사용자 이메일 (부하 테스트에서 임의 사용자로 로그인)
+    code가 "invalid"로 시작하면 400 (잘못된 인증 코드)
+
+엔드포인트:
+    POST /token               - Authorization Code → Access Token
+    GET  /oauth2/v2/userinfo  - Access Token → 사용자 정보
+"""
+
+import base64
+import hashlib
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+_TOKEN_PREFIX = "fake."
+
+app = FastAPI(title="fake-google-oauth", docs_url=None, redoc_url=None, openapi_url=None)
+
+
+@app.post("/token")
+async def exchange_token(request: Request) -> Any:
+    """Authorization Code(이메일)를 가짜 Access Token으로 교환합니다."""
+    form = await request.form()
+    code = str(form.get("code") or "")
+
+    if not code or code.startswith("invalid"):
+        return JSONResponse(status_code=400, content={"error": "invalid_grant"})
+
+    encoded = base64.urlsafe_b64encode(code.encode()).decode().rstrip("=")
+    return {
+        "access_token": f"{_TOKEN_PREFIX}{encoded}",
+        "expires_in": 3599,
+        "token_type": "Bearer",
+        "scope": "openid email profile",
+    }
+
+
+@app.get("/oauth2/v2/userinfo")
+async def userinfo(request: Request) -> Any:
+    """가짜 Access Token에 담긴 이메일로 사용자 정보를 반환합니다."""
+    token = request.headers.get("authorization", "").removeprefix("Bearer ")
+    if not token.startswith(_TOKEN_PREFIX):
+        return JSONResponse(status_code=401, content={"error": "invalid_token"})
+
+    encoded = token[len(_TOKEN_PREFIX):]
+    email = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode()
+
+    return {
+        "id": hashlib.sha256(email.encode()).hexdigest()[:21],
+        "email": email,
+        "verified_email": True,
+        "name": email.split("@")[0],
+        "picture": "",
+    }
@@ -0,0 +1,119 @@
+"""
+가짜 OpenAI API (ASGI 앱)
+
+OpenAI SDK의 http_client transport로 연결되어 실제 SDK 코드 경로를 그대로 사용합니다.
+
+엔드포인트:
+    POST /v1/chat/completions       - Chat Completion (설정된 지연 + 편차 후 응답)
+    POST /v1/audio/transcriptions   - Whisper STT (파일 크기 기반 가짜 구간 생성)
+"""
+
+import asyncio
+import json
+import random
+import time
+import uuid
+from typing import Any
+
+from fastapi import FastAPI, Request
+
+from server.app.core.config import settings
+
+# 가짜 STT 구간 길이(초) / 오디오 바이트레이트 추정 (webm opus 약 32kbps)
+_SEGMENT_SECONDS: int = 10
+_AUDIO_BYTES_PER_SECOND: int = 4000
+
+_FAKE_QUESTIONS: list[str] = [
+    "최근 진행한 업무 중 가장 보람 있었던 일은 무엇인가요?",
+    "현재 업무에서 가장 큰 장애물은 무엇이고, 어떤 도움이 필요한가요?",
+    "다음 분기에 새롭게 도전해보고 싶은 역할이나 과제가 있나요?",
+    "팀 내 협업 방식에서 개선되었으면 하는 점은 무엇인가요?",
+]
+
+app = FastAPI(title="fake-openai", docs_url=None, redoc_url=None, openapi_url=None)
+
+
+async def _simulate_latency() -> None:
+    """설정된 기본 지연 + 무작위 편차만큼 대기합니다."""
+    delay_ms = settings.FAKE_OPENAI_LATENCY_MS + random.uniform(0, settings.FAKE_OPENAI_JITTER_MS)
+    await asyncio.sleep(delay_ms / 1000)
+
+
+def _estimate_tokens(text: str) -> int:
+    """토큰 수 근사 (usage 필드용)"""
+    return len(text) // 2 + 1
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request) -> dict[str, Any]:
+    """
+    Chat Completion 응답을 흉내 냅니다.
+
+    마지막 메시지가 JSON 배열 응답을 요구하면 추천 질문 배열을, 아니면 요약 문장을 반환합니다.
+    """
+    body = await request.json()
+    await _simulate_latency()
+
+    prompt = body["messages"][-1]["content"] if body.get("messages") else ""
+    if "JSON 배열" in prompt:
+        content = json.dumps(random.sample(_FAKE_QUESTIONS, k=3), ensure_ascii=False)
+    else:
+        content = "가짜 요약: 이번 미팅에서는 진행 중인 업무 현황과 다음 단계 계획을 논의했습니다."
+
+    prompt_tokens = sum(_estimate_tokens(m.get("content") or "") for m in body.get("messages", []))
+    completion_tokens = _estimate_tokens(content)
+
+    return {
+        "id": f"chatcmpl-fake-{uuid.uuid4().hex[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-4o"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+@app.post("/v1/audio/transcriptions")
+async def audio_transcriptions(request: Request) -> dict[str, Any]:
+    """
+    Whisper STT 응답을 흉내 냅니다.
+
+    업로드 파일 크기로 오디오 길이를 추정하여 _SEGMENT_SECONDS 단위 구간을 생성합니다.
+    response_format=verbose_json이면 segments를 포함합니다.
+    """
+    form = await request.form()
+    upload = form["file"]
+    audio_bytes = await upload.read()
+    await _simulate_latency()
+
+    duration = max(1, len(audio_bytes) // _AUDIO_BYTES_PER_SECOND)
+    segments = [
+        {
+            "id": index,
+            "start": float(start),
+            "end": float(min(start + _SEGMENT_SECONDS, duration)),
+            "text": f"가짜 발화 구간 {index + 1}",
+        }
+        for index, start in enumerate(range(0, duration, _SEGMENT_SECONDS))
+    ]
+    text = " ".join(segment["text"] for segment in segments)
+
+    if form.get("response_format") == "verbose_json":
+        return {
+            "task": "transcribe",
+            "language": form.get("language") or "korean",
+            "duration": float(duration),
+            "text": text,
+            "segments": segments,
+        }
+    return {"text": text}
@@ -0,0 +1,387 @@
+"""
+외부 호출 복원력 (Resilience) 모듈
+
+외부 의존성(OpenAI, Google OAuth, GCS) 호출을 공통 정책으로 감쌉니다.
+
+기능:
+- Circuit Breaker: 연속 실패(타임아웃 포함)가 임계치를 넘으면 일정 시간 즉시 실패 (fail fast)
+- Bulkhead: 의존성별 동시 호출 수 제한 — 한 의존성 장애가 전체 워커를 잠식하지 않도록 격리
+- Deadline: contextvar 기반 남은 시간 전파 — 중첩 호출이 상위 호출의 남은 시간을 넘지 않음
+
+사용법:
+    from server.app.core.resilience import deadline, openai_dependency
+
+    with deadline(15):
+        result = await openai_dependency.call(lambda: client.chat.completions.create(...))
+
+상태 조회:
+    dependency_health() → /core/health 의 dependencies 항목 (open/half_open이면 degraded)
+
+제약:
+    상태는 워커 프로세스 단위입니다. (워커마다 독립적으로 차단/복구)
+"""
+
+import asyncio
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from server.app.core.config import settings
+from server.app.core.logging import get_logger
+from server.app.shared.exceptions import ExternalServiceException, UnauthorizedException
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 현재 호출 흐름의 마감 시각 (time.monotonic 기준, None이면 제한 없음)
+_deadline_at: ContextVar[Optional[float]] = ContextVar("deadline_at", default=None)
+
+
+# ====================
+# Deadline
+# ====================
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    현재 호출 흐름에 마감 시간을 설정합니다.
+
+    이미 더 짧은 마감이 설정되어 있으면 그 값을 유지합니다. (상위 마감을 늘리지 않음)
+
+    Args:
+        seconds: 지금부터의 제한 시간(초)
+    """
+    candidate = time.monotonic() + seconds
+    current = _deadline_at.get()
+    token = _deadline_at.set(candidate if current is None else min(current, candidate))
+    try:
+        yield
+    finally:
+        _deadline_at.reset(token)
+
+
+def remaining_seconds() -> Optional[float]:
+    """
+    현재 마감까지 남은 시간(초)을 반환합니다.
+
+    Returns:
+        float | None: 남은 시간 (마감 미설정 시 None, 지났으면 0)
+    """
+    deadline_at = _deadline_at.get()
+    if deadline_at is None:
+        return None
+    return max(0.0, deadline_at - time.monotonic())
+
+
+# ====================
+# Circuit Breaker
+# ====================
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 Circuit Breaker
+
+    상태:
+        closed    : 정상 — 호출 허용
+        open      : 차단 — reset_timeout_seconds 동안 즉시 실패
+        half_open : 시험 — 한 건만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout_seconds: float) -> None:
+        """
+        Args:
+            failure_threshold: open 전환 기준 연속 실패 수
+            reset_timeout_seconds: open 유지 시간(초)
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (closed | open | half_open)"""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self._reset_timeout_seconds:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        """호출 허용 여부를 반환합니다. (half_open에서는 시험 호출 한 건만 허용)"""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """성공 기록 — closed로 복귀합니다."""
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """실패 기록 — 임계치 도달 또는 시험 호출 실패 시 open으로 전환합니다."""
+        self._consecutive_failures += 1
+        if self._trial_in_flight or self._consecutive_failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """시험 호출이 성공/실패 판정 없이 끝났을 때(취소, 제외 예외) 다음 시험을 허용합니다."""
+        self._trial_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """상태 요약"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+        }
+
+
+# ====================
+# Dependency (Circuit Breaker + Bulkhead + Deadline)
+# ====================
+
+
+class Dependency:
+    """
+    외부 의존성 호출 정책
+
+    호출 순서:
+        1. Circuit Breaker 확인 — open이면 즉시 ExternalServiceException
+        2. Bulkhead 대기 — 대기 시간도 호출 제한 시간에 포함 (대기 중 예산 소진 시 대기 초과 실패)
+        3. 호출 — min(호출 제한 시간, 상위 deadline 남은 시간) 내 완료되지 않으면 타임아웃 실패
+
+    블로킹 SDK 호출은 call_blocking을 사용합니다. (스레드 종료까지 슬롯 유지)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout_seconds: float,
+        max_concurrency: int,
+        failure_threshold: int = settings.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = settings.CIRCUIT_RESET_SECONDS,
+        ignored_exceptions: tuple[type[BaseException], ...] = (),
+    ) -> None:
+        """
+        Args:
+            name: 의존성 이름 (로그, 헬스체크 표시용)
+            timeout_seconds: 기본 호출 제한 시간(초)
+            max_concurrency: 동시 호출 수 상한 (bulkhead)
+            failure_threshold: Circuit open 기준 연속 실패 수
+            reset_timeout_seconds: Circuit open 유지 시간(초)
+            ignored_exceptions: 실패로 집계하지 않을 예외 (예: 잘못된 인증 코드 같은 클라이언트 오류)
+        """
+        self.name = name
+        self._timeout_seconds = timeout_seconds
+        self._max_concurrency = max_concurrency
+        self._ignored_exceptions = ignored_exceptions
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout_seconds)
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        timeout: Optional[float] = None,
+    ) -> T:
+        """
+        정책을 적용하여 외부 호출을 실행합니다.
+
+        Args:
+            func: 호출할 코루틴 함수 (인자 없음)
+            timeout: 이번 호출 제한 시간(초, None이면 기본값)
+
+        Returns:
+            T: func 결과
+
+        Raises:
+            ExternalServiceException: circuit open / 동시 호출 한도 대기 초과 / 타임아웃
+            Exception: func가 발생시킨 예외 (실패로 집계 후 그대로 전파)
+        """
+        return await self._call(func, timeout, hold_slot_until_done=False)
+
+    async def call_blocking(
+        self,
+        func: Callable[[], T],
+        timeout: Optional[float] = None,
+    ) -> T:
+        """
+        블로킹 함수를 스레드에서 실행합니다. (정책은 call과 동일)
+
+        스레드는 취소할 수 없어 타임아웃 후에도 끝까지 실행되므로, 호출자에게는 타임아웃으로
+        실패를 반환하되 스레드가 실제로 끝날 때까지 동시 호출 슬롯을 반환하지 않습니다.
+        (응답 없는 호출이 쌓여도 실행 중인 스레드 수가 max_concurrency를 넘지 않음)
+
+        Args:
+            func: 스레드에서 실행할 함수 (인자 없음)
+            timeout: 이번 호출 제한 시간(초, None이면 기본값)
+
+        Returns:
+            T: func 결과
+
+        Raises:
+            ExternalServiceException: circuit open / 동시 호출 한도 대기 초과 / 타임아웃
+            Exception: func가 발생시킨 예외 (실패로 집계 후 그대로 전파)
+        """
+        return await self._call(lambda: asyncio.to_thread(func), timeout, hold_slot_until_done=True)
+
+    async def _call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        timeout: Optional[float],
+        hold_slot_until_done: bool,
+    ) -> T:
+        """
+        call / call_blocking 공통 구현
+
+        Args:
+            func: 호출할 코루틴 함수 (인자 없음)
+            timeout: 이번 호출 제한 시간(초, None이면 기본값)
+            hold_slot_until_done: 타임아웃/취소 후에도 func가 끝날 때까지 동시 호출 슬롯 유지 여부
+        """
+        if not self.breaker.allow():
+            logger.warning(f"[{self.name}] circuit open → 즉시 실패")
+            raise ExternalServiceException(
+                f"{self.name} 서비스를 일시적으로 사용할 수 없습니다",
+                details={"dependency": self.name, "circuit": "open"},
+            )
+
+        budget = self._timeout_seconds if timeout is None else timeout
+        remaining = remaining_seconds()
+        if remaining is not None:
+            budget = min(budget, remaining)
+        started_at = time.monotonic()
+
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=budget)
+        except TimeoutError as exc:
+            raise self._bulkhead_timeout() from exc
+
+        # 대기 중 예산을 모두 썼으면 호출하지 않음 (호출 실패가 아닌 대기 초과로 처리)
+        call_budget = budget - (time.monotonic() - started_at)
+        if call_budget <= 0:
+            self._semaphore.release()
+            raise self._bulkhead_timeout()
+
+        self._in_flight += 1
+        task: asyncio.Future[T] = asyncio.ensure_future(func())
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(task) if hold_slot_until_done else task,
+                timeout=call_budget,
+            )
+        except TimeoutError as exc:
+            self.breaker.record_failure()
+            logger.warning(f"[{self.name}] 응답 시간 초과 ({budget:.1f}초)")
+            raise ExternalServiceException(
+                f"{self.name} 응답 시간을 초과했습니다",
+                details={"dependency": self.name, "timeout": round(budget, 3)},
+            ) from exc
+        except self._ignored_exceptions:
+            self.breaker.release_trial()
+            raise
+        except asyncio.CancelledError:
+            self.breaker.release_trial()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        finally:
+            if task.done():
+                self._release_slot()
+            else:
+                task.add_done_callback(self._release_detached_slot)
+
+        self.breaker.record_success()
+        return result
+
+    def _bulkhead_timeout(self) -> ExternalServiceException:
+        """동시 호출 한도 대기 초과 예외 (포화는 의존성 장애가 아니므로 circuit 실패로 집계하지 않음)"""
+        self.breaker.release_trial()
+        logger.warning(f"[{self.name}] 동시 호출 한도 대기 초과 (max={self._max_concurrency})")
+        return ExternalServiceException(
+            f"{self.name} 호출 대기 시간을 초과했습니다",
+            details={"dependency": self.name, "bulkhead": self._max_concurrency},
+        )
+
+    def _release_slot(self) -> None:
+        """동시 호출 슬롯 반환"""
+        self._in_flight -= 1
+        self._semaphore.release()
+
+    def _release_detached_slot(self, task: "asyncio.Future[Any]") -> None:
+        """호출자가 떠난 뒤 끝난 호출의 슬롯 반환 (결과를 받을 곳이 없으므로 예외는 회수만 함)"""
+        if not task.cancelled():
+            task.exception()
+        self._release_slot()
+
+    def snapshot(self) -> dict[str, Any]:
+        """상태 요약 (헬스체크용)"""
+        return {
+            **self.breaker.snapshot(),
+            "in_flight": self._in_flight,
+            "max_concurrency": self._max_concurrency,
+        }
+
+
+# ====================
+# Dependency Registry
+# ====================
+
+_dependencies: dict[str, Dependency] = {}
+
+
+def register_dependency(dependency: Dependency) -> Dependency:
+    """헬스체크 대상으로 의존성을 등록합니다."""
+    _dependencies[dependency.name] = dependency
+    return dependency
+
+
+def dependency_health() -> dict[str, dict[str, Any]]:
+    """
+    등록된 의존성 상태를 반환합니다.
+
+    Returns:
+        dict: { name: { state, consecutive_failures, in_flight, max_concurrency } }
+    """
+    return {name: dependency.snapshot() for name, dependency in _dependencies.items()}
+
+
+# OpenAI (GPT-4o, Whisper) — 호출별 timeout 지정 (추천 질문 15초, STT는 더 길게)
+openai_dependency = register_dependency(
+    Dependency(
+        "openai",
+        timeout_seconds=settings.OPENAI_TIMEOUT_SECONDS,
+        max_concurrency=settings.OPENAI_MAX_CONCURRENCY,
+    )
+)
+
+# Google OAuth (토큰 교환, 사용자 정보) — 잘못된 인증 코드는 장애로 집계하지 않음
+google_oauth_dependency = register_dependency(
+    Dependency(
+        "google_oauth",
+        timeout_seconds=settings.GOOGLE_OAUTH_TIMEOUT_SECONDS,
+        max_concurrency=settings.GOOGLE_OAUTH_MAX_CONCURRENCY,
+        ignored_exceptions=(UnauthorizedException,),
+    )
+)
+
+# GCS (URL 서명, 파일 조회/다운로드)
+gcs_dependency = register_dependency(
+    Dependency(
+        "gcs",
+        timeout_seconds=settings.GCS_TIMEOUT_SECONDS,
+        max_concurrency=settings.GCS_MAX_CONCURRENCY,
+    )
+)
@@ -4,6 +4,7 @@ Core 레벨 라우터
 도메인과 무관한 인프라 레벨의 공통 엔드포인트를 제공합니다.
 - Health Check: 서비스 상태 확인 (운영 모니터링용)
 - Version: 배포 버전 확인 (배포 추적용)
+- Storage: local 스토리지 백엔드 서명 URL 대상 (업로드 PUT, Range 재생 GET)
 
 사용 가이드:
     이 라우터는 main.py에서 직접 등록되며,
@@ -13,10 +14,18 @@ Core 레벨 라우터
     예: /metrics, /ready, /alive 등
 """
 
-from typing import Dict, Any
-from fastapi import APIRouter, status
+import mimetypes
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Request, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from server.app.core.config import settings
+from server.app.core.resilience import dependency_health
+from server.app.core.storage import LocalStorageBackend, get_storage
+from server.app.core.storage.local import iter_file_range, parse_range, verify_signature
+from server.app.shared.exceptions import NotFoundException
 
 
 # ====================
@@ -40,9 +49,11 @@ class HealthCheckService:
     서버의 상태를 확인하고 반환합니다.
     운영 환경에서 로드밸런서나 모니터링 툴이 사용합니다.
 
+    외부 의존성(OpenAI, Google OAuth, GCS)의 circuit 상태를 함께 보고합니다.
+    (circuit이 open/half_open인 의존성이 있으면 degraded)
+
     확장 가이드:
         - 데이터베이스 연결 상태 확인 추가
-        - 외부 API 연결 상태 확인 추가
         - 캐시 서버 상태 확인 추가
     """
 
@@ -55,15 +66,19 @@ class HealthCheckService:
             Dict: 헬스 상태 정보
                 - status: "ok" | "degraded" | "error"
                 - env: 현재 환경 (development, staging, production)
+                - dependencies: 외부 의존성별 circuit 상태 (state, consecutive_failures, in_flight ...)
 
         TODO: 프로덕션에서는 아래 체크 추가
             - await DatabaseManager.check_connection()
             - await RedisClient.ping()
-            - await check_external_services()
         """
+        dependencies = dependency_health()
+        degraded = any(dep["state"] != "closed" for dep in dependencies.values())
+
         return {
-            "status": "ok",
+            "status": "degraded" if degraded else "ok",
             "env": settings.ENVIRONMENT,
+            "dependencies": dependencies,
         }
 
 
@@ -123,7 +138,7 @@ class VersionService:
 
     **응답 상태:**
     - `ok`: 정상 작동
-    - `degraded`: 일부 기능 제한 (예: DB 연결 불안정)
+    - `degraded`: 일부 기능 제한 (예: 외부 의존성 circuit open — `dependencies` 참고)
     - `error`: 서비스 이용 불가
     """,
     response_model=Dict[str, Any],
@@ -176,6 +191,116 @@ async def version_info() -> Dict[str, Any]:
     return await service.get_version_info()
 
 
+def _authorize_storage_request(object_path: str, method: str, request: Request) -> Path:
+    """
+    local 스토리지 서명 URL을 검증하고 로컬 파일 경로를 반환합니다.
+
+    Raises:
+        HTTPException: local 백엔드가 아니면 404, 서명이 없거나 유효하지 않으면 403
+    """
+    storage = get_storage()
+    if not isinstance(storage, LocalStorageBackend):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    params = request.query_params
+    try:
+        expires = int(params["expires"])
+        signature = params["signature"]
+    except (KeyError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="서명이 없습니다") from exc
+
+    if params.get("method") != method or not verify_signature(object_path, method, expires, signature):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="서명이 유효하지 않습니다")
+
+    try:
+        return storage.resolve_path(object_path)
+    except NotFoundException as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=exc.message) from exc
+
+
+@router.put(
+    "/storage/{object_path:path}",
+    summary="local 스토리지 업로드",
+    description="""
+    local 스토리지 백엔드의 서명 URL 업로드 대상입니다. (STORAGE_BACKEND=local)
+
+    요청 본문을 스트리밍으로 임시 파일에 기록한 뒤 원자적으로 교체합니다.
+    """,
+    include_in_schema=False,
+)
+async def upload_storage_object(object_path: str, request: Request) -> Response:
+    """
+    서명 URL 업로드 엔드포인트
+
+    Returns:
+        Response: 200 (본문 없음)
+    """
+    _authorize_storage_request(object_path, "PUT", request)
+    storage: LocalStorageBackend = get_storage()
+    await storage.write_stream(object_path, request.stream())
+    return Response(status_code=status.HTTP_200_OK)
+
+
+@router.get(
+    "/storage/{object_path:path}",
+    summary="local 스토리지 다운로드 (Range 지원)",
+    description="""
+    local 스토리지 백엔드의 서명 URL 재생 대상입니다. (STORAGE_BACKEND=local)
+
+    **응답:**
+    - Range 헤더 없음: 파일 전체 (서버가 지원하면 sendfile로 전송)
+    - `Range: bytes=start-end`: 206 Partial Content (해당 구간만 mmap으로 읽어 전송)
+    - 만족할 수 없는 Range: 416
+    """,
+    include_in_schema=False,
+)
+async def download_storage_object(
+    object_path: str,
+    request: Request,
+    range_header: Optional[str] = Header(default=None, alias="Range"),
+) -> Response:
+    """
+    서명 URL 재생 엔드포인트
+
+    오디오 플레이어의 탐색(seek)은 Range 요청으로 들어오므로
+    요청 구간만 읽어 파일 전체를 메모리에 올리지 않습니다.
+
+    Returns:
+        Response: 전체 파일(200) 또는 부분 응답(206)
+    """
+    path = _authorize_storage_request(object_path, "GET", request)
+    if not path.is_file():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="객체가 없습니다")
+
+    media_type = "audio/webm" if path.suffix == ".webm" else (
+        mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    )
+    size = path.stat().st_size
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}", "Accept-Ranges": "bytes"},
+        )
+
+    if byte_range is None:
+        return FileResponse(path, media_type=media_type, headers={"Accept-Ranges": "bytes"})
+
+    start, end = byte_range
+    return StreamingResponse(
+        iter_file_range(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers={
+            "Accept-Ranges": "bytes",
+            "Content-Range": f"bytes {start}-{end}/{size}",
+            "Content-Length": str(end - start + 1),
+        },
+    )
+
+
 # ====================
 # 확장 가이드
 # ====================
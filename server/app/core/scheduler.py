@@ -3,6 +3,7 @@
 
 APScheduler를 사용하여 주기적으로 만료된 세션을 정리합니다.
 추가로 PROCESSING 고착 미팅(30분 초과)을 FAILED로 자동 전환합니다.
+워커 비정상 종료로 in_progress에 남은 HR 동기화 이력도 failure로 정리합니다.
 """
 
 import asyncio
@@ -82,6 +83,7 @@ async def cleanup_stuck_processing_meetings() -> None:
     try:
         async with AsyncSessionLocal() as db:
             from server.app.domain.coaching.repositories import CoachingRepository
+            from server.app.domain.coaching.service import broadcast_meeting_event
 
             repo = CoachingRepository(db)
             stuck_meetings = await repo.find_stuck_processing_meetings(timeout_minutes=30)
@@ -93,7 +95,16 @@ async def cleanup_stuck_processing_meetings() -> None:
             failed_count = 0
             for meeting in stuck_meetings:
                 try:
-                    await repo.mark_meeting_failed(meeting.meeting_id)
+                    # 조회 이후 파이프라인이 먼저 완료했다면 전환되지 않음
+                    failed_meeting = await repo.mark_meeting_failed(meeting.meeting_id)
+                    if failed_meeting is None:
+                        continue
+                    await broadcast_meeting_event(
+                        failed_meeting.meeting_id,
+                        "status_changed",
+                        failed_meeting.state_version,
+                        {"status": failed_meeting.status},
+                    )
                     failed_count += 1
                     logger.warning(
                         "[크론잡] PROCESSING 고착 미팅 FAILED 전환",
@@ -118,6 +129,57 @@ async def cleanup_stuck_processing_meetings() -> None:
         logger.error(f"[크론잡] PROCESSING 고착 미팅 정리 중 오류: {str(e)}")
 
 
+async def cleanup_stale_hr_sync_jobs() -> None:
+    """
+    in_progress로 고착된 HR 동기화 이력을 failure로 전환합니다.
+
+    백그라운드 동기화 작업 중 워커가 비정상 종료되면 이력이 in_progress로 남습니다.
+    HR_SYNC_STALE_MINUTES를 넘긴 이력 중 이 워커에서 실행 중이 아닌 것만 정리합니다.
+    """
+    try:
+        from server.app.domain.hr.sync_jobs import reap_stale_sync_jobs
+
+        reaped = await reap_stale_sync_jobs()
+        if reaped:
+            logger.warning(
+                f"[크론잡] in_progress 고착 HR 동기화 {len(reaped)}건 failure 전환",
+                extra={"sync_ids": reaped},
+            )
+        else:
+            logger.debug("[크론잡] in_progress 고착 HR 동기화 없음")
+
+    except Exception as e:
+        logger.error(f"[크론잡] 고착 HR 동기화 정리 중 오류: {str(e)}")
+
+
+async def pull_hr_source_changes() -> None:
+    """
+    HR 원천 시스템 변경분을 수집해 동기화합니다. (HR_SOURCE_CONNECTOR 설정 시)
+
+    커넥터별 워터마크 이후 변경분만 반영합니다.
+    HR_SOURCE_PULL_INTERVAL_MINUTES마다 실행됩니다.
+    """
+    try:
+        from server.app.domain.hr.source_pull import pull_hr_source
+        from server.app.domain.hr.sources import get_hr_source
+
+        connector = get_hr_source()
+        if connector is None:
+            return
+
+        applied = await pull_hr_source(connector)
+        if any(applied.values()):
+            logger.info(
+                "[크론잡] HR 원천 수집 완료",
+                extra={"source_name": connector.source_name, **applied},
+            )
+        else:
+            logger.debug("[크론잡] HR 원천 변경분 없음")
+
+    except Exception as e:
+        logger.error(f"[크론잡] HR 원천 수집 중 오류: {str(e)}")
+
+
 def start_scheduler() -> AsyncIOScheduler:
     """
     스케줄러를 시작합니다.
@@ -151,6 +213,27 @@ def start_scheduler() -> AsyncIOScheduler:
         replace_existing=True,
     )
 
+    # in_progress 고착 HR 동기화 방어 (매 10분마다)
+    _scheduler.add_job(
+        cleanup_stale_hr_sync_jobs,
+        trigger=IntervalTrigger(minutes=10),
+        id="cleanup_stale_hr_sync_jobs",
+        name="고착 HR 동기화 정리",
+        replace_existing=True,
+    )
+
+    # HR 원천 주기 수집 (커넥터 설정 시)
+    if settings.HR_SOURCE_CONNECTOR:
+        _scheduler.add_job(
+            pull_hr_source_changes,
+            trigger=IntervalTrigger(minutes=settings.HR_SOURCE_PULL_INTERVAL_MINUTES),
+            id="pull_hr_source_changes",
+            name="HR 원천 수집",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
     _scheduler.start()
     logger.info("세션 정리 스케줄러 시작됨 (10분 간격)")
 
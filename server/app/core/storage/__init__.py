@@ -2,9 +2,33 @@
 Core Storage Module
 
 파일 스토리지 관련 유틸리티를 제공합니다.
-현재: Google Cloud Storage (GCS) 연동
+- StorageBackend      : 백엔드 공통 인터페이스
+- GCSClient           : Google Cloud Storage (STORAGE_BACKEND=gcs)
+- LocalStorageBackend : 로컬 디스크/NFS (STORAGE_BACKEND=local)
 """
 
-from .gcs import GCSClient, get_gcs_client
+from functools import lru_cache
 
-__all__ = ["GCSClient", "get_gcs_client"]
+from server.app.core.config import settings
+
+from .base import StorageBackend
+from .gcs import GCSClient
+from .local import LocalStorageBackend
+
+
+@lru_cache()
+def get_storage() -> StorageBackend:
+    """
+    스토리지 백엔드 싱글톤 반환
+
+    STORAGE_BACKEND=local 이거나 FAKE_EXTERNAL_SERVICES=true 이면 로컬 백엔드,
+    그 외에는 GCS 클라이언트를 반환합니다.
+
+    Returns:
+        StorageBackend: 스토리지 백엔드 인스턴스
+    """
+    if settings.STORAGE_BACKEND == "local" or settings.FAKE_EXTERNAL_SERVICES:
+        return LocalStorageBackend()
+    return GCSClient()
+
+__all__ = ["GCSClient", "LocalStorageBackend", "StorageBackend", "get_storage"]
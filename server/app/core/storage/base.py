@@ -0,0 +1,131 @@
+"""
+스토리지 백엔드 인터페이스
+
+구현체:
+    - GCSClient           : Google Cloud Storage (STORAGE_BACKEND=gcs)
+    - LocalStorageBackend : 로컬/NFS 디렉토리 (STORAGE_BACKEND=local, 온프레미스·테스트 배포)
+
+객체 경로(gcs_path)는 백엔드와 무관한 버킷/루트 기준 상대 경로입니다.
+
+분할 업로드 (긴 녹음, 불안정한 네트워크):
+    1. 클라이언트가 파트(part_number 1..N)별 서명 URL로 병렬 PUT
+       → 파트 객체 경로: {gcs_path}.parts/{part_number:05d}
+    2. 실패한 파트만 재업로드 (list_uploaded_parts로 서버가 수신 현황 확인)
+    3. compose_parts로 최종 객체 조립 후 파트 삭제
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class StorageBackend(ABC):
+    """
+    파일 스토리지 백엔드 공통 인터페이스
+
+    업로드/다운로드는 서명 URL로 클라이언트가 직접 수행하고,
+    서버는 URL 발급과 내부 처리용 조회만 담당합니다.
+    """
+
+    @staticmethod
+    def build_audio_path(leader_emp_no: str, meeting_id: str) -> str:
+        """
+        오디오 파일 객체 경로 생성
+
+        경로 규칙: meetings/{leader_emp_no}/{meeting_id}/original_audio.webm
+        """
+        return f"meetings/{leader_emp_no}/{meeting_id}/original_audio.webm"
+
+    @staticmethod
+    def build_part_path(gcs_path: str, part_number: int) -> str:
+        """
+        분할 업로드 파트 객체 경로 생성
+
+        경로 규칙: {gcs_path}.parts/{part_number:05d} (이름순 정렬 = 파트 순서)
+        """
+        return f"{gcs_path}.parts/{part_number:05d}"
+
+    @abstractmethod
+    async def generate_upload_presigned_url(
+        self,
+        leader_emp_no: str,
+        meeting_id: str,
+        expiration_seconds: int = 3600,
+    ) -> dict[str, str]:
+        """
+        오디오 업로드용 서명 URL 생성 (PUT)
+
+        Returns:
+            dict: { "presigned_url": str, "gcs_path": str, "expires_at": str }
+        """
+
+    @abstractmethod
+    async def generate_download_presigned_url(
+        self,
+        gcs_path: str,
+        expiration_seconds: int = 3600,
+    ) -> str:
+        """
+        다운로드(재생)용 서명 URL 생성 (GET)
+
+        Returns:
+            str: 서명 URL
+        """
+
+    @abstractmethod
+    async def download_file(self, gcs_path: str) -> bytes:
+        """
+        파일 전체 다운로드 (AI 파이프라인 내부 처리용)
+
+        Raises:
+            ExternalServiceException: 파일이 존재하지 않거나 다운로드 실패 시
+        """
+
+    @abstractmethod
+    async def file_exists(self, gcs_path: str) -> bool:
+        """파일 존재 여부"""
+
+    @abstractmethod
+    async def get_object_size(self, gcs_path: str) -> Optional[int]:
+        """
+        객체 크기(바이트) 조회
+
+        Returns:
+            int | None: 객체 크기, 객체가 없으면 None
+        """
+
+    @abstractmethod
+    async def generate_part_upload_presigned_urls(
+        self,
+        gcs_path: str,
+        part_numbers: list[int],
+        expiration_seconds: int = 3600,
+    ) -> dict[int, str]:
+        """
+        분할 업로드 파트별 서명 URL 생성 (PUT)
+
+        URL만으로 업로드할 수 있어야 합니다. (Content-Type 등 서명된 필수 헤더 없음)
+
+        Returns:
+            dict: { part_number: 서명 URL }
+        """
+
+    @abstractmethod
+    async def list_uploaded_parts(self, gcs_path: str) -> dict[int, int]:
+        """
+        업로드된 파트 목록 조회 (서버 측 수신 현황)
+
+        Returns:
+            dict: { part_number: 파트 크기(바이트) }
+        """
+
+    @abstractmethod
+    async def compose_parts(self, gcs_path: str, part_count: int) -> int:
+        """
+        파트 1..part_count를 순서대로 이어 최종 객체를 만들고 파트를 삭제합니다.
+
+        Returns:
+            int: 최종 객체 크기(바이트)
+
+        Raises:
+            ExternalServiceException: 조립 실패 시
+        """
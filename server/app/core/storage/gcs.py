@@ -6,13 +6,18 @@ Google Cloud Storage (GCS) 연동 모듈
 - Presigned Upload URL 생성 (프론트엔드 직접 업로드용)
 - Presigned Download URL 생성 (오디오 재생용)
 - 파일 다운로드 (AI 파이프라인 내부 처리용)
+- 분할 업로드: 파트별 Presigned URL 발급, 파트 목록 조회, compose로 최종 객체 조립
 
 GCS 경로 규칙:
     meetings/{leader_emp_no}/{meeting_id}/original_audio.webm
+
+호출 정책:
+    google-cloud-storage SDK는 블로킹 호출이므로 gcs_dependency.call_blocking으로
+    스레드에서 실행합니다. (circuit breaker, bulkhead, deadline 적용)
+    타임아웃 후에도 스레드는 끝까지 실행되며, 그동안 bulkhead 슬롯을 유지합니다.
 """
 
 import datetime
-from functools import lru_cache
 from typing import Optional
 
 from google.cloud import storage
@@ -20,15 +25,23 @@ from google.oauth2 import service_account
 
 from server.app.core.config import get_settings
 from server.app.core.logging import get_logger
+from server.app.core.resilience import gcs_dependency
+from server.app.core.storage.base import StorageBackend
 from server.app.shared.exceptions import ExternalServiceException
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# 파일 다운로드 제한 시간(초) — 파일 크기에 비례하므로 기본 GCS 제한 시간보다 길게 허용
+_DOWNLOAD_TIMEOUT_SECONDS: float = 120.0
+
+# GCS compose 요청당 최대 소스 객체 수
+_COMPOSE_MAX_SOURCES: int = 32
+
 
-class GCSClient:
+class GCSClient(StorageBackend):
     """
-    Google Cloud Storage 클라이언트 싱글톤
+    Google Cloud Storage 클라이언트
 
     Presigned URL 생성 및 파일 조작을 담당합니다.
     서비스 계정 인증 방식을 사용합니다.
@@ -68,15 +81,6 @@ class GCSClient:
         bucket = client.bucket(self._bucket_name)
         return bucket.blob(gcs_path)
 
-    @staticmethod
-    def build_audio_path(leader_emp_no: str, meeting_id: str) -> str:
-        """
-        오디오 파일 GCS 경로 생성
-
-        경로 규칙: meetings/{leader_emp_no}/{meeting_id}/original_audio.webm
-        """
-        return f"meetings/{leader_emp_no}/{meeting_id}/original_audio.webm"
-
     async def generate_upload_presigned_url(
         self,
         leader_emp_no: str,
@@ -102,11 +106,13 @@ class GCSClient:
             blob = self._get_blob(gcs_path)
             expiration = datetime.timedelta(seconds=expiration_seconds)
 
-            presigned_url = blob.generate_signed_url(
-                version="v4",
-                expiration=expiration,
-                method="PUT",
-                content_type="audio/webm",
+            presigned_url = await gcs_dependency.call_blocking(
+                lambda: blob.generate_signed_url(
+                    version="v4",
+                    expiration=expiration,
+                    method="PUT",
+                    content_type="audio/webm",
+                )
             )
 
             expires_at = (
@@ -148,10 +154,12 @@ class GCSClient:
             blob = self._get_blob(gcs_path)
             expiration = datetime.timedelta(seconds=expiration_seconds)
 
-            presigned_url = blob.generate_signed_url(
-                version="v4",
-                expiration=expiration,
-                method="GET",
+            presigned_url = await gcs_dependency.call_blocking(
+                lambda: blob.generate_signed_url(
+                    version="v4",
+                    expiration=expiration,
+                    method="GET",
+                )
             )
 
             logger.info(f"Presigned download URL 생성 완료: path={gcs_path}")
@@ -182,11 +190,17 @@ class GCSClient:
         try:
             blob = self._get_blob(gcs_path)
 
-            if not blob.exists():
+            exists = await gcs_dependency.call_blocking(
+                lambda: blob.exists(timeout=settings.GCS_TIMEOUT_SECONDS)
+            )
+            if not exists:
                 logger.error(f"GCS 파일이 존재하지 않음: path={gcs_path}")
                 raise ExternalServiceException(f"GCS 파일을 찾을 수 없습니다: {gcs_path}")
 
-            file_bytes = blob.download_as_bytes()
+            file_bytes = await gcs_dependency.call_blocking(
+                lambda: blob.download_as_bytes(timeout=_DOWNLOAD_TIMEOUT_SECONDS),
+                timeout=_DOWNLOAD_TIMEOUT_SECONDS,
+            )
             logger.info(f"GCS 파일 다운로드 완료: path={gcs_path}, size={len(file_bytes)} bytes")
             return file_bytes
 
@@ -208,20 +222,154 @@ class GCSClient:
         """
         try:
             blob = self._get_blob(gcs_path)
-            return blob.exists()
+            return await gcs_dependency.call_blocking(
+                lambda: blob.exists(timeout=settings.GCS_TIMEOUT_SECONDS)
+            )
         except Exception as e:
             logger.error(f"GCS 파일 존재 확인 실패: path={gcs_path}, error={e}")
             return False
 
+    async def get_object_size(self, gcs_path: str) -> Optional[int]:
+        """
+        GCS 객체 크기 조회
 
-@lru_cache()
-def get_gcs_client() -> GCSClient:
-    """
-    GCS 클라이언트 싱글톤 반환
+        Returns:
+            int | None: 객체 크기(바이트), 객체가 없으면 None
+
+        Raises:
+            ExternalServiceException: 조회 실패 시
+        """
+        try:
+            bucket = self._get_client().bucket(self._bucket_name)
+            found = await gcs_dependency.call_blocking(
+                lambda: bucket.get_blob(gcs_path, timeout=settings.GCS_TIMEOUT_SECONDS)
+            )
+            return None if found is None else found.size
 
-    애플리케이션 생명주기 동안 단일 인스턴스를 공유합니다.
+        except ExternalServiceException:
+            raise
+        except Exception as e:
+            logger.error(f"GCS 객체 크기 조회 실패: path={gcs_path}, error={e}")
+            raise ExternalServiceException("업로드 파일 확인에 실패했습니다.")
 
-    Returns:
-        GCSClient: GCS 클라이언트 인스턴스
-    """
-    return GCSClient()
+    async def generate_part_upload_presigned_urls(
+        self,
+        gcs_path: str,
+        part_numbers: list[int],
+        expiration_seconds: int = 3600,
+    ) -> dict[int, str]:
+        """
+        분할 업로드 파트별 Presigned Upload URL 생성
+
+        파트는 독립 객체이므로 클라이언트가 병렬로 업로드하고, 실패한 파트만 재시도할 수 있습니다.
+        (서명은 로컬 계산이므로 파트 수만큼 네트워크 호출이 발생하지 않음)
+        파트는 조립 전 중간 객체이므로 Content-Type을 서명에 넣지 않습니다.
+        (클라이언트가 어떤 Content-Type으로 PUT해도 서명이 일치, 최종 객체는 compose에서 audio/webm 지정)
+
+        Returns:
+            dict: { part_number: Presigned URL }
+        """
+        expiration = datetime.timedelta(seconds=expiration_seconds)
+
+        def sign_all() -> dict[int, str]:
+            return {
+                part_number: self._get_blob(self.build_part_path(gcs_path, part_number)).generate_signed_url(
+                    version="v4",
+                    expiration=expiration,
+                    method="PUT",
+                )
+                for part_number in part_numbers
+            }
+
+        try:
+            urls = await gcs_dependency.call_blocking(sign_all)
+            logger.info(f"파트 Presigned upload URL 생성 완료: path={gcs_path}, parts={len(urls)}")
+            return urls
+
+        except ExternalServiceException:
+            raise
+        except Exception as e:
+            logger.error(f"파트 Presigned upload URL 생성 실패: path={gcs_path}, error={e}")
+            raise ExternalServiceException("업로드 URL 생성에 실패했습니다.")
+
+    async def list_uploaded_parts(self, gcs_path: str) -> dict[int, int]:
+        """
+        업로드된 파트 객체 목록 조회
+
+        Returns:
+            dict: { part_number: 파트 크기(바이트) }
+        """
+        prefix = f"{gcs_path}.parts/"
+
+        def list_parts() -> dict[int, int]:
+            blobs = self._get_client().list_blobs(
+                self._bucket_name, prefix=prefix, timeout=settings.GCS_TIMEOUT_SECONDS
+            )
+            parts: dict[int, int] = {}
+            for blob in blobs:
+                name = blob.name[len(prefix):]
+                if name.isdigit():
+                    parts[int(name)] = blob.size
+            return parts
+
+        try:
+            return await gcs_dependency.call_blocking(list_parts)
+
+        except ExternalServiceException:
+            raise
+        except Exception as e:
+            logger.error(f"GCS 파트 목록 조회 실패: path={gcs_path}, error={e}")
+            raise ExternalServiceException("업로드 현황 조회에 실패했습니다.")
+
+    async def compose_parts(self, gcs_path: str, part_count: int) -> int:
+        """
+        파트 객체를 compose로 이어 최종 객체를 만들고 파트를 삭제합니다.
+
+        compose는 요청당 소스 32개까지이므로, 첫 배치 이후에는
+        [지금까지 조립한 객체 + 다음 파트 31개] 순서로 반복합니다. (GCS 내부 복사, 재업로드 없음)
+
+        Returns:
+            int: 최종 객체 크기(바이트)
+
+        Raises:
+            ExternalServiceException: 조립 실패 시
+        """
+        target = self._get_blob(gcs_path)
+        parts = [
+            self._get_blob(self.build_part_path(gcs_path, part_number))
+            for part_number in range(1, part_count + 1)
+        ]
+
+        def compose() -> int:
+            target.content_type = "audio/webm"
+            target.compose(parts[:_COMPOSE_MAX_SOURCES], timeout=_DOWNLOAD_TIMEOUT_SECONDS)
+            for start in range(_COMPOSE_MAX_SOURCES, len(parts), _COMPOSE_MAX_SOURCES - 1):
+                target.compose(
+                    [target, *parts[start:start + _COMPOSE_MAX_SOURCES - 1]],
+                    timeout=_DOWNLOAD_TIMEOUT_SECONDS,
+                )
+            target.reload(timeout=settings.GCS_TIMEOUT_SECONDS)
+            return target.size
+
+        try:
+            size = await gcs_dependency.call_blocking(compose, timeout=_DOWNLOAD_TIMEOUT_SECONDS)
+        except ExternalServiceException:
+            raise
+        except Exception as e:
+            logger.error(f"GCS 파트 조립 실패: path={gcs_path}, error={e}")
+            raise ExternalServiceException("업로드 파일 조립에 실패했습니다.")
+
+        # 파트 삭제 실패는 최종 객체에 영향이 없으므로 기록만 남김 (버킷 lifecycle 규칙으로 정리)
+        try:
+            await gcs_dependency.call_blocking(
+                lambda: self._get_client().bucket(self._bucket_name).delete_blobs(
+                    parts,
+                    on_error=lambda blob: None,
+                    timeout=settings.GCS_TIMEOUT_SECONDS,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"GCS 파트 삭제 실패: path={gcs_path}, error={e}")
+
+        logger.info(f"GCS 파트 조립 완료: path={gcs_path}, parts={part_count}, size={size} bytes")
+        return size
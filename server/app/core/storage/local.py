@@ -0,0 +1,312 @@
+"""
+로컬 파일시스템 스토리지 백엔드 (로컬 디스크 / NFS)
+
+온프레미스·테스트 배포용 StorageBackend 구현입니다.
+객체는 LOCAL_STORAGE_ROOT 아래에 gcs_path 그대로 저장됩니다.
+
+서명 URL:
+    {LOCAL_STORAGE_PUBLIC_URL}/core/storage/{gcs_path}?method=GET&expires=<unix>&signature=<hmac>
+    HMAC-SHA256(SECRET_KEY, "{method}\\n{gcs_path}\\n{expires}") — 만료/메서드/경로 위변조 시 403
+    업로드(PUT)와 재생(GET, Range 지원)은 core 라우터의 /core/storage 엔드포인트가 처리합니다.
+
+Range 읽기:
+    iter_file_range는 파일을 mmap으로 열어 요청 구간의 페이지만 읽습니다.
+    (1시간 녹음에서 탐색해도 파일 전체를 읽지 않음)
+"""
+
+import asyncio
+import datetime
+import hashlib
+import hmac
+import mmap
+import os
+import shutil
+import time
+import urllib.parse
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from server.app.core.config import settings
+from server.app.core.logging import get_logger
+from server.app.core.storage.base import StorageBackend
+from server.app.shared.exceptions import ExternalServiceException, NotFoundException
+
+logger = get_logger(__name__)
+
+# Range 응답 청크 크기 (1MB)
+_RANGE_CHUNK_BYTES: int = 1024 * 1024
+
+
+def _signature(method: str, gcs_path: str, expires: int) -> str:
+    """서명 URL HMAC 값"""
+    message = f"{method}\n{gcs_path}\n{expires}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+
+def verify_signature(gcs_path: str, method: str, expires: int, signature: str) -> bool:
+    """서명 URL 검증 (만료 시각 + HMAC)"""
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(_signature(method, gcs_path, expires), signature)
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """
+    HTTP Range 헤더를 해석합니다. (단일 구간만 지원, 다중 구간은 첫 구간 사용)
+
+    Args:
+        range_header: Range 헤더 값 (예: "bytes=0-1023", "bytes=1024-", "bytes=-500")
+        size: 파일 크기
+
+    Returns:
+        tuple | None: (start, end) 포함 구간, 헤더가 없으면 None
+
+    Raises:
+        ValueError: 해석할 수 없거나 만족할 수 없는 구간일 때 (416)
+    """
+    if not range_header:
+        return None
+
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not ranges:
+        raise ValueError("지원하지 않는 Range 단위입니다")
+
+    first = ranges.split(",")[0].strip()
+    start_text, _, end_text = first.partition("-")
+
+    if not start_text:
+        # 접미 구간: 마지막 N 바이트
+        suffix = int(end_text)
+        if suffix <= 0:
+            raise ValueError("유효하지 않은 Range입니다")
+        start, end = max(0, size - suffix), size - 1
+    else:
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+        end = min(end, size - 1)
+
+    if start >= size or start > end:
+        raise ValueError("만족할 수 없는 Range입니다")
+    return start, end
+
+
+async def iter_file_range(path: Path, start: int, end: int) -> AsyncIterator[bytes]:
+    """
+    파일의 [start, end] 구간을 mmap으로 읽어 청크 단위로 반환합니다.
+
+    페이지 폴트가 이벤트 루프를 막지 않도록 청크 복사는 스레드에서 수행합니다.
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        position = start
+        while position <= end:
+            chunk_end = min(position + _RANGE_CHUNK_BYTES, end + 1)
+            yield await asyncio.to_thread(mapped.__getitem__, slice(position, chunk_end))
+            position = chunk_end
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    로컬 디렉토리 기반 스토리지 백엔드
+    """
+
+    def __init__(
+        self,
+        root: str = settings.LOCAL_STORAGE_ROOT,
+        public_url: str = settings.LOCAL_STORAGE_PUBLIC_URL,
+    ) -> None:
+        """
+        Args:
+            root: 객체 저장 루트 디렉토리
+            public_url: 서명 URL 호스트 (브라우저가 접근하는 API 서버 주소)
+        """
+        self._root = Path(root).resolve()
+        self._public_url = public_url.rstrip("/")
+
+    def resolve_path(self, gcs_path: str) -> Path:
+        """
+        객체 경로를 로컬 파일 경로로 변환합니다. (루트 밖 경로 차단)
+
+        Raises:
+            NotFoundException: 루트 디렉토리 밖을 가리키는 경로일 때
+        """
+        path = (self._root / gcs_path).resolve()
+        if not path.is_relative_to(self._root):
+            raise NotFoundException(
+                "유효하지 않은 객체 경로입니다",
+                details={"gcs_path": gcs_path},
+            )
+        return path
+
+    def sign_url(
+        self, gcs_path: str, method: str, expiration_seconds: int
+    ) -> tuple[str, datetime.datetime]:
+        """
+        서명 URL을 생성합니다.
+
+        Returns:
+            tuple: (서명 URL, 만료 시각 UTC)
+        """
+        expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=expiration_seconds)
+        expires = int(time.time()) + expiration_seconds
+        query = urllib.parse.urlencode(
+            {"method": method, "expires": expires, "signature": _signature(method, gcs_path, expires)}
+        )
+        url = f"{self._public_url}/core/storage/{urllib.parse.quote(gcs_path)}?{query}"
+        return url, expires_at
+
+    async def generate_upload_presigned_url(
+        self,
+        leader_emp_no: str,
+        meeting_id: str,
+        expiration_seconds: int = 3600,
+    ) -> dict[str, str]:
+        """로컬 업로드 서명 URL 생성 (PUT /core/storage/...)"""
+        gcs_path = self.build_audio_path(leader_emp_no, meeting_id)
+        presigned_url, expires_at = self.sign_url(gcs_path, "PUT", expiration_seconds)
+
+        logger.info(f"Local upload URL 생성 완료: meeting_id={meeting_id}, path={gcs_path}")
+        return {
+            "presigned_url": presigned_url,
+            "gcs_path": gcs_path,
+            "expires_at": expires_at.isoformat() + "Z",
+        }
+
+    async def generate_download_presigned_url(
+        self,
+        gcs_path: str,
+        expiration_seconds: int = 3600,
+    ) -> str:
+        """로컬 재생 서명 URL 생성 (GET /core/storage/..., Range 지원)"""
+        presigned_url, _ = self.sign_url(gcs_path, "GET", expiration_seconds)
+        return presigned_url
+
+    async def download_file(self, gcs_path: str) -> bytes:
+        """
+        로컬 파일 전체를 읽습니다. (AI 파이프라인 내부 처리용)
+
+        Raises:
+            ExternalServiceException: 파일이 존재하지 않거나 읽기 실패 시
+        """
+        path = self.resolve_path(gcs_path)
+        try:
+            file_bytes = await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError as exc:
+            logger.error(f"로컬 파일이 존재하지 않음: path={gcs_path}")
+            raise ExternalServiceException(f"파일을 찾을 수 없습니다: {gcs_path}") from exc
+        except OSError as exc:
+            logger.error(f"로컬 파일 읽기 실패: path={gcs_path}, error={exc}")
+            raise ExternalServiceException("파일 다운로드에 실패했습니다.") from exc
+
+        logger.info(f"로컬 파일 다운로드 완료: path={gcs_path}, size={len(file_bytes)} bytes")
+        return file_bytes
+
+    async def file_exists(self, gcs_path: str) -> bool:
+        """로컬 파일 존재 여부"""
+        return await asyncio.to_thread(self.resolve_path(gcs_path).is_file)
+
+    async def get_object_size(self, gcs_path: str) -> Optional[int]:
+        """로컬 파일 크기 (없으면 None)"""
+        path = self.resolve_path(gcs_path)
+        try:
+            return (await asyncio.to_thread(path.stat)).st_size
+        except FileNotFoundError:
+            return None
+
+    async def generate_part_upload_presigned_urls(
+        self,
+        gcs_path: str,
+        part_numbers: list[int],
+        expiration_seconds: int = 3600,
+    ) -> dict[int, str]:
+        """파트별 로컬 업로드 서명 URL 생성 (PUT /core/storage/{gcs_path}.parts/...)"""
+        return {
+            part_number: self.sign_url(
+                self.build_part_path(gcs_path, part_number), "PUT", expiration_seconds
+            )[0]
+            for part_number in part_numbers
+        }
+
+    async def list_uploaded_parts(self, gcs_path: str) -> dict[int, int]:
+        """
+        파트 디렉토리의 완료된 파트 목록 (업로드 중인 임시 파일 제외)
+        """
+        parts_dir = self.resolve_path(f"{gcs_path}.parts")
+
+        def scan() -> dict[int, int]:
+            if not parts_dir.is_dir():
+                return {}
+            return {
+                int(entry.name): entry.stat().st_size
+                for entry in os.scandir(parts_dir)
+                if entry.is_file() and entry.name.isdigit()
+            }
+
+        return await asyncio.to_thread(scan)
+
+    async def compose_parts(self, gcs_path: str, part_count: int) -> int:
+        """
+        파트 파일을 순서대로 이어 최종 파일을 만듭니다. (임시 파일 → rename, 이후 파트 디렉토리 삭제)
+
+        Raises:
+            ExternalServiceException: 파트 누락 또는 파일 쓰기 실패 시
+        """
+        path = self.resolve_path(gcs_path)
+        parts_dir = self.resolve_path(f"{gcs_path}.parts")
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+
+        def compose() -> int:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with open(temp_path, "wb") as target:
+                    for part_number in range(1, part_count + 1):
+                        part_path = self.resolve_path(self.build_part_path(gcs_path, part_number))
+                        with open(part_path, "rb") as source:
+                            shutil.copyfileobj(source, target, _RANGE_CHUNK_BYTES)
+                os.replace(temp_path, path)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+            shutil.rmtree(parts_dir, ignore_errors=True)
+            return path.stat().st_size
+
+        try:
+            size = await asyncio.to_thread(compose)
+        except OSError as exc:
+            logger.error(f"로컬 파트 조립 실패: path={gcs_path}, error={exc}")
+            raise ExternalServiceException("업로드 파일 조립에 실패했습니다.") from exc
+
+        logger.info(f"로컬 파트 조립 완료: path={gcs_path}, parts={part_count}, size={size} bytes")
+        return size
+
+    async def write_stream(self, gcs_path: str, chunks: AsyncIterator[bytes]) -> int:
+        """
+        업로드 스트림을 파일로 저장합니다. (임시 파일에 쓴 뒤 rename — 부분 파일 노출 방지)
+
+        Args:
+            gcs_path: 객체 경로
+            chunks: 요청 본문 청크
+
+        Returns:
+            int: 저장된 바이트 수
+        """
+        path = self.resolve_path(gcs_path)
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+
+        size = 0
+        file = await asyncio.to_thread(open, temp_path, "wb")
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    await asyncio.to_thread(file.write, chunk)
+                    size += len(chunk)
+        except BaseException:
+            file.close()
+            temp_path.unlink(missing_ok=True)
+            raise
+        file.close()
+        await asyncio.to_thread(os.replace, temp_path, path)
+
+        logger.info(f"로컬 파일 저장 완료: path={gcs_path}, size={size} bytes")
+        return size
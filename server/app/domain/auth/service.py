@@ -5,14 +5,16 @@ Google OAuth 2.0 Authorization Code Flow를 구현합니다.
 """
 
 import urllib.parse
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.core.config import settings
+from server.app.core.fakes import fake_transport
 from server.app.core.logging import get_logger
+from server.app.core.resilience import deadline, google_oauth_dependency
 from server.app.core.security import create_access_token, create_refresh_token
 from server.app.domain.auth.models import RefreshToken
 from datetime import datetime, timedelta
@@ -33,6 +35,27 @@ from server.app.shared.types import ServiceResult
 logger = get_logger(__name__)
 
 
+async def _send_google_request(
+    send: Callable[[], Awaitable[httpx.Response]],
+) -> httpx.Response:
+    """
+    Google API 호출을 google_oauth_dependency 정책(circuit breaker, bulkhead, deadline)으로 실행합니다.
+
+    5xx 응답은 장애로 집계하고, 4xx(잘못된 인증 코드 등)는 호출 측이 판단하도록 그대로 반환합니다.
+    """
+
+    async def send_checked() -> httpx.Response:
+        response = await send()
+        if response.status_code >= 500:
+            raise ExternalServiceException(
+                "Google 인증 서버 오류",
+                details={"status_code": response.status_code},
+            )
+        return response
+
+    return await google_oauth_dependency.call(send_checked)
+
+
 class SessionService:
     """
     세션 관리 서비스
@@ -354,11 +377,13 @@ class GoogleAuthService(BaseService[GoogleAuthCallbackRequest, GoogleAuthRespons
             ServiceResult[GoogleAuthResponse]: 로그인 결과
         """
         try:
-            # 1. Authorization Code → Access Token 교환
-            access_token = await self._exchange_code_for_token(request.code)
+            # 1~2. Google 호출은 하나의 deadline을 공유 (토큰 교환이 늦으면 사용자 정보 조회 시간 단축)
+            with deadline(settings.GOOGLE_OAUTH_TIMEOUT_SECONDS):
+                # 1. Authorization Code → Access Token 교환
+                access_token = await self._exchange_code_for_token(request.code)
 
-            # 2. Access Token → 사용자 정보 조회
-            user_info = await self._get_user_info(access_token)
+                # 2. Access Token → 사용자 정보 조회
+                user_info = await self._get_user_info(access_token)
 
             email = user_info.get("email")
             if not email:
@@ -472,20 +497,22 @@ class GoogleAuthService(BaseService[GoogleAuthCallbackRequest, GoogleAuthRespons
 
         Raises:
             UnauthorizedException: 인증 코드가 유효하지 않은 경우
-            ExternalServiceException: Google API 호출 실패
+            ExternalServiceException: Google API 호출 실패 (타임아웃, circuit open 포함)
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.GOOGLE_TOKEN_URL,
-                    data={
-                        "code": code,
-                        "client_id": settings.GOOGLE_CLIENT_ID,
-                        "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                        "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-                        "grant_type": "authorization_code",
-                    },
-                    timeout=10.0,
+            async with httpx.AsyncClient(transport=fake_transport("google_oauth")) as client:
+                response = await _send_google_request(
+                    lambda: client.post(
+                        self.GOOGLE_TOKEN_URL,
+                        data={
+                            "code": code,
+                            "client_id": settings.GOOGLE_CLIENT_ID,
+                            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+                            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+                            "grant_type": "authorization_code",
+                        },
+                        timeout=settings.GOOGLE_OAUTH_TIMEOUT_SECONDS,
+                    )
                 )
 
                 if response.status_code != 200:
@@ -509,7 +536,7 @@ class GoogleAuthService(BaseService[GoogleAuthCallbackRequest, GoogleAuthRespons
         except httpx.TimeoutException:
             raise ExternalServiceException(
                 "Google 인증 서버 응답 시간 초과",
-                details={"timeout": 10.0},
+                details={"timeout": settings.GOOGLE_OAUTH_TIMEOUT_SECONDS},
             )
         except httpx.RequestError as e:
             raise ExternalServiceException(
@@ -528,14 +555,16 @@ class GoogleAuthService(BaseService[GoogleAuthCallbackRequest, GoogleAuthRespons
             dict: 사용자 정보 (email, name 등)
 
         Raises:
-            ExternalServiceException: Google API 호출 실패
+            ExternalServiceException: Google API 호출 실패 (타임아웃, circuit open 포함)
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.GOOGLE_USERINFO_URL,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                    timeout=10.0,
+            async with httpx.AsyncClient(transport=fake_transport("google_oauth")) as client:
+                response = await _send_google_request(
+                    lambda: client.get(
+                        self.GOOGLE_USERINFO_URL,
+                        headers={"Authorization": f"Bearer {access_token}"},
+                        timeout=settings.GOOGLE_OAUTH_TIMEOUT_SECONDS,
+                    )
                 )
 
                 if response.status_code != 200:
@@ -553,7 +582,7 @@ class GoogleAuthService(BaseService[GoogleAuthCallbackRequest, GoogleAuthRespons
         except httpx.TimeoutException:
             raise ExternalServiceException(
                 "Google API 응답 시간 초과",
-                details={"timeout": 10.0},
+                details={"timeout": settings.GOOGLE_OAUTH_TIMEOUT_SECONDS},
             )
         except httpx.RequestError as e:
             raise ExternalServiceException(
@@ -6,23 +6,39 @@ Coaching 도메인 Calculator
 Task 4:
     - generate_ai_suggested_agendas : LLM을 통해 AI 추천 질문 생성
 
+Task 4 (프롬프트 컨텍스트 선택):
+    - select_relevant_summaries     : TF-IDF 유사도 기반 이전 미팅 요약 선택 (토큰 예산 내)
+
+Task 6 (녹음 분할 업로드):
+    - plan_upload_parts             : 전체 크기/파트 크기 → 파트 번호별 기대 크기
+
 Task 6 (BackgroundTask 진입점):
-    - run_ai_pipeline               : AI 파이프라인 전체 실행 (Task 13-14에서 구현)
+    - run_ai_pipeline               : AI 파이프라인 실행 (다운로드 + STT, 이후 단계는 Task 13-14)
+    - run_stt                       : Whisper STT 호출 (청크 분할은 Task 13-14)
 
 Task 13-14 (AI 파이프라인 — 추후 구현):
-    - run_stt                       : Whisper STT 호출 + 청크 분할
     - run_speaker_diarization       : LLM 화자 분리
     - run_timeline_matching_and_summary : 타임라인 구간 매칭 + 구간 요약
     - run_full_summary_and_action_items : 전체 요약 + Action Item 추출
 """
 
-import asyncio
 import json
+import math
 import re
-from typing import Optional
+from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+import httpx
 
 from server.app.core.config import get_settings
+from server.app.core.fakes import fake_transport
 from server.app.core.logging import get_logger
+from server.app.core.resilience import openai_dependency
+from server.app.shared.exceptions import ExternalServiceException
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -30,6 +46,15 @@ settings = get_settings()
 # LLM 타임아웃 (15초, 초과 시 빈 배열 fallback)
 _LLM_TIMEOUT_SECONDS: int = 15
 
+# Whisper STT 타임아웃 (녹음 길이에 비례하므로 LLM보다 길게)
+_STT_TIMEOUT_SECONDS: int = 300
+
+# Whisper 업로드 파일 크기 한도 (25MB)
+_WHISPER_MAX_BYTES: int = 25 * 1024 * 1024
+
+# TF-IDF 토큰 패턴 (영문/숫자 단어, 한글 어절)
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z]+|[가-힣]+")
+
 
 async def generate_ai_suggested_agendas(
     member_rnr_titles: list[str],
@@ -44,22 +69,24 @@ async def generate_ai_suggested_agendas(
 
     타임아웃 15초 초과 또는 API 오류 시 빈 배열을 반환합니다.
     (베타 타협: 10명 규모에서는 동기 방식 허용)
+    호출은 openai_dependency 정책을 따릅니다: 동시 호출 제한(대기 시간도 타임아웃에 포함),
+    상위 deadline 전파, 연속 실패 시 circuit open → 대기 없이 즉시 빈 배열.
 
     Args:
         member_rnr_titles: 팀원의 R&R 제목 목록
-        previous_summaries: 이전 미팅 AI 요약 목록 (N-1, N-2)
+        previous_summaries: 이전 미팅 AI 요약 목록 (최신 요약 + 관련도 상위, 토큰 예산 내)
         is_first_meeting: 첫 미팅 여부
 
     Returns:
         list[str]: AI 추천 질문 목록 (실패 시 빈 배열)
     """
-    if not settings.OPENAI_API_KEY:
+    if not settings.OPENAI_API_KEY and not settings.FAKE_EXTERNAL_SERVICES:
         logger.warning("OPENAI_API_KEY 미설정 → AI 추천 질문 생략")
         return []
 
     try:
-        agendas = await asyncio.wait_for(
-            _call_llm_for_agendas(
+        agendas = await openai_dependency.call(
+            lambda: _call_llm_for_agendas(
                 member_rnr_titles=member_rnr_titles,
                 previous_summaries=previous_summaries,
                 is_first_meeting=is_first_meeting,
@@ -67,9 +94,10 @@ async def generate_ai_suggested_agendas(
             timeout=_LLM_TIMEOUT_SECONDS,
         )
         return agendas
-    except asyncio.TimeoutError:
+    except ExternalServiceException as exc:
         logger.warning(
-            "AI 추천 질문 LLM 타임아웃 (15초 초과) → 빈 배열 fallback"
+            "AI 추천 질문 LLM 호출 불가 (타임아웃 / circuit open) → 빈 배열 fallback",
+            extra={"error": exc.message, **exc.details},
         )
         return []
     except Exception as exc:
@@ -96,9 +124,7 @@ async def _call_llm_for_agendas(
     Returns:
         list[str]: 파싱된 AI 추천 질문 목록
     """
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    client = _create_openai_client()
 
     prompt = _build_agenda_prompt(
         member_rnr_titles=member_rnr_titles,
@@ -129,6 +155,20 @@ async def _call_llm_for_agendas(
     return _parse_agenda_response(raw_content)
 
 
+def _create_openai_client() -> "AsyncOpenAI":
+    """
+    OpenAI 클라이언트를 생성합니다.
+
+    FAKE_EXTERNAL_SERVICES=true 이면 가짜 OpenAI ASGI 앱으로 연결된 클라이언트를 반환합니다.
+    """
+    from openai import AsyncOpenAI
+
+    transport = fake_transport("openai")
+    if transport is None:
+        return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return AsyncOpenAI(api_key="fake", http_client=httpx.AsyncClient(transport=transport))
+
+
 def _build_agenda_prompt(
     member_rnr_titles: list[str],
     previous_summaries: list[str],
@@ -219,11 +259,211 @@ def _parse_agenda_response(raw_content: str) -> list[str]:
 
 
 # =============================================
-# Task 6 — AI 파이프라인 BackgroundTask 진입점
-# (실제 구현은 Task 13-14에서 진행)
+# Task 4 — 프롬프트 컨텍스트 선택
+# =============================================
+
+
+def select_relevant_summaries(
+    query_texts: list[str],
+    summaries: list[str],
+    top_k: int,
+    token_budget: int,
+) -> list[str]:
+    """
+    이전 미팅 요약 중 현재 면담 맥락과 가장 관련 있는 요약을 토큰 예산 내에서 선택합니다.
+
+    선택 규칙:
+        1. 가장 최근 요약(summaries[0])은 대화 연속성을 위해 항상 우선 포함
+        2. 나머지는 query_texts(R&R 제목, 미완료 Action Item)와의 TF-IDF 코사인 유사도 순
+        3. 누적 추정 토큰이 token_budget을 넘는 요약은 건너뜀
+
+    외부 임베딩 서비스 없이 동작하며, 요약별 토큰화 결과는 캐싱되므로
+    새로 완료된 미팅의 요약만 추가로 토큰화됩니다.
+    IDF는 후보 요약(리더-팀원 쌍당 최대 수십 건)만으로 호출마다 계산합니다.
+    후보 집합이 바뀔 때마다 IDF가 달라지므로 벡터를 미리 저장하지 않습니다.
+
+    Args:
+        query_texts: 현재 면담 맥락 텍스트 목록 (R&R 제목, Action Item 등)
+        summaries: 이전 미팅 요약 목록 (최신순)
+        top_k: 최대 선택 건수
+        token_budget: 선택된 요약의 누적 추정 토큰 상한
+
+    Returns:
+        list[str]: 선택된 요약 목록 (최신 요약 → 유사도 내림차순)
+    """
+    if not summaries or top_k <= 0:
+        return []
+
+    doc_terms = [_term_counts(summary) for summary in summaries]
+
+    # 문서 빈도(df) → 평활화 IDF
+    doc_freq: Counter[str] = Counter()
+    for terms in doc_terms:
+        doc_freq.update(terms.keys())
+    n_docs = len(doc_terms)
+    idf = {
+        term: math.log((1 + n_docs) / (1 + df)) + 1.0
+        for term, df in doc_freq.items()
+    }
+
+    query_vec = _tfidf_vector(_term_counts(" ".join(query_texts)), idf)
+    scores = [
+        _cosine(query_vec, _tfidf_vector(terms, idf))
+        for terms in doc_terms
+    ]
+
+    # 최신 요약 우선, 나머지는 유사도 내림차순 (동점이면 최신순)
+    ranked = [0] + sorted(
+        range(1, n_docs),
+        key=lambda i: (-scores[i], i),
+    )
+
+    selected: list[str] = []
+    used_tokens = 0
+    for i in ranked:
+        cost = _estimate_tokens(summaries[i])
+        if used_tokens + cost > token_budget:
+            continue
+        selected.append(summaries[i])
+        used_tokens += cost
+        if len(selected) >= top_k:
+            break
+
+    return selected
+
+
+@lru_cache(maxsize=4096)
+def _term_counts(text: str) -> Counter[str]:
+    """
+    텍스트를 TF-IDF 용어로 분해하여 빈도를 셉니다.
+
+    한글 어절은 조사·어미가 붙어도 매칭되도록 2-gram으로 분해합니다.
+    (예: "자격증을" → "자격", "격증", "증을")
+    호출 측은 반환값을 수정하지 않아야 합니다. (캐시 공유)
+
+    Args:
+        text: 원문 텍스트
+
+    Returns:
+        Counter[str]: {용어: 빈도}
+    """
+    counts: Counter[str] = Counter()
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if token.isascii():
+            counts[token] += 1
+        elif len(token) == 1:
+            counts[token] += 1
+        else:
+            counts.update(token[i:i + 2] for i in range(len(token) - 1))
+    return counts
+
+
+def _tfidf_vector(term_counts: Counter[str], idf: dict[str, float]) -> dict[str, float]:
+    """
+    용어 빈도를 L2 정규화된 TF-IDF 희소 벡터로 변환합니다. (IDF에 없는 용어 제외)
+
+    Args:
+        term_counts: {용어: 빈도}
+        idf: {용어: IDF}
+
+    Returns:
+        dict[str, float]: {용어: 가중치}
+    """
+    vec = {
+        term: (1.0 + math.log(count)) * idf[term]
+        for term, count in term_counts.items()
+        if term in idf
+    }
+    norm = math.sqrt(sum(w * w for w in vec.values()))
+    if norm == 0.0:
+        return {}
+    return {term: w / norm for term, w in vec.items()}
+
+
+def _cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    """정규화된 두 희소 벡터의 코사인 유사도"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(term, 0.0) for term, w in a.items())
+
+
+def _estimate_tokens(text: str) -> int:
+    """LLM 토큰 수 추정 (한국어 기준 약 2자당 1토큰)"""
+    return len(text) // 2 + 1
+
+
+# =============================================
+# Task 6 — 녹음 분할 업로드 / AI 파이프라인 BackgroundTask 진입점
+# (파이프라인 실제 구현은 Task 13-14에서 진행)
 # =============================================
 
 
+def plan_upload_parts(total_bytes: int, part_bytes: int) -> dict[int, int]:
+    """
+    녹음 분할 업로드의 파트 번호별 기대 크기를 계산합니다.
+
+    파트 번호는 1부터 시작하며, 마지막 파트만 part_bytes보다 작을 수 있습니다.
+    업로드된 파트는 이 크기와 일치할 때만 수신 완료로 간주합니다. (중단된 파트 재전송 대상)
+
+    Args:
+        total_bytes: 녹음 파일 전체 크기(바이트)
+        part_bytes: 파트 크기(바이트)
+
+    Returns:
+        dict[int, int]: { part_number: 기대 크기(바이트) }
+    """
+    part_count = max(1, -(-total_bytes // part_bytes))
+    return {
+        part_number: min(part_bytes, total_bytes - (part_number - 1) * part_bytes)
+        for part_number in range(1, part_count + 1)
+    }
+
+
+async def run_stt(audio_bytes: bytes, filename: str = "audio.webm") -> list[dict]:
+    """
+    OpenAI Whisper로 녹음 파일을 STT 처리하여 구간 목록을 반환합니다.
+
+    호출은 openai_dependency 정책(동시 호출 제한, 타임아웃, circuit breaker)을 따릅니다.
+    Whisper 업로드 한도(25MB) 초과 파일의 청크 분할은 Task 13-14에서 구현하며,
+    현재는 한도 초과 시 예외를 발생시켜 파이프라인을 FAILED로 종료합니다.
+
+    Args:
+        audio_bytes: 녹음 파일 전체
+        filename: 업로드 파일명 (확장자로 포맷 판별)
+
+    Returns:
+        list[dict]: STT 구간 [{start, end, text, speaker}, ...] (speaker는 화자 분리 전 None)
+
+    Raises:
+        ExternalServiceException: 파일 크기 초과, 타임아웃, circuit open, API 오류 시
+    """
+    if len(audio_bytes) > _WHISPER_MAX_BYTES:
+        raise ExternalServiceException(
+            "Whisper 업로드 한도를 초과한 녹음 파일입니다",
+            details={"size": len(audio_bytes), "limit": _WHISPER_MAX_BYTES},
+        )
+
+    async def _transcribe() -> list[dict]:
+        client = _create_openai_client()
+        response = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(filename, audio_bytes),
+            response_format="verbose_json",
+            language="ko",
+        )
+        return [
+            {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text.strip(),
+                "speaker": None,
+            }
+            for segment in (response.segments or [])
+        ]
+
+    return await openai_dependency.call(_transcribe, timeout=_STT_TIMEOUT_SECONDS)
+
+
 async def run_ai_pipeline(meeting_id: str) -> None:
     """
     AI 파이프라인 전체를 실행합니다. (BackgroundTask로 호출됨)
@@ -236,36 +476,52 @@ async def run_ai_pipeline(meeting_id: str) -> None:
         5. 전체 요약 + Action Item 추출 (LLM)
         6. TbCoachingRelation 통계 갱신 + status=COMPLETED 전환
 
-    현재 상태: Task 13-14 구현 전 placeholder
-        - meeting status를 COMPLETED로 전환하지 않음
-        - 실패 시 mark_meeting_failed 호출하여 FAILED 전환
+    현재 구현 범위: 1~2단계 (다운로드, STT + 트랜스크립트 구간 저장)
+        - 단계 시작마다 진행 상황을 기록하고 SSE 구독자에게 발행 (False면 이미 FAILED → 중단)
+        - 3~6단계와 COMPLETED 전환(finalize_meeting)은 Task 13-14에서 구현
+          (그 전까지 미팅은 PROCESSING으로 남고, 스케줄러가 고착 미팅을 FAILED 처리)
+        - 실패 시 FAILED 전환 + status_changed(FAILED) 종료 이벤트 발행
 
     Args:
         meeting_id: 미팅 UUID 문자열
     """
-    logger.info(
-        "[AI Pipeline] 파이프라인 시작 (placeholder)",
-        extra={"meeting_id": meeting_id},
-    )
+    # service 모듈이 calculators를 import하므로 순환 import 방지를 위해 함수 내부에서 import
+    from server.app.core.database import AsyncSessionLocal
+    from server.app.domain.coaching.service import CoachingPipelineService
 
-    # Task 13-14에서 실제 파이프라인 구현
-    # 현재는 placeholder로 로그만 남기고 종료
-    # 실제 구현 시 아래 단계 추가:
-    #
-    # from server.app.core.database import AsyncSessionLocal
-    # async with AsyncSessionLocal() as db:
-    #     try:
-    #         audio_bytes = await _download_audio(meeting_id, db)
-    #         transcript = await run_stt(audio_bytes)
-    #         labeled = await run_speaker_diarization(transcript, ...)
-    #         await run_timeline_matching_and_summary(meeting_id, labeled, db)
-    #         await run_full_summary_and_action_items(meeting_id, db)
-    #         await finalize_meeting(meeting_id, db)
-    #     except Exception as e:
-    #         logger.error(f"[AI Pipeline] 실패: {e}", exc_info=True)
-    #         await mark_meeting_failed_db(meeting_id, db)
+    logger.info("[AI Pipeline] 파이프라인 시작", extra={"meeting_id": meeting_id})
+
+    async with AsyncSessionLocal() as db:
+        pipeline = CoachingPipelineService(db)
+        try:
+            if not await pipeline.report_stage(meeting_id, "DOWNLOAD"):
+                return
+            audio_bytes = await pipeline.load_audio(meeting_id)
+
+            if not await pipeline.report_stage(meeting_id, "STT"):
+                return
+            transcript = await run_stt(audio_bytes)
+            saved = await pipeline.save_transcript(meeting_id, transcript)
+
+            # Task 13-14에서 이어서 구현:
+            #     labeled = await run_speaker_diarization(transcript, ...)
+            #     await pipeline.save_transcript(meeting_id, labeled)
+            #     if not await pipeline.report_stage(meeting_id, "SUMMARY"):
+            #         return
+            #     await run_timeline_matching_and_summary(meeting_id, labeled, db)
+            #     await run_full_summary_and_action_items(meeting_id, db)
+            #     await pipeline.finalize_meeting(meeting_id)  # COMPLETED + 검색 색인 + DONE 이벤트
+        except Exception as exc:
+            logger.error(
+                "[AI Pipeline] 실패 → FAILED 전환",
+                extra={"meeting_id": meeting_id, "error": str(exc)},
+                exc_info=True,
+            )
+            await db.rollback()
+            await pipeline.fail_meeting(meeting_id)
+            return
 
     logger.info(
-        "[AI Pipeline] placeholder 완료 — Task 13-14에서 실제 구현 예정",
-        extra={"meeting_id": meeting_id},
+        "[AI Pipeline] STT 완료 — 요약 단계는 Task 13-14에서 구현 예정",
+        extra={"meeting_id": meeting_id, "segment_count": saved},
     )
@@ -2,4 +2,76 @@
 Coaching 도메인 Formatter
 
 응답 데이터 변환 담당 (비즈니스 로직, DB 접근 금지)
+
+Task 9:
+    - format_search_snippet : 검색 스니펫 공백 정리 + 검색어 하이라이트 구간 계산
+
+Task 13:
+    - format_pipeline_stage : 미팅 상태 + 파이프라인 단계 → 진행 상황 표시 단계
 """
+
+import re
+from typing import Optional
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def format_search_snippet(
+    snippet: str,
+    terms: list[str],
+) -> tuple[str, list[tuple[int, int]]]:
+    """
+    검색 스니펫의 공백을 정리하고 검색어가 등장하는 구간을 계산합니다.
+
+    HTML 태그를 삽입하지 않고 [start, end) 오프셋만 반환하여
+    클라이언트가 안전하게 하이라이트를 렌더링하도록 합니다.
+
+    Args:
+        snippet: DB에서 잘라온 원본 스니펫
+        terms: 검색어 목록
+
+    Returns:
+        tuple: (정리된 스니펫, [(start, end), ...] 오름차순·비중첩 하이라이트 구간)
+    """
+    text = _WHITESPACE_PATTERN.sub(" ", snippet).strip()
+    lowered = text.lower()
+
+    spans: list[tuple[int, int]] = []
+    for term in terms:
+        needle = term.lower()
+        if not needle:
+            continue
+        start = lowered.find(needle)
+        while start != -1:
+            spans.append((start, start + len(needle)))
+            start = lowered.find(needle, start + len(needle))
+
+    # 겹치는 구간 병합
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return text, merged
+
+
+def format_pipeline_stage(status: str, pipeline_stage: Optional[str]) -> Optional[str]:
+    """
+    미팅 상태와 파이프라인 단계를 진행 상황 표시 단계로 변환합니다.
+
+    Args:
+        status: 미팅 상태
+        pipeline_stage: tb_meeting.pipeline_stage (DOWNLOAD | STT | SUMMARY | None)
+
+    Returns:
+        str | None: DOWNLOAD | STT | SUMMARY | DONE | FAILED (파이프라인 시작 전 None)
+    """
+    if status == "COMPLETED":
+        return "DONE"
+    if status == "FAILED":
+        return "FAILED"
+    if status == "PROCESSING":
+        return pipeline_stage
+    return None
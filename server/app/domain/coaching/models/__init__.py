@@ -10,10 +10,13 @@ Coaching AI 도메인 모델
 - TbMeetingActionItem: tb_meeting_action_item (Action Item)
 - TbMeetingRecord    : tb_meeting_record    (녹음 및 AI 분석 결과)
 - TbMeetingTimeline  : tb_meeting_timeline  (실시간 타임라인)
+- TbMeetingTranscriptSegment: tb_meeting_transcript_segment (STT 구간 단위 저장)
+- TbMeetingSearchDocument : tb_meeting_search_document (미팅 검색 문서)
 
 생성 순서 (FK 의존성):
   tb_meeting → tb_coaching_relation (last_meeting_id FK)
   tb_meeting → tb_meeting_agenda, tb_meeting_action_item, tb_meeting_record, tb_meeting_timeline
+  tb_meeting → tb_meeting_transcript_segment, tb_meeting_search_document
   tb_rr → tb_meeting_timeline (rr_id FK)
 """
 
@@ -22,13 +25,17 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -101,6 +108,32 @@ class TbMeeting(Base):
         comment="리더 전용 비공개 메모",
     )
 
+    state_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="미팅 실행 화면 상태 버전 (아젠다/Action Item/타임라인/메모 변경 시 +1)",
+    )
+
+    pipeline_stage: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        nullable=True,
+        comment="AI 파이프라인 진행 단계: DOWNLOAD | STT | SUMMARY (PROCESSING 중에만 의미)",
+    )
+
+    upload_total_bytes: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        comment="분할 업로드 세션의 녹음 파일 전체 크기(바이트) — 종료 시 최종 객체 크기 검증",
+    )
+
+    upload_part_bytes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="분할 업로드 세션의 파트 크기(바이트) — 마지막 파트만 더 작음",
+    )
+
     in_date: Mapped[datetime] = mapped_column(
         DateTime,
         default=datetime.utcnow,
@@ -354,11 +387,14 @@ class TbMeetingRecord(Base):
 
     GCS 경로: meetings/{leader_emp_no}/{meeting_id}/original_audio.webm
 
-    stt_transcript JSON 구조:
+    stt_transcript JSON 구조 (레거시):
     [
       {"start": 0.0, "end": 5.2, "text": "...", "speaker": "LEADER"},
       {"start": 5.5, "end": 12.0, "text": "...", "speaker": "MEMBER"},
     ]
+
+    STT 결과는 tb_meeting_transcript_segment에 구간 단위로 저장합니다.
+    stt_transcript는 deferred 컬럼이므로 selectinload(TbMeeting.record) 시 로드되지 않습니다.
     """
 
     __tablename__ = "tb_meeting_record"
@@ -387,6 +423,7 @@ class TbMeetingRecord(Base):
     stt_transcript: Mapped[Optional[dict]] = mapped_column(
         JSONB,
         nullable=True,
+        deferred=True,
         comment="STT 결과 JSON [{start, end, text, speaker}, ...]",
     )
 
@@ -414,12 +451,22 @@ class TbMeetingTimeline(Base):
     실시간 타임라인 기록 테이블 (tb_meeting_timeline)
 
     start_time / end_time은 녹음 시작 기준 상대 시간(초)입니다.
-    end_time이 None인 카드는 현재 진행 중인 카드입니다.
+    end_time이 None인 카드는 현재 진행 중인 카드입니다. (미팅당 최대 1개 — 부분 유니크 인덱스)
     segment_summary는 AI 파이프라인이 채워줍니다.
     """
 
     __tablename__ = "tb_meeting_timeline"
 
+    __table_args__ = (
+        Index(
+            "uq_timeline_open_per_meeting",
+            "meeting_id",
+            unique=True,
+            postgresql_where=text("end_time IS NULL"),
+            sqlite_where=text("end_time IS NULL"),
+        ),
+    )
+
     timeline_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
@@ -472,6 +519,160 @@ class TbMeetingTimeline(Base):
         )
 
 
+class TbMeetingTranscriptSegment(Base):
+    """
+    STT 트랜스크립트 구간 테이블 (tb_meeting_transcript_segment)
+
+    녹음 길이에 비례해 커지는 STT 결과를 tb_meeting_record와 분리하여 구간(row) 단위로 저장합니다.
+    (meeting_id, start_time) 인덱스로 리포트 화면의 구간 페이지 조회를 처리합니다.
+
+    start_time / end_time은 녹음 시작 기준 상대 시간(초, 소수점 포함)입니다.
+    """
+
+    __tablename__ = "tb_meeting_transcript_segment"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "meeting_id",
+            "seq",
+            name="uq_transcript_segment_seq",
+        ),
+        Index(
+            "ix_transcript_segment_meeting_start",
+            "meeting_id",
+            "start_time",
+        ),
+    )
+
+    segment_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        comment="구간 ID (UUID)",
+    )
+
+    meeting_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tb_meeting.meeting_id", ondelete="CASCADE"),
+        nullable=False,
+        comment="미팅 ID",
+    )
+
+    seq: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="구간 순번 (0부터 시작, STT 결과 순서)",
+    )
+
+    start_time: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="구간 시작 시간 (녹음 시작 기준 상대 초)",
+    )
+
+    end_time: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="구간 종료 시간 (녹음 시작 기준 상대 초)",
+    )
+
+    speaker: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        nullable=True,
+        comment="화자 (LEADER / MEMBER, 화자 분리 전이면 NULL)",
+    )
+
+    text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="구간 발화 텍스트",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TbMeetingTranscriptSegment(meeting_id='{self.meeting_id}', "
+            f"seq={self.seq}, start_time={self.start_time})>"
+        )
+
+
+class TbMeetingSearchDocument(Base):
+    """
+    미팅 검색 문서 테이블 (tb_meeting_search_document)
+
+    ai_summary + 타임라인 segment_summary + STT 트랜스크립트를 하나의 search_text로 합쳐
+    pg_trgm GIN 인덱스로 부분 문자열 검색을 제공합니다.
+    (한국어는 PostgreSQL 기본 tsvector 사전으로 형태소 분리가 되지 않으므로 trigram 사용)
+
+    AI 파이프라인 finalize 단계에서 미팅 단위로 재생성됩니다.
+    private_memo는 팀원에게 노출되면 안 되므로 포함하지 않습니다.
+    """
+
+    __tablename__ = "tb_meeting_search_document"
+
+    __table_args__ = (
+        Index(
+            "ix_meeting_search_leader",
+            "leader_emp_no",
+            "completed_at",
+        ),
+        Index(
+            "ix_meeting_search_member",
+            "member_emp_no",
+            "completed_at",
+        ),
+        Index(
+            "ix_meeting_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
+
+    meeting_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tb_meeting.meeting_id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="미팅 ID (1:1 관계)",
+    )
+
+    leader_emp_no: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="리더 사번 (검색 범위 필터)",
+    )
+
+    member_emp_no: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="팀원 사번 (검색 범위 필터)",
+    )
+
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="미팅 종료일시 (UTC, 동점 정렬용)",
+    )
+
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="검색 대상 텍스트 (요약 + 구간 요약 + 트랜스크립트)",
+    )
+
+    up_date: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        comment="색인 갱신일시 (UTC)",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TbMeetingSearchDocument(meeting_id='{self.meeting_id}', "
+            f"leader='{self.leader_emp_no}', member='{self.member_emp_no}')>"
+        )
+
+
 __all__ = [
     "TbMeeting",
     "TbCoachingRelation",
@@ -479,4 +680,6 @@ __all__ = [
     "TbMeetingActionItem",
     "TbMeetingRecord",
     "TbMeetingTimeline",
+    "TbMeetingTranscriptSegment",
+    "TbMeetingSearchDocument",
 ]
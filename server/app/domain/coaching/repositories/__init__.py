@@ -18,15 +18,16 @@ Coaching 도메인 Repository
     - find_previous_completed_meetings : leader-member 간 이전 COMPLETED 미팅 조회
     - find_incomplete_action_items   : 미완료 Action Item 조회
     - find_member_rnr_titles         : 팀원 R&R 제목 목록 조회 (LLM 프롬프트용)
+    - find_completed_meeting_summaries : leader-member 간 이전 미팅 AI 요약 목록 조회 (LLM 프롬프트용)
 
 메서드 목록 (Task 5):
-    - start_meeting                  : 미팅 IN_PROGRESS 전환 + started_at 기록
-    - insert_agendas                 : 아젠다 일괄 INSERT
-    - copy_action_items_as_carried_over : 이전 미팅 미완료 Action Item 이월 복사 INSERT
+    - transition_meeting_status      : 조건부 UPDATE ... RETURNING 상태 전이 (MEETING_STATUS_TRANSITIONS)
+    - _bump_state_version            : 미팅 실행 화면 state_version +1 (변경 메서드 트랜잭션 내 호출)
+    - start_meeting_with_carry_over  : 미팅 IN_PROGRESS 전환 + 아젠다 INSERT + Action Item 이월
+                                       (단일 트랜잭션, INSERT ... SELECT)
     - find_meeting_with_active_data  : 미팅 + 아젠다 + 액션아이템 + 타임라인 일괄 조회
     - find_member_rnr_tree           : 팀원 R&R 계층 구조 조회
-    - create_timeline                : 타임라인 카드 생성
-    - find_open_timeline             : end_time IS NULL 타임라인 조회
+    - switch_timeline                : 활성 타임라인 마감 + 신규 카드 생성 + state_version 증가 (CTE, 단일 statement)
     - patch_timeline                 : 타임라인 카드 업데이트
     - update_meeting_memo            : 개인 메모 업데이트
     - toggle_agenda_complete         : 아젠다 완료 토글
@@ -35,24 +36,58 @@ Coaching 도메인 Repository
     - find_agenda_max_order          : 현재 미팅 아젠다 최대 order 조회
 
 메서드 목록 (Task 6):
-    - complete_meeting                 : 미팅 PROCESSING 전환 + completed_at/actual_duration 기록
-    - create_meeting_record            : TbMeetingRecord INSERT (audio_file_url 포함)
-    - upsert_coaching_relation         : TbCoachingRelation UPSERT (없으면 INSERT, 있으면 UPDATE)
-    - close_open_timeline_with_duration : 미팅 종료 시 마지막 활성 타임라인 자동 마감
-    - mark_meeting_failed              : 미팅 status = FAILED 전환
+    - complete_meeting                 : 미팅 PROCESSING 전환 + 활성 타임라인 마감 + TbMeetingRecord UPSERT
+                                         + TbCoachingRelation UPSERT (단일 트랜잭션)
+    - mark_meeting_failed              : 미팅 status = FAILED 전환 (COMPLETED 제외)
     - find_stuck_processing_meetings   : 30분 이상 PROCESSING 고착 미팅 조회 (스케줄러용)
+    - record_pipeline_stage            : AI 파이프라인 진행 단계 기록 + state_version 증가 (PROCESSING만)
+    - save_upload_session              : 녹음 분할 업로드 세션(전체 크기, 파트 크기) 기록
 
 메서드 목록 (Task 7):
     - find_meetings_by_member          : 팀원별 미팅 히스토리 목록 조회 (최신순)
     - find_meeting_with_report_data    : 미팅 리포트용 데이터 조회 (record + timelines + action_items)
+
+메서드 목록 (Task 8):
+    - replace_transcript_segments      : STT 구간 일괄 저장 (기존 구간 교체)
+    - find_transcript_segments         : 시간 구간 기준 트랜스크립트 페이지 조회
+
+메서드 목록 (Task 9):
+    - upsert_meeting_search_document   : 미팅 검색 문서 재생성 (INSERT ... SELECT ON CONFLICT)
+    - search_meetings                  : 요청자 범위 미팅 검색 (trigram 인덱스) + 스니펫 구간 추출
+
+메서드 목록 (Task 10):
+    - find_members_info                : 팀원 인사정보 일괄 조회 (IN)
+    - find_completed_meetings_by_members : 팀원별 최근 COMPLETED 미팅 + AI 요약 일괄 조회 (윈도우 함수)
+    - find_member_rnr_titles_by_emp_nos : 팀원별 R&R 제목 일괄 조회 (IN)
+
+메서드 목록 (Task 11):
+    - apply_meeting_ops                : 미팅 실행 화면 변경 op 일괄 적용 (단일 트랜잭션, bulk statement)
+
+메서드 목록 (Task 12):
+    - save_meeting_memos               : 자동 저장 버퍼의 미팅별 최종 메모 일괄 저장 (executemany UPDATE)
 """
 
 import uuid
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-from sqlalchemy import and_, desc, select, update
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    desc,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -63,7 +98,9 @@ from server.app.domain.coaching.models import (
     TbMeetingActionItem,
     TbMeetingAgenda,
     TbMeetingRecord,
+    TbMeetingSearchDocument,
     TbMeetingTimeline,
+    TbMeetingTranscriptSegment,
 )
 from server.app.domain.hr.models.department import CMDepartment
 from server.app.domain.hr.models.employee import HRMgnt
@@ -75,6 +112,31 @@ logger = get_logger(__name__)
 # 팀원 직책 코드
 MEMBER_POSITION_CODE: str = "P005"
 
+# 미팅 상태 전이 규칙: { 목표 상태: 허용되는 현재 상태 목록 }
+# 조건부 UPDATE(WHERE status IN (...))로 DB가 전이 가능 여부를 판정합니다.
+MEETING_STATUS_TRANSITIONS: dict[str, tuple[str, ...]] = {
+    "IN_PROGRESS": ("REQUESTED",),
+    "PROCESSING": ("REQUESTED", "IN_PROGRESS", "FAILED"),
+    "COMPLETED": ("PROCESSING",),
+    "FAILED": ("REQUESTED", "IN_PROGRESS", "PROCESSING"),
+}
+
+
+def _parse_uuid(value: str, label: str, key: str) -> uuid.UUID:
+    """
+    UUID 문자열을 파싱합니다. 형식이 잘못되면 해당 대상을 찾을 수 없는 것으로 처리합니다.
+
+    Raises:
+        NotFoundException: 유효하지 않은 UUID 문자열일 때
+    """
+    try:
+        return uuid.UUID(value)
+    except ValueError as exc:
+        raise NotFoundException(
+            message=f"유효하지 않은 {label} ID입니다",
+            details={key: value},
+        ) from exc
+
 
 class CoachingRepository:
     """
@@ -155,13 +217,14 @@ class CoachingRepository:
         leader_dept_code: str,
         dept_code_filter: Optional[str] = None,
         search_name: Optional[str] = None,
+        dept_codes: Optional[list[str]] = None,
     ) -> list[dict[str, Any]]:
         """
         팀원 목록과 코칭 통계를 함께 조회합니다 (LEFT JOIN).
 
         - position_code == 'P005' (팀원만)
         - on_work_yn == 'Y' (재직자만)
-        - dept_code == leader_dept_code (같은 부서)
+        - dept_code == leader_dept_code (같은 부서, dept_codes 지정 시 dept_code IN dept_codes)
         - emp_no != leader_emp_no (리더 자신 제외)
 
         Args:
@@ -169,6 +232,7 @@ class CoachingRepository:
             leader_dept_code: 리더 부서 코드
             dept_code_filter: 부서 코드 추가 필터 (optional)
             search_name: 이름 검색어 (optional, 2자 미만 시 전체 조회)
+            dept_codes: 조회 부서 코드 목록 (optional, 리더 부서 + 하위 부서)
 
         Returns:
             list[dict]: 팀원 목록 (emp_no, emp_name, dept_name, last_meeting_date, total_meeting_count)
@@ -180,6 +244,7 @@ class CoachingRepository:
                 "leader_dept_code": leader_dept_code,
                 "dept_code_filter": dept_code_filter,
                 "search_name": search_name,
+                "dept_count": len(dept_codes) if dept_codes else 1,
             },
         )
 
@@ -188,7 +253,11 @@ class CoachingRepository:
             conditions = [
                 HRMgnt.position_code == MEMBER_POSITION_CODE,
                 HRMgnt.on_work_yn == "Y",
-                HRMgnt.dept_code == leader_dept_code,
+                (
+                    HRMgnt.dept_code.in_(dept_codes)
+                    if dept_codes
+                    else HRMgnt.dept_code == leader_dept_code
+                ),
                 HRMgnt.emp_no != leader_emp_no,
             ]
 
@@ -414,6 +483,7 @@ class CoachingRepository:
         leader-member 간 이전 COMPLETED 미팅을 최신 순으로 조회합니다.
 
         이월 Action Item 및 사전 준비 데이터 로드에 사용합니다.
+        AI 요약은 find_completed_meeting_summaries로 별도 조회합니다.
 
         Args:
             leader_emp_no: 리더 사번
@@ -434,7 +504,6 @@ class CoachingRepository:
 
         stmt = (
             select(TbMeeting)
-            .options(selectinload(TbMeeting.record))
             .where(
                 and_(
                     TbMeeting.leader_emp_no == leader_emp_no,
@@ -478,6 +547,51 @@ class CoachingRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_completed_meeting_summaries(
+        self,
+        leader_emp_no: str,
+        member_emp_no: str,
+        limit: int,
+    ) -> list[str]:
+        """
+        leader-member 간 이전 COMPLETED 미팅의 AI 요약을 최신 순으로 조회합니다.
+
+        LLM 프롬프트에 넣을 요약 후보군 조회용이며, ai_summary 컬럼만 조회합니다.
+
+        Args:
+            leader_emp_no: 리더 사번
+            member_emp_no: 팀원 사번
+            limit: 조회할 최대 건수
+
+        Returns:
+            list[str]: 최신 순 AI 요약 목록 (요약이 없는 미팅 제외)
+        """
+        logger.info(
+            "find_completed_meeting_summaries called",
+            extra={
+                "leader_emp_no": leader_emp_no,
+                "member_emp_no": member_emp_no,
+                "limit": limit,
+            },
+        )
+
+        stmt = (
+            select(TbMeetingRecord.ai_summary)
+            .join(TbMeeting, TbMeeting.meeting_id == TbMeetingRecord.meeting_id)
+            .where(
+                and_(
+                    TbMeeting.leader_emp_no == leader_emp_no,
+                    TbMeeting.member_emp_no == member_emp_no,
+                    TbMeeting.status == "COMPLETED",
+                    TbMeetingRecord.ai_summary.is_not(None),
+                )
+            )
+            .order_by(desc(TbMeeting.completed_at))
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return [row.ai_summary for row in result.all()]
+
     async def find_member_rnr_titles(self, member_emp_no: str) -> list[str]:
         """
         팀원의 R&R 제목 목록을 조회합니다. (LLM 프롬프트 구성용)
@@ -515,149 +629,267 @@ class CoachingRepository:
     # Task 5 — 미팅 실행 Repository 메서드
     # =============================================
 
-    async def start_meeting(self, meeting: TbMeeting) -> TbMeeting:
+    async def _apply_status_transition(
+        self,
+        meeting_id: uuid.UUID,
+        to_status: str,
+        values: Optional[dict[str, Any]] = None,
+    ) -> Optional[TbMeeting]:
         """
-        미팅 상태를 IN_PROGRESS로 전환하고 started_at을 기록합니다.
+        조건부 UPDATE ... RETURNING 으로 미팅 상태를 전이합니다. (commit하지 않음)
+
+        UPDATE tb_meeting SET status=:to, state_version=state_version+1, ...
+        WHERE meeting_id=:id AND status IN (:from...) RETURNING *
+
+        호출 측 트랜잭션 안에서 후속 statement와 함께 사용합니다.
 
         Args:
-            meeting: 상태를 변경할 TbMeeting ORM 객체
+            meeting_id: 미팅 UUID
+            to_status: 목표 상태 (MEETING_STATUS_TRANSITIONS 키)
+            values: 상태와 함께 갱신할 컬럼 값
 
         Returns:
-            TbMeeting: 업데이트된 미팅 ORM 객체
+            TbMeeting | None: 전이된 미팅 (현재 상태에서 전이 불가하면 None)
         """
-        logger.info("start_meeting called", extra={"meeting_id": str(meeting.meeting_id)})
-
-        try:
-            meeting.status = "IN_PROGRESS"
-            meeting.started_at = datetime.utcnow()
-            self.db.add(meeting)
-            await self.db.commit()
-            await self.db.refresh(meeting)
-
-            logger.info("start_meeting 완료", extra={"meeting_id": str(meeting.meeting_id)})
-            return meeting
-
-        except Exception as exc:
-            await self.db.rollback()
-            logger.error(
-                "start_meeting 실패",
-                extra={"meeting_id": str(meeting.meeting_id), "error": str(exc)},
+        stmt = (
+            update(TbMeeting)
+            .where(
+                and_(
+                    TbMeeting.meeting_id == meeting_id,
+                    TbMeeting.status.in_(MEETING_STATUS_TRANSITIONS[to_status]),
+                )
             )
-            raise RepositoryException(
-                "미팅 시작 처리에 실패했습니다",
-                details={"meeting_id": str(meeting.meeting_id)},
-            ) from exc
+            .values(
+                status=to_status,
+                state_version=TbMeeting.state_version + 1,
+                **(values or {}),
+            )
+            .returning(TbMeeting)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
 
-    async def insert_agendas(
+    async def transition_meeting_status(
         self,
         meeting_id: uuid.UUID,
-        agendas: list[dict[str, Any]],
-    ) -> list[TbMeetingAgenda]:
+        to_status: str,
+        values: Optional[dict[str, Any]] = None,
+    ) -> Optional[TbMeeting]:
         """
-        아젠다 목록을 일괄 INSERT합니다.
+        미팅 상태를 단일 round trip으로 전이합니다.
+
+        전이 가능 여부(MEETING_STATUS_TRANSITIONS)는 DB의 조건부 UPDATE가 판정하므로
+        동시 요청 중 하나만 성공하며, 나머지는 None을 받습니다.
 
         Args:
             meeting_id: 미팅 UUID
-            agendas: [{"content": str, "source": str, "order": int}, ...] 형태의 아젠다 목록
+            to_status: 목표 상태
+            values: 상태와 함께 갱신할 컬럼 값
 
         Returns:
-            list[TbMeetingAgenda]: 생성된 아젠다 ORM 객체 목록
+            TbMeeting | None: 전이된 미팅 (전이 불가하면 None)
+
+        Raises:
+            RepositoryException: DB 처리 실패 시
         """
         logger.info(
-            "insert_agendas called",
-            extra={"meeting_id": str(meeting_id), "count": len(agendas)},
+            "transition_meeting_status called",
+            extra={"meeting_id": str(meeting_id), "to_status": to_status},
         )
 
         try:
-            agenda_objects = [
-                TbMeetingAgenda(
-                    agenda_id=uuid.uuid4(),
-                    meeting_id=meeting_id,
-                    content=item["content"],
-                    source=item["source"],
-                    order=item["order"],
-                    is_completed=False,
+            meeting = await self._apply_status_transition(meeting_id, to_status, values)
+            if meeting is None:
+                await self.db.rollback()
+                logger.info(
+                    "transition_meeting_status 생략 (전이 불가 상태)",
+                    extra={"meeting_id": str(meeting_id), "to_status": to_status},
                 )
-                for item in agendas
-            ]
-            self.db.add_all(agenda_objects)
+                return None
+
             await self.db.commit()
 
             logger.info(
-                "insert_agendas 완료",
-                extra={"meeting_id": str(meeting_id), "inserted": len(agenda_objects)},
+                "transition_meeting_status 완료",
+                extra={"meeting_id": str(meeting_id), "to_status": to_status},
             )
-            return agenda_objects
+            return meeting
 
         except Exception as exc:
             await self.db.rollback()
             logger.error(
-                "insert_agendas 실패",
-                extra={"meeting_id": str(meeting_id), "error": str(exc)},
+                "transition_meeting_status 실패",
+                extra={"meeting_id": str(meeting_id), "to_status": to_status, "error": str(exc)},
             )
             raise RepositoryException(
-                "아젠다 INSERT에 실패했습니다",
-                details={"meeting_id": str(meeting_id)},
+                "미팅 상태 변경에 실패했습니다",
+                details={"meeting_id": str(meeting_id), "to_status": to_status},
             ) from exc
 
-    async def copy_action_items_as_carried_over(
+    async def _bump_state_version(
         self,
         meeting_id: uuid.UUID,
-        source_items: list[TbMeetingActionItem],
-    ) -> list[TbMeetingActionItem]:
+        private_memo: Optional[str] = None,
+    ) -> int:
         """
-        이전 미팅의 미완료 Action Item을 현재 미팅으로 이월 복사 INSERT합니다.
+        미팅 실행 화면 state_version을 +1 합니다. (commit하지 않음)
 
-        - is_carried_over = True
-        - origin_meeting_id = 원본 meeting_id
-        - assignee = 원본 값 그대로 복사
-        - is_completed = False
+        변경 메서드의 트랜잭션 안에서 호출되며, tb_meeting 행 잠금으로
+        같은 미팅에 대한 동시 변경을 직렬화합니다.
 
         Args:
-            meeting_id: 현재 미팅 UUID (이월 대상)
-            source_items: 복사할 원본 Action Item 목록
+            meeting_id: 미팅 UUID
+            private_memo: 함께 저장할 메모 (None이면 기존 값 유지)
 
         Returns:
-            list[TbMeetingActionItem]: 이월 복사된 Action Item 목록
+            int: 증가된 state_version
         """
-        if not source_items:
-            return []
+        values: dict[str, Any] = {"state_version": TbMeeting.state_version + 1}
+        if private_memo is not None:
+            values["private_memo"] = private_memo
+
+        result = await self.db.execute(
+            update(TbMeeting)
+            .where(TbMeeting.meeting_id == meeting_id)
+            .values(**values)
+            .returning(TbMeeting.state_version)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one()
+
+    async def start_meeting_with_carry_over(
+        self,
+        meeting_id: uuid.UUID,
+        leader_emp_no: str,
+        member_emp_no: str,
+        agendas: list[dict[str, Any]],
+        carry_over_meeting_limit: int = 2,
+    ) -> Optional[int]:
+        """
+        미팅 시작 처리를 하나의 트랜잭션으로 수행합니다.
+
+        1. UPDATE tb_meeting SET status='IN_PROGRESS' ... WHERE status='REQUESTED' RETURNING
+           (조건부 UPDATE — 동시 시작 요청 중 하나만 성공)
+        2. 아젠다 multi-row INSERT
+        3. INSERT INTO tb_meeting_action_item SELECT ... — 최근 COMPLETED 미팅(N-1, N-2)의
+           미완료 Action Item을 서버 측에서 이월 복사 (이월 건수와 무관하게 1 statement)
+           - is_carried_over = True, origin_meeting_id = 원본 meeting_id
+           - assignee = 원본 값 그대로 복사, is_completed = False
+
+        Args:
+            meeting_id: 시작할 미팅 UUID
+            leader_emp_no: 리더 사번
+            member_emp_no: 팀원 사번
+            agendas: [{"content": str, "source": str, "order": int}, ...] 형태의 아젠다 목록
+            carry_over_meeting_limit: 이월 대상 이전 미팅 수 (기본 2건 — N-1, N-2)
+
+        Returns:
+            int | None: 이월 복사된 Action Item 수 (REQUESTED 상태가 아니어서 시작되지 않았으면 None)
 
+        Raises:
+            RepositoryException: DB 처리 실패 시
+        """
         logger.info(
-            "copy_action_items_as_carried_over called",
-            extra={"meeting_id": str(meeting_id), "source_count": len(source_items)},
+            "start_meeting_with_carry_over called",
+            extra={"meeting_id": str(meeting_id), "agenda_count": len(agendas)},
         )
 
         try:
-            carried_items = [
-                TbMeetingActionItem(
-                    action_item_id=uuid.uuid4(),
-                    meeting_id=meeting_id,
-                    origin_meeting_id=item.meeting_id,
-                    is_carried_over=True,
-                    content=item.content,
-                    assignee=item.assignee,
-                    is_completed=False,
+            # 1. 상태 전환 (REQUESTED → IN_PROGRESS)
+            started = await self._apply_status_transition(
+                meeting_id,
+                "IN_PROGRESS",
+                {"started_at": datetime.utcnow()},
+            )
+            if started is None:
+                await self.db.rollback()
+                logger.info(
+                    "start_meeting_with_carry_over 생략 (REQUESTED 아님)",
+                    extra={"meeting_id": str(meeting_id)},
                 )
-                for item in source_items
-            ]
-            self.db.add_all(carried_items)
+                return None
+
+            # 2. 아젠다 INSERT
+            if agendas:
+                await self.db.execute(
+                    insert(TbMeetingAgenda),
+                    [
+                        {
+                            "agenda_id": uuid.uuid4(),
+                            "meeting_id": meeting_id,
+                            "content": item["content"],
+                            "source": item["source"],
+                            "order": item["order"],
+                            "is_completed": False,
+                        }
+                        for item in agendas
+                    ],
+                )
+
+            # 3. 미완료 Action Item 이월 (INSERT ... SELECT)
+            previous_meeting_ids = (
+                select(TbMeeting.meeting_id)
+                .where(
+                    and_(
+                        TbMeeting.leader_emp_no == leader_emp_no,
+                        TbMeeting.member_emp_no == member_emp_no,
+                        TbMeeting.status == "COMPLETED",
+                    )
+                )
+                .order_by(desc(TbMeeting.completed_at))
+                .limit(carry_over_meeting_limit)
+            )
+            carry_over_source = select(
+                func.gen_random_uuid(),
+                literal(meeting_id),
+                TbMeetingActionItem.meeting_id,
+                true(),
+                TbMeetingActionItem.content,
+                TbMeetingActionItem.assignee,
+                false(),
+            ).where(
+                and_(
+                    TbMeetingActionItem.meeting_id.in_(previous_meeting_ids.scalar_subquery()),
+                    TbMeetingActionItem.is_completed.is_(False),
+                )
+            )
+            carried = await self.db.execute(
+                insert(TbMeetingActionItem).from_select(
+                    [
+                        "action_item_id",
+                        "meeting_id",
+                        "origin_meeting_id",
+                        "is_carried_over",
+                        "content",
+                        "assignee",
+                        "is_completed",
+                    ],
+                    carry_over_source,
+                )
+            )
+            carried_count: int = carried.rowcount or 0
+
             await self.db.commit()
 
             logger.info(
-                "copy_action_items_as_carried_over 완료",
-                extra={"meeting_id": str(meeting_id), "copied": len(carried_items)},
+                "start_meeting_with_carry_over 완료",
+                extra={
+                    "meeting_id": str(meeting_id),
+                    "agendas_inserted": len(agendas),
+                    "action_items_carried_over": carried_count,
+                },
             )
-            return carried_items
+            return carried_count
 
         except Exception as exc:
             await self.db.rollback()
             logger.error(
-                "copy_action_items_as_carried_over 실패",
+                "start_meeting_with_carry_over 실패",
                 extra={"meeting_id": str(meeting_id), "error": str(exc)},
             )
             raise RepositoryException(
-                "Action Item 이월 복사에 실패했습니다",
+                "미팅 시작 처리에 실패했습니다",
                 details={"meeting_id": str(meeting_id)},
             ) from exc
 
@@ -740,80 +972,148 @@ class CoachingRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def create_timeline(
+    async def switch_timeline(
         self,
         meeting_id: uuid.UUID,
         rr_id: Optional[uuid.UUID],
         start_time: int,
-    ) -> TbMeetingTimeline:
-        """
-        타임라인 카드를 생성합니다.
+    ) -> tuple[TbMeetingTimeline, int]:
+        """
+        활성 타임라인 카드를 마감하고 새 카드를 생성합니다. (주제 전환, 단일 statement)
+
+        WITH closed AS (
+            UPDATE tb_meeting_timeline SET end_time = :start_time
+            WHERE meeting_id = :meeting_id AND end_time IS NULL
+            RETURNING timeline_id
+        ), inserted AS (
+            INSERT INTO tb_meeting_timeline (...)
+            SELECT ... FROM (SELECT count(*) FROM closed) AS c
+            RETURNING *
+        )
+        UPDATE tb_meeting SET state_version = state_version + 1
+        FROM inserted WHERE tb_meeting.meeting_id = inserted.meeting_id
+        RETURNING tb_meeting.state_version, inserted.*
+
+        INSERT가 closed 집계를 읽으므로 UPDATE가 먼저 완료되어, 부분 유니크 인덱스
+        (uq_timeline_open_per_meeting — 미팅당 활성 카드 1개)를 위반하지 않습니다.
+        동시 전환 요청이 인덱스에 걸리면 상대가 만든 카드를 마감하도록 한 번 재시도합니다.
 
         Args:
             meeting_id: 미팅 UUID
             rr_id: R&R UUID (None 가능)
-            start_time: 녹음 시작 기준 상대 시간(초)
+            start_time: 녹음 시작 기준 상대 시간(초) — 기존 카드의 end_time이 됨
 
         Returns:
-            TbMeetingTimeline: 생성된 타임라인 ORM 객체
+            tuple: (생성된 타임라인, 증가된 state_version)
+
+        Raises:
+            RepositoryException: DB 처리 실패 시
         """
         logger.info(
-            "create_timeline called",
+            "switch_timeline called",
             extra={"meeting_id": str(meeting_id), "rr_id": str(rr_id), "start_time": start_time},
         )
 
-        try:
-            timeline = TbMeetingTimeline(
-                timeline_id=uuid.uuid4(),
-                meeting_id=meeting_id,
-                rr_id=rr_id,
-                start_time=start_time,
-                end_time=None,
-                segment_summary=None,
+        closed = (
+            update(TbMeetingTimeline)
+            .where(
+                and_(
+                    TbMeetingTimeline.meeting_id == meeting_id,
+                    TbMeetingTimeline.end_time.is_(None),
+                )
             )
-            self.db.add(timeline)
-            await self.db.commit()
-            await self.db.refresh(timeline)
-
-            logger.info(
-                "create_timeline 완료",
-                extra={"timeline_id": str(timeline.timeline_id)},
+            .values(end_time=start_time)
+            .returning(TbMeetingTimeline.timeline_id)
+            .cte("closed")
+        )
+        closed_count = select(func.count().label("closed_count")).select_from(closed).subquery("c")
+
+        for attempt in range(2):
+            inserted = (
+                insert(TbMeetingTimeline)
+                .from_select(
+                    ["timeline_id", "meeting_id", "rr_id", "start_time"],
+                    select(
+                        literal(uuid.uuid4(), TbMeetingTimeline.timeline_id.type),
+                        literal(meeting_id, TbMeetingTimeline.meeting_id.type),
+                        literal(rr_id, TbMeetingTimeline.rr_id.type),
+                        literal(start_time, TbMeetingTimeline.start_time.type),
+                    ).select_from(closed_count),
+                )
+                .returning(
+                    TbMeetingTimeline.timeline_id,
+                    TbMeetingTimeline.meeting_id,
+                    TbMeetingTimeline.rr_id,
+                    TbMeetingTimeline.start_time,
+                    TbMeetingTimeline.end_time,
+                )
+                .cte("inserted")
             )
-            return timeline
-
-        except Exception as exc:
-            await self.db.rollback()
-            logger.error(
-                "create_timeline 실패",
-                extra={"meeting_id": str(meeting_id), "error": str(exc)},
+            stmt = (
+                update(TbMeeting)
+                .where(TbMeeting.meeting_id == inserted.c.meeting_id)
+                .values(state_version=TbMeeting.state_version + 1)
+                .returning(
+                    TbMeeting.state_version,
+                    inserted.c.timeline_id,
+                    inserted.c.rr_id,
+                    inserted.c.start_time,
+                    inserted.c.end_time,
+                )
+                .execution_options(synchronize_session=False)
             )
-            raise RepositoryException(
-                "타임라인 생성에 실패했습니다",
-                details={"meeting_id": str(meeting_id)},
-            ) from exc
-
-    async def find_open_timeline(
-        self, meeting_id: uuid.UUID
-    ) -> Optional[TbMeetingTimeline]:
-        """
-        end_time IS NULL인 활성 타임라인 카드를 조회합니다.
 
-        Args:
-            meeting_id: 미팅 UUID
-
-        Returns:
-            TbMeetingTimeline | None: 활성 타임라인 (없으면 None)
-        """
-        logger.info("find_open_timeline called", extra={"meeting_id": str(meeting_id)})
+            try:
+                row = (await self.db.execute(stmt)).one()
+                await self.db.commit()
 
-        stmt = select(TbMeetingTimeline).where(
-            and_(
-                TbMeetingTimeline.meeting_id == meeting_id,
-                TbMeetingTimeline.end_time.is_(None),
-            )
+                timeline = TbMeetingTimeline(
+                    timeline_id=row.timeline_id,
+                    meeting_id=meeting_id,
+                    rr_id=row.rr_id,
+                    start_time=row.start_time,
+                    end_time=row.end_time,
+                    segment_summary=None,
+                )
+                logger.info(
+                    "switch_timeline 완료",
+                    extra={"timeline_id": str(timeline.timeline_id)},
+                )
+                return timeline, row.state_version
+
+            except IntegrityError as exc:
+                await self.db.rollback()
+                if attempt == 0:
+                    logger.info(
+                        "switch_timeline 재시도 (동시 전환 감지)",
+                        extra={"meeting_id": str(meeting_id)},
+                    )
+                    continue
+                logger.error(
+                    "switch_timeline 실패",
+                    extra={"meeting_id": str(meeting_id), "error": str(exc)},
+                )
+                raise RepositoryException(
+                    "타임라인 생성에 실패했습니다",
+                    details={"meeting_id": str(meeting_id)},
+                ) from exc
+
+            except Exception as exc:
+                await self.db.rollback()
+                logger.error(
+                    "switch_timeline 실패",
+                    extra={"meeting_id": str(meeting_id), "error": str(exc)},
+                )
+                raise RepositoryException(
+                    "타임라인 생성에 실패했습니다",
+                    details={"meeting_id": str(meeting_id)},
+                ) from exc
+
+        # 두 번째 시도는 반환 또는 예외로 끝나므로 도달하지 않음
+        raise RepositoryException(
+            "타임라인 생성에 실패했습니다",
+            details={"meeting_id": str(meeting_id)},
         )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
 
     async def find_timeline_by_id(
         self,
@@ -863,7 +1163,7 @@ class CoachingRepository:
         timeline: TbMeetingTimeline,
         end_time: Optional[int] = None,
         segment_summary: Optional[str] = None,
-    ) -> TbMeetingTimeline:
+    ) -> tuple[TbMeetingTimeline, int]:
         """
         타임라인 카드를 업데이트합니다.
 
@@ -876,7 +1176,7 @@ class CoachingRepository:
             segment_summary: 구간 요약 (optional)
 
         Returns:
-            TbMeetingTimeline: 업데이트된 타임라인 ORM 객체
+            tuple: (업데이트된 타임라인 ORM 객체, 증가된 state_version)
         """
         logger.info(
             "patch_timeline called",
@@ -889,11 +1189,12 @@ class CoachingRepository:
             if segment_summary is not None:
                 timeline.segment_summary = segment_summary
             self.db.add(timeline)
+            state_version = await self._bump_state_version(timeline.meeting_id)
             await self.db.commit()
             await self.db.refresh(timeline)
 
             logger.info("patch_timeline 완료", extra={"timeline_id": str(timeline.timeline_id)})
-            return timeline
+            return timeline, state_version
 
         except Exception as exc:
             await self.db.rollback()
@@ -926,6 +1227,7 @@ class CoachingRepository:
         try:
             meeting.private_memo = private_memo
             self.db.add(meeting)
+            await self._bump_state_version(meeting.meeting_id)
             await self.db.commit()
             await self.db.refresh(meeting)
 
@@ -986,7 +1288,9 @@ class CoachingRepository:
 
         return agenda
 
-    async def toggle_agenda_complete(self, agenda: TbMeetingAgenda) -> TbMeetingAgenda:
+    async def toggle_agenda_complete(
+        self, agenda: TbMeetingAgenda
+    ) -> tuple[TbMeetingAgenda, int]:
         """
         아젠다의 완료 상태를 토글합니다.
 
@@ -994,13 +1298,14 @@ class CoachingRepository:
             agenda: 토글할 TbMeetingAgenda ORM 객체
 
         Returns:
-            TbMeetingAgenda: 업데이트된 아젠다 ORM 객체
+            tuple: (업데이트된 아젠다 ORM 객체, 증가된 state_version)
         """
         logger.info("toggle_agenda_complete called", extra={"agenda_id": str(agenda.agenda_id)})
 
         try:
             agenda.is_completed = not agenda.is_completed
             self.db.add(agenda)
+            state_version = await self._bump_state_version(agenda.meeting_id)
             await self.db.commit()
             await self.db.refresh(agenda)
 
@@ -1008,7 +1313,7 @@ class CoachingRepository:
                 "toggle_agenda_complete 완료",
                 extra={"agenda_id": str(agenda.agenda_id), "is_completed": agenda.is_completed},
             )
-            return agenda
+            return agenda, state_version
 
         except Exception as exc:
             await self.db.rollback()
@@ -1066,7 +1371,7 @@ class CoachingRepository:
 
     async def toggle_action_item_complete(
         self, action_item: TbMeetingActionItem
-    ) -> TbMeetingActionItem:
+    ) -> tuple[TbMeetingActionItem, int]:
         """
         Action Item의 완료 상태를 토글합니다.
         이월 항목도 현재 미팅 row에서만 업데이트합니다 (원본 불변).
@@ -1075,7 +1380,7 @@ class CoachingRepository:
             action_item: 토글할 TbMeetingActionItem ORM 객체
 
         Returns:
-            TbMeetingActionItem: 업데이트된 Action Item ORM 객체
+            tuple: (업데이트된 Action Item ORM 객체, 증가된 state_version)
         """
         logger.info(
             "toggle_action_item_complete called",
@@ -1085,6 +1390,7 @@ class CoachingRepository:
         try:
             action_item.is_completed = not action_item.is_completed
             self.db.add(action_item)
+            state_version = await self._bump_state_version(action_item.meeting_id)
             await self.db.commit()
             await self.db.refresh(action_item)
 
@@ -1095,7 +1401,7 @@ class CoachingRepository:
                     "is_completed": action_item.is_completed,
                 },
             )
-            return action_item
+            return action_item, state_version
 
         except Exception as exc:
             await self.db.rollback()
@@ -1132,7 +1438,7 @@ class CoachingRepository:
         meeting_id: uuid.UUID,
         content: str,
         order: int,
-    ) -> TbMeetingAgenda:
+    ) -> tuple[TbMeetingAgenda, int]:
         """
         리더 즉석 아젠다를 추가합니다. (source=LEADER_ADDED)
 
@@ -1142,7 +1448,7 @@ class CoachingRepository:
             order: 정렬 순서
 
         Returns:
-            TbMeetingAgenda: 생성된 아젠다 ORM 객체
+            tuple: (생성된 아젠다 ORM 객체, 증가된 state_version)
         """
         logger.info("create_agenda called", extra={"meeting_id": str(meeting_id)})
 
@@ -1156,11 +1462,12 @@ class CoachingRepository:
                 is_completed=False,
             )
             self.db.add(agenda)
+            state_version = await self._bump_state_version(meeting_id)
             await self.db.commit()
             await self.db.refresh(agenda)
 
             logger.info("create_agenda 완료", extra={"agenda_id": str(agenda.agenda_id)})
-            return agenda
+            return agenda, state_version
 
         except Exception as exc:
             await self.db.rollback()
@@ -1177,263 +1484,275 @@ class CoachingRepository:
     # Task 6 — 미팅 종료 + GCS 업로드 Repository 메서드
     # =============================================
 
-    async def close_open_timeline_with_duration(
+    async def complete_meeting(
         self,
         meeting_id: uuid.UUID,
+        leader_emp_no: str,
+        member_emp_no: str,
         actual_duration_seconds: int,
-    ) -> None:
+        private_memo: Optional[str],
+        audio_file_url: str,
+    ) -> Optional[TbMeeting]:
         """
-        end_time IS NULL인 활성 타임라인 카드를 actual_duration_seconds로 자동 마감합니다.
+        미팅 종료 처리를 하나의 트랜잭션으로 수행합니다.
 
-        미팅 종료 시 마지막 타임라인 카드가 열려있으면 실제 녹음 길이로 마감합니다.
+        1. 조건부 UPDATE로 PROCESSING 전환 + completed_at/actual_duration/private_memo 기록
+           (이미 PROCESSING/COMPLETED이면 None 반환 — 중복 종료 요청은 DB가 차단)
+        2. end_time IS NULL인 활성 타임라인 카드를 actual_duration_seconds로 마감
+        3. TbMeetingRecord UPSERT (audio_file_url — FAILED 후 재종료 시 경로 갱신)
+        4. TbCoachingRelation UPSERT (total_meeting_count +1)
 
         Args:
             meeting_id: 미팅 UUID
+            leader_emp_no: 리더 사번
+            member_emp_no: 팀원 사번
             actual_duration_seconds: 실제 녹음 길이(초)
+            private_memo: 비공개 메모 (None이면 기존 값 유지)
+            audio_file_url: GCS 오디오 파일 경로
+
+        Returns:
+            TbMeeting | None: PROCESSING으로 전환된 미팅 (전이 불가 상태면 None)
+
+        Raises:
+            RepositoryException: DB 처리 실패 시
         """
         logger.info(
-            "close_open_timeline_with_duration called",
+            "complete_meeting called",
             extra={"meeting_id": str(meeting_id), "duration": actual_duration_seconds},
         )
 
-        open_timeline = await self.find_open_timeline(meeting_id)
-        if open_timeline is not None:
-            await self.patch_timeline(timeline=open_timeline, end_time=actual_duration_seconds)
-            logger.info(
-                "close_open_timeline_with_duration 완료",
-                extra={
-                    "timeline_id": str(open_timeline.timeline_id),
-                    "end_time": actual_duration_seconds,
-                },
-            )
+        now = datetime.utcnow()
+        values: dict[str, Any] = {
+            "completed_at": now,
+            "actual_duration_seconds": actual_duration_seconds,
+            "pipeline_stage": None,  # FAILED → PROCESSING 재처리 시 진행 단계 초기화
+        }
+        if private_memo is not None:
+            values["private_memo"] = private_memo
 
-    async def complete_meeting(
-        self,
-        meeting: TbMeeting,
-        actual_duration_seconds: int,
-        private_memo: Optional[str],
-    ) -> TbMeeting:
-        """
-        미팅 상태를 PROCESSING으로 전환하고 완료 정보를 기록합니다.
+        try:
+            # 1. PROCESSING 전환
+            meeting = await self._apply_status_transition(meeting_id, "PROCESSING", values)
+            if meeting is None:
+                await self.db.rollback()
+                logger.info(
+                    "complete_meeting 생략 (이미 처리된 미팅)",
+                    extra={"meeting_id": str(meeting_id)},
+                )
+                return None
 
-        Args:
-            meeting: 상태를 변경할 TbMeeting ORM 객체
-            actual_duration_seconds: 실제 녹음 길이(초)
-            private_memo: 비공개 메모 (None이면 기존 값 유지)
+            # 2. 마지막 활성 타임라인 자동 마감
+            await self.db.execute(
+                update(TbMeetingTimeline)
+                .where(
+                    and_(
+                        TbMeetingTimeline.meeting_id == meeting_id,
+                        TbMeetingTimeline.end_time.is_(None),
+                    )
+                )
+                .values(end_time=actual_duration_seconds)
+            )
 
-        Returns:
-            TbMeeting: 업데이트된 미팅 ORM 객체
-        """
-        logger.info("complete_meeting called", extra={"meeting_id": str(meeting.meeting_id)})
+            # 3. TbMeetingRecord UPSERT
+            record_stmt = pg_insert(TbMeetingRecord).values(
+                record_id=uuid.uuid4(),
+                meeting_id=meeting_id,
+                audio_file_url=audio_file_url,
+            )
+            await self.db.execute(
+                record_stmt.on_conflict_do_update(
+                    index_elements=["meeting_id"],
+                    set_={"audio_file_url": record_stmt.excluded.audio_file_url},
+                )
+            )
 
-        try:
-            meeting.status = "PROCESSING"
-            meeting.completed_at = datetime.utcnow()
-            meeting.actual_duration_seconds = actual_duration_seconds
-            if private_memo is not None:
-                meeting.private_memo = private_memo
+            # 4. TbCoachingRelation UPSERT
+            await self.db.execute(
+                pg_insert(TbCoachingRelation)
+                .values(
+                    relation_id=uuid.uuid4(),
+                    leader_emp_no=leader_emp_no,
+                    member_emp_no=member_emp_no,
+                    last_meeting_id=meeting_id,
+                    last_meeting_date=now,
+                    total_meeting_count=1,
+                )
+                .on_conflict_do_update(
+                    constraint="uq_coaching_relation",
+                    set_={
+                        "last_meeting_id": meeting_id,
+                        "last_meeting_date": now,
+                        "total_meeting_count": TbCoachingRelation.total_meeting_count + 1,
+                        "up_date": now,
+                    },
+                )
+            )
 
-            self.db.add(meeting)
             await self.db.commit()
-            await self.db.refresh(meeting)
 
-            logger.info("complete_meeting 완료", extra={"meeting_id": str(meeting.meeting_id)})
+            logger.info("complete_meeting 완료", extra={"meeting_id": str(meeting_id)})
             return meeting
 
         except Exception as exc:
             await self.db.rollback()
             logger.error(
                 "complete_meeting 실패",
-                extra={"meeting_id": str(meeting.meeting_id), "error": str(exc)},
+                extra={"meeting_id": str(meeting_id), "error": str(exc)},
             )
             raise RepositoryException(
                 "미팅 완료 처리에 실패했습니다",
-                details={"meeting_id": str(meeting.meeting_id)},
+                details={"meeting_id": str(meeting_id)},
             ) from exc
 
-    async def create_meeting_record(
-        self,
-        meeting_id: uuid.UUID,
-        audio_file_url: str,
-    ) -> TbMeetingRecord:
+    async def mark_meeting_failed(self, meeting_id: uuid.UUID) -> Optional[TbMeeting]:
         """
-        TbMeetingRecord를 생성합니다. (GCS 오디오 경로 저장)
+        미팅 status를 FAILED로 전환합니다.
+
+        AI 파이프라인 실패 또는 gcs_path 누락 시 호출됩니다.
+        COMPLETED 미팅은 전환하지 않습니다. (파이프라인 완료와 스케줄러 경합 방지)
 
         Args:
-            meeting_id: 미팅 UUID
-            audio_file_url: GCS 오디오 파일 경로
+            meeting_id: 실패 처리할 미팅 UUID
 
         Returns:
-            TbMeetingRecord: 생성된 레코드 ORM 객체
+            TbMeeting | None: FAILED로 전환된 미팅 (전환 불가 상태면 None)
         """
-        logger.info(
-            "create_meeting_record called",
-            extra={"meeting_id": str(meeting_id), "audio_file_url": audio_file_url},
-        )
+        return await self.transition_meeting_status(meeting_id, "FAILED")
 
-        try:
-            record = TbMeetingRecord(
-                record_id=uuid.uuid4(),
-                meeting_id=meeting_id,
-                audio_file_url=audio_file_url,
-            )
-            self.db.add(record)
-            await self.db.commit()
-            await self.db.refresh(record)
+    async def find_stuck_processing_meetings(
+        self, timeout_minutes: int = 30
+    ) -> list[TbMeeting]:
+        """
+        지정된 시간 이상 PROCESSING 상태에 고착된 미팅을 조회합니다.
 
-            logger.info(
-                "create_meeting_record 완료",
-                extra={"record_id": str(record.record_id)},
-            )
-            return record
+        스케줄러가 주기적으로 호출하여 고착 미팅을 FAILED로 전환하는 데 사용합니다.
 
-        except Exception as exc:
-            await self.db.rollback()
-            logger.error(
-                "create_meeting_record 실패",
-                extra={"meeting_id": str(meeting_id), "error": str(exc)},
+        Args:
+            timeout_minutes: PROCESSING 고착 기준 시간 (분, 기본 30분)
+
+        Returns:
+            list[TbMeeting]: 고착 미팅 목록
+        """
+        threshold = datetime.utcnow() - timedelta(minutes=timeout_minutes)
+
+        stmt = select(TbMeeting).where(
+            and_(
+                TbMeeting.status == "PROCESSING",
+                TbMeeting.completed_at < threshold,
             )
-            raise RepositoryException(
-                "미팅 레코드 생성에 실패했습니다",
-                details={"meeting_id": str(meeting_id)},
-            ) from exc
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
 
-    async def upsert_coaching_relation(
+    async def record_pipeline_stage(
         self,
-        leader_emp_no: str,
-        member_emp_no: str,
         meeting_id: uuid.UUID,
-        completed_at: datetime,
-    ) -> None:
+        stage: str,
+    ) -> Optional[int]:
         """
-        TbCoachingRelation을 UPSERT합니다.
+        AI 파이프라인 진행 단계를 기록하고 state_version을 +1 합니다.
 
-        row가 없으면 INSERT, 있으면 UPDATE합니다.
-        total_meeting_count는 INSERT 시 1, UPDATE 시 +1 증가합니다.
+        PROCESSING 미팅만 갱신합니다. (스케줄러가 먼저 FAILED 처리한 미팅은 갱신하지 않음)
 
         Args:
-            leader_emp_no: 리더 사번
-            member_emp_no: 팀원 사번
-            meeting_id: 완료된 미팅 UUID
-            completed_at: 미팅 완료 일시 (UTC)
+            meeting_id: 미팅 UUID
+            stage: 진행 단계 (DOWNLOAD | STT | SUMMARY)
+
+        Returns:
+            int | None: 증가된 state_version (PROCESSING이 아니면 None)
+
+        Raises:
+            RepositoryException: DB 처리 실패 시
         """
         logger.info(
-            "upsert_coaching_relation called",
-            extra={
-                "leader_emp_no": leader_emp_no,
-                "member_emp_no": member_emp_no,
-                "meeting_id": str(meeting_id),
-            },
+            "record_pipeline_stage called",
+            extra={"meeting_id": str(meeting_id), "stage": stage},
         )
 
         try:
-            stmt = (
-                pg_insert(TbCoachingRelation)
-                .values(
-                    relation_id=uuid.uuid4(),
-                    leader_emp_no=leader_emp_no,
-                    member_emp_no=member_emp_no,
-                    last_meeting_id=meeting_id,
-                    last_meeting_date=completed_at,
-                    total_meeting_count=1,
-                )
-                .on_conflict_do_update(
-                    constraint="uq_coaching_relation",
-                    set_={
-                        "last_meeting_id": meeting_id,
-                        "last_meeting_date": completed_at,
-                        "total_meeting_count": TbCoachingRelation.total_meeting_count + 1,
-                        "up_date": datetime.utcnow(),
-                    },
+            result = await self.db.execute(
+                update(TbMeeting)
+                .where(
+                    TbMeeting.meeting_id == meeting_id,
+                    TbMeeting.status == "PROCESSING",
                 )
+                .values(pipeline_stage=stage, state_version=TbMeeting.state_version + 1)
+                .returning(TbMeeting.state_version)
+                .execution_options(synchronize_session=False)
             )
-            await self.db.execute(stmt)
+            state_version = result.scalar_one_or_none()
             await self.db.commit()
 
             logger.info(
-                "upsert_coaching_relation 완료",
+                "record_pipeline_stage 완료",
                 extra={
-                    "leader_emp_no": leader_emp_no,
-                    "member_emp_no": member_emp_no,
+                    "meeting_id": str(meeting_id),
+                    "stage": stage,
+                    "updated": state_version is not None,
                 },
             )
+            return state_version
 
         except Exception as exc:
             await self.db.rollback()
             logger.error(
-                "upsert_coaching_relation 실패",
-                extra={
-                    "leader_emp_no": leader_emp_no,
-                    "member_emp_no": member_emp_no,
-                    "error": str(exc),
-                },
+                "record_pipeline_stage 실패",
+                extra={"meeting_id": str(meeting_id), "error": str(exc)},
             )
             raise RepositoryException(
-                "코칭 관계 UPSERT에 실패했습니다",
-                details={
-                    "leader_emp_no": leader_emp_no,
-                    "member_emp_no": member_emp_no,
-                },
+                "파이프라인 진행 단계 기록에 실패했습니다",
+                details={"meeting_id": str(meeting_id)},
             ) from exc
 
-    async def mark_meeting_failed(self, meeting_id: uuid.UUID) -> None:
+    async def save_upload_session(
+        self,
+        meeting_id: uuid.UUID,
+        total_bytes: int,
+        part_bytes: int,
+    ) -> None:
         """
-        미팅 status를 FAILED로 전환합니다.
+        녹음 분할 업로드 세션을 기록합니다.
 
-        AI 파이프라인 실패 또는 gcs_path 누락 시 호출됩니다.
+        같은 크기로 다시 호출하면(재개) 값이 그대로이므로 이미 받은 파트가 유효하게 유지됩니다.
 
         Args:
-            meeting_id: 실패 처리할 미팅 UUID
+            meeting_id: 미팅 UUID
+            total_bytes: 녹음 파일 전체 크기(바이트)
+            part_bytes: 파트 크기(바이트)
+
+        Raises:
+            RepositoryException: DB 처리 실패 시
         """
-        logger.info("mark_meeting_failed called", extra={"meeting_id": str(meeting_id)})
+        logger.info(
+            "save_upload_session called",
+            extra={"meeting_id": str(meeting_id), "total_bytes": total_bytes},
+        )
 
         try:
-            stmt = (
+            await self.db.execute(
                 update(TbMeeting)
                 .where(TbMeeting.meeting_id == meeting_id)
-                .values(status="FAILED")
+                .values(upload_total_bytes=total_bytes, upload_part_bytes=part_bytes)
+                .execution_options(synchronize_session=False)
             )
-            await self.db.execute(stmt)
             await self.db.commit()
 
-            logger.info("mark_meeting_failed 완료", extra={"meeting_id": str(meeting_id)})
+            logger.info(
+                "save_upload_session 완료",
+                extra={"meeting_id": str(meeting_id), "part_bytes": part_bytes},
+            )
 
         except Exception as exc:
             await self.db.rollback()
             logger.error(
-                "mark_meeting_failed 실패",
+                "save_upload_session 실패",
                 extra={"meeting_id": str(meeting_id), "error": str(exc)},
             )
             raise RepositoryException(
-                "미팅 FAILED 처리에 실패했습니다",
+                "업로드 세션 기록에 실패했습니다",
                 details={"meeting_id": str(meeting_id)},
             ) from exc
 
-    async def find_stuck_processing_meetings(
-        self, timeout_minutes: int = 30
-    ) -> list[TbMeeting]:
-        """
-        지정된 시간 이상 PROCESSING 상태에 고착된 미팅을 조회합니다.
-
-        스케줄러가 주기적으로 호출하여 고착 미팅을 FAILED로 전환하는 데 사용합니다.
-
-        Args:
-            timeout_minutes: PROCESSING 고착 기준 시간 (분, 기본 30분)
-
-        Returns:
-            list[TbMeeting]: 고착 미팅 목록
-        """
-        threshold = datetime.utcnow() - timedelta(minutes=timeout_minutes)
-
-        stmt = select(TbMeeting).where(
-            and_(
-                TbMeeting.status == "PROCESSING",
-                TbMeeting.completed_at < threshold,
-            )
-        )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
-
     # =============================================
     # Task 7 — 히스토리 및 리포트 Repository
     # =============================================
@@ -1479,6 +1798,7 @@ class CoachingRepository:
         미팅 리포트에 필요한 전체 데이터를 한 번에 조회합니다.
 
         record (ai_summary, audio_file_url), timelines, action_items 를 eager load합니다.
+        STT 트랜스크립트는 로드하지 않습니다. (find_transcript_segments로 구간 조회)
 
         Args:
             meeting_id: 미팅 UUID
@@ -1519,3 +1839,833 @@ class CoachingRepository:
         stmt = select(Rr.rr_id, Rr.title).where(Rr.rr_id.in_(rr_ids))
         result = await self.db.execute(stmt)
         return {row.rr_id: row.title for row in result.all()}
+
+    # =============================================
+    # Task 8 — 트랜스크립트 Repository
+    # =============================================
+
+    async def replace_transcript_segments(
+        self,
+        meeting_id: uuid.UUID,
+        segments: list[dict[str, Any]],
+    ) -> int:
+        """
+        미팅의 STT 구간을 일괄 저장합니다. (기존 구간은 삭제 후 교체)
+
+        AI 파이프라인 재실행 시에도 중복 없이 동일 결과가 되도록 DELETE + multi-row INSERT를
+        하나의 트랜잭션으로 처리합니다.
+
+        Args:
+            meeting_id: 미팅 UUID
+            segments: STT 결과 [{start, end, text, speaker}, ...] (순서 = seq)
+
+        Returns:
+            int: 저장된 구간 수
+
+        Raises:
+            RepositoryException: DB 저장 실패 시
+        """
+        logger.info(
+            "replace_transcript_segments called",
+            extra={"meeting_id": str(meeting_id), "segment_count": len(segments)},
+        )
+
+        try:
+            await self.db.execute(
+                delete(TbMeetingTranscriptSegment).where(
+                    TbMeetingTranscriptSegment.meeting_id == meeting_id
+                )
+            )
+
+            if segments:
+                rows = [
+                    {
+                        "segment_id": uuid.uuid4(),
+                        "meeting_id": meeting_id,
+                        "seq": seq,
+                        "start_time": float(seg.get("start") or 0.0),
+                        "end_time": (
+                            float(seg["end"]) if seg.get("end") is not None else None
+                        ),
+                        "speaker": seg.get("speaker"),
+                        "text": seg.get("text") or "",
+                    }
+                    for seq, seg in enumerate(segments)
+                ]
+                await self.db.execute(insert(TbMeetingTranscriptSegment), rows)
+
+            await self.db.commit()
+
+            logger.info(
+                "replace_transcript_segments 완료",
+                extra={"meeting_id": str(meeting_id), "segment_count": len(segments)},
+            )
+            return len(segments)
+
+        except Exception as exc:
+            await self.db.rollback()
+            logger.error(
+                "replace_transcript_segments 실패",
+                extra={"meeting_id": str(meeting_id), "error": str(exc)},
+            )
+            raise RepositoryException(
+                "트랜스크립트 저장에 실패했습니다",
+                details={"meeting_id": str(meeting_id)},
+            ) from exc
+
+    async def find_transcript_segments(
+        self,
+        meeting_id: uuid.UUID,
+        from_sec: float,
+        after_seq: Optional[int],
+        to_sec: Optional[float],
+        limit: int,
+    ) -> list[TbMeetingTranscriptSegment]:
+        """
+        시간 구간 [from_sec, to_sec) 에 시작하는 트랜스크립트 구간을 조회합니다.
+
+        (meeting_id, start_time) 인덱스 범위 스캔으로 처리되므로
+        녹음 길이와 무관하게 페이지 크기만큼만 읽습니다.
+        다음 페이지 존재 여부 판단을 위해 호출 측에서 limit + 1로 요청합니다.
+
+        after_seq가 있으면 (start_time, seq) > (from_sec, after_seq) keyset 조건으로 조회합니다.
+        시작 시각이 같은 구간이 페이지 경계에 걸쳐도 중복/누락 없이 이어집니다.
+
+        Args:
+            meeting_id: 미팅 UUID
+            from_sec: 조회 시작 시각 (초, after_seq가 없으면 포함)
+            after_seq: 이전 페이지 마지막 구간의 seq (첫 페이지는 None)
+            to_sec: 조회 종료 시각 (초, 미포함, None이면 끝까지)
+            limit: 최대 조회 건수
+
+        Returns:
+            list[TbMeetingTranscriptSegment]: start_time, seq 오름차순 구간 목록
+        """
+        logger.info(
+            "find_transcript_segments called",
+            extra={
+                "meeting_id": str(meeting_id),
+                "from_sec": from_sec,
+                "after_seq": after_seq,
+                "to_sec": to_sec,
+                "limit": limit,
+            },
+        )
+
+        conditions = [TbMeetingTranscriptSegment.meeting_id == meeting_id]
+        if after_seq is None:
+            conditions.append(TbMeetingTranscriptSegment.start_time >= from_sec)
+        else:
+            conditions.append(
+                or_(
+                    TbMeetingTranscriptSegment.start_time > from_sec,
+                    and_(
+                        TbMeetingTranscriptSegment.start_time == from_sec,
+                        TbMeetingTranscriptSegment.seq > after_seq,
+                    ),
+                )
+            )
+        if to_sec is not None:
+            conditions.append(TbMeetingTranscriptSegment.start_time < to_sec)
+
+        stmt = (
+            select(TbMeetingTranscriptSegment)
+            .where(and_(*conditions))
+            .order_by(
+                TbMeetingTranscriptSegment.start_time,
+                TbMeetingTranscriptSegment.seq,
+            )
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    # =============================================
+    # Task 9 — 미팅 검색 Repository
+    # =============================================
+
+    async def upsert_meeting_search_document(self, meeting_id: uuid.UUID) -> None:
+        """
+        미팅 검색 문서를 재생성합니다. (AI 파이프라인 finalize 단계)
+
+        ai_summary, 타임라인 segment_summary, 트랜스크립트 구간 텍스트를 서버 측에서 합쳐
+        INSERT ... SELECT ... ON CONFLICT DO UPDATE 한 번으로 저장합니다.
+
+        Args:
+            meeting_id: 미팅 UUID
+
+        Raises:
+            RepositoryException: DB 저장 실패 시
+        """
+        logger.info(
+            "upsert_meeting_search_document called",
+            extra={"meeting_id": str(meeting_id)},
+        )
+
+        segment_summaries = (
+            select(
+                func.string_agg(
+                    TbMeetingTimeline.segment_summary,
+                    aggregate_order_by(literal(" "), TbMeetingTimeline.start_time),
+                )
+            )
+            .where(TbMeetingTimeline.meeting_id == TbMeeting.meeting_id)
+            .scalar_subquery()
+        )
+        transcript_text = (
+            select(
+                func.string_agg(
+                    TbMeetingTranscriptSegment.text,
+                    aggregate_order_by(literal(" "), TbMeetingTranscriptSegment.seq),
+                )
+            )
+            .where(TbMeetingTranscriptSegment.meeting_id == TbMeeting.meeting_id)
+            .scalar_subquery()
+        )
+
+        source = (
+            select(
+                TbMeeting.meeting_id,
+                TbMeeting.leader_emp_no,
+                TbMeeting.member_emp_no,
+                TbMeeting.completed_at,
+                func.concat_ws(
+                    " ",
+                    TbMeetingRecord.ai_summary,
+                    segment_summaries,
+                    transcript_text,
+                ),
+                literal(datetime.utcnow()),
+            )
+            .outerjoin(TbMeetingRecord, TbMeetingRecord.meeting_id == TbMeeting.meeting_id)
+            .where(TbMeeting.meeting_id == meeting_id)
+        )
+
+        stmt = pg_insert(TbMeetingSearchDocument).from_select(
+            [
+                "meeting_id",
+                "leader_emp_no",
+                "member_emp_no",
+                "completed_at",
+                "search_text",
+                "up_date",
+            ],
+            source,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["meeting_id"],
+            set_={
+                "completed_at": stmt.excluded.completed_at,
+                "search_text": stmt.excluded.search_text,
+                "up_date": stmt.excluded.up_date,
+            },
+        )
+
+        try:
+            await self.db.execute(stmt)
+            await self.db.commit()
+
+            logger.info(
+                "upsert_meeting_search_document 완료",
+                extra={"meeting_id": str(meeting_id)},
+            )
+
+        except Exception as exc:
+            await self.db.rollback()
+            logger.error(
+                "upsert_meeting_search_document 실패",
+                extra={"meeting_id": str(meeting_id), "error": str(exc)},
+            )
+            raise RepositoryException(
+                "미팅 검색 색인 갱신에 실패했습니다",
+                details={"meeting_id": str(meeting_id)},
+            ) from exc
+
+    async def search_meetings(
+        self,
+        requester_emp_no: str,
+        terms: list[str],
+        limit: int,
+        snippet_radius: int,
+    ) -> list[dict[str, Any]]:
+        """
+        요청자가 리더 또는 팀원으로 참여한 미팅 중 모든 검색어를 포함하는 미팅을 조회합니다.
+
+        - 범위 필터: leader_emp_no / member_emp_no 인덱스
+        - 검색어 필터: search_text ILIKE (pg_trgm GIN 인덱스)
+        - 정렬: word_similarity(검색어, search_text) 내림차순 → completed_at 최신순
+        - 스니펫: 첫 번째 검색어 주변 구간만 DB에서 잘라 반환 (전체 문서 전송 방지)
+
+        Args:
+            requester_emp_no: 요청자 사번
+            terms: 검색어 목록 (1개 이상, AND 조건)
+            limit: 최대 조회 건수
+            snippet_radius: 스니펫 앞뒤 글자 수
+
+        Returns:
+            list[dict]: [{meeting_id, leader_emp_no, member_emp_no, member_name,
+                          completed_at, score, snippet}, ...]
+        """
+        logger.info(
+            "search_meetings called",
+            extra={
+                "requester_emp_no": requester_emp_no,
+                "term_count": len(terms),
+                "limit": limit,
+            },
+        )
+
+        doc = TbMeetingSearchDocument
+        query_text = " ".join(terms)
+        score = func.word_similarity(query_text, doc.search_text)
+        hit_pos = func.strpos(func.lower(doc.search_text), terms[0].lower())
+        snippet = func.substr(
+            doc.search_text,
+            func.greatest(hit_pos - snippet_radius, 1),
+            snippet_radius * 2 + len(terms[0]),
+        )
+
+        stmt = (
+            select(
+                doc.meeting_id,
+                doc.leader_emp_no,
+                doc.member_emp_no,
+                HRMgnt.name_kor.label("member_name"),
+                doc.completed_at,
+                score.label("score"),
+                snippet.label("snippet"),
+            )
+            .outerjoin(HRMgnt, HRMgnt.emp_no == doc.member_emp_no)
+            .where(
+                or_(
+                    doc.leader_emp_no == requester_emp_no,
+                    doc.member_emp_no == requester_emp_no,
+                ),
+                *[doc.search_text.icontains(term, autoescape=True) for term in terms],
+            )
+            .order_by(desc("score"), desc(doc.completed_at))
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+
+        return [
+            {
+                "meeting_id": row.meeting_id,
+                "leader_emp_no": row.leader_emp_no,
+                "member_emp_no": row.member_emp_no,
+                "member_name": row.member_name,
+                "completed_at": row.completed_at,
+                "score": float(row.score or 0.0),
+                "snippet": row.snippet or "",
+            }
+            for row in result.all()
+        ]
+
+    # =============================================
+    # Task 10 — 일괄 사전 준비 Repository
+    # =============================================
+
+    async def find_members_info(self, member_emp_nos: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        팀원 인사정보를 일괄 조회합니다.
+
+        Args:
+            member_emp_nos: 팀원 사번 목록
+
+        Returns:
+            dict: { emp_no: {emp_no, emp_name, dept_name} } (없는 사번은 제외)
+        """
+        if not member_emp_nos:
+            return {}
+
+        logger.info(
+            "find_members_info called",
+            extra={"member_count": len(member_emp_nos)},
+        )
+
+        stmt = (
+            select(
+                HRMgnt.emp_no,
+                HRMgnt.name_kor.label("emp_name"),
+                CMDepartment.dept_name,
+            )
+            .join(CMDepartment, HRMgnt.dept_code == CMDepartment.dept_code)
+            .where(HRMgnt.emp_no.in_(member_emp_nos))
+        )
+        result = await self.db.execute(stmt)
+
+        return {
+            row.emp_no: {
+                "emp_no": row.emp_no,
+                "emp_name": row.emp_name,
+                "dept_name": row.dept_name,
+            }
+            for row in result.all()
+        }
+
+    async def find_completed_meetings_by_members(
+        self,
+        leader_emp_no: str,
+        member_emp_nos: list[str],
+        limit_per_member: int,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        리더와 여러 팀원 간 COMPLETED 미팅을 팀원별 최신 순으로 일괄 조회합니다.
+
+        ROW_NUMBER() OVER (PARTITION BY member_emp_no) 로 팀원별 상위 N건만 남기며,
+        AI 요약(ai_summary)만 함께 조회합니다.
+
+        Args:
+            leader_emp_no: 리더 사번
+            member_emp_nos: 팀원 사번 목록
+            limit_per_member: 팀원별 최대 조회 건수
+
+        Returns:
+            dict: { member_emp_no: [{meeting_id, ai_summary}, ...] } (최신 순)
+        """
+        if not member_emp_nos:
+            return {}
+
+        logger.info(
+            "find_completed_meetings_by_members called",
+            extra={
+                "leader_emp_no": leader_emp_no,
+                "member_count": len(member_emp_nos),
+                "limit_per_member": limit_per_member,
+            },
+        )
+
+        ranked = (
+            select(
+                TbMeeting.member_emp_no,
+                TbMeeting.meeting_id,
+                TbMeetingRecord.ai_summary,
+                func.row_number()
+                .over(
+                    partition_by=TbMeeting.member_emp_no,
+                    order_by=desc(TbMeeting.completed_at),
+                )
+                .label("rn"),
+            )
+            .outerjoin(TbMeetingRecord, TbMeetingRecord.meeting_id == TbMeeting.meeting_id)
+            .where(
+                and_(
+                    TbMeeting.leader_emp_no == leader_emp_no,
+                    TbMeeting.member_emp_no.in_(member_emp_nos),
+                    TbMeeting.status == "COMPLETED",
+                )
+            )
+            .subquery()
+        )
+        stmt = (
+            select(ranked.c.member_emp_no, ranked.c.meeting_id, ranked.c.ai_summary)
+            .where(ranked.c.rn <= limit_per_member)
+            .order_by(ranked.c.member_emp_no, ranked.c.rn)
+        )
+        result = await self.db.execute(stmt)
+
+        meetings_by_member: dict[str, list[dict[str, Any]]] = {}
+        for row in result.all():
+            meetings_by_member.setdefault(row.member_emp_no, []).append(
+                {"meeting_id": row.meeting_id, "ai_summary": row.ai_summary}
+            )
+        return meetings_by_member
+
+    async def find_member_rnr_titles_by_emp_nos(
+        self,
+        member_emp_nos: list[str],
+    ) -> dict[str, list[str]]:
+        """
+        여러 팀원의 R&R 제목 목록을 일괄 조회합니다. (LLM 프롬프트 구성용)
+
+        현재 연도 기준, MEMBER 타입 R&R만 조회합니다.
+
+        Args:
+            member_emp_nos: 팀원 사번 목록
+
+        Returns:
+            dict: { emp_no: [title, ...] } (제목 오름차순)
+        """
+        if not member_emp_nos:
+            return {}
+
+        current_year = str(datetime.utcnow().year)
+
+        logger.info(
+            "find_member_rnr_titles_by_emp_nos called",
+            extra={"member_count": len(member_emp_nos), "year": current_year},
+        )
+
+        stmt = (
+            select(Rr.emp_no, Rr.title)
+            .where(
+                and_(
+                    Rr.emp_no.in_(member_emp_nos),
+                    Rr.year == current_year,
+                    Rr.rr_type == "MEMBER",
+                )
+            )
+            .order_by(Rr.emp_no, Rr.title)
+        )
+        result = await self.db.execute(stmt)
+
+        titles_by_member: dict[str, list[str]] = {}
+        for row in result.all():
+            titles_by_member.setdefault(row.emp_no, []).append(row.title)
+        return titles_by_member
+
+    # =============================================
+    # Task 11 — 미팅 실행 일괄 변경(ops) Repository
+    # =============================================
+
+    async def apply_meeting_ops(
+        self,
+        meeting_id: uuid.UUID,
+        ops: list[dict[str, Any]],
+    ) -> tuple[int, list[Optional[str]]]:
+        """
+        미팅 실행 화면 변경 op 목록을 하나의 트랜잭션으로 적용합니다.
+
+        op를 요청 순서대로 메모리에서 접어 대상별 최종 상태를 만든 뒤 bulk statement로 반영합니다.
+        (op 수와 무관하게 statement 수는 대상 테이블 수에 비례)
+
+        1. tb_meeting UPDATE (state_version +1, 배치 내 마지막 메모) — 행 잠금으로 동시 배치 직렬화
+        2. 참조된 아젠다/Action Item/타임라인 + 활성 타임라인 조회 (이 미팅 소속인지 검증)
+        3. op 순서대로 fold
+           - create_timeline: 활성 카드를 start_time으로 마감 후 신규 카드 추가
+           - patch_timeline: end_time/segment_summary 덮어쓰기
+           - set_*_completed: 대상별 마지막 값만 반영
+        4. 신규 아젠다 multi-row INSERT, 기존 타임라인 executemany UPDATE 후 신규 타임라인
+           multi-row INSERT (활성 카드 1개 유지), 완료 상태는 값(True/False)별 IN UPDATE
+
+        Args:
+            meeting_id: 미팅 UUID
+            ops: op dict 목록 (MeetingOpsRequest.ops의 model_dump 결과, 요청 순서)
+
+        Returns:
+            tuple: (증가된 state_version, op별 대상 ID 목록 — 요청 순서)
+
+        Raises:
+            NotFoundException: 참조한 아젠다/Action Item/타임라인이 이 미팅에 없을 때
+            RepositoryException: DB 처리 실패 시
+        """
+        logger.info(
+            "apply_meeting_ops called",
+            extra={"meeting_id": str(meeting_id), "op_count": len(ops)},
+        )
+
+        # ── 대상 ID 파싱 (트랜잭션 전 — 잘못된 ID면 아무것도 적용하지 않음) ──
+        created_agenda_ids: set[uuid.UUID] = set()
+        created_timeline_ids: set[uuid.UUID] = set()
+        agenda_refs: set[uuid.UUID] = set()
+        action_item_refs: set[uuid.UUID] = set()
+        timeline_refs: set[uuid.UUID] = set()
+        last_memo: Optional[str] = None
+
+        parsed: list[dict[str, Any]] = []
+        for op in ops:
+            item = dict(op)
+            kind = item["op"]
+            if kind == "set_agenda_completed":
+                item["agenda_id"] = _parse_uuid(item["agenda_id"], "아젠다", "agenda_id")
+                if item["agenda_id"] not in created_agenda_ids:
+                    agenda_refs.add(item["agenda_id"])
+            elif kind == "set_action_item_completed":
+                item["action_item_id"] = _parse_uuid(
+                    item["action_item_id"], "Action Item", "action_item_id"
+                )
+                action_item_refs.add(item["action_item_id"])
+            elif kind == "create_timeline":
+                item["timeline_id"] = (
+                    _parse_uuid(item["timeline_id"], "타임라인", "timeline_id")
+                    if item.get("timeline_id")
+                    else uuid.uuid4()
+                )
+                item["rr_id"] = (
+                    _parse_uuid(item["rr_id"], "R&R", "rr_id") if item.get("rr_id") else None
+                )
+                created_timeline_ids.add(item["timeline_id"])
+            elif kind == "patch_timeline":
+                item["timeline_id"] = _parse_uuid(item["timeline_id"], "타임라인", "timeline_id")
+                if item["timeline_id"] not in created_timeline_ids:
+                    timeline_refs.add(item["timeline_id"])
+            elif kind == "create_agenda":
+                item["agenda_id"] = (
+                    _parse_uuid(item["agenda_id"], "아젠다", "agenda_id")
+                    if item.get("agenda_id")
+                    else uuid.uuid4()
+                )
+                created_agenda_ids.add(item["agenda_id"])
+            elif kind == "update_memo":
+                last_memo = item["private_memo"]
+            parsed.append(item)
+
+        try:
+            # 1. state_version +1 (+ 최종 메모) — 이후 statement는 이 행 잠금 하에서 실행
+            state_version = await self._bump_state_version(meeting_id, private_memo=last_memo)
+
+            # 2. 참조 대상 소속 검증
+            if agenda_refs:
+                found = await self.db.execute(
+                    select(TbMeetingAgenda.agenda_id).where(
+                        and_(
+                            TbMeetingAgenda.meeting_id == meeting_id,
+                            TbMeetingAgenda.agenda_id.in_(agenda_refs),
+                        )
+                    )
+                )
+                missing = agenda_refs - set(found.scalars().all())
+                if missing:
+                    raise NotFoundException(
+                        message="아젠다를 찾을 수 없습니다",
+                        details={"agenda_id": str(next(iter(missing)))},
+                    )
+
+            if action_item_refs:
+                found = await self.db.execute(
+                    select(TbMeetingActionItem.action_item_id).where(
+                        and_(
+                            TbMeetingActionItem.meeting_id == meeting_id,
+                            TbMeetingActionItem.action_item_id.in_(action_item_refs),
+                        )
+                    )
+                )
+                missing = action_item_refs - set(found.scalars().all())
+                if missing:
+                    raise NotFoundException(
+                        message="Action Item을 찾을 수 없습니다",
+                        details={"action_item_id": str(next(iter(missing)))},
+                    )
+
+            # 기존 타임라인 상태: 참조된 카드 + 활성 카드 (create_timeline 자동 마감 대상)
+            timelines: dict[uuid.UUID, dict[str, Any]] = {}
+            if timeline_refs or created_timeline_ids:
+                timeline_filter = TbMeetingTimeline.end_time.is_(None)
+                if timeline_refs:
+                    timeline_filter = or_(
+                        timeline_filter,
+                        TbMeetingTimeline.timeline_id.in_(timeline_refs),
+                    )
+                rows = await self.db.execute(
+                    select(
+                        TbMeetingTimeline.timeline_id,
+                        TbMeetingTimeline.end_time,
+                        TbMeetingTimeline.segment_summary,
+                    ).where(
+                        and_(
+                            TbMeetingTimeline.meeting_id == meeting_id,
+                            timeline_filter,
+                        )
+                    )
+                )
+                for row in rows.all():
+                    timelines[row.timeline_id] = {
+                        "end_time": row.end_time,
+                        "segment_summary": row.segment_summary,
+                    }
+                missing = timeline_refs - timelines.keys()
+                if missing:
+                    raise NotFoundException(
+                        message="타임라인을 찾을 수 없습니다",
+                        details={"timeline_id": str(next(iter(missing)))},
+                    )
+
+            next_order = 0
+            if created_agenda_ids:
+                max_order = await self.db.execute(
+                    select(func.max(TbMeetingAgenda.order)).where(
+                        TbMeetingAgenda.meeting_id == meeting_id
+                    )
+                )
+                current_max = max_order.scalar_one_or_none()
+                next_order = (current_max if current_max is not None else -1) + 1
+
+            # 3. op 순서대로 fold
+            new_agendas: dict[uuid.UUID, dict[str, Any]] = {}
+            new_timelines: dict[uuid.UUID, dict[str, Any]] = {}
+            dirty_timeline_ids: set[uuid.UUID] = set()
+            agenda_completed: dict[uuid.UUID, bool] = {}
+            action_item_completed: dict[uuid.UUID, bool] = {}
+            target_ids: list[Optional[str]] = []
+
+            for item in parsed:
+                kind = item["op"]
+                if kind == "set_agenda_completed":
+                    agenda_id = item["agenda_id"]
+                    if agenda_id in new_agendas:
+                        new_agendas[agenda_id]["is_completed"] = item["is_completed"]
+                    else:
+                        agenda_completed[agenda_id] = item["is_completed"]
+                    target_ids.append(str(agenda_id))
+                elif kind == "set_action_item_completed":
+                    action_item_completed[item["action_item_id"]] = item["is_completed"]
+                    target_ids.append(str(item["action_item_id"]))
+                elif kind == "create_timeline":
+                    for timeline_id, state in (*timelines.items(), *new_timelines.items()):
+                        if state["end_time"] is None:
+                            state["end_time"] = item["start_time"]
+                            if timeline_id in timelines:
+                                dirty_timeline_ids.add(timeline_id)
+                    new_timelines[item["timeline_id"]] = {
+                        "timeline_id": item["timeline_id"],
+                        "meeting_id": meeting_id,
+                        "rr_id": item["rr_id"],
+                        "start_time": item["start_time"],
+                        "end_time": None,
+                        "segment_summary": None,
+                    }
+                    target_ids.append(str(item["timeline_id"]))
+                elif kind == "patch_timeline":
+                    timeline_id = item["timeline_id"]
+                    state = new_timelines.get(timeline_id) or timelines[timeline_id]
+                    if item.get("end_time") is not None:
+                        state["end_time"] = item["end_time"]
+                    if item.get("segment_summary") is not None:
+                        state["segment_summary"] = item["segment_summary"]
+                    if timeline_id in timelines:
+                        dirty_timeline_ids.add(timeline_id)
+                    target_ids.append(str(timeline_id))
+                elif kind == "create_agenda":
+                    new_agendas[item["agenda_id"]] = {
+                        "agenda_id": item["agenda_id"],
+                        "meeting_id": meeting_id,
+                        "content": item["content"],
+                        "source": "LEADER_ADDED",
+                        "order": next_order,
+                        "is_completed": False,
+                    }
+                    next_order += 1
+                    target_ids.append(str(item["agenda_id"]))
+                else:  # update_memo — 1단계에서 반영
+                    target_ids.append(None)
+
+            # 4. bulk 반영
+            if new_agendas:
+                await self.db.execute(insert(TbMeetingAgenda), list(new_agendas.values()))
+
+            if dirty_timeline_ids:
+                timeline_table = TbMeetingTimeline.__table__
+                await self.db.execute(
+                    update(timeline_table)
+                    .where(timeline_table.c.timeline_id == bindparam("b_timeline_id"))
+                    .values(
+                        end_time=bindparam("b_end_time"),
+                        segment_summary=bindparam("b_segment_summary"),
+                    ),
+                    [
+                        {
+                            "b_timeline_id": timeline_id,
+                            "b_end_time": timelines[timeline_id]["end_time"],
+                            "b_segment_summary": timelines[timeline_id]["segment_summary"],
+                        }
+                        for timeline_id in dirty_timeline_ids
+                    ],
+                )
+
+            # 기존 활성 카드 마감 후 INSERT (미팅당 활성 카드 1개 부분 유니크 인덱스)
+            if new_timelines:
+                await self.db.execute(insert(TbMeetingTimeline), list(new_timelines.values()))
+
+            for model, key_column, completed_map in (
+                (TbMeetingAgenda, TbMeetingAgenda.agenda_id, agenda_completed),
+                (TbMeetingActionItem, TbMeetingActionItem.action_item_id, action_item_completed),
+            ):
+                for value in (True, False):
+                    ids = [key for key, completed in completed_map.items() if completed is value]
+                    if ids:
+                        await self.db.execute(
+                            update(model)
+                            .where(
+                                and_(
+                                    model.meeting_id == meeting_id,
+                                    key_column.in_(ids),
+                                )
+                            )
+                            .values(is_completed=value)
+                            .execution_options(synchronize_session=False)
+                        )
+
+            await self.db.commit()
+
+            logger.info(
+                "apply_meeting_ops 완료",
+                extra={
+                    "meeting_id": str(meeting_id),
+                    "state_version": state_version,
+                    "agendas_created": len(new_agendas),
+                    "timelines_created": len(new_timelines),
+                    "timelines_updated": len(dirty_timeline_ids),
+                },
+            )
+            return state_version, target_ids
+
+        except NotFoundException:
+            await self.db.rollback()
+            raise
+        except Exception as exc:
+            await self.db.rollback()
+            logger.error(
+                "apply_meeting_ops 실패",
+                extra={"meeting_id": str(meeting_id), "error": str(exc)},
+            )
+            raise RepositoryException(
+                "미팅 변경 일괄 적용에 실패했습니다",
+                details={"meeting_id": str(meeting_id)},
+            ) from exc
+
+    # =============================================
+    # Task 12 — 메모 자동 저장 Repository
+    # =============================================
+
+    async def save_meeting_memos(self, memos: dict[uuid.UUID, str]) -> int:
+        """
+        미팅별 최종 메모를 한 번의 executemany UPDATE로 저장합니다.
+
+        자동 저장 버퍼가 주기적으로 호출합니다. 버퍼가 최신 값을 직접 제공하므로
+        (get_active_meeting) state_version은 올리지 않습니다.
+        IN_PROGRESS 미팅만 갱신해, 종료 후 도착한 자동 저장 값이 최종 메모를 덮어쓰지 않습니다.
+
+        Args:
+            memos: { meeting_id: private_memo }
+
+        Returns:
+            int: 갱신된 미팅 수
+
+        Raises:
+            RepositoryException: DB 처리 실패 시
+        """
+        logger.info("save_meeting_memos called", extra={"meeting_count": len(memos)})
+
+        if not memos:
+            return 0
+
+        meeting_table = TbMeeting.__table__
+        try:
+            result = await self.db.execute(
+                update(meeting_table)
+                .where(
+                    meeting_table.c.meeting_id == bindparam("b_meeting_id"),
+                    meeting_table.c.status == "IN_PROGRESS",
+                )
+                .values(private_memo=bindparam("b_private_memo")),
+                [
+                    {"b_meeting_id": meeting_id, "b_private_memo": private_memo}
+                    for meeting_id, private_memo in memos.items()
+                ],
+            )
+            await self.db.commit()
+
+            updated: int = result.rowcount or 0
+            logger.info("save_meeting_memos 완료", extra={"updated": updated})
+            return updated
+
+        except Exception as exc:
+            await self.db.rollback()
+            logger.error(
+                "save_meeting_memos 실패",
+                extra={"meeting_count": len(memos), "error": str(exc)},
+            )
+            raise RepositoryException(
+                "메모 일괄 저장에 실패했습니다",
+                details={"meeting_count": len(memos)},
+            ) from exc
@@ -5,6 +5,7 @@ Coaching 도메인 라우터
     GET    /v1/coaching/dashboard                                              - 대시보드 (팀원 목록 + 면담 현황)
     POST   /v1/coaching/meetings                                               - 미팅 레코드 생성 (REQUESTED)
     GET    /v1/coaching/meetings/{meeting_id}/pre-meeting                      - 사전 준비 데이터 로드
+    POST   /v1/coaching/pre-meetings/batch                                     - 팀원 일괄 사전 준비 (NDJSON 스트림)
     DELETE /v1/coaching/meetings/{meeting_id}                                  - 사전 준비 모달 취소 (REQUESTED 삭제)
     PATCH  /v1/coaching/meetings/{meeting_id}/start                            - 미팅 시작 (IN_PROGRESS)
     GET    /v1/coaching/meetings/{meeting_id}/active                           - 미팅 실행 화면 초기 데이터
@@ -12,32 +13,57 @@ Coaching 도메인 라우터
     POST   /v1/coaching/meetings/{meeting_id}/timelines                        - 타임라인 카드 생성
     PATCH  /v1/coaching/meetings/{meeting_id}/timelines/{timeline_id}          - 타임라인 카드 마감/편집
     PATCH  /v1/coaching/meetings/{meeting_id}/memo                             - 개인 메모 저장
+    PUT    /v1/coaching/meetings/{meeting_id}/memo/autosave                    - 개인 메모 자동 저장 (버퍼링)
     PATCH  /v1/coaching/meetings/{meeting_id}/agendas/{agenda_id}/complete     - 아젠다 완료 토글
     PATCH  /v1/coaching/meetings/{meeting_id}/action-items/{action_item_id}/complete - Action Item 완료 토글
     POST   /v1/coaching/meetings/{meeting_id}/agendas                          - 즉석 아젠다 추가
+    POST   /v1/coaching/meetings/{meeting_id}/ops                              - 실행 화면 변경 일괄 적용
+    WS     /v1/coaching/meetings/{meeting_id}/ws                               - 실행 화면 실시간 채널 (스냅샷 + 증분 이벤트)
     GET    /v1/coaching/meetings/{meeting_id}/ai-questions                     - AI 스마트 아젠다 새로고침
     POST   /v1/coaching/meetings/{meeting_id}/presigned-url                    - GCS Presigned Upload URL 발급
+    POST   /v1/coaching/meetings/{meeting_id}/upload-session                   - 녹음 분할 업로드 세션 시작/재개
+    GET    /v1/coaching/meetings/{meeting_id}/upload-session                   - 녹음 분할 업로드 수신 현황 조회
     PATCH  /v1/coaching/meetings/{meeting_id}/complete                         - 미팅 종료 처리 (PROCESSING 전환)
     GET    /v1/coaching/members/{member_emp_no}/meetings                       - 팀원별 미팅 히스토리 목록
     GET    /v1/coaching/meetings/{meeting_id}/report                           - 미팅 상세 리포트 (Bento Grid 데이터)
+    GET    /v1/coaching/meetings/{meeting_id}/events                           - AI 파이프라인 진행 상황 (SSE)
     GET    /v1/coaching/meetings/{meeting_id}/audio-url                        - GCS Presigned Download URL 발급
+    GET    /v1/coaching/meetings/{meeting_id}/transcript                       - STT 트랜스크립트 구간 페이지 조회
+    GET    /v1/coaching/meetings/search                                        - 참여 미팅 전문 검색
 
 인증:
     모든 엔드포인트는 JWT Bearer 토큰 필수 (get_current_user_id 의존성 사용)
+    WebSocket은 브라우저가 헤더를 지정할 수 없으므로 ?token= 쿼리로 Access Token 전달
 """
 
-from typing import Optional
-
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+import asyncio
+import uuid
+from typing import Any, AsyncIterator, Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from server.app.core.database import get_db
-from server.app.core.dependencies import get_current_user_id
+from server.app.core.database import AsyncSessionLocal, get_db
+from server.app.core.dependencies import authenticate_access_token, get_current_user_id
+from server.app.core.events import event_hub
 from server.app.core.logging import get_logger
 from server.app.domain.coaching.schemas import (
     ActiveMeetingResponse,
     AiQuestionsResponse,
     AudioUrlResponse,
+    AutosaveMemoRequest,
+    AutosaveMemoResponse,
+    BatchPreMeetingRequest,
     CompleteMeetingRequest,
     CreateAgendaRequest,
     CreateAgendaResponse,
@@ -47,25 +73,38 @@ from server.app.domain.coaching.schemas import (
     CreateTimelineResponse,
     DashboardResponse,
     MeetingHistoryResponse,
+    MeetingOpsRequest,
+    MeetingOpsResponse,
     MeetingReportResponse,
+    MeetingSearchResponse,
     MeetingStartRequest,
     PatchMemoRequest,
     PatchTimelineRequest,
+    PipelineProgressEvent,
     PreMeetingResponse,
     PresignedUrlResponse,
     RrTreeResponse,
+    TranscriptPageResponse,
+    UploadSessionRequest,
+    UploadSessionResponse,
 )
 from server.app.domain.coaching.service import (
     CoachingActiveMeetingService,
     CoachingCompleteMeetingService,
     CoachingDashboardService,
     CoachingHistoryService,
+    CoachingPipelineService,
     CoachingPreMeetingService,
+    meeting_channel,
 )
 from server.app.shared.exceptions import BusinessLogicException, NotFoundException
 
 logger = get_logger(__name__)
 
+# 파이프라인 진행 상황 SSE 설정
+_SSE_KEEPALIVE_SECONDS: float = 15.0  # 프록시 idle timeout 방지용 주석 라인 전송 간격
+_PIPELINE_TERMINAL_STATUSES: tuple[str, ...] = ("COMPLETED", "FAILED")
+
 router = APIRouter(prefix="/coaching", tags=["coaching"])
 
 
@@ -81,11 +120,13 @@ router = APIRouter(prefix="/coaching", tags=["coaching"])
     description=(
         "로그인한 리더의 팀원 목록과 면담 현황 통계를 조회합니다. "
         "position_code='P005'(팀원)이고 on_work_yn='Y'(재직)인 직원만 포함됩니다. "
-        "dept_code 파라미터로 부서 필터링, search_name으로 이름 검색이 가능합니다."
+        "dept_code 파라미터로 부서 필터링, search_name으로 이름 검색이 가능합니다. "
+        "include_sub_depts=true이면 리더 부서의 하위 부서 팀원까지 포함합니다."
     ),
 )
 async def get_coaching_dashboard(
     dept_code: Optional[str] = Query(None, description="부서 코드 필터 (미입력 시 리더 소속 부서 전체)"),
+    include_sub_depts: bool = Query(False, description="하위 부서 팀원 포함 여부"),
     search_name: Optional[str] = Query(None, description="이름 검색어 (2자 이상 입력 시 적용)"),
     user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
@@ -95,6 +136,7 @@ async def get_coaching_dashboard(
 
     Args:
         dept_code: 부서 코드 필터 (optional)
+        include_sub_depts: 하위 부서 팀원 포함 여부
         search_name: 이름 검색어 (optional, 2자 미만 시 전체 조회)
         user_id: JWT에서 추출한 로그인 사용자 ID
         db: 데이터베이스 세션
@@ -112,7 +154,12 @@ async def get_coaching_dashboard(
     """
     logger.info(
         "GET /coaching/dashboard",
-        extra={"user_id": user_id, "dept_code": dept_code, "search_name": search_name},
+        extra={
+            "user_id": user_id,
+            "dept_code": dept_code,
+            "include_sub_depts": include_sub_depts,
+            "search_name": search_name,
+        },
     )
 
     try:
@@ -120,6 +167,7 @@ async def get_coaching_dashboard(
         return await service.get_dashboard(
             user_id=user_id,
             dept_code_filter=dept_code,
+            include_sub_depts=include_sub_depts,
             search_name=search_name,
         )
     except NotFoundException as exc:
@@ -270,6 +318,72 @@ async def get_pre_meeting_data(
         ) from exc
 
 
+@router.post(
+    "/pre-meetings/batch",
+    summary="팀원 일괄 사전 준비",
+    description=(
+        "여러 팀원의 사전 준비 데이터(이전 미팅 미완료 Action Item, AI 추천 질문)를 한 번에 생성합니다. "
+        "응답은 application/x-ndjson 스트림이며, 팀원별 준비가 끝나는 순서대로 한 줄씩 전송됩니다. "
+        "미팅 레코드는 생성하지 않습니다."
+    ),
+)
+async def prepare_pre_meetings_batch(
+    body: BatchPreMeetingRequest,
+    user_id: str = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """
+    팀원 일괄 사전 준비 데이터를 NDJSON으로 스트리밍합니다.
+
+    DB 조회는 짧은 독립 세션에서 스트림 시작 전에 끝냅니다.
+    (get_db 세션은 스트림이 끝날 때까지 정리되지 않아 LLM 호출 내내 커넥션을 점유함)
+
+    Args:
+        body: { member_emp_nos }
+        user_id: JWT에서 추출한 로그인 사용자 ID (리더)
+
+    Returns:
+        StreamingResponse: 한 줄당 BatchPreMeetingItem JSON
+
+    Raises:
+        HTTPException(404): 리더 정보가 없을 때
+        HTTPException(400): 팀원 목록이 비었거나 최대 인원을 초과할 때
+        HTTPException(500): 서버 내부 오류
+    """
+    logger.info(
+        "POST /coaching/pre-meetings/batch",
+        extra={"user_id": user_id, "member_count": len(body.member_emp_nos)},
+    )
+
+    try:
+        async with AsyncSessionLocal() as db:
+            stream = await CoachingPreMeetingService(db).prepare_batch(
+                user_id=user_id,
+                member_emp_nos=body.member_emp_nos,
+            )
+    except NotFoundException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except BusinessLogicException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.error(
+            "POST /coaching/pre-meetings/batch 실패",
+            extra={"user_id": user_id, "error": str(exc)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="일괄 사전 준비 중 오류가 발생했습니다",
+        ) from exc
+
+    return StreamingResponse(stream, media_type="application/x-ndjson")
+
+
 @router.delete(
     "/meetings/{meeting_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -712,6 +826,71 @@ async def update_memo(
         ) from exc
 
 
+@router.put(
+    "/meetings/{meeting_id}/memo/autosave",
+    response_model=AutosaveMemoResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="개인 메모 자동 저장",
+    description=(
+        "에디터 자동 저장용 엔드포인트입니다. 요청은 서버 버퍼에 기록되고 "
+        "DB에는 수 초 주기로 미팅별 마지막 값만 저장됩니다. "
+        "seq가 이미 받은 값 이하이면 accepted=false를 반환합니다. "
+        "리더가 아니거나 IN_PROGRESS 상태가 아닌 경우 400 에러를 반환합니다."
+    ),
+)
+async def autosave_memo(
+    meeting_id: str,
+    body: AutosaveMemoRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> AutosaveMemoResponse:
+    """
+    개인 메모 자동 저장 요청을 버퍼에 기록합니다. (리더 전용)
+
+    Args:
+        meeting_id: 미팅 UUID 문자열
+        body: { seq, private_memo }
+        user_id: JWT에서 추출한 로그인 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        AutosaveMemoResponse: 반영 여부 + seq
+
+    Raises:
+        HTTPException(404): 미팅이 없을 때
+        HTTPException(400): 리더가 아니거나 IN_PROGRESS 상태가 아닐 때
+        HTTPException(500): 서버 내부 오류
+    """
+    try:
+        service = CoachingActiveMeetingService(db)
+        return await service.autosave_memo(
+            user_id=user_id,
+            meeting_id=meeting_id,
+            seq=body.seq,
+            private_memo=body.private_memo,
+        )
+    except NotFoundException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except BusinessLogicException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.error(
+            "PUT /coaching/meetings/{meeting_id}/memo/autosave 실패",
+            extra={"user_id": user_id, "meeting_id": meeting_id, "error": str(exc)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="메모 자동 저장 중 오류가 발생했습니다",
+        ) from exc
+
+
 @router.patch(
     "/meetings/{meeting_id}/agendas/{agenda_id}/complete",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -906,6 +1085,230 @@ async def create_agenda(
         ) from exc
 
 
+@router.post(
+    "/meetings/{meeting_id}/ops",
+    response_model=MeetingOpsResponse,
+    summary="미팅 실행 화면 변경 일괄 적용",
+    description=(
+        "아젠다/Action Item 완료, 타임라인 생성/마감, 메모 저장, 즉석 아젠다 추가를 "
+        "순서가 있는 op 목록으로 받아 한 트랜잭션에 적용합니다. "
+        "하나라도 실패하면 전체가 적용되지 않으며, 응답의 state_version으로 화면 상태를 동기화합니다."
+    ),
+)
+async def apply_meeting_ops(
+    meeting_id: str,
+    body: MeetingOpsRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> MeetingOpsResponse:
+    """
+    미팅 실행 화면 변경 op 목록을 일괄 적용합니다.
+
+    Args:
+        meeting_id: 미팅 UUID 문자열
+        body: { ops: [ { op, ... }, ... ] }
+        user_id: JWT에서 추출한 로그인 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        MeetingOpsResponse: state_version + op별 대상 ID
+
+    Raises:
+        HTTPException(404): 미팅 또는 참조 대상이 없을 때
+        HTTPException(400): 권한 없을 때
+        HTTPException(500): 서버 내부 오류
+    """
+    logger.info(
+        "POST /coaching/meetings/{meeting_id}/ops",
+        extra={"user_id": user_id, "meeting_id": meeting_id, "op_count": len(body.ops)},
+    )
+
+    try:
+        service = CoachingActiveMeetingService(db)
+        return await service.apply_ops(
+            user_id=user_id,
+            meeting_id=meeting_id,
+            body=body,
+        )
+    except NotFoundException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except BusinessLogicException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.error(
+            "POST /coaching/meetings/{meeting_id}/ops 실패",
+            extra={"user_id": user_id, "meeting_id": meeting_id, "error": str(exc)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="미팅 변경 일괄 적용 중 오류가 발생했습니다",
+        ) from exc
+
+
+async def _load_meeting_snapshot(user_id: str, meeting_id: str) -> dict[str, Any]:
+    """
+    실행 화면 스냅샷 메시지를 짧은 세션으로 조회합니다.
+
+    WebSocket 연결 동안 DB 커넥션을 점유하지 않도록 조회마다 세션을 열고 닫습니다.
+    """
+    async with AsyncSessionLocal() as db:
+        snapshot = await CoachingActiveMeetingService(db).get_active_meeting(
+            user_id=user_id, meeting_id=meeting_id
+        )
+
+    return {
+        "type": "snapshot",
+        "state_version": snapshot.state_version,
+        "data": snapshot.model_dump(mode="json"),
+    }
+
+
+def _render_meeting_event(event: dict[str, Any], is_leader: bool) -> dict[str, Any]:
+    """
+    허브 이벤트를 구독자 메시지로 변환합니다.
+
+    private_data(개인 메모 등)는 리더에게만 data에 병합하고, 팀원에게는 제거합니다.
+    """
+    private_data = event.get("private_data")
+    if private_data is None:
+        return event
+
+    message = {key: value for key, value in event.items() if key != "private_data"}
+    if is_leader:
+        message["data"] = {**event["data"], **private_data}
+    return message
+
+
+async def _wait_client_disconnect(websocket: WebSocket) -> None:
+    """클라이언트 → 서버 메시지는 사용하지 않으며 연결 종료만 감지합니다."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+@router.websocket("/meetings/{meeting_id}/ws")
+async def meeting_realtime_channel(
+    websocket: WebSocket,
+    meeting_id: str,
+    token: str = Query(..., description="Access Token (브라우저 WebSocket은 헤더 지정 불가)"),
+    since_version: Optional[int] = Query(
+        None, ge=0, description="재연결 시 마지막으로 반영한 state_version"
+    ),
+) -> None:
+    """
+    미팅 실행 화면 실시간 채널
+
+    리더/팀원 화면이 폴링 없이 아젠다·Action Item·타임라인·메모·상태 변경을 수신합니다.
+
+    메시지 (서버 → 클라이언트, JSON):
+        {"type": "snapshot", "state_version": n, "data": ActiveMeetingResponse}
+        {"type": "<event>", "meeting_id": str, "state_version": n, "data": {...}}
+
+    재연결:
+        since_version 이후 이벤트가 허브 버퍼에 연속으로 남아 있으면 놓친 이벤트만 재전송하고,
+        그렇지 않으면(다른 워커에서 발생, 버퍼 초과 등) 스냅샷부터 다시 전송합니다.
+        state_version 이하의 이벤트는 중복으로 간주해 전송하지 않습니다.
+
+    Args:
+        websocket: WebSocket 연결
+        meeting_id: 미팅 UUID 문자열
+        token: Access Token
+        since_version: 재연결 시 마지막으로 반영한 state_version
+
+    Close codes:
+        1008: 인증 실패 / 권한 없음 / 미팅 없음 / 시작 전 미팅
+        1011: 서버 내부 오류
+    """
+    logger.info(
+        "WS /coaching/meetings/{meeting_id}/ws",
+        extra={"meeting_id": meeting_id, "since_version": since_version},
+    )
+
+    try:
+        async with AsyncSessionLocal() as db:
+            user_id = await authenticate_access_token(token, db)
+            meeting_uuid, is_leader = await CoachingActiveMeetingService(
+                db
+            ).authorize_meeting_channel(user_id=user_id, meeting_id=meeting_id)
+    except (HTTPException, NotFoundException, BusinessLogicException) as exc:
+        logger.warning(
+            "WS /coaching/meetings/{meeting_id}/ws 연결 거부",
+            extra={"meeting_id": meeting_id, "error": str(exc)},
+        )
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+
+    # 스냅샷/재전송 전에 구독해야 그 사이 발생한 이벤트를 놓치지 않음 (중복은 버전으로 제거)
+    channel = meeting_channel(meeting_uuid)
+    queue = event_hub.subscribe(channel)
+    disconnect = asyncio.create_task(_wait_client_disconnect(websocket))
+
+    try:
+        replayed = (
+            event_hub.replay(channel, since_version) if since_version is not None else None
+        )
+        if replayed is None:
+            snapshot = await _load_meeting_snapshot(user_id, meeting_id)
+            await websocket.send_json(snapshot)
+            sent_version = snapshot["state_version"]
+        else:
+            sent_version = since_version
+            for event in replayed:
+                await websocket.send_json(_render_meeting_event(event, is_leader))
+                sent_version = event["state_version"]
+
+        while True:
+            next_event = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait(
+                {next_event, disconnect}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if disconnect in done:
+                next_event.cancel()
+                break
+
+            event = next_event.result()
+            if event["type"] == "resync":
+                # 구독자 큐 초과로 이벤트가 유실됨 → 스냅샷으로 재동기화
+                snapshot = await _load_meeting_snapshot(user_id, meeting_id)
+                await websocket.send_json(snapshot)
+                sent_version = snapshot["state_version"]
+                continue
+
+            if event["state_version"] <= sent_version:
+                continue
+
+            await websocket.send_json(_render_meeting_event(event, is_leader))
+            sent_version = event["state_version"]
+    except WebSocketDisconnect:
+        pass
+    except (NotFoundException, BusinessLogicException) as exc:
+        logger.warning(
+            "WS /coaching/meetings/{meeting_id}/ws 스냅샷 조회 거부",
+            extra={"meeting_id": meeting_id, "error": str(exc)},
+        )
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+    except Exception as exc:
+        logger.error(
+            "WS /coaching/meetings/{meeting_id}/ws 실패",
+            extra={"meeting_id": meeting_id, "error": str(exc)},
+            exc_info=True,
+        )
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+    finally:
+        disconnect.cancel()
+        event_hub.unsubscribe(channel, queue)
+
+
 @router.get(
     "/meetings/{meeting_id}/ai-questions",
     response_model=AiQuestionsResponse,
@@ -1037,6 +1440,140 @@ async def get_presigned_url(
         ) from exc
 
 
+@router.post(
+    "/meetings/{meeting_id}/upload-session",
+    response_model=UploadSessionResponse,
+    status_code=status.HTTP_200_OK,
+    summary="녹음 분할 업로드 세션 시작/재개",
+    description=(
+        "긴 녹음 파일을 파트 단위로 나눠 병렬 업로드하기 위한 세션을 시작합니다. "
+        "같은 total_size_bytes로 다시 호출하면 이미 받은 파트는 uploaded_parts로, "
+        "남은 파트만 업로드 URL과 함께 pending_parts로 반환합니다. "
+        "리더만 호출 가능합니다."
+    ),
+)
+async def start_upload_session(
+    meeting_id: str,
+    body: UploadSessionRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> UploadSessionResponse:
+    """
+    녹음 분할 업로드 세션을 시작(또는 재개)합니다.
+
+    Args:
+        meeting_id: 미팅 UUID 문자열
+        body: { total_size_bytes }
+        user_id: JWT에서 추출한 로그인 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        UploadSessionResponse: 파트 계획 + 수신 현황 + 남은 파트 업로드 URL
+
+    Raises:
+        HTTPException(404): 미팅이 없을 때
+        HTTPException(400): 권한 없음, 종료된 미팅, 최대 크기 초과 시
+        HTTPException(500): 스토리지 오류 또는 서버 내부 오류
+    """
+    logger.info(
+        "POST /coaching/meetings/{meeting_id}/upload-session",
+        extra={"user_id": user_id, "meeting_id": meeting_id},
+    )
+
+    try:
+        service = CoachingCompleteMeetingService(db)
+        return await service.start_upload_session(
+            user_id=user_id,
+            meeting_id=meeting_id,
+            body=body,
+        )
+    except NotFoundException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except BusinessLogicException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.error(
+            "POST /coaching/meetings/{meeting_id}/upload-session 실패",
+            extra={"user_id": user_id, "meeting_id": meeting_id, "error": str(exc)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="업로드 세션 생성 중 오류가 발생했습니다",
+        ) from exc
+
+
+@router.get(
+    "/meetings/{meeting_id}/upload-session",
+    response_model=UploadSessionResponse,
+    status_code=status.HTTP_200_OK,
+    summary="녹음 분할 업로드 수신 현황 조회",
+    description=(
+        "서버가 수신을 확인한 파트 목록과, 남은 파트의 새 업로드 URL을 반환합니다. "
+        "네트워크 단절 후 업로드를 재개할 때 사용합니다. "
+        "리더만 호출 가능합니다."
+    ),
+)
+async def get_upload_session(
+    meeting_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> UploadSessionResponse:
+    """
+    녹음 분할 업로드 수신 현황을 조회합니다.
+
+    Args:
+        meeting_id: 미팅 UUID 문자열
+        user_id: JWT에서 추출한 로그인 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        UploadSessionResponse: 파트 계획 + 수신 현황 + 남은 파트 업로드 URL
+
+    Raises:
+        HTTPException(404): 미팅 또는 업로드 세션이 없을 때
+        HTTPException(400): 권한 없을 때
+        HTTPException(500): 스토리지 오류 또는 서버 내부 오류
+    """
+    logger.info(
+        "GET /coaching/meetings/{meeting_id}/upload-session",
+        extra={"user_id": user_id, "meeting_id": meeting_id},
+    )
+
+    try:
+        service = CoachingCompleteMeetingService(db)
+        return await service.get_upload_session(
+            user_id=user_id,
+            meeting_id=meeting_id,
+        )
+    except NotFoundException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except BusinessLogicException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.error(
+            "GET /coaching/meetings/{meeting_id}/upload-session 실패",
+            extra={"user_id": user_id, "meeting_id": meeting_id, "error": str(exc)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="업로드 현황 조회 중 오류가 발생했습니다",
+        ) from exc
+
+
 @router.patch(
     "/meetings/{meeting_id}/complete",
     status_code=status.HTTP_200_OK,
@@ -1046,7 +1583,8 @@ async def get_presigned_url(
         "status=PROCESSING으로 전환하고, TbMeetingRecord와 TbCoachingRelation을 갱신합니다. "
         "AI 파이프라인이 BackgroundTask로 트리거됩니다. "
         "이미 PROCESSING/COMPLETED 상태이면 멱등 처리(200 반환)합니다. "
-        "gcs_path 누락 시 status=FAILED로 전환합니다."
+        "gcs_path 누락 시 status=FAILED로 전환합니다. "
+        "업로드 파일이 없거나 분할 업로드 파트가 누락/크기 불일치면 400을 반환합니다 (재업로드 후 재호출)."
     ),
 )
 async def complete_meeting(
@@ -1221,6 +1759,144 @@ async def get_meeting_report(
         ) from exc
 
 
+async def _pipeline_event_stream(
+    user_id: str,
+    meeting_id: str,
+    channel: str,
+    queue: asyncio.Queue,
+    progress: PipelineProgressEvent,
+) -> AsyncIterator[str]:
+    """
+    진행 상황 SSE 스트림을 생성합니다. (종료 상태 전송 후 스트림 종료)
+
+    스트림 중에는 DB 세션을 점유하지 않으며, 재동기화가 필요할 때만 짧은 세션을 엽니다.
+    """
+    sent_version = -1
+    try:
+        while True:
+            if progress.state_version > sent_version:
+                yield (
+                    f"id: {progress.state_version}\n"
+                    f"event: progress\n"
+                    f"data: {progress.model_dump_json()}\n\n"
+                )
+                sent_version = progress.state_version
+
+            if progress.status in _PIPELINE_TERMINAL_STATUSES:
+                return
+
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=_SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            if event["type"] == "resync":
+                # 구독자 큐 초과로 이벤트가 유실됨 → 현재 상태 재조회
+                async with AsyncSessionLocal() as db:
+                    progress = await CoachingPipelineService(db).get_pipeline_progress(
+                        user_id=user_id, meeting_id=meeting_id
+                    )
+                continue
+
+            next_progress = CoachingPipelineService.progress_from_event(event)
+            if next_progress is not None:
+                progress = next_progress
+    except Exception as exc:
+        logger.error(
+            "GET /coaching/meetings/{meeting_id}/events 스트림 실패",
+            extra={"user_id": user_id, "meeting_id": meeting_id, "error": str(exc)},
+            exc_info=True,
+        )
+    finally:
+        event_hub.unsubscribe(channel, queue)
+
+
+@router.get(
+    "/meetings/{meeting_id}/events",
+    summary="AI 파이프라인 진행 상황 스트림 (SSE)",
+    description=(
+        "미팅 종료 후 AI 파이프라인 진행 단계를 text/event-stream으로 전송합니다. "
+        "연결 직후 현재 상태를 보내고, 단계 변경(DOWNLOAD → STT → SUMMARY → DONE | FAILED)마다 "
+        "progress 이벤트를 전송하며 DONE/FAILED 전송 후 스트림을 종료합니다. "
+        "리포트 폴링 대신 사용합니다."
+    ),
+)
+async def stream_pipeline_events(
+    meeting_id: str,
+    user_id: str = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """
+    AI 파이프라인 진행 상황을 SSE로 스트리밍합니다.
+
+    다른 프로세스에서 실행되는 파이프라인의 이벤트는 Postgres LISTEN/NOTIFY로 전달됩니다.
+    초기 상태는 짧은 독립 세션으로 조회합니다. (get_db 세션은 스트림이 끝날 때까지
+    정리되지 않아 파이프라인 내내 커넥션을 점유함)
+
+    Args:
+        meeting_id: 미팅 UUID 문자열
+        user_id: JWT에서 추출한 로그인 사용자 ID (리더 또는 팀원)
+
+    Returns:
+        StreamingResponse: event: progress, data: PipelineProgressEvent JSON
+
+    Raises:
+        HTTPException(404): 미팅이 없을 때
+        HTTPException(400): 권한 없을 때
+        HTTPException(500): 서버 내부 오류
+    """
+    logger.info(
+        "GET /coaching/meetings/{meeting_id}/events",
+        extra={"user_id": user_id, "meeting_id": meeting_id},
+    )
+
+    try:
+        channel = meeting_channel(uuid.UUID(meeting_id))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="유효하지 않은 미팅 ID입니다",
+        ) from exc
+
+    # 초기 상태 조회 전에 구독해야 그 사이 발생한 단계 변경을 놓치지 않음
+    queue = event_hub.subscribe(channel)
+    try:
+        try:
+            async with AsyncSessionLocal() as db:
+                progress = await CoachingPipelineService(db).get_pipeline_progress(
+                    user_id=user_id, meeting_id=meeting_id
+                )
+        except NotFoundException as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(exc),
+            ) from exc
+        except BusinessLogicException as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc),
+            ) from exc
+        except Exception as exc:
+            logger.error(
+                "GET /coaching/meetings/{meeting_id}/events 실패",
+                extra={"user_id": user_id, "meeting_id": meeting_id, "error": str(exc)},
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="파이프라인 진행 상황 조회 중 오류가 발생했습니다",
+            ) from exc
+    except HTTPException:
+        event_hub.unsubscribe(channel, queue)
+        raise
+
+    return StreamingResponse(
+        _pipeline_event_stream(user_id, meeting_id, channel, queue, progress),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/meetings/{meeting_id}/audio-url",
     response_model=AudioUrlResponse,
@@ -1277,3 +1953,141 @@ async def get_audio_url(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="오디오 URL 발급 중 오류가 발생했습니다",
         ) from exc
+
+
+@router.get(
+    "/meetings/{meeting_id}/transcript",
+    response_model=TranscriptPageResponse,
+    summary="STT 트랜스크립트 구간 조회",
+)
+async def get_transcript(
+    meeting_id: str,
+    from_sec: float = Query(0.0, alias="from", ge=0, description="조회 시작 시각 (초)"),
+    after_seq: Optional[int] = Query(None, ge=0, description="이전 페이지 next_after_seq (커서)"),
+    to_sec: Optional[float] = Query(None, alias="to", ge=0, description="조회 종료 시각 (초, 미포함)"),
+    limit: int = Query(200, ge=1, le=1000, description="페이지 크기 (1-1000)"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> TranscriptPageResponse:
+    """
+    STT 트랜스크립트를 녹음 시각 구간 단위로 페이지 조회합니다.
+
+    리포트 API에는 트랜스크립트가 포함되지 않으며, 리포트 화면은 이 엔드포인트로
+    필요한 구간만 조회합니다. has_more=True이면 next_from, next_after_seq를
+    from, after_seq로 재요청합니다.
+
+    권한:
+        - 리더 / 팀원: 접근 가능
+        - 그 외: 404 반환
+
+    Args:
+        meeting_id: 미팅 UUID 문자열
+        from_sec: 조회 시작 시각 (초)
+        after_seq: 커서 seq (from과 같은 시각의 구간 중 이 seq 이후부터)
+        to_sec: 조회 종료 시각 (초, 미지정 시 끝까지)
+        limit: 페이지 크기
+        user_id: JWT에서 추출한 로그인 사용자 ID
+        db: 데이터베이스 세션
+
+    Raises:
+        HTTPException(404): 미팅이 없거나 접근 권한이 없을 때
+        HTTPException(500): 서버 내부 오류
+    """
+    logger.info(
+        "GET /coaching/meetings/{meeting_id}/transcript",
+        extra={
+            "user_id": user_id,
+            "meeting_id": meeting_id,
+            "from_sec": from_sec,
+            "after_seq": after_seq,
+            "to_sec": to_sec,
+            "limit": limit,
+        },
+    )
+
+    try:
+        service = CoachingHistoryService(db)
+        return await service.get_transcript(
+            user_id=user_id,
+            meeting_id=meeting_id,
+            from_sec=from_sec,
+            after_seq=after_seq,
+            to_sec=to_sec,
+            limit=limit,
+        )
+    except NotFoundException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.error(
+            "GET /coaching/meetings/{meeting_id}/transcript 실패",
+            extra={"user_id": user_id, "meeting_id": meeting_id, "error": str(exc)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="트랜스크립트 조회 중 오류가 발생했습니다",
+        ) from exc
+
+
+@router.get(
+    "/meetings/search",
+    response_model=MeetingSearchResponse,
+    summary="미팅 전문 검색",
+)
+async def search_meetings(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (공백 구분, AND 조건)"),
+    limit: int = Query(20, ge=1, le=50, description="최대 결과 건수 (1-50)"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> MeetingSearchResponse:
+    """
+    로그인 사용자가 리더 또는 팀원으로 참여한 미팅을 검색합니다.
+
+    검색 대상: AI 전체 요약, 타임라인 구간 요약, STT 트랜스크립트
+    (AI 파이프라인 finalize 단계에서 색인된 미팅만 검색됩니다)
+
+    Args:
+        q: 검색어
+        limit: 최대 결과 건수
+        user_id: JWT에서 추출한 로그인 사용자 ID
+        db: 데이터베이스 세션
+
+    Raises:
+        HTTPException(400): 유효한 검색어가 없을 때
+        HTTPException(500): 서버 내부 오류
+    """
+    logger.info(
+        "GET /coaching/meetings/search",
+        extra={"user_id": user_id, "limit": limit},
+    )
+
+    try:
+        service = CoachingHistoryService(db)
+        return await service.search_meetings(
+            user_id=user_id,
+            query=q,
+            limit=limit,
+        )
+    except NotFoundException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+    except BusinessLogicException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    except Exception as exc:
+        logger.error(
+            "GET /coaching/meetings/search 실패",
+            extra={"user_id": user_id, "error": str(exc)},
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="미팅 검색 중 오류가 발생했습니다",
+        ) from exc
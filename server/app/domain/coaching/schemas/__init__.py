@@ -5,9 +5,9 @@ Request/Response DTO 정의
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Literal, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # =============================================
@@ -154,6 +154,7 @@ class ActiveMeetingResponse(BaseModel):
     action_items: list[ActiveMeetingActionItem]
     timelines: list[ActiveMeetingTimelineItem]
     private_memo: Optional[str]
+    state_version: int  # 변경마다 +1 (ops 응답 버전과 비교하여 동기화)
 
 
 class RrTreeNode(BaseModel):
@@ -211,6 +212,20 @@ class PatchMemoRequest(BaseModel):
     private_memo: str
 
 
+class AutosaveMemoRequest(BaseModel):
+    """PUT /coaching/meetings/{meeting_id}/memo/autosave 요청"""
+
+    seq: int = Field(..., ge=0)  # 클라이언트가 변경마다 단조 증가시키는 순번
+    private_memo: str
+
+
+class AutosaveMemoResponse(BaseModel):
+    """PUT /coaching/meetings/{meeting_id}/memo/autosave 응답"""
+
+    accepted: bool  # False면 더 최신 seq가 이미 반영됨
+    seq: int
+
+
 class CreateAgendaRequest(BaseModel):
     """POST /coaching/meetings/{meeting_id}/agendas 요청"""
 
@@ -246,10 +261,40 @@ class PresignedUrlResponse(BaseModel):
     expires_at: str
 
 
+class UploadSessionRequest(BaseModel):
+    """POST /coaching/meetings/{meeting_id}/upload-session 요청"""
+
+    total_size_bytes: int = Field(..., gt=0)  # 녹음 파일 전체 크기(바이트)
+
+
+class UploadPartUrl(BaseModel):
+    """분할 업로드 파트별 업로드 URL"""
+
+    part_number: int  # 1부터 시작
+    size_bytes: int  # 이 파트로 보낼 바이트 수 (offset = (part_number - 1) * part_size_bytes)
+    presigned_url: str  # PUT 대상 (Content-Type 등 필수 헤더 없음)
+
+
+class UploadSessionResponse(BaseModel):
+    """POST/GET /coaching/meetings/{meeting_id}/upload-session 응답
+
+    클라이언트는 pending_parts를 병렬로 PUT하고, 실패하면 GET으로 현황을 다시 받아 남은 파트만 재전송합니다.
+    """
+
+    gcs_path: str
+    total_size_bytes: int
+    part_size_bytes: int
+    part_count: int
+    uploaded_parts: list[int]  # 서버가 수신 완료를 확인한 파트 번호
+    pending_parts: list[UploadPartUrl]  # 아직 받지 못한 파트 (업로드 URL 포함)
+    expires_at: str  # pending_parts URL 만료 시각
+
+
 class CompleteMeetingRequest(BaseModel):
     """PATCH /coaching/meetings/{meeting_id}/complete 요청
 
     GCS 업로드 완료 후 프론트엔드가 전달합니다.
+    분할 업로드 세션이 있으면 서버가 파트를 조립하고 최종 크기를 검증합니다.
     """
 
     actual_duration_seconds: int  # 실제 녹음 길이(초)
@@ -326,3 +371,182 @@ class AudioUrlResponse(BaseModel):
 
     audio_url: str
     expires_at: str  # ISO 8601 UTC 문자열
+
+
+# =============================================
+# Task 8 — 트랜스크립트 스키마
+# =============================================
+
+
+class TranscriptSegmentItem(BaseModel):
+    """트랜스크립트 구간 아이템"""
+
+    seq: int
+    start_time: float
+    end_time: Optional[float]
+    speaker: Optional[str]   # 'LEADER' | 'MEMBER' | None
+    text: str
+
+
+class TranscriptPageResponse(BaseModel):
+    """GET /coaching/meetings/{meeting_id}/transcript 응답
+
+    has_more=True이면 next_from, next_after_seq 값을 from, after_seq 파라미터로 재요청하여
+    다음 페이지를 조회합니다. (시작 시각이 같은 구간이 여러 페이지에 걸쳐도 중복/누락 없음)
+    """
+
+    meeting_id: str
+    items: list[TranscriptSegmentItem]
+    has_more: bool
+    next_from: Optional[float]
+    next_after_seq: Optional[int]
+
+
+# =============================================
+# Task 9 — 미팅 검색 스키마
+# =============================================
+
+
+class MeetingSearchItem(BaseModel):
+    """미팅 검색 결과 아이템"""
+
+    meeting_id: str
+    leader_emp_no: str
+    member_emp_no: str
+    member_name: Optional[str]
+    completed_at: Optional[datetime]
+    score: float
+    snippet: str
+    highlights: list[tuple[int, int]]  # snippet 내 검색어 [start, end) 오프셋
+
+
+class MeetingSearchResponse(BaseModel):
+    """GET /coaching/meetings/search 응답"""
+
+    query: str
+    items: list[MeetingSearchItem]
+    total: int
+
+
+# =============================================
+# Task 10 — 일괄 사전 준비 스키마
+# =============================================
+
+
+class BatchPreMeetingRequest(BaseModel):
+    """POST /coaching/pre-meetings/batch 요청"""
+
+    member_emp_nos: list[str]
+
+
+class BatchPreMeetingItem(BaseModel):
+    """POST /coaching/pre-meetings/batch NDJSON 응답의 한 줄 (팀원 1명)"""
+
+    member_emp_no: str
+    member_info: Optional[MemberInfo]   # 인사정보가 없으면 None (error 채움)
+    is_first_meeting: bool
+    previous_action_items: list[ActionItemBrief]
+    ai_suggested_agendas: list[str]  # AI 추천 질문 (LLM 호출, 실패 시 빈 배열)
+    error: Optional[str] = None
+
+
+# =============================================
+# Task 11 — 미팅 실행 일괄 변경(ops) 스키마
+# =============================================
+
+
+class SetAgendaCompletedOp(BaseModel):
+    """아젠다 완료 상태 지정 (토글 대신 목표 값을 보내 재시도에도 안전)"""
+
+    op: Literal["set_agenda_completed"]
+    agenda_id: str
+    is_completed: bool
+
+
+class SetActionItemCompletedOp(BaseModel):
+    """Action Item 완료 상태 지정"""
+
+    op: Literal["set_action_item_completed"]
+    action_item_id: str
+    is_completed: bool
+
+
+class CreateTimelineOp(BaseModel):
+    """타임라인 카드 생성 (활성 카드는 start_time으로 자동 마감)"""
+
+    op: Literal["create_timeline"]
+    timeline_id: Optional[str] = None  # 클라이언트 생성 UUID (같은 배치의 후속 op에서 참조)
+    rr_id: Optional[str] = None
+    start_time: int
+
+
+class PatchTimelineOp(BaseModel):
+    """타임라인 카드 마감/편집"""
+
+    op: Literal["patch_timeline"]
+    timeline_id: str
+    end_time: Optional[int] = None
+    segment_summary: Optional[str] = None
+
+
+class UpdateMemoOp(BaseModel):
+    """개인 메모 저장 (배치 내 마지막 값만 반영)"""
+
+    op: Literal["update_memo"]
+    private_memo: str
+
+
+class CreateAgendaOp(BaseModel):
+    """즉석 아젠다 추가 (source=LEADER_ADDED)"""
+
+    op: Literal["create_agenda"]
+    agenda_id: Optional[str] = None  # 클라이언트 생성 UUID (같은 배치의 후속 op에서 참조)
+    content: str
+
+
+MeetingOp = Annotated[
+    Union[
+        SetAgendaCompletedOp,
+        SetActionItemCompletedOp,
+        CreateTimelineOp,
+        PatchTimelineOp,
+        UpdateMemoOp,
+        CreateAgendaOp,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class MeetingOpsRequest(BaseModel):
+    """POST /coaching/meetings/{meeting_id}/ops 요청 (순서대로 적용)"""
+
+    ops: list[MeetingOp] = Field(..., min_length=1, max_length=200)
+
+
+class MeetingOpResult(BaseModel):
+    """op 단위 적용 결과"""
+
+    op: str
+    target_id: Optional[str]  # 생성/변경된 대상 ID (update_memo는 None)
+
+
+class MeetingOpsResponse(BaseModel):
+    """POST /coaching/meetings/{meeting_id}/ops 응답"""
+
+    meeting_id: str
+    state_version: int
+    results: list[MeetingOpResult]  # 요청 ops와 같은 순서
+
+
+# =============================================
+# Task 13 — AI 파이프라인 진행 상황 스키마
+# =============================================
+
+
+class PipelineProgressEvent(BaseModel):
+    """GET /coaching/meetings/{meeting_id}/events SSE progress 이벤트 data"""
+
+    meeting_id: str
+    status: str           # REQUESTED | IN_PROGRESS | PROCESSING | COMPLETED | FAILED
+    stage: Optional[str]  # DOWNLOAD | STT | SUMMARY | DONE | FAILED (파이프라인 시작 전 None)
+    state_version: int
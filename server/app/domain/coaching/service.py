@@ -5,19 +5,28 @@ Coaching 도메인 Service
 Repository / Calculator / Formatter 조율
 """
 
+import asyncio
+import contextlib
+import time
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.app.core.config import settings
+from server.app.core.events import event_hub, pg_event_bridge
 from server.app.core.logging import get_logger
-from server.app.core.storage.gcs import GCSClient, get_gcs_client
+from server.app.core.storage import StorageBackend, get_storage
 from server.app.domain.coaching.calculators import (
     generate_ai_suggested_agendas,
+    plan_upload_parts,
     run_ai_pipeline,
+    select_relevant_summaries,
 )
+from server.app.domain.coaching.formatters import format_pipeline_stage, format_search_snippet
 from server.app.domain.coaching.repositories import CoachingRepository
 from server.app.domain.coaching.schemas import (
     ActionItemBrief,
@@ -28,6 +37,8 @@ from server.app.domain.coaching.schemas import (
     ActiveMeetingTimelineItem,
     AiQuestionsResponse,
     AudioUrlResponse,
+    AutosaveMemoResponse,
+    BatchPreMeetingItem,
     CompleteMeetingRequest,
     CreateAgendaResponse,
     CreateMeetingResponse,
@@ -37,23 +48,127 @@ from server.app.domain.coaching.schemas import (
     DashboardSummary,
     MeetingHistoryItem,
     MeetingHistoryResponse,
+    MeetingOpResult,
+    MeetingOpsRequest,
+    MeetingOpsResponse,
     MeetingReportResponse,
+    MeetingSearchItem,
+    MeetingSearchResponse,
     MemberInfo,
     PatchTimelineRequest,
+    PipelineProgressEvent,
     PreMeetingResponse,
     PresignedUrlResponse,
     RrTreeNode,
     RrTreeResponse,
     TimelineItem,
+    TranscriptPageResponse,
+    TranscriptSegmentItem,
+    UploadPartUrl,
+    UploadSessionRequest,
+    UploadSessionResponse,
 )
+from server.app.domain.hr.hierarchy import department_hierarchy
 from server.app.shared.exceptions import BusinessLogicException, NotFoundException
 
 logger = get_logger(__name__)
 
+# 미팅 검색 설정
+_SEARCH_MAX_TERMS: int = 5         # 검색어 최대 개수 (AND 조건)
+_SEARCH_SNIPPET_RADIUS: int = 60   # 스니펫 앞뒤 글자 수
+
+# LLM 프롬프트용 이전 미팅 요약 선택 설정
+_SUMMARY_CANDIDATE_LIMIT: int = 50   # 유사도 비교 대상 이전 미팅 수
+_SUMMARY_TOP_K: int = 3              # 프롬프트에 포함할 최대 요약 수
+_SUMMARY_TOKEN_BUDGET: int = 1500    # 프롬프트에 포함할 요약의 누적 추정 토큰 상한
+
+# 일괄 사전 준비 최대 팀원 수
+_BATCH_PRE_MEETING_MAX_MEMBERS: int = 50
+
+# 녹음 분할 업로드 파트 URL 만료 시간(초) — 만료 후에는 업로드 세션 조회로 재발급
+_UPLOAD_URL_EXPIRATION_SECONDS: int = 3600
+
 # 면담 상태 판별 기준
 _OVERDUE_2M_DAYS: int = 60   # 2개월 (60일)
 _DUE_1M_DAYS: int = 30       # 1개월 (30일)
 
+# AI 파이프라인 진행 단계 (tb_meeting.pipeline_stage, 실행 순서)
+PIPELINE_STAGES: tuple[str, ...] = ("DOWNLOAD", "STT", "SUMMARY")
+
+# 이후 실시간 이벤트가 없는 미팅 상태 (채널 이벤트 버퍼 정리 기준)
+_TERMINAL_MEETING_STATUSES: frozenset[str] = frozenset({"COMPLETED", "FAILED"})
+
+
+def meeting_channel(meeting_id: uuid.UUID | str) -> str:
+    """미팅 실시간 이벤트 채널 이름"""
+    return f"meeting:{meeting_id}"
+
+
+def _is_final_meeting_event(event_type: str, data: dict[str, Any]) -> bool:
+    """미팅 채널의 마지막 이벤트(COMPLETED/FAILED 전환)인지 여부"""
+    return event_type == "status_changed" and data.get("status") in _TERMINAL_MEETING_STATUSES
+
+
+def publish_meeting_event(
+    meeting_id: uuid.UUID | str,
+    event_type: str,
+    state_version: int,
+    data: dict[str, Any],
+    private_data: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """
+    미팅 상태 변경 이벤트를 실시간 채널 구독자에게 발행합니다. (현재 워커 프로세스)
+
+    COMPLETED/FAILED 전환 이벤트는 채널의 마지막 이벤트로 발행되어 채널 버퍼를 비웁니다.
+
+    Args:
+        meeting_id: 미팅 UUID
+        event_type: 이벤트 종류 (agenda_updated, timeline_switched, status_changed ...)
+        state_version: 변경 후 tb_meeting.state_version
+        data: 리더/팀원 공통 payload
+        private_data: 리더에게만 전달할 payload (예: private_memo)
+
+    Returns:
+        dict: 발행된 이벤트
+    """
+    event: dict[str, Any] = {
+        "type": event_type,
+        "meeting_id": str(meeting_id),
+        "state_version": state_version,
+        "data": data,
+    }
+    if private_data is not None:
+        event["private_data"] = private_data
+    event_hub.publish(
+        meeting_channel(meeting_id), event, final=_is_final_meeting_event(event_type, data)
+    )
+    return event
+
+
+async def broadcast_meeting_event(
+    meeting_id: uuid.UUID,
+    event_type: str,
+    state_version: int,
+    data: dict[str, Any],
+) -> None:
+    """
+    미팅 이벤트를 현재 프로세스와 다른 워커 프로세스(Postgres NOTIFY) 모두에 발행합니다.
+
+    상태 전환 / 파이프라인 진행 단계처럼 다른 프로세스(파이프라인 워커, 스케줄러)에서
+    발생하거나 다른 워커의 SSE 구독자가 받아야 하는 작은 이벤트에 사용합니다.
+    변경을 커밋한 뒤 호출합니다. (NOTIFY는 별도 커넥션으로 즉시 전송)
+
+    Args:
+        meeting_id: 미팅 UUID
+        event_type: 이벤트 종류 (status_changed, pipeline_stage)
+        state_version: 변경 후 tb_meeting.state_version
+        data: payload (private_data 미지원)
+    """
+    event = publish_meeting_event(meeting_id, event_type, state_version, data)
+    await pg_event_bridge.notify(
+        meeting_channel(meeting_id), event, final=_is_final_meeting_event(event_type, data)
+    )
+
 
 def _calculate_meeting_status(last_meeting_date: Optional[datetime]) -> str:
     """
@@ -101,12 +216,13 @@ class CoachingDashboardService:
         user_id: str,
         dept_code_filter: Optional[str] = None,
         search_name: Optional[str] = None,
+        include_sub_depts: bool = False,
     ) -> DashboardResponse:
         """
         대시보드 데이터를 조회합니다.
 
         1. user_id → emp_no 변환
-        2. 리더의 dept_code 조회
+        2. 리더의 dept_code 조회 (include_sub_depts면 부서 계층 캐시로 하위 부서 포함)
         3. 팀원 목록 + TbCoachingRelation LEFT JOIN 조회
         4. meeting_status 계산
         5. 집계 요약(summary) 계산
@@ -115,6 +231,7 @@ class CoachingDashboardService:
             user_id: JWT에서 추출한 로그인 사용자 ID
             dept_code_filter: 부서 코드 필터 (optional)
             search_name: 이름 검색어 (optional, 2자 미만 시 전체 조회)
+            include_sub_depts: 하위 부서 팀원 포함 여부
 
         Returns:
             DashboardResponse: 요약 카드 + 팀원 목록
@@ -125,6 +242,7 @@ class CoachingDashboardService:
                 "user_id": user_id,
                 "dept_code_filter": dept_code_filter,
                 "search_name": search_name,
+                "include_sub_depts": include_sub_depts,
             },
         )
 
@@ -135,10 +253,16 @@ class CoachingDashboardService:
         leader_info = await self.repo.find_leader_info(leader_emp_no)
         leader_dept_code: str = leader_info["dept_code"]
 
+        dept_codes: Optional[list[str]] = None
+        if include_sub_depts:
+            hierarchy = await department_hierarchy.get(self.db)
+            dept_codes = hierarchy.descendants(leader_dept_code) or [leader_dept_code]
+
         # 3. 팀원 목록 + 코칭 통계 조회
         raw_members = await self.repo.find_team_members_with_coaching(
             leader_emp_no=leader_emp_no,
             leader_dept_code=leader_dept_code,
+            dept_codes=dept_codes,
             dept_code_filter=dept_code_filter,
             search_name=search_name,
         )
@@ -186,6 +310,40 @@ class CoachingDashboardService:
 # =============================================
 
 
+async def _load_relevant_summaries(
+    repo: CoachingRepository,
+    leader_emp_no: str,
+    member_emp_no: str,
+    query_texts: list[str],
+) -> list[str]:
+    """
+    LLM 프롬프트에 넣을 이전 미팅 요약을 선택합니다.
+
+    최근 요약 후보군을 조회한 뒤 현재 면담 맥락(query_texts)과의 TF-IDF 유사도로
+    토큰 예산 내 상위 요약만 남깁니다. (최신 요약은 항상 우선 포함)
+
+    Args:
+        repo: Coaching Repository
+        leader_emp_no: 리더 사번
+        member_emp_no: 팀원 사번
+        query_texts: R&R 제목, 미완료 Action Item 등 현재 면담 맥락
+
+    Returns:
+        list[str]: 선택된 이전 미팅 요약 목록
+    """
+    candidates = await repo.find_completed_meeting_summaries(
+        leader_emp_no=leader_emp_no,
+        member_emp_no=member_emp_no,
+        limit=_SUMMARY_CANDIDATE_LIMIT,
+    )
+    return select_relevant_summaries(
+        query_texts=query_texts,
+        summaries=candidates,
+        top_k=_SUMMARY_TOP_K,
+        token_budget=_SUMMARY_TOKEN_BUDGET,
+    )
+
+
 class CoachingPreMeetingService:
     """
     사전 준비 모달 서비스
@@ -330,12 +488,14 @@ class CoachingPreMeetingService:
         ]
 
         # 6. AI 추천 질문 생성 (LLM 호출, 타임아웃 15초 — 실패 시 빈 배열 fallback)
+        #    이전 요약은 R&R + 미완료 Action Item과 관련도가 높은 순으로 토큰 예산 내 선택
         member_rnr_titles = await self.repo.find_member_rnr_titles(member_emp_no)
-        previous_summaries: list[str] = [
-            m.record.ai_summary
-            for m in previous_meetings
-            if m.record is not None and m.record.ai_summary is not None
-        ]
+        previous_summaries = await _load_relevant_summaries(
+            repo=self.repo,
+            leader_emp_no=leader_emp_no,
+            member_emp_no=member_emp_no,
+            query_texts=member_rnr_titles + [item.content for item in raw_action_items],
+        )
 
         ai_suggested_agendas = await generate_ai_suggested_agendas(
             member_rnr_titles=member_rnr_titles,
@@ -362,6 +522,136 @@ class CoachingPreMeetingService:
             member_preset_agendas=[],  # v1: 항상 빈 배열
         )
 
+    async def prepare_batch(
+        self,
+        user_id: str,
+        member_emp_nos: list[str],
+    ) -> AsyncIterator[str]:
+        """
+        여러 팀원의 사전 준비 데이터를 일괄 생성하고 NDJSON 스트림으로 반환합니다.
+
+        1. 팀원 정보 / 이전 미팅 + 요약 / 미완료 Action Item / R&R 을 IN 쿼리로 일괄 조회
+        2. 팀원별 AI 추천 질문을 동시에 생성 (LLM 동시 호출 수는 전역 세마포어로 제한)
+        3. 완료되는 순서대로 팀원 1명당 한 줄(BatchPreMeetingItem JSON)을 내보냄
+
+        DB 조회는 스트림 시작 전에 모두 끝나므로, 스트리밍 중에는 세션을 사용하지 않습니다.
+        (호출 측은 반환 직후 세션을 닫아도 됨 — 조회 결과는 모두 메모리에 적재됨)
+        미팅 레코드는 생성하지 않습니다. (미팅 시작 시 POST /meetings 로 생성)
+
+        Args:
+            user_id: JWT에서 추출한 로그인 사용자 ID
+            member_emp_nos: 팀원 사번 목록
+
+        Returns:
+            AsyncIterator[str]: NDJSON 라인 스트림
+
+        Raises:
+            BusinessLogicException: 팀원 목록이 비었거나 최대 인원을 초과할 때
+        """
+        logger.info(
+            "prepare_batch called",
+            extra={"user_id": user_id, "member_count": len(member_emp_nos)},
+        )
+
+        # 순서 유지 중복 제거
+        member_emp_nos = list(dict.fromkeys(member_emp_nos))
+        if not member_emp_nos:
+            raise BusinessLogicException("팀원 목록이 비어 있습니다")
+        if len(member_emp_nos) > _BATCH_PRE_MEETING_MAX_MEMBERS:
+            raise BusinessLogicException(
+                f"한 번에 최대 {_BATCH_PRE_MEETING_MAX_MEMBERS}명까지 준비할 수 있습니다",
+                details={"member_count": len(member_emp_nos)},
+            )
+
+        leader_emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+
+        # 1. 일괄 조회 (팀원 수와 무관하게 쿼리 4회)
+        members_info = await self.repo.find_members_info(member_emp_nos)
+        meetings_by_member = await self.repo.find_completed_meetings_by_members(
+            leader_emp_no=leader_emp_no,
+            member_emp_nos=member_emp_nos,
+            limit_per_member=_SUMMARY_CANDIDATE_LIMIT,
+        )
+        rnr_titles_by_member = await self.repo.find_member_rnr_titles_by_emp_nos(member_emp_nos)
+
+        # 이월 대상: 팀원별 최근 2건 (N-1, N-2)
+        recent_meeting_member: dict[uuid.UUID, str] = {
+            m["meeting_id"]: emp_no
+            for emp_no, meetings in meetings_by_member.items()
+            for m in meetings[:2]
+        }
+        raw_action_items = await self.repo.find_incomplete_action_items(
+            list(recent_meeting_member.keys())
+        )
+        action_items_by_member: dict[str, list[Any]] = {}
+        for item in raw_action_items:
+            action_items_by_member.setdefault(
+                recent_meeting_member[item.meeting_id], []
+            ).append(item)
+
+        # 2~3. 팀원별 LLM 호출 (스트림 소비 시점에 실행)
+        async def _prepare_member(emp_no: str) -> BatchPreMeetingItem:
+            member_raw = members_info.get(emp_no)
+            if member_raw is None:
+                return BatchPreMeetingItem(
+                    member_emp_no=emp_no,
+                    member_info=None,
+                    is_first_meeting=False,
+                    previous_action_items=[],
+                    ai_suggested_agendas=[],
+                    error="팀원 정보를 찾을 수 없습니다",
+                )
+
+            meetings = meetings_by_member.get(emp_no, [])
+            action_items = action_items_by_member.get(emp_no, [])
+            rnr_titles = rnr_titles_by_member.get(emp_no, [])
+
+            previous_summaries = select_relevant_summaries(
+                query_texts=rnr_titles + [item.content for item in action_items],
+                summaries=[m["ai_summary"] for m in meetings if m["ai_summary"] is not None],
+                top_k=_SUMMARY_TOP_K,
+                token_budget=_SUMMARY_TOKEN_BUDGET,
+            )
+            ai_suggested_agendas = await generate_ai_suggested_agendas(
+                member_rnr_titles=rnr_titles,
+                previous_summaries=previous_summaries,
+                is_first_meeting=len(meetings) == 0,
+            )
+
+            return BatchPreMeetingItem(
+                member_emp_no=emp_no,
+                member_info=MemberInfo(**member_raw),
+                is_first_meeting=len(meetings) == 0,
+                previous_action_items=[
+                    ActionItemBrief(
+                        action_item_id=str(item.action_item_id),
+                        content=item.content,
+                        assignee=item.assignee,
+                        origin_meeting_id=str(item.meeting_id),
+                    )
+                    for item in action_items
+                ],
+                ai_suggested_agendas=ai_suggested_agendas,
+            )
+
+        async def _stream() -> AsyncIterator[str]:
+            tasks = [asyncio.create_task(_prepare_member(emp_no)) for emp_no in member_emp_nos]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    item = await next_done
+                    yield item.model_dump_json() + "\n"
+            finally:
+                # 클라이언트 연결 종료 시 남은 LLM 호출 취소
+                for task in tasks:
+                    task.cancel()
+
+            logger.info(
+                "prepare_batch 완료",
+                extra={"leader_emp_no": leader_emp_no, "member_count": len(member_emp_nos)},
+            )
+
+        return _stream()
+
     async def delete_meeting(self, user_id: str, meeting_id: str) -> None:
         """
         사전 준비 모달 취소 시 미팅 레코드를 삭제합니다.
@@ -466,10 +756,11 @@ class CoachingActiveMeetingService:
         - 미팅 실행 화면 데이터 조회
         - R&R 계층 구조 조회
         - 타임라인 생성/마감/편집
-        - 개인 메모 저장
+        - 개인 메모 저장 (명시 저장 / 자동 저장 버퍼)
         - 아젠다/Action Item 완료 토글
         - 즉석 아젠다 추가
         - AI 질문 새로고침
+        - 실행 화면 변경 일괄 적용 (ops)
     """
 
     def __init__(self, db: AsyncSession) -> None:
@@ -492,9 +783,10 @@ class CoachingActiveMeetingService:
         1. user_id → leader_emp_no 변환
         2. 미팅 조회 및 권한 확인
         3. status == REQUESTED 확인 (중복 시작 방지)
-        4. N-1, N-2 미완료 Action Item 이월 복사 INSERT
-        5. 아젠다 INSERT
-        6. status = IN_PROGRESS, started_at 기록
+        4~6. 단일 트랜잭션으로 처리 (Repository.start_meeting_with_carry_over)
+            - status = IN_PROGRESS, started_at 기록 (조건부 UPDATE)
+            - 아젠다 INSERT
+            - N-1, N-2 미완료 Action Item 이월 복사 (INSERT ... SELECT)
 
         Args:
             user_id: JWT에서 추출한 로그인 사용자 ID
@@ -528,31 +820,23 @@ class CoachingActiveMeetingService:
                 details={"meeting_id": meeting_id, "current_status": meeting.status},
             )
 
-        meeting_uuid: uuid.UUID = meeting.meeting_id
-        member_emp_no: str = meeting.member_emp_no
-
-        # 4. N-1, N-2 미완료 Action Item 이월 복사 (COMPLETED 기준 최신 2건)
-        previous_meetings = await self.repo.find_previous_completed_meetings(
-            leader_emp_no=leader_emp_no,
-            member_emp_no=member_emp_no,
-            limit=2,
-        )
-        previous_meeting_ids = [m.meeting_id for m in previous_meetings]
-        incomplete_items = await self.repo.find_incomplete_action_items(previous_meeting_ids)
-        await self.repo.copy_action_items_as_carried_over(
-            meeting_id=meeting_uuid,
-            source_items=incomplete_items,
-        )
-
-        # 5. 아젠다 INSERT (order는 요청 순서 기준)
+        # 4~6. 상태 전환 + 아젠다 INSERT + N-1, N-2 미완료 Action Item 이월 (단일 트랜잭션)
         agenda_data = [
             {"content": a["content"], "source": a["source"], "order": idx}
             for idx, a in enumerate(agendas)
         ]
-        await self.repo.insert_agendas(meeting_id=meeting_uuid, agendas=agenda_data)
-
-        # 6. status = IN_PROGRESS, started_at 기록
-        await self.repo.start_meeting(meeting)
+        carried_count = await self.repo.start_meeting_with_carry_over(
+            meeting_id=meeting.meeting_id,
+            leader_emp_no=leader_emp_no,
+            member_emp_no=meeting.member_emp_no,
+            agendas=agenda_data,
+        )
+        if carried_count is None:
+            # 상태 확인 이후 다른 요청이 먼저 시작한 경우
+            raise BusinessLogicException(
+                "REQUESTED 상태의 미팅만 시작할 수 있습니다",
+                details={"meeting_id": meeting_id},
+            )
 
         logger.info(
             "start_meeting 완료",
@@ -560,7 +844,7 @@ class CoachingActiveMeetingService:
                 "meeting_id": meeting_id,
                 "leader_emp_no": leader_emp_no,
                 "agendas_inserted": len(agenda_data),
-                "action_items_carried_over": len(incomplete_items),
+                "action_items_carried_over": carried_count,
             },
         )
 
@@ -613,10 +897,11 @@ class CoachingActiveMeetingService:
             dept_name=member_raw["dept_name"],
         )
 
-        # private_memo: 리더만 반환
-        private_memo: Optional[str] = (
-            meeting.private_memo if meeting.leader_emp_no == leader_emp_no else None
-        )
+        # private_memo: 리더만 반환 (자동 저장 버퍼에 기록 대기 중인 값 우선)
+        private_memo: Optional[str] = None
+        if meeting.leader_emp_no == leader_emp_no:
+            buffered_memo = memo_autosave_buffer.peek(meeting.meeting_id)
+            private_memo = buffered_memo if buffered_memo is not None else meeting.private_memo
 
         agendas = sorted(meeting.agendas, key=lambda a: a.order)
         agenda_items = [
@@ -667,8 +952,39 @@ class CoachingActiveMeetingService:
             action_items=action_items,
             timelines=timeline_items,
             private_memo=private_memo,
+            state_version=meeting.state_version,
         )
 
+    async def authorize_meeting_channel(
+        self,
+        user_id: str,
+        meeting_id: str,
+    ) -> tuple[uuid.UUID, bool]:
+        """
+        미팅 실시간 채널 구독 권한을 확인합니다. (리더 또는 팀원)
+
+        Args:
+            user_id: JWT에서 추출한 로그인 사용자 ID
+            meeting_id: 미팅 UUID 문자열
+
+        Returns:
+            tuple: (미팅 UUID, 리더 여부) — 리더가 아니면 private_data를 전달하지 않음
+
+        Raises:
+            NotFoundException: 미팅이 없을 때
+            BusinessLogicException: 권한 없을 때
+        """
+        emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+        meeting = await self.repo.find_meeting_by_id(meeting_id)
+
+        if meeting.leader_emp_no != emp_no and meeting.member_emp_no != emp_no:
+            raise BusinessLogicException(
+                "이 미팅에 접근할 권한이 없습니다",
+                details={"meeting_id": meeting_id},
+            )
+
+        return meeting.meeting_id, meeting.leader_emp_no == emp_no
+
     async def get_member_rnr_tree(
         self,
         user_id: str,
@@ -709,7 +1025,8 @@ class CoachingActiveMeetingService:
         """
         타임라인 카드를 생성합니다.
 
-        기존에 end_time IS NULL인 활성 카드가 있으면 자동 마감 후 신규 생성합니다.
+        기존에 end_time IS NULL인 활성 카드가 있으면 start_time으로 마감하고 신규 카드를 생성합니다.
+        (repo.switch_timeline — 한 번의 round trip, 활성 카드가 둘이 되는 구간 없음)
 
         Args:
             user_id: JWT에서 추출한 로그인 사용자 ID
@@ -738,21 +1055,26 @@ class CoachingActiveMeetingService:
                 details={"meeting_id": meeting_id},
             )
 
-        meeting_uuid: uuid.UUID = meeting.meeting_id
-
-        # 활성 타임라인 카드 자동 마감
-        open_timeline = await self.repo.find_open_timeline(meeting_uuid)
-        if open_timeline is not None:
-            await self.repo.patch_timeline(timeline=open_timeline, end_time=start_time)
-
-        # 신규 타임라인 생성
+        # 활성 타임라인 카드 마감 + 신규 생성 (단일 statement)
         rr_uuid: Optional[uuid.UUID] = uuid.UUID(rr_id) if rr_id else None
-        timeline = await self.repo.create_timeline(
-            meeting_id=meeting_uuid,
+        timeline, state_version = await self.repo.switch_timeline(
+            meeting_id=meeting.meeting_id,
             rr_id=rr_uuid,
             start_time=start_time,
         )
 
+        # 구독자는 활성 카드를 start_time으로 마감하고 새 카드를 추가
+        publish_meeting_event(
+            meeting.meeting_id,
+            "timeline_switched",
+            state_version,
+            {
+                "timeline_id": str(timeline.timeline_id),
+                "rr_id": str(timeline.rr_id) if timeline.rr_id else None,
+                "start_time": timeline.start_time,
+            },
+        )
+
         logger.info(
             "create_timeline 완료",
             extra={"timeline_id": str(timeline.timeline_id)},
@@ -807,12 +1129,23 @@ class CoachingActiveMeetingService:
             timeline_id=timeline_id,
         )
 
-        await self.repo.patch_timeline(
+        timeline, state_version = await self.repo.patch_timeline(
             timeline=timeline,
             end_time=body.end_time,
             segment_summary=body.segment_summary,
         )
 
+        publish_meeting_event(
+            meeting.meeting_id,
+            "timeline_updated",
+            state_version,
+            {
+                "timeline_id": str(timeline.timeline_id),
+                "end_time": timeline.end_time,
+                "segment_summary": timeline.segment_summary,
+            },
+        )
+
         logger.info(
             "patch_timeline 완료",
             extra={"timeline_id": timeline_id},
@@ -851,10 +1184,67 @@ class CoachingActiveMeetingService:
                 details={"meeting_id": meeting_id},
             )
 
-        await self.repo.update_meeting_memo(meeting=meeting, private_memo=private_memo)
+        # 명시 저장이 우선 — 기록 대기 중인 자동 저장 값은 폐기
+        await memo_autosave_buffer.pop(meeting.meeting_id)
+        meeting = await self.repo.update_meeting_memo(meeting=meeting, private_memo=private_memo)
+
+        # 메모는 리더 전용 — 팀원에게는 버전만 전달
+        publish_meeting_event(
+            meeting.meeting_id,
+            "memo_updated",
+            meeting.state_version,
+            {},
+            private_data={"private_memo": private_memo},
+        )
 
         logger.info("update_memo 완료", extra={"meeting_id": meeting_id})
 
+    async def autosave_memo(
+        self,
+        user_id: str,
+        meeting_id: str,
+        seq: int,
+        private_memo: str,
+    ) -> AutosaveMemoResponse:
+        """
+        개인 메모 자동 저장 요청을 버퍼에 기록합니다. (리더만, IN_PROGRESS 미팅만 가능)
+
+        DB에는 flush 주기마다 미팅별 마지막 값만 기록됩니다.
+        seq가 이미 받은 값 이하이면 무시합니다. (last-writer-wins)
+
+        Args:
+            user_id: JWT에서 추출한 로그인 사용자 ID
+            meeting_id: 미팅 UUID 문자열
+            seq: 클라이언트 변경 순번
+            private_memo: 메모 전체 내용
+
+        Returns:
+            AutosaveMemoResponse: 반영 여부 + seq
+
+        Raises:
+            NotFoundException: 미팅이 없을 때
+            BusinessLogicException: 권한 없을 때 (리더가 아닌 경우) 또는 IN_PROGRESS 상태가 아닐 때
+        """
+        leader_emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+        meeting = await self.repo.find_meeting_by_id(meeting_id)
+
+        if meeting.leader_emp_no != leader_emp_no:
+            raise BusinessLogicException(
+                "메모는 리더만 저장할 수 있습니다",
+                details={"meeting_id": meeting_id},
+            )
+
+        # 종료된 미팅에 늦게 도착한 자동 저장이 최종 메모를 덮어쓰지 않도록 거부
+        if meeting.status != "IN_PROGRESS":
+            raise BusinessLogicException(
+                "진행 중인 미팅만 자동 저장할 수 있습니다",
+                details={"meeting_id": meeting_id, "status": meeting.status},
+            )
+
+        accepted = memo_autosave_buffer.submit(meeting.meeting_id, seq, private_memo)
+
+        return AutosaveMemoResponse(accepted=accepted, seq=seq)
+
     async def toggle_agenda_complete(
         self,
         user_id: str,
@@ -891,7 +1281,14 @@ class CoachingActiveMeetingService:
             meeting_id=meeting.meeting_id,
             agenda_id=agenda_id,
         )
-        await self.repo.toggle_agenda_complete(agenda)
+        agenda, state_version = await self.repo.toggle_agenda_complete(agenda)
+
+        publish_meeting_event(
+            meeting.meeting_id,
+            "agenda_updated",
+            state_version,
+            {"agenda_id": str(agenda.agenda_id), "is_completed": agenda.is_completed},
+        )
 
         logger.info("toggle_agenda_complete 완료", extra={"agenda_id": agenda_id})
 
@@ -937,7 +1334,17 @@ class CoachingActiveMeetingService:
             meeting_id=meeting.meeting_id,
             action_item_id=action_item_id,
         )
-        await self.repo.toggle_action_item_complete(action_item)
+        action_item, state_version = await self.repo.toggle_action_item_complete(action_item)
+
+        publish_meeting_event(
+            meeting.meeting_id,
+            "action_item_updated",
+            state_version,
+            {
+                "action_item_id": str(action_item.action_item_id),
+                "is_completed": action_item.is_completed,
+            },
+        )
 
         logger.info("toggle_action_item_complete 완료", extra={"action_item_id": action_item_id})
 
@@ -977,7 +1384,7 @@ class CoachingActiveMeetingService:
             )
 
         max_order = await self.repo.find_agenda_max_order(meeting.meeting_id)
-        agenda = await self.repo.create_agenda(
+        agenda, state_version = await self.repo.create_agenda(
             meeting_id=meeting.meeting_id,
             content=content,
             order=max_order + 1,
@@ -985,13 +1392,17 @@ class CoachingActiveMeetingService:
 
         logger.info("create_agenda 완료", extra={"agenda_id": str(agenda.agenda_id)})
 
-        return CreateAgendaResponse(
+        response = CreateAgendaResponse(
             agenda_id=str(agenda.agenda_id),
             content=agenda.content,
             source=agenda.source,
             order=agenda.order,
             is_completed=agenda.is_completed,
         )
+        publish_meeting_event(
+            meeting.meeting_id, "agenda_created", state_version, response.model_dump()
+        )
+        return response
 
     async def get_ai_questions(
         self,
@@ -1028,7 +1439,7 @@ class CoachingActiveMeetingService:
 
         member_emp_no: str = meeting.member_emp_no
 
-        # 이전 COMPLETED 미팅 요약 조회
+        # 이전 COMPLETED 미팅 조회
         previous_meetings = await self.repo.find_previous_completed_meetings(
             leader_emp_no=leader_emp_no,
             member_emp_no=member_emp_no,
@@ -1036,11 +1447,15 @@ class CoachingActiveMeetingService:
         )
         is_first_meeting: bool = len(previous_meetings) == 0
         member_rnr_titles = await self.repo.find_member_rnr_titles(member_emp_no)
-        previous_summaries: list[str] = [
-            m.record.ai_summary
-            for m in previous_meetings
-            if m.record is not None and m.record.ai_summary is not None
-        ]
+        open_action_items = await self.repo.find_incomplete_action_items(
+            [m.meeting_id for m in previous_meetings]
+        )
+        previous_summaries = await _load_relevant_summaries(
+            repo=self.repo,
+            leader_emp_no=leader_emp_no,
+            member_emp_no=member_emp_no,
+            query_texts=member_rnr_titles + [item.content for item in open_action_items],
+        )
 
         ai_suggested_agendas = await generate_ai_suggested_agendas(
             member_rnr_titles=member_rnr_titles,
@@ -1055,6 +1470,88 @@ class CoachingActiveMeetingService:
 
         return AiQuestionsResponse(ai_suggested_agendas=ai_suggested_agendas)
 
+    async def apply_ops(
+        self,
+        user_id: str,
+        meeting_id: str,
+        body: MeetingOpsRequest,
+    ) -> MeetingOpsResponse:
+        """
+        미팅 실행 화면 변경 op 목록을 한 번의 권한 확인과 단일 트랜잭션으로 적용합니다.
+
+        개별 엔드포인트(타임라인/메모/아젠다/Action Item)를 묶어 호출 수를 줄이며,
+        하나라도 실패하면 배치 전체가 적용되지 않습니다.
+
+        Args:
+            user_id: JWT에서 추출한 로그인 사용자 ID
+            meeting_id: 미팅 UUID 문자열
+            body: { ops: [ { op, ... }, ... ] } (요청 순서대로 적용)
+
+        Returns:
+            MeetingOpsResponse: 증가된 state_version + op별 대상 ID
+
+        Raises:
+            NotFoundException: 미팅 또는 참조 대상이 없을 때
+            BusinessLogicException: 권한 없을 때 (리더가 아닌 경우)
+        """
+        logger.info(
+            "apply_ops called",
+            extra={"user_id": user_id, "meeting_id": meeting_id, "op_count": len(body.ops)},
+        )
+
+        leader_emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+        meeting = await self.repo.find_meeting_by_id(meeting_id)
+
+        if meeting.leader_emp_no != leader_emp_no:
+            raise BusinessLogicException(
+                "이 미팅에 접근할 권한이 없습니다",
+                details={"meeting_id": meeting_id},
+            )
+
+        if any(op.op == "update_memo" for op in body.ops):
+            await memo_autosave_buffer.pop(meeting.meeting_id)
+
+        state_version, target_ids = await self.repo.apply_meeting_ops(
+            meeting_id=meeting.meeting_id,
+            ops=[op.model_dump() for op in body.ops],
+        )
+
+        logger.info(
+            "apply_ops 완료",
+            extra={"meeting_id": meeting_id, "state_version": state_version},
+        )
+
+        # 적용된 op 목록을 그대로 전달 (생성 대상은 서버가 확정한 ID로 채움, 메모는 리더 전용)
+        applied_ops: list[dict[str, Any]] = []
+        private_memo: Optional[str] = None
+        for op, target_id in zip(body.ops, target_ids):
+            if op.op == "update_memo":
+                private_memo = op.private_memo
+                continue
+            op_data = op.model_dump()
+            if op.op == "create_timeline":
+                op_data["timeline_id"] = target_id
+            elif op.op == "create_agenda":
+                op_data["agenda_id"] = target_id
+            applied_ops.append(op_data)
+
+        publish_meeting_event(
+            meeting.meeting_id,
+            "ops_applied",
+            state_version,
+            {"ops": applied_ops},
+            private_data={"private_memo": private_memo} if private_memo is not None else None,
+        )
+
+        return MeetingOpsResponse(
+            meeting_id=str(meeting.meeting_id),
+            state_version=state_version,
+            results=[
+                MeetingOpResult(op=op.op, target_id=target_id)
+                for op, target_id in zip(body.ops, target_ids)
+            ],
+        )
+
 
 # =============================================
 # Task 6 — 미팅 종료 + GCS 업로드 Service
@@ -1067,6 +1564,7 @@ class CoachingCompleteMeetingService:
 
     책임:
         - GCS Presigned Upload URL 발급
+        - 녹음 분할 업로드 세션 (파트 병렬 업로드, 수신 현황 조회, 재개)
         - 미팅 종료 처리 (PROCESSING 전환 + TbMeetingRecord 생성 + TbCoachingRelation UPSERT)
         - AI 파이프라인 BackgroundTask 트리거
     """
@@ -1078,7 +1576,7 @@ class CoachingCompleteMeetingService:
         """
         self.db = db
         self.repo = CoachingRepository(db)
-        self.gcs: GCSClient = get_gcs_client()
+        self.storage: StorageBackend = get_storage()
 
     async def get_presigned_url(
         self,
@@ -1119,7 +1617,7 @@ class CoachingCompleteMeetingService:
             )
 
         # 3. GCS Presigned Upload URL 생성
-        url_data = await self.gcs.generate_upload_presigned_url(
+        url_data = await self.storage.generate_upload_presigned_url(
             leader_emp_no=leader_emp_no,
             meeting_id=meeting_id,
         )
@@ -1135,40 +1633,37 @@ class CoachingCompleteMeetingService:
             expires_at=url_data["expires_at"],
         )
 
-    async def complete_meeting(
+    async def start_upload_session(
         self,
         user_id: str,
         meeting_id: str,
-        body: CompleteMeetingRequest,
-        background_tasks: BackgroundTasks,
-    ) -> None:
+        body: UploadSessionRequest,
+    ) -> UploadSessionResponse:
         """
-        미팅 종료를 처리합니다.
+        녹음 분할 업로드 세션을 시작(또는 재개)합니다.
 
-        종료 처리 흐름:
-        1. user_id → leader_emp_no 변환
-        2. 미팅 조회 및 권한 확인
-        3. 멱등성 체크: PROCESSING/COMPLETED이면 즉시 반환
-        4. gcs_path 없으면 FAILED 처리 후 반환
-        5. 마지막 타임라인 카드 end_time NULL이면 actual_duration_seconds로 자동 마감
-        6. TbMeetingRecord 생성 (audio_file_url = gcs_path)
-        7. 미팅 status=PROCESSING, completed_at=utcnow() 업데이트
-        8. TbCoachingRelation UPSERT
-        9. AI 파이프라인 BackgroundTask 트리거
+        같은 전체 크기로 다시 호출하면 기존 파트 계획을 유지하므로,
+        이미 받은 파트는 uploaded_parts로, 남은 파트만 pending_parts로 반환됩니다.
 
         Args:
             user_id: JWT에서 추출한 로그인 사용자 ID
             meeting_id: 미팅 UUID 문자열
-            body: { actual_duration_seconds, gcs_path, private_memo? }
-            background_tasks: FastAPI BackgroundTasks
+            body: { total_size_bytes }
+
+        Returns:
+            UploadSessionResponse: 파트 계획 + 수신 현황 + 남은 파트 업로드 URL
 
         Raises:
             NotFoundException: 미팅이 없을 때
-            BusinessLogicException: 권한 없을 때
+            BusinessLogicException: 권한 없거나, 이미 종료된 미팅이거나, 최대 크기 초과 시
         """
         logger.info(
-            "complete_meeting called",
-            extra={"user_id": user_id, "meeting_id": meeting_id},
+            "start_upload_session called",
+            extra={
+                "user_id": user_id,
+                "meeting_id": meeting_id,
+                "total_size_bytes": body.total_size_bytes,
+            },
         )
 
         # 1. user_id → leader_emp_no
@@ -1181,56 +1676,331 @@ class CoachingCompleteMeetingService:
                 "이 미팅에 접근할 권한이 없습니다",
                 details={"meeting_id": meeting_id},
             )
-
-        # 3. 멱등성 체크: 이미 PROCESSING/COMPLETED이면 200 반환 (중복 호출 무시)
         if meeting.status in ("PROCESSING", "COMPLETED"):
-            logger.info(
-                "complete_meeting 멱등성 체크: 이미 처리된 미팅",
-                extra={"meeting_id": meeting_id, "status": meeting.status},
+            raise BusinessLogicException(
+                "이미 종료된 미팅입니다",
+                details={"meeting_id": meeting_id, "status": meeting.status},
             )
-            return
-
-        # 4. gcs_path 누락 시 FAILED 처리
-        if not body.gcs_path:
-            logger.error(
-                "complete_meeting: gcs_path 누락 → FAILED 처리",
-                extra={"meeting_id": meeting_id},
+        if body.total_size_bytes > settings.AUDIO_UPLOAD_MAX_BYTES:
+            raise BusinessLogicException(
+                "녹음 파일이 최대 크기를 초과했습니다",
+                details={
+                    "meeting_id": meeting_id,
+                    "max_size_bytes": settings.AUDIO_UPLOAD_MAX_BYTES,
+                },
             )
-            await self.repo.mark_meeting_failed(meeting.meeting_id)
-            return
-
-        meeting_uuid: uuid.UUID = meeting.meeting_id
-        member_emp_no: str = meeting.member_emp_no
-
-        # 5. 마지막 활성 타임라인 자동 마감
-        await self.repo.close_open_timeline_with_duration(
-            meeting_id=meeting_uuid,
-            actual_duration_seconds=body.actual_duration_seconds,
-        )
 
-        # 6. TbMeetingRecord 생성
-        await self.repo.create_meeting_record(
-            meeting_id=meeting_uuid,
-            audio_file_url=body.gcs_path,
-        )
-
-        # 7. 미팅 PROCESSING 전환
-        completed_meeting = await self.repo.complete_meeting(
-            meeting=meeting,
-            actual_duration_seconds=body.actual_duration_seconds,
-            private_memo=body.private_memo,
-        )
-        completed_at: datetime = completed_meeting.completed_at or datetime.utcnow()
+        # 3. 재개면 기존 파트 크기 유지, 아니면 새 세션 기록
+        if meeting.upload_total_bytes == body.total_size_bytes and meeting.upload_part_bytes:
+            part_bytes = meeting.upload_part_bytes
+        else:
+            part_bytes = settings.AUDIO_UPLOAD_PART_BYTES
+            await self.repo.save_upload_session(
+                meeting_id=meeting.meeting_id,
+                total_bytes=body.total_size_bytes,
+                part_bytes=part_bytes,
+            )
 
-        # 8. TbCoachingRelation UPSERT
-        await self.repo.upsert_coaching_relation(
+        return await self._describe_upload_session(
             leader_emp_no=leader_emp_no,
-            member_emp_no=member_emp_no,
-            meeting_id=meeting_uuid,
-            completed_at=completed_at,
+            meeting_id=meeting_id,
+            total_bytes=body.total_size_bytes,
+            part_bytes=part_bytes,
         )
 
-        # 9. AI 파이프라인 BackgroundTask 트리거
+    async def get_upload_session(
+        self,
+        user_id: str,
+        meeting_id: str,
+    ) -> UploadSessionResponse:
+        """
+        녹음 분할 업로드 수신 현황을 조회합니다. (남은 파트 URL 재발급 포함)
+
+        Args:
+            user_id: JWT에서 추출한 로그인 사용자 ID
+            meeting_id: 미팅 UUID 문자열
+
+        Returns:
+            UploadSessionResponse: 파트 계획 + 수신 현황 + 남은 파트 업로드 URL
+
+        Raises:
+            NotFoundException: 미팅 또는 업로드 세션이 없을 때
+            BusinessLogicException: 권한 없을 때
+        """
+        logger.info(
+            "get_upload_session called",
+            extra={"user_id": user_id, "meeting_id": meeting_id},
+        )
+
+        leader_emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+
+        meeting = await self.repo.find_meeting_by_id(meeting_id)
+        if meeting.leader_emp_no != leader_emp_no:
+            raise BusinessLogicException(
+                "이 미팅에 접근할 권한이 없습니다",
+                details={"meeting_id": meeting_id},
+            )
+        if meeting.upload_total_bytes is None or meeting.upload_part_bytes is None:
+            raise NotFoundException(
+                "업로드 세션이 없습니다",
+                details={"meeting_id": meeting_id},
+            )
+
+        return await self._describe_upload_session(
+            leader_emp_no=leader_emp_no,
+            meeting_id=meeting_id,
+            total_bytes=meeting.upload_total_bytes,
+            part_bytes=meeting.upload_part_bytes,
+        )
+
+    async def _describe_upload_session(
+        self,
+        leader_emp_no: str,
+        meeting_id: str,
+        total_bytes: int,
+        part_bytes: int,
+    ) -> UploadSessionResponse:
+        """
+        스토리지의 파트 수신 현황으로 업로드 세션 응답을 구성합니다.
+
+        기대 크기와 일치하는 파트만 수신 완료로 간주합니다. (중단된 파트는 재전송 대상)
+        """
+        gcs_path = self.storage.build_audio_path(leader_emp_no, meeting_id)
+        expected_parts = plan_upload_parts(total_bytes, part_bytes)
+        received_parts = await self.storage.list_uploaded_parts(gcs_path)
+
+        uploaded: list[int] = []
+        pending: list[int] = []
+        for part_number, size in expected_parts.items():
+            if received_parts.get(part_number) == size:
+                uploaded.append(part_number)
+            else:
+                pending.append(part_number)
+
+        urls = await self.storage.generate_part_upload_presigned_urls(
+            gcs_path=gcs_path,
+            part_numbers=pending,
+            expiration_seconds=_UPLOAD_URL_EXPIRATION_SECONDS,
+        )
+        expires_at = datetime.utcnow() + timedelta(seconds=_UPLOAD_URL_EXPIRATION_SECONDS)
+
+        logger.info(
+            "업로드 세션 현황",
+            extra={
+                "meeting_id": meeting_id,
+                "part_count": len(expected_parts),
+                "uploaded": len(uploaded),
+            },
+        )
+
+        return UploadSessionResponse(
+            gcs_path=gcs_path,
+            total_size_bytes=total_bytes,
+            part_size_bytes=part_bytes,
+            part_count=len(expected_parts),
+            uploaded_parts=uploaded,
+            pending_parts=[
+                UploadPartUrl(
+                    part_number=part_number,
+                    size_bytes=expected_parts[part_number],
+                    presigned_url=urls[part_number],
+                )
+                for part_number in pending
+            ],
+            expires_at=expires_at.isoformat() + "Z",
+        )
+
+    async def _verify_uploaded_audio(
+        self,
+        leader_emp_no: str,
+        meeting_id: str,
+        gcs_path: str,
+        total_bytes: Optional[int],
+        part_bytes: Optional[int],
+    ) -> int:
+        """
+        업로드된 녹음 파일을 검증합니다. (분할 업로드면 파트 조립 포함)
+
+        검증 항목:
+            - gcs_path가 이 미팅의 오디오 경로인지
+            - 분할 업로드 세션이면 모든 파트 수신 후 조립, 최종 크기 = total_bytes
+            - 최종 객체가 존재하고 비어 있지 않은지
+
+        Returns:
+            int: 최종 객체 크기(바이트)
+
+        Raises:
+            BusinessLogicException: 경로 불일치, 파트 누락, 객체 없음, 크기 불일치 시 (클라이언트 재업로드 대상)
+        """
+        if gcs_path != self.storage.build_audio_path(leader_emp_no, meeting_id):
+            raise BusinessLogicException(
+                "업로드 경로가 이 미팅과 일치하지 않습니다",
+                details={"meeting_id": meeting_id, "gcs_path": gcs_path},
+            )
+
+        size: Optional[int] = None
+        if total_bytes is not None and part_bytes is not None:
+            received_parts = await self.storage.list_uploaded_parts(gcs_path)
+            if received_parts:
+                expected_parts = plan_upload_parts(total_bytes, part_bytes)
+                missing = [
+                    part_number
+                    for part_number, expected_size in expected_parts.items()
+                    if received_parts.get(part_number) != expected_size
+                ]
+                if missing:
+                    raise BusinessLogicException(
+                        "녹음 파일 업로드가 완료되지 않았습니다",
+                        details={"meeting_id": meeting_id, "missing_parts": missing},
+                    )
+                size = await self.storage.compose_parts(gcs_path, len(expected_parts))
+
+        if size is None:
+            # 단일 PUT 업로드 또는 이전 요청에서 이미 조립된 경우
+            size = await self.storage.get_object_size(gcs_path)
+
+        if not size:
+            raise BusinessLogicException(
+                "업로드된 녹음 파일이 없습니다",
+                details={"meeting_id": meeting_id, "gcs_path": gcs_path},
+            )
+        if total_bytes is not None and size != total_bytes:
+            raise BusinessLogicException(
+                "업로드된 녹음 파일 크기가 일치하지 않습니다",
+                details={
+                    "meeting_id": meeting_id,
+                    "expected_bytes": total_bytes,
+                    "actual_bytes": size,
+                },
+            )
+        return size
+
+    async def complete_meeting(
+        self,
+        user_id: str,
+        meeting_id: str,
+        body: CompleteMeetingRequest,
+        background_tasks: BackgroundTasks,
+    ) -> None:
+        """
+        미팅 종료를 처리합니다.
+
+        종료 처리 흐름:
+        1. user_id → leader_emp_no 변환
+        2. 미팅 조회 및 권한 확인
+        3. 멱등성 체크: PROCESSING/COMPLETED이면 즉시 반환
+        4. gcs_path 없으면 FAILED 처리 후 반환
+        4-1. 업로드 파일 검증 (경로, 분할 업로드 파트 조립, 최종 크기) — 실패 시 400 (재업로드 후 재호출)
+        5~8. 단일 트랜잭션 (repo.complete_meeting)
+           - 조건부 UPDATE로 status=PROCESSING, completed_at=utcnow() 전환
+             (private_memo 미전달 시 자동 저장 버퍼에 남은 메모 기록)
+             (동시 요청이 먼저 전환했으면 파이프라인 트리거 없이 반환)
+           - 마지막 타임라인 카드 end_time NULL이면 actual_duration_seconds로 자동 마감
+           - TbMeetingRecord UPSERT (audio_file_url = gcs_path)
+           - TbCoachingRelation UPSERT
+        9. AI 파이프라인 BackgroundTask 트리거
+
+        Args:
+            user_id: JWT에서 추출한 로그인 사용자 ID
+            meeting_id: 미팅 UUID 문자열
+            body: { actual_duration_seconds, gcs_path, private_memo? }
+            background_tasks: FastAPI BackgroundTasks
+
+        Raises:
+            NotFoundException: 미팅이 없을 때
+            BusinessLogicException: 권한 없을 때
+        """
+        logger.info(
+            "complete_meeting called",
+            extra={"user_id": user_id, "meeting_id": meeting_id},
+        )
+
+        # 1. user_id → leader_emp_no
+        leader_emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+
+        # 2. 미팅 조회 및 권한 확인
+        meeting = await self.repo.find_meeting_by_id(meeting_id)
+        if meeting.leader_emp_no != leader_emp_no:
+            raise BusinessLogicException(
+                "이 미팅에 접근할 권한이 없습니다",
+                details={"meeting_id": meeting_id},
+            )
+
+        # 3. 멱등성 체크: 이미 PROCESSING/COMPLETED이면 200 반환 (중복 호출 무시)
+        if meeting.status in ("PROCESSING", "COMPLETED"):
+            logger.info(
+                "complete_meeting 멱등성 체크: 이미 처리된 미팅",
+                extra={"meeting_id": meeting_id, "status": meeting.status},
+            )
+            return
+
+        # 4. gcs_path 누락 시 FAILED 처리
+        if not body.gcs_path:
+            logger.error(
+                "complete_meeting: gcs_path 누락 → FAILED 처리",
+                extra={"meeting_id": meeting_id},
+            )
+            failed_meeting = await self.repo.mark_meeting_failed(meeting.meeting_id)
+            if failed_meeting is not None:
+                await broadcast_meeting_event(
+                    failed_meeting.meeting_id,
+                    "status_changed",
+                    failed_meeting.state_version,
+                    {"status": failed_meeting.status},
+                )
+            return
+
+        # 4-1. 업로드 파일 검증 (gcs_path를 그대로 믿지 않음)
+        audio_size = await self._verify_uploaded_audio(
+            leader_emp_no=leader_emp_no,
+            meeting_id=meeting_id,
+            gcs_path=body.gcs_path,
+            total_bytes=meeting.upload_total_bytes,
+            part_bytes=meeting.upload_part_bytes,
+        )
+
+        meeting_uuid: uuid.UUID = meeting.meeting_id
+        member_emp_no: str = meeting.member_emp_no
+
+        # 자동 저장 버퍼에 남은 메모는 종료 트랜잭션에서 함께 기록 (body 값이 있으면 body 우선)
+        # 종료가 반영되지 않으면 버퍼 값을 되돌림 (body 값이 있으면 클라이언트 재시도가 다시 보냄)
+        buffered_memo = await memo_autosave_buffer.pop(meeting_uuid)
+        private_memo = body.private_memo if body.private_memo is not None else buffered_memo
+        restore_memo = buffered_memo if body.private_memo is None else None
+
+        # 5~8. PROCESSING 전환 + 타임라인 마감 + 녹음 레코드 + 코칭 관계 (단일 트랜잭션)
+        try:
+            completed_meeting = await self.repo.complete_meeting(
+                meeting_id=meeting_uuid,
+                leader_emp_no=leader_emp_no,
+                member_emp_no=member_emp_no,
+                actual_duration_seconds=body.actual_duration_seconds,
+                private_memo=private_memo,
+                audio_file_url=body.gcs_path,
+            )
+        except Exception:
+            memo_autosave_buffer.restore(meeting_uuid, restore_memo)
+            raise
+        if completed_meeting is None:
+            memo_autosave_buffer.restore(meeting_uuid, restore_memo)
+            # 동시 종료 요청이 먼저 전환한 경우 — 파이프라인 중복 트리거 방지
+            logger.info(
+                "complete_meeting 멱등성 체크: 동시 요청이 먼저 처리함",
+                extra={"meeting_id": meeting_id},
+            )
+            return
+
+        await broadcast_meeting_event(
+            meeting_uuid,
+            "status_changed",
+            completed_meeting.state_version,
+            {
+                "status": completed_meeting.status,
+                "completed_at": completed_meeting.completed_at.isoformat(),
+            },
+        )
+
+        # 9. AI 파이프라인 BackgroundTask 트리거
         background_tasks.add_task(
             run_ai_pipeline,
             meeting_id=str(meeting_uuid),
@@ -1243,6 +2013,7 @@ class CoachingCompleteMeetingService:
                 "leader_emp_no": leader_emp_no,
                 "member_emp_no": member_emp_no,
                 "gcs_path": body.gcs_path,
+                "audio_size": audio_size,
                 "duration": body.actual_duration_seconds,
             },
         )
@@ -1261,11 +2032,13 @@ class CoachingHistoryService:
         - 팀원별 미팅 히스토리 목록 조회
         - 미팅 상세 리포트 조회 (private_memo 권한 체크)
         - GCS Presigned Download URL 발급 (오디오 재생용)
+        - STT 트랜스크립트 구간 페이지 조회
+        - 참여 미팅 전문 검색 (요약 / 구간 요약 / 트랜스크립트)
     """
 
     def __init__(self, db: AsyncSession) -> None:
         self.repo = CoachingRepository(db)
-        self.gcs: GCSClient = get_gcs_client()
+        self.storage: StorageBackend = get_storage()
 
     async def get_member_meetings(
         self,
@@ -1498,7 +2271,7 @@ class CoachingHistoryService:
         from datetime import datetime as dt
 
         expiration_seconds = 3600
-        presigned_url = await self.gcs.generate_download_presigned_url(
+        presigned_url = await self.storage.generate_download_presigned_url(
             gcs_path=gcs_path,
             expiration_seconds=expiration_seconds,
         )
@@ -1517,3 +2290,548 @@ class CoachingHistoryService:
             audio_url=presigned_url,
             expires_at=expires_at,
         )
+
+    async def get_transcript(
+        self,
+        user_id: str,
+        meeting_id: str,
+        from_sec: float,
+        after_seq: Optional[int],
+        to_sec: Optional[float],
+        limit: int,
+    ) -> TranscriptPageResponse:
+        """
+        STT 트랜스크립트를 시간 구간 단위로 페이지 조회합니다.
+
+        리포트 API와 분리되어 있어, 녹음 길이와 무관하게 리포트 응답 크기가 일정합니다.
+        다음 페이지 커서는 (next_from, next_after_seq) 쌍입니다. (시작 시각이 같은 구간 구분)
+
+        권한 체크: 리더 또는 팀원만 조회 가능
+
+        Args:
+            user_id: JWT 로그인 사용자 ID
+            meeting_id: 미팅 UUID 문자열
+            from_sec: 조회 시작 시각 (초)
+            after_seq: 이전 페이지 커서의 seq (첫 페이지는 None)
+            to_sec: 조회 종료 시각 (초, 미포함, None이면 끝까지)
+            limit: 페이지 크기
+
+        Returns:
+            TranscriptPageResponse: { items, has_more, next_from, next_after_seq }
+
+        Raises:
+            NotFoundException: 미팅이 없거나 권한이 없을 때
+        """
+        requester_emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+        meeting = await self.repo.find_meeting_by_id(meeting_id)
+
+        # 접근 권한 체크: 리더 또는 팀원만 조회 가능
+        is_leader = str(meeting.leader_emp_no) == requester_emp_no
+        is_member = str(meeting.member_emp_no) == requester_emp_no
+        if not (is_leader or is_member):
+            raise NotFoundException(f"트랜스크립트 조회 권한이 없습니다: {meeting_id}")
+
+        # 다음 페이지 존재 여부 판단을 위해 1건 더 조회
+        segments = await self.repo.find_transcript_segments(
+            meeting_id=meeting.meeting_id,
+            from_sec=from_sec,
+            after_seq=after_seq,
+            to_sec=to_sec,
+            limit=limit + 1,
+        )
+        has_more = len(segments) > limit
+        # 커서 = 이번 페이지 마지막 구간의 (start_time, seq)
+        last_segment = segments[limit - 1] if has_more else None
+
+        items: list[TranscriptSegmentItem] = [
+            TranscriptSegmentItem(
+                seq=seg.seq,
+                start_time=seg.start_time,
+                end_time=seg.end_time,
+                speaker=seg.speaker,
+                text=seg.text,
+            )
+            for seg in segments[:limit]
+        ]
+
+        logger.info(
+            "get_transcript 완료",
+            extra={
+                "meeting_id": meeting_id,
+                "requester_emp_no": requester_emp_no,
+                "count": len(items),
+                "has_more": has_more,
+            },
+        )
+
+        return TranscriptPageResponse(
+            meeting_id=str(meeting.meeting_id),
+            items=items,
+            has_more=has_more,
+            next_from=last_segment.start_time if last_segment else None,
+            next_after_seq=last_segment.seq if last_segment else None,
+        )
+
+    async def search_meetings(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+    ) -> MeetingSearchResponse:
+        """
+        요청자가 리더 또는 팀원으로 참여한 미팅을 검색합니다.
+
+        공백으로 구분된 검색어를 모두 포함하는 미팅만 반환하며(AND),
+        유사도 순으로 정렬하고 검색어 주변 스니펫과 하이라이트 구간을 함께 반환합니다.
+
+        Args:
+            user_id: JWT 로그인 사용자 ID
+            query: 검색어 문자열
+            limit: 최대 결과 건수
+
+        Returns:
+            MeetingSearchResponse: 검색 결과 목록
+
+        Raises:
+            BusinessLogicException: 유효한 검색어가 없을 때
+        """
+        requester_emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+
+        # 검색어 정규화: 공백 분리 → 중복 제거 → 최대 개수 제한
+        terms: list[str] = []
+        for term in query.split():
+            if term.lower() not in (t.lower() for t in terms):
+                terms.append(term)
+        terms = terms[:_SEARCH_MAX_TERMS]
+        if not terms:
+            raise BusinessLogicException("검색어를 입력해주세요")
+
+        rows = await self.repo.search_meetings(
+            requester_emp_no=requester_emp_no,
+            terms=terms,
+            limit=limit,
+            snippet_radius=_SEARCH_SNIPPET_RADIUS,
+        )
+
+        items: list[MeetingSearchItem] = []
+        for row in rows:
+            snippet, highlights = format_search_snippet(row["snippet"], terms)
+            items.append(
+                MeetingSearchItem(
+                    meeting_id=str(row["meeting_id"]),
+                    leader_emp_no=row["leader_emp_no"],
+                    member_emp_no=row["member_emp_no"],
+                    member_name=row["member_name"],
+                    completed_at=row["completed_at"],
+                    score=row["score"],
+                    snippet=snippet,
+                    highlights=highlights,
+                )
+            )
+
+        logger.info(
+            "search_meetings 완료",
+            extra={
+                "requester_emp_no": requester_emp_no,
+                "term_count": len(terms),
+                "total": len(items),
+            },
+        )
+
+        return MeetingSearchResponse(
+            query=" ".join(terms),
+            items=items,
+            total=len(items),
+        )
+
+
+class CoachingPipelineService:
+    """
+    AI 파이프라인 후처리 서비스
+
+    담당:
+        - 파이프라인 진행 단계 기록 + 진행 상황 이벤트 발행 (SSE 구독자)
+        - 녹음 파일 다운로드 (DOWNLOAD 단계)
+        - 파이프라인 진행 상황 조회 (SSE 연결 시 초기 이벤트)
+        - STT 결과 트랜스크립트 구간 저장
+        - 파이프라인 finalize 단계: PROCESSING → COMPLETED 전환 + 미팅 검색 색인 갱신
+        - 파이프라인 실패 처리: FAILED 전환 + 종료 이벤트 발행
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.repo = CoachingRepository(db)
+        self.storage: StorageBackend = get_storage()
+
+    async def report_stage(self, meeting_id: str, stage: str) -> bool:
+        """
+        파이프라인 진행 단계를 기록하고 진행 상황 이벤트를 발행합니다.
+
+        각 단계 시작 시 호출됩니다. 이벤트는 다른 워커 프로세스의 SSE 구독자에게도
+        Postgres NOTIFY로 전달됩니다.
+
+        Args:
+            meeting_id: 미팅 UUID 문자열
+            stage: 진행 단계 (PIPELINE_STAGES)
+
+        Returns:
+            bool: 기록되었으면 True, 미팅이 PROCESSING이 아니면(이미 FAILED 등) False
+
+        Raises:
+            BusinessLogicException: 알 수 없는 단계일 때
+        """
+        if stage not in PIPELINE_STAGES:
+            raise BusinessLogicException(
+                "알 수 없는 파이프라인 단계입니다",
+                details={"meeting_id": meeting_id, "stage": stage},
+            )
+
+        meeting_uuid = uuid.UUID(meeting_id)
+        state_version = await self.repo.record_pipeline_stage(meeting_uuid, stage)
+        if state_version is None:
+            logger.info(
+                "report_stage 생략 (PROCESSING 아님)",
+                extra={"meeting_id": meeting_id, "stage": stage},
+            )
+            return False
+
+        await broadcast_meeting_event(
+            meeting_uuid,
+            "pipeline_stage",
+            state_version,
+            {"status": "PROCESSING", "stage": stage},
+        )
+        return True
+
+    async def get_pipeline_progress(
+        self,
+        user_id: str,
+        meeting_id: str,
+    ) -> PipelineProgressEvent:
+        """
+        미팅의 현재 AI 파이프라인 진행 상황을 반환합니다. (리더 또는 팀원)
+
+        Args:
+            user_id: JWT 로그인 사용자 ID
+            meeting_id: 미팅 UUID 문자열
+
+        Returns:
+            PipelineProgressEvent: 현재 상태 + 진행 단계 + state_version
+
+        Raises:
+            NotFoundException: 미팅이 없을 때
+            BusinessLogicException: 권한 없을 때
+        """
+        emp_no = await self.repo.find_emp_no_by_user_id(user_id)
+        meeting = await self.repo.find_meeting_by_id(meeting_id)
+
+        if meeting.leader_emp_no != emp_no and meeting.member_emp_no != emp_no:
+            raise BusinessLogicException(
+                "이 미팅에 접근할 권한이 없습니다",
+                details={"meeting_id": meeting_id},
+            )
+
+        return PipelineProgressEvent(
+            meeting_id=str(meeting.meeting_id),
+            status=meeting.status,
+            stage=format_pipeline_stage(meeting.status, meeting.pipeline_stage),
+            state_version=meeting.state_version,
+        )
+
+    @staticmethod
+    def progress_from_event(event: dict[str, Any]) -> Optional[PipelineProgressEvent]:
+        """
+        미팅 채널 이벤트를 진행 상황 이벤트로 변환합니다.
+
+        Args:
+            event: 이벤트 허브 이벤트
+
+        Returns:
+            PipelineProgressEvent | None: 진행 상황과 무관한 이벤트(아젠다 변경 등)면 None
+        """
+        if event["type"] not in ("pipeline_stage", "status_changed"):
+            return None
+
+        data = event["data"]
+        return PipelineProgressEvent(
+            meeting_id=event["meeting_id"],
+            status=data["status"],
+            stage=format_pipeline_stage(data["status"], data.get("stage")),
+            state_version=event["state_version"],
+        )
+
+    async def load_audio(self, meeting_id: str) -> bytes:
+        """
+        미팅 녹음 파일을 스토리지에서 내려받습니다. (파이프라인 DOWNLOAD 단계)
+
+        Args:
+            meeting_id: 미팅 UUID 문자열
+
+        Returns:
+            bytes: 녹음 파일 전체
+
+        Raises:
+            NotFoundException: 미팅 또는 녹음 파일 경로가 없을 때
+            ExternalServiceException: 스토리지 다운로드 실패 시
+        """
+        meeting = await self.repo.find_meeting_with_report_data(uuid.UUID(meeting_id))
+        if meeting is None or meeting.record is None or not meeting.record.audio_file_url:
+            raise NotFoundException(f"녹음 파일을 찾을 수 없습니다: {meeting_id}")
+
+        return await self.storage.download_file(meeting.record.audio_file_url)
+
+    async def save_transcript(self, meeting_id: str, segments: list[dict[str, Any]]) -> int:
+        """
+        STT 결과를 트랜스크립트 구간 테이블에 저장합니다. (파이프라인 STT 단계)
+
+        기존 구간은 교체되므로 파이프라인 재실행 시에도 중복되지 않습니다.
+
+        Args:
+            meeting_id: 미팅 UUID 문자열
+            segments: STT 구간 [{start, end, text, speaker}, ...] (재생 순서)
+
+        Returns:
+            int: 저장된 구간 수
+        """
+        return await self.repo.replace_transcript_segments(uuid.UUID(meeting_id), segments)
+
+    async def finalize_meeting(self, meeting_id: str) -> None:
+        """
+        AI 파이프라인 결과(요약, 구간 요약, 트랜스크립트) 저장 후 호출되는 finalize 단계입니다.
+
+        PROCESSING 상태인 미팅만 COMPLETED로 전환하며(조건부 UPDATE), 스케줄러가 먼저
+        FAILED 처리한 미팅은 전환되지 않습니다.
+        검색 문서를 재생성하므로 파이프라인 재실행 시에도 항상 최신 결과로 색인됩니다.
+
+        Args:
+            meeting_id: 미팅 UUID 문자열
+
+        Raises:
+            NotFoundException: 미팅이 존재하지 않을 때
+        """
+        meeting = await self.repo.find_meeting_by_id(meeting_id)
+        completed = await self.repo.transition_meeting_status(meeting.meeting_id, "COMPLETED")
+        await self.repo.upsert_meeting_search_document(meeting.meeting_id)
+
+        if completed is not None:
+            await broadcast_meeting_event(
+                completed.meeting_id,
+                "status_changed",
+                completed.state_version,
+                {"status": completed.status},
+            )
+
+        logger.info(
+            "finalize_meeting 완료",
+            extra={"meeting_id": meeting_id},
+        )
+
+    async def fail_meeting(self, meeting_id: str) -> None:
+        """
+        파이프라인 실패 시 미팅을 FAILED로 전환하고 종료 이벤트를 발행합니다.
+
+        이미 COMPLETED / FAILED인 미팅은 전환되지 않으며 이벤트도 발행하지 않습니다.
+
+        Args:
+            meeting_id: 미팅 UUID 문자열
+        """
+        failed = await self.repo.mark_meeting_failed(uuid.UUID(meeting_id))
+        if failed is None:
+            return
+
+        await broadcast_meeting_event(
+            failed.meeting_id,
+            "status_changed",
+            failed.state_version,
+            {"status": failed.status},
+        )
+
+
+# =============================================
+# Task 12 — 메모 자동 저장 버퍼
+# =============================================
+
+# 마지막 자동 저장 요청 후 미팅별 seq 기록을 유지하는 시간(초)
+MEMO_AUTOSAVE_IDLE_SECONDS = 600.0
+
+# { meeting_id: private_memo } 를 받아 저장하고 갱신 건수를 반환하는 writer
+MemoWriter = Callable[[dict[uuid.UUID, str]], Awaitable[int]]
+
+
+async def _write_memos_to_db(memos: dict[uuid.UUID, str]) -> int:
+    """
+    자동 저장 버퍼의 기본 writer — 독립 DB 세션으로 메모를 일괄 저장합니다.
+
+    Args:
+        memos: { meeting_id: private_memo }
+
+    Returns:
+        int: 갱신된 미팅 수
+    """
+    from server.app.core.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        return await CoachingRepository(db).save_meeting_memos(memos)
+
+
+class MemoAutosaveBuffer:
+    """
+    미팅 메모 자동 저장 버퍼 (워커 프로세스 내)
+
+    에디터의 잦은 자동 저장 요청을 미팅별 최신 값 하나로 합쳐(coalesce)
+    flush 주기마다 한 번의 executemany UPDATE로 기록합니다.
+
+    규칙:
+        - 클라이언트 seq 기준 last-writer-wins: 이미 받은 seq 이하의 요청은 무시
+          (pop 이후에도 seq 기록은 유지 — 늦게 도착한 이전 요청이 명시 저장 값을 덮어쓰지 않음)
+        - flush 시점: 주기(MEMO_AUTOSAVE_FLUSH_SECONDS), 미팅 종료/명시 저장(pop), 워커 종료(stop)
+        - 기록을 마치고 idle_seconds 동안 요청이 없는 미팅의 seq 기록은 flush 때 정리
+        - 버퍼는 워커 프로세스 단위 — 같은 미팅의 요청이 여러 워커로 나뉘면 seq 순서는 보장하지 않음
+    """
+
+    def __init__(
+        self,
+        writer: MemoWriter = _write_memos_to_db,
+        flush_interval_seconds: float = settings.MEMO_AUTOSAVE_FLUSH_SECONDS,
+        idle_seconds: float = MEMO_AUTOSAVE_IDLE_SECONDS,
+    ) -> None:
+        """
+        Args:
+            writer: 버퍼 내용을 저장하는 비동기 함수
+            flush_interval_seconds: 주기 flush 간격(초)
+            idle_seconds: 마지막 요청 후 seq 기록을 유지하는 시간(초)
+        """
+        self._writer = writer
+        self._flush_interval_seconds = flush_interval_seconds
+        self._idle_seconds = idle_seconds
+        self._pending: dict[uuid.UUID, tuple[int, str]] = {}
+        self._last_seq: dict[uuid.UUID, int] = {}
+        self._last_submit_at: dict[uuid.UUID, float] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, meeting_id: uuid.UUID, seq: int, private_memo: str) -> bool:
+        """
+        메모 변경을 버퍼에 기록합니다. (DB 접근 없음)
+
+        Args:
+            meeting_id: 미팅 UUID
+            seq: 클라이언트가 단조 증가시키는 변경 순번
+            private_memo: 메모 전체 내용
+
+        Returns:
+            bool: 반영되었으면 True, 더 최신 seq가 이미 있어 무시되었으면 False
+        """
+        if seq <= self._last_seq.get(meeting_id, -1):
+            return False
+
+        self._last_seq[meeting_id] = seq
+        self._last_submit_at[meeting_id] = time.monotonic()
+        self._pending[meeting_id] = (seq, private_memo)
+        return True
+
+    def peek(self, meeting_id: uuid.UUID) -> Optional[str]:
+        """
+        아직 DB에 기록되지 않은 최신 메모를 반환합니다. (없으면 None)
+        """
+        entry = self._pending.get(meeting_id)
+        return entry[1] if entry is not None else None
+
+    async def pop(self, meeting_id: uuid.UUID) -> Optional[str]:
+        """
+        미팅의 버퍼 항목을 꺼냅니다. (미팅 종료, 명시 저장 시 호출)
+
+        진행 중인 flush가 끝난 뒤 꺼내므로, 호출 측이 이후 저장한 값을
+        이전 flush가 덮어쓰지 않습니다. seq 기록은 남겨 이전 seq의 늦은 요청을 계속 거부합니다.
+
+        Args:
+            meeting_id: 미팅 UUID
+
+        Returns:
+            str | None: 기록되지 않은 최신 메모 (없으면 None)
+        """
+        async with self._lock:
+            entry = self._pending.pop(meeting_id, None)
+        return entry[1] if entry is not None else None
+
+    def restore(self, meeting_id: uuid.UUID, private_memo: Optional[str]) -> None:
+        """
+        pop으로 꺼낸 메모를 버퍼에 되돌립니다. (꺼낸 뒤 저장 트랜잭션이 반영되지 않았을 때)
+
+        그 사이 새 자동 저장 값이 들어왔으면 새 값을 유지합니다.
+
+        Args:
+            meeting_id: 미팅 UUID
+            private_memo: pop이 반환한 메모 (None이면 무시)
+        """
+        if private_memo is None:
+            return
+        self._pending.setdefault(meeting_id, (self._last_seq.get(meeting_id, 0), private_memo))
+
+    async def flush(self) -> int:
+        """
+        버퍼에 쌓인 미팅별 최신 메모를 한 번에 저장합니다.
+
+        저장 실패 시 해당 항목을 다시 버퍼에 넣어 다음 주기에 재시도합니다.
+        (그 사이 더 새 값이 들어온 미팅은 새 값 유지)
+
+        Returns:
+            int: 저장 요청한 미팅 수 (실패 시 0)
+        """
+        async with self._lock:
+            self._prune_idle()
+            if not self._pending:
+                return 0
+
+            batch = self._pending
+            self._pending = {}
+
+            try:
+                await self._writer({meeting_id: memo for meeting_id, (_, memo) in batch.items()})
+            except Exception as exc:
+                for meeting_id, entry in batch.items():
+                    self._pending.setdefault(meeting_id, entry)
+                logger.error(
+                    "메모 자동 저장 flush 실패 — 다음 주기에 재시도",
+                    extra={"meeting_count": len(batch), "error": str(exc)},
+                )
+                return 0
+
+        logger.debug("메모 자동 저장 flush 완료", extra={"meeting_count": len(batch)})
+        return len(batch)
+
+    def _prune_idle(self) -> None:
+        """기록 대기 값이 없고 idle_seconds 동안 요청이 없던 미팅의 seq 기록을 정리합니다."""
+        idle_before = time.monotonic() - self._idle_seconds
+        idle_ids = [
+            meeting_id
+            for meeting_id, submitted_at in self._last_submit_at.items()
+            if submitted_at < idle_before and meeting_id not in self._pending
+        ]
+        for meeting_id in idle_ids:
+            del self._last_submit_at[meeting_id]
+            self._last_seq.pop(meeting_id, None)
+
+    async def _run(self) -> None:
+        """flush 주기마다 버퍼를 저장하는 백그라운드 루프"""
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            await self.flush()
+
+    def start(self) -> None:
+        """주기 flush 백그라운드 태스크를 시작합니다. (애플리케이션 시작 시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기 flush를 중지하고 남은 버퍼를 저장합니다. (워커 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+
+# 프로세스 전역 메모 자동 저장 버퍼
+memo_autosave_buffer = MemoAutosaveBuffer()
@@ -1,11 +1,21 @@
 """
 HR 도메인 Calculator
 
-조직도 트리 변환 등 순수 비즈니스 로직을 제공합니다.
+조직도 트리 변환, 동기화 검증 등 순수 비즈니스 로직을 제공합니다.
 """
 
+from server.app.domain.hr.calculators.compact_org_tree import CompactOrgTree
 from server.app.domain.hr.calculators.org_tree_calculator import OrgTreeCalculator
+from server.app.domain.hr.calculators.sync_calculator import (
+    DepartmentSyncDiff,
+    EmployeeSyncDiff,
+    SyncCalculator,
+)
 
 __all__ = [
+    "CompactOrgTree",
+    "DepartmentSyncDiff",
+    "EmployeeSyncDiff",
     "OrgTreeCalculator",
+    "SyncCalculator",
 ]
@@ -0,0 +1,310 @@
+"""
+HR 도메인 - 배열 기반 조직도 트리 Calculator
+
+대규모 조직도(수만~수십만 부서)를 부서당 객체 없이 정수 배열로 표현합니다.
+
+구조:
+    - parent        : 부서 인덱스 → 상위 부서 인덱스 (-1: 최상위)
+    - child_offsets : CSR 오프셋, 부서 i의 하위 부서는 child_index[child_offsets[i]:child_offsets[i + 1]]
+                      (dept_code 순 정렬)
+    - order         : DFS 전위 순회 순서 (형제는 dept_code 순)
+    - pre / end     : 부서 i의 하위 트리 = order[pre[i]:end[i]]
+    - depth         : 최상위 = 0
+
+질의 비용:
+    - is_ancestor, subtree_size, 직원 수 조회 : O(1)
+    - children, descendants                    : O(k) (k = 반환 건수)
+    - ancestors                                : O(depth)
+
+Pydantic OrgTreeNode는 to_nodes()에서 응답에 포함되는 부분만 생성합니다.
+
+원칙:
+    - 순수 계산 (DB 접근 금지)
+"""
+
+from array import array
+from typing import Iterable, Optional
+
+from server.app.domain.hr.models import CMDepartmentTree
+from server.app.domain.hr.schemas.department import OrgTreeNode
+
+
+class CompactOrgTree:
+    """
+    배열 기반 조직도 트리
+
+    build()로 생성하며 생성 후에는 변경하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        nodes: list[CMDepartmentTree],
+        codes: list[str],
+        index: dict[str, int],
+        parent: array,
+        child_offsets: array,
+        child_index: array,
+        roots: array,
+        order: array,
+        pre: array,
+        end: array,
+        depth: array,
+        main_counts: array,
+        concurrent_counts: array,
+        subtree_counts: array,
+    ) -> None:
+        self._nodes = nodes
+        self._codes = codes
+        self._index = index
+        self._parent = parent
+        self._child_offsets = child_offsets
+        self._child_index = child_index
+        self._roots = roots
+        self._order = order
+        self._pre = pre
+        self._end = end
+        self._depth = depth
+        self._main_counts = main_counts
+        self._concurrent_counts = concurrent_counts
+        self._subtree_counts = subtree_counts
+
+    @classmethod
+    def build(
+        cls,
+        flat_nodes: list[CMDepartmentTree],
+        headcounts: dict[str, tuple[int, int]] | None = None,
+    ) -> "CompactOrgTree":
+        """
+        플랫 리스트로 배열 기반 트리를 구성합니다. (O(n log n), 재귀 없음)
+
+        상위 부서가 목록에 없으면 최상위로 취급합니다.
+        순환 참조로 최상위에서 도달할 수 없는 부서는 트리에서 제외됩니다.
+
+        Args:
+            flat_nodes: CM_DEPARTMENT_TREE 플랫 리스트
+            headcounts: 부서별 직원 수 {dept_code: (주소속 수, 겸직 수)}
+
+        Returns:
+            CompactOrgTree: 배열 기반 트리
+        """
+        if headcounts is None:
+            headcounts = {}
+
+        # 중복 dept_code는 마지막 항목 사용
+        flat_nodes = list({node.dept_code: node for node in flat_nodes}.values())
+        n = len(flat_nodes)
+        codes = [node.dept_code for node in flat_nodes]
+        index = {code: i for i, code in enumerate(codes)}
+
+        # 1. 상위 부서 인덱스 (ORM 속성 접근은 한 번만)
+        parent = array("i", [-1]) * n
+        for i, node in enumerate(flat_nodes):
+            p = index.get(node.upper_dept_code, -1) if node.upper_dept_code else -1
+            if p != i:
+                parent[i] = p
+
+        # 2. CSR 하위 부서 배열 (상위 부서별로 묶고 dept_code 순 정렬)
+        child_offsets = array("i", [0]) * (n + 1)
+        for p in parent:
+            if p >= 0:
+                child_offsets[p + 1] += 1
+        for i in range(n):
+            child_offsets[i + 1] += child_offsets[i]
+
+        by_code = sorted(range(n), key=codes.__getitem__)
+        child_index = array("i", [0]) * child_offsets[n]
+        cursor = array("i", child_offsets[:n])
+        roots = array("i")
+        for i in by_code:
+            p = parent[i]
+            if p < 0:
+                roots.append(i)
+            else:
+                child_index[cursor[p]] = i
+                cursor[p] += 1
+
+        # 3. DFS 전위 순회 (명시적 스택, 형제는 dept_code 순)
+        order = array("i")
+        pre = array("i", [-1]) * n
+        depth = array("i", [0]) * n
+        stack = list(reversed(roots))
+        while stack:
+            i = stack.pop()
+            pre[i] = len(order)
+            order.append(i)
+            p = parent[i]
+            if p >= 0:
+                depth[i] = depth[p] + 1
+            stack.extend(reversed(child_index[child_offsets[i]:child_offsets[i + 1]]))
+
+        # 4. 하위 트리 끝 위치 + 누적 직원 수 (역순 순회로 상위 부서에 합산)
+        end = array("i", [0]) * n
+        main_counts = array("q", [0]) * n
+        concurrent_counts = array("q", [0]) * n
+        subtree_counts = array("q", [0]) * n
+        for i, code in enumerate(codes):
+            main_count, concurrent_count = headcounts.get(code, (0, 0))
+            main_counts[i] = main_count
+            concurrent_counts[i] = concurrent_count
+            subtree_counts[i] = main_count + concurrent_count
+
+        for position in range(len(order) - 1, -1, -1):
+            i = order[position]
+            last = child_offsets[i + 1] - 1
+            end[i] = end[child_index[last]] if last >= child_offsets[i] else position + 1
+            p = parent[i]
+            if p >= 0:
+                subtree_counts[p] += subtree_counts[i]
+
+        return cls(
+            nodes=flat_nodes,
+            codes=codes,
+            index=index,
+            parent=parent,
+            child_offsets=child_offsets,
+            child_index=child_index,
+            roots=roots,
+            order=order,
+            pre=pre,
+            end=end,
+            depth=depth,
+            main_counts=main_counts,
+            concurrent_counts=concurrent_counts,
+            subtree_counts=subtree_counts,
+        )
+
+    # =============================================
+    # 질의
+    # =============================================
+
+    def __len__(self) -> int:
+        """트리에 포함된 부서 수 (순환 참조로 제외된 부서 제외)"""
+        return len(self._order)
+
+    def __contains__(self, dept_code: str) -> bool:
+        """트리에 포함된 부서인지 여부"""
+        i = self._index.get(dept_code)
+        return i is not None and self._pre[i] >= 0
+
+    def root_codes(self) -> list[str]:
+        """최상위 부서 코드 목록 (dept_code 순)"""
+        return [self._codes[i] for i in self._roots]
+
+    def children(self, dept_code: str) -> list[str]:
+        """하위 부서 코드 목록 (dept_code 순, O(k))"""
+        i = self._index_of(dept_code)
+        return [
+            self._codes[c]
+            for c in self._child_index[self._child_offsets[i]:self._child_offsets[i + 1]]
+        ]
+
+    def child_count(self, dept_code: str) -> int:
+        """직속 하위 부서 수 (O(1))"""
+        i = self._index_of(dept_code)
+        return self._child_offsets[i + 1] - self._child_offsets[i]
+
+    def descendants(self, dept_code: str, include_self: bool = False) -> list[str]:
+        """하위 트리 전체 부서 코드 (DFS 순, O(k))"""
+        i = self._index_of(dept_code)
+        start = self._pre[i] if include_self else self._pre[i] + 1
+        return [self._codes[d] for d in self._order[start:self._end[i]]]
+
+    def ancestors(self, dept_code: str) -> list[str]:
+        """상위 부서 코드 목록 (가까운 순, O(depth))"""
+        i = self._parent[self._index_of(dept_code)]
+        result: list[str] = []
+        while i >= 0:
+            result.append(self._codes[i])
+            i = self._parent[i]
+        return result
+
+    def is_ancestor(self, ancestor_code: str, dept_code: str) -> bool:
+        """ancestor_code가 dept_code의 상위(또는 자기 자신) 부서인지 (O(1))"""
+        a = self._index_of(ancestor_code)
+        d = self._index_of(dept_code)
+        return self._pre[a] <= self._pre[d] < self._end[a]
+
+    def depth(self, dept_code: str) -> int:
+        """트리 깊이 (최상위 = 0)"""
+        return self._depth[self._index_of(dept_code)]
+
+    def subtree_size(self, dept_code: str) -> int:
+        """자기 자신 포함 하위 트리 부서 수 (O(1))"""
+        i = self._index_of(dept_code)
+        return self._end[i] - self._pre[i]
+
+    def subtree_employee_count(self, dept_code: str) -> int:
+        """하위 부서 포함 누적 직원 수 (O(1))"""
+        return self._subtree_counts[self._index_of(dept_code)]
+
+    # =============================================
+    # Pydantic 노드 생성 (응답에 필요한 부분만)
+    # =============================================
+
+    def to_nodes(
+        self,
+        root_codes: Optional[Iterable[str]] = None,
+        max_depth: Optional[int] = None,
+    ) -> list[OrgTreeNode]:
+        """
+        지정한 부서부터 OrgTreeNode 트리를 생성합니다.
+
+        Args:
+            root_codes: 시작 부서 코드 (None이면 최상위 부서 전체)
+            max_depth: 시작 부서 아래로 포함할 단계 수 (None이면 전체, 0이면 시작 부서만)
+
+        Returns:
+            list[OrgTreeNode]: 시작 부서 노드 목록 (children 포함)
+        """
+        if root_codes is None:
+            start = list(self._roots)
+        else:
+            start = [self._index_of(code) for code in root_codes]
+
+        result = [self._make_node(i) for i in start]
+        stack = [(node, i, 0) for node, i in zip(result, start)]
+        while stack:
+            node, i, level = stack.pop()
+            if max_depth is not None and level >= max_depth:
+                continue
+            for c in self._child_index[self._child_offsets[i]:self._child_offsets[i + 1]]:
+                child = self._make_node(c)
+                node.children.append(child)
+                stack.append((child, c, level + 1))
+        return result
+
+    def _make_node(self, i: int) -> OrgTreeNode:
+        """인덱스 i 부서의 OrgTreeNode (children 비어 있음)"""
+        item = self._nodes[i]
+        main_count = self._main_counts[i]
+        concurrent_count = self._concurrent_counts[i]
+        child_count = self._child_offsets[i + 1] - self._child_offsets[i]
+        return OrgTreeNode(
+            std_year=item.std_year,
+            dept_code=item.dept_code,
+            dept_name=item.dept_name,
+            upper_dept_code=item.upper_dept_code,
+            disp_lvl=item.disp_lvl,
+            dept_head_emp_no=item.dept_head_emp_no,
+            dept_head_name=item.name_kor,
+            employee_count=main_count + concurrent_count,
+            main_employee_count=main_count,
+            concurrent_employee_count=concurrent_count,
+            subtree_employee_count=self._subtree_counts[i],
+            has_children=child_count > 0,
+            child_count=child_count,
+            subtree_dept_count=self._end[i] - self._pre[i],
+            children=[],
+        )
+
+    def _index_of(self, dept_code: str) -> int:
+        """
+        부서 코드 → 인덱스
+
+        Raises:
+            KeyError: 트리에 없는 부서 코드
+        """
+        i = self._index.get(dept_code)
+        if i is None or self._pre[i] < 0:
+            raise KeyError(dept_code)
+        return i
@@ -9,6 +9,9 @@ HR 도메인 - 조직도 트리 Calculator
     - API 호출 금지
 """
 
+from typing import Optional
+
+from server.app.domain.hr.calculators.compact_org_tree import CompactOrgTree
 from server.app.domain.hr.models import CMDepartmentTree
 from server.app.domain.hr.schemas.department import OrgTreeNode
 
@@ -19,21 +22,26 @@ class OrgTreeCalculator:
 
     책임:
         - 플랫 리스트 → 계층형 트리 변환
-        - DISP_LVL 기준 정렬
-        - 직원 수 정보 주입
+        - dept_code 기준 정렬
+        - 직원 수 정보 주입 (부서별 + 하위 부서 누적)
+        - 부서 계층 클로저(상위-하위 전체 쌍) 계산
     """
 
     @staticmethod
     def build_tree(
         flat_nodes: list[CMDepartmentTree],
-        employee_counts: dict[str, int] | None = None,
+        headcounts: dict[str, tuple[int, int]] | None = None,
     ) -> list[OrgTreeNode]:
         """
         플랫 리스트를 계층형 트리 구조로 변환합니다.
 
+        트리 구성과 함께 하위 부서 누적 직원 수(subtree_employee_count)를 계산합니다.
+        내부적으로 CompactOrgTree를 구성한 뒤 전체 트리를 OrgTreeNode로 생성합니다.
+        (일부 부서만 응답할 때는 CompactOrgTree.to_nodes로 필요한 부분만 생성)
+
         Args:
-            flat_nodes: CM_DEPARTMENT_TREE 플랫 리스트 (disp_lvl, dept_code 정렬 필수)
-            employee_counts: 부서별 직원 수 딕셔너리 {dept_code: count}
+            flat_nodes: CM_DEPARTMENT_TREE 플랫 리스트 (정렬 불필요)
+            headcounts: 부서별 직원 수 딕셔너리 {dept_code: (주소속 수, 겸직 수)}
 
         Returns:
             List[OrgTreeNode]: 최상위 부서 리스트 (children에 하위 부서 포함)
@@ -41,49 +49,31 @@ class OrgTreeCalculator:
         if not flat_nodes:
             return []
 
-        if employee_counts is None:
-            employee_counts = {}
-
-        # 1. 모든 노드를 OrgTreeNode로 변환하며 dict에 저장
-        node_map: dict[str, OrgTreeNode] = {}
-        for item in flat_nodes:
-            node = OrgTreeNode(
-                std_year=item.std_year,
-                dept_code=item.dept_code,
-                dept_name=item.dept_name,
-                upper_dept_code=item.upper_dept_code,
-                disp_lvl=item.disp_lvl,
-                dept_head_emp_no=item.dept_head_emp_no,
-                dept_head_name=item.name_kor,
-                employee_count=employee_counts.get(item.dept_code, 0),
-                children=[],
-            )
-            node_map[item.dept_code] = node
-
-        # 2. 부모-자식 관계 구성
-        root_nodes: list[OrgTreeNode] = []
-        for _dept_code, node in node_map.items():
-            if node.upper_dept_code and node.upper_dept_code in node_map:
-                parent = node_map[node.upper_dept_code]
-                parent.children.append(node)
-            else:
-                # 최상위 노드 (upper_dept_code가 없거나 부모가 트리에 없음)
-                root_nodes.append(node)
-
-        # 3. 각 레벨에서 dept_code 기준 정렬
-        OrgTreeCalculator._sort_children(root_nodes)
-
-        return root_nodes
+        return CompactOrgTree.build(flat_nodes, headcounts).to_nodes()
 
     @staticmethod
-    def _sort_children(nodes: list[OrgTreeNode]) -> None:
+    def build_closure(upper_by_code: dict[str, Optional[str]]) -> list[tuple[str, str, int]]:
         """
-        트리 노드의 children을 재귀적으로 dept_code 기준 정렬합니다.
+        부서 계층 클로저 행을 계산합니다. (cm_department_closure 재구성용)
+
+        상위 부서가 목록에 없으면 경로가 끊깁니다. (미사용 부서 제외 시 그 아래는 별도 최상위)
+        순환 참조는 이미 방문한 부서에서 멈춥니다.
 
         Args:
-            nodes: 정렬 대상 노드 리스트
+            upper_by_code: {부서 코드: 상위 부서 코드}
+
+        Returns:
+            list[tuple]: (ancestor_dept_code, descendant_dept_code, depth) 목록 (자기 자신 depth=0 포함)
         """
-        nodes.sort(key=lambda n: n.dept_code)
-        for node in nodes:
-            if node.children:
-                OrgTreeCalculator._sort_children(node.children)
+        rows: list[tuple[str, str, int]] = []
+        for dept_code in upper_by_code:
+            rows.append((dept_code, dept_code, 0))
+            visited = {dept_code}
+            depth = 1
+            upper = upper_by_code[dept_code]
+            while upper in upper_by_code and upper not in visited:
+                rows.append((upper, dept_code, depth))
+                visited.add(upper)
+                depth += 1
+                upper = upper_by_code[upper]
+        return rows
@@ -0,0 +1,427 @@
+"""
+HR 도메인 - 동기화 Calculator
+
+Bulk 동기화 전에 요청 행을 검증하여 일괄 적용할 행과 실패 행으로 나누고,
+저장된 내용 해시(row_hash)와 비교하여 실제로 바뀐 행만 골라냅니다.
+DB 조회 결과(존재하는 부서/사용자, 저장된 해시 등)는 호출자가 전달합니다.
+
+원칙:
+    - 순수 함수로 구현 (Side Effect 금지)
+    - DB 접근 금지
+"""
+
+import hashlib
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from server.app.domain.hr.schemas.sync import (
+    ConcurrentPositionSyncRequest,
+    DepartmentSyncRequest,
+    EmployeeSyncRequest,
+)
+
+# 조직도 행 비교 값: (상위 부서 코드, 부서명, disp_lvl, 부서장 사번, 부서장 성명)
+TreeRow = tuple[Optional[str], str, int, Optional[str], Optional[str]]
+
+
+@dataclass
+class EmployeeSyncDiff:
+    """
+    직원 동기화 청크의 변경분
+
+    upserts / concurrent_upserts / concurrent_deletes에 있는 행만 DB에 씁니다.
+    """
+
+    upserts: list[EmployeeSyncRequest] = field(default_factory=list)
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    concurrent_upserts: list[tuple[str, ConcurrentPositionSyncRequest, str]] = field(default_factory=list)
+    concurrent_deletes: list[tuple[str, str]] = field(default_factory=list)
+    inserted: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    def counts(self) -> Counter:
+        """hr_sync_history 건수 컬럼 이름으로 된 건수"""
+        return Counter(
+            inserted_count=len(self.inserted),
+            updated_count=len(self.updated),
+            unchanged_count=len(self.unchanged),
+            deleted_count=len(self.concurrent_deletes),
+        )
+
+    def for_employee(self, emp_no: str) -> "EmployeeSyncDiff":
+        """한 사번의 변경분만 남긴 Diff (행 단위 재시도용)"""
+        return EmployeeSyncDiff(
+            upserts=[emp for emp in self.upserts if emp.emp_no == emp_no],
+            fingerprints={k: v for k, v in self.fingerprints.items() if k == emp_no},
+            concurrent_upserts=[row for row in self.concurrent_upserts if row[0] == emp_no],
+            concurrent_deletes=[row for row in self.concurrent_deletes if row[0] == emp_no],
+            inserted=[code for code in self.inserted if code == emp_no],
+            updated=[code for code in self.updated if code == emp_no],
+            unchanged=[code for code in self.unchanged if code == emp_no],
+        )
+
+
+@dataclass
+class DepartmentSyncDiff:
+    """
+    부서 동기화 요청의 변경분
+
+    upserts는 cm_department, tree_upserts는 cm_department_tree에 쓸 행입니다.
+    relevels는 요청에 없지만 상위 경로가 바뀌어 disp_lvl만 다시 쓰는 하위 부서 조직도 행입니다.
+    (tree_upserts에도 포함, 반영 건수에는 세지 않음)
+    hierarchy_changed가 False면 클로저 재구성과 계층 캐시 무효화를 생략할 수 있습니다.
+    """
+
+    upserts: list[DepartmentSyncRequest] = field(default_factory=list)
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    tree_upserts: list[DepartmentSyncRequest] = field(default_factory=list)
+    relevels: list[DepartmentSyncRequest] = field(default_factory=list)
+    inserted: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    hierarchy_changed: bool = False
+
+    def counts(self) -> Counter:
+        """hr_sync_history 건수 컬럼 이름으로 된 건수"""
+        return Counter(
+            inserted_count=len(self.inserted),
+            updated_count=len(self.updated),
+            unchanged_count=len(self.unchanged),
+            deleted_count=0,
+        )
+
+    def for_department(self, dept_code: str) -> "DepartmentSyncDiff":
+        """한 부서의 변경분만 남긴 Diff (행 단위 재시도용)"""
+        return DepartmentSyncDiff(
+            upserts=[dept for dept in self.upserts if dept.dept_code == dept_code],
+            fingerprints={k: v for k, v in self.fingerprints.items() if k == dept_code},
+            tree_upserts=[dept for dept in self.tree_upserts if dept.dept_code == dept_code],
+            inserted=[code for code in self.inserted if code == dept_code],
+            updated=[code for code in self.updated if code == dept_code],
+            unchanged=[code for code in self.unchanged if code == dept_code],
+            hierarchy_changed=self.hierarchy_changed,
+        )
+
+
+class SyncCalculator:
+    """
+    HR 동기화 Calculator
+
+    책임:
+        - 직원 동기화 청크 검증 (FK / UNIQUE 위반 사전 차단)
+        - 청크 내 중복 사번 정리 (마지막 행 우선)
+        - 부서 동기화 계층 검증 및 표시 레벨(disp_lvl) 계산
+        - 내용 해시(row_hash) 계산 및 저장된 해시와 비교 (변경 행만 쓰기)
+    """
+
+    @staticmethod
+    def fingerprint(*values: Any) -> str:
+        """
+        동기화 내용 해시 (SHA-256 hex)
+
+        None과 빈 문자열을 구분하도록 JSON 배열로 직렬화한 뒤 해시합니다.
+        """
+        payload = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def employee_fingerprint(emp: EmployeeSyncRequest) -> str:
+        """hr_mgnt 행 해시"""
+        return SyncCalculator.fingerprint(
+            emp.user_id, emp.name_kor, emp.dept_code, emp.position_code, emp.on_work_yn
+        )
+
+    @staticmethod
+    def concurrent_fingerprint(concur: ConcurrentPositionSyncRequest) -> str:
+        """hr_mgnt_concur 행 해시 (키: 사번 + 부서 코드)"""
+        return SyncCalculator.fingerprint(concur.is_main, concur.position_code)
+
+    @staticmethod
+    def department_fingerprint(dept: DepartmentSyncRequest) -> str:
+        """cm_department 행 해시"""
+        return SyncCalculator.fingerprint(
+            dept.dept_name, dept.upper_dept_code, dept.dept_head_emp_no, dept.use_yn
+        )
+
+    @staticmethod
+    def plan_employee_chunk(
+        employees: list[EmployeeSyncRequest],
+        known_dept_codes: set[str],
+        known_user_ids: set[str],
+        user_id_owners: dict[str, str],
+    ) -> tuple[list[EmployeeSyncRequest], list[str]]:
+        """
+        직원 동기화 청크를 일괄 적용 대상과 실패 행으로 나눕니다.
+
+        같은 사번이 여러 번 오면 마지막 행만 적용합니다. (기존 순차 처리와 같은 결과)
+        겸직 목록의 중복 부서도 마지막 항목만 남깁니다.
+
+        Args:
+            employees: 동기화 요청 청크
+            known_dept_codes: cm_department에 존재하는 부서 코드
+            known_user_ids: cm_user에 존재하는 사용자 ID
+            user_id_owners: hr_mgnt에 이미 등록된 {user_id: emp_no}
+
+        Returns:
+            tuple: (일괄 적용할 요청 목록, 실패 메시지 목록 "emp_no=...: 사유")
+        """
+        latest: dict[str, EmployeeSyncRequest] = {}
+        for emp_req in employees:
+            latest[emp_req.emp_no] = emp_req
+
+        accepted: list[EmployeeSyncRequest] = []
+        failures: list[str] = []
+        claimed_user_ids: dict[str, str] = {}
+
+        for emp_req in latest.values():
+            reason = None
+            owner = claimed_user_ids.get(emp_req.user_id) or user_id_owners.get(emp_req.user_id)
+            missing_concur = sorted(
+                {c.dept_code for c in emp_req.concurrent_positions} - known_dept_codes
+            )
+
+            if emp_req.dept_code not in known_dept_codes:
+                reason = f"부서 코드가 존재하지 않습니다: {emp_req.dept_code}"
+            elif missing_concur:
+                reason = f"겸직 부서 코드가 존재하지 않습니다: {', '.join(missing_concur)}"
+            elif emp_req.user_id not in known_user_ids:
+                reason = f"사용자 ID가 존재하지 않습니다: {emp_req.user_id}"
+            elif owner is not None and owner != emp_req.emp_no:
+                reason = f"사용자 ID가 다른 사번에 이미 사용 중입니다: {emp_req.user_id} ({owner})"
+
+            if reason:
+                failures.append(f"emp_no={emp_req.emp_no}: {reason}")
+                continue
+
+            claimed_user_ids[emp_req.user_id] = emp_req.emp_no
+            concurrent = {c.dept_code: c for c in emp_req.concurrent_positions}
+            if len(concurrent) != len(emp_req.concurrent_positions):
+                emp_req = emp_req.model_copy(
+                    update={"concurrent_positions": list(concurrent.values())}
+                )
+            accepted.append(emp_req)
+
+        return accepted, failures
+
+    @staticmethod
+    def plan_department_sync(
+        departments: list[DepartmentSyncRequest],
+        existing_upper_by_code: dict[str, Optional[str]],
+    ) -> tuple[list[DepartmentSyncRequest], dict[str, int], list[str]]:
+        """
+        부서 동기화 요청의 계층을 검증하고 표시 레벨(disp_lvl)을 계산합니다.
+
+        기존 부서 계층에 요청을 덮어쓴 최종 계층 기준으로 최상위 부서를 1로 하는 깊이를 구합니다.
+        부서마다 상위 경로를 한 번만 따라가므로 전체 O(부서 수)입니다. (계산된 레벨 재사용)
+        같은 부서 코드가 여러 번 오면 마지막 행만 적용합니다.
+        적용할 부서의 기존 하위 부서(요청에 없는 부서)도 최종 계층 기준 레벨을 함께 반환합니다.
+        (상위 부서 이동 시 하위 조직도 행의 disp_lvl 갱신용)
+
+        실패 사유:
+            - 상위 부서가 기존 부서에도 요청에도 없음 (FK 위반)
+            - 상위 경로에 순환 참조 (자기 자신을 상위로 지정한 경우 포함)
+            - 상위 부서가 위 사유로 실패 (하위 부서도 함께 실패)
+
+        Args:
+            departments: 부서 동기화 요청 목록
+            existing_upper_by_code: cm_department의 {부서 코드: 상위 부서 코드}
+
+        Returns:
+            tuple: (적용할 요청 목록 — 상위 부서 먼저,
+                    {부서 코드: disp_lvl} — 적용할 부서 + 그 기존 하위 부서,
+                    실패 메시지 목록)
+        """
+        latest: dict[str, DepartmentSyncRequest] = {}
+        for dept_req in departments:
+            latest[dept_req.dept_code] = dept_req
+
+        upper_by_code = dict(existing_upper_by_code)
+        upper_by_code.update({code: req.upper_dept_code for code, req in latest.items()})
+
+        levels: dict[str, int] = {}
+        failed: dict[str, str] = {}
+
+        for dept_code in latest:
+            path: list[str] = []
+            position: dict[str, int] = {}
+            current = dept_code
+
+            # 레벨이 정해진 부서(또는 최상위/끊긴 경로/순환)를 만날 때까지 위로 이동
+            while current not in levels and current not in failed:
+                if current in position:
+                    cycle = path[position[current]:]
+                    reason = f"상위 부서 순환 참조: {' → '.join(cycle + [current])}"
+                    for code in cycle:
+                        failed[code] = reason
+                    path = path[:position[current]]
+                    break
+
+                position[current] = len(path)
+                path.append(current)
+                upper = upper_by_code[current]
+                if upper is None:
+                    levels[current] = 1
+                    path.pop()
+                    break
+                if upper not in upper_by_code:
+                    failed[current] = f"상위 부서 코드가 존재하지 않습니다: {upper}"
+                    path.pop()
+                    break
+                current = upper
+
+            # 내려오면서 상위 부서 레벨 + 1 (상위가 실패하면 하위도 실패)
+            for code in reversed(path):
+                upper = upper_by_code[code]
+                if upper in failed:
+                    failed[code] = f"상위 부서 동기화 실패: {upper}"
+                else:
+                    levels[code] = levels[upper] + 1
+
+        accepted = sorted(
+            (req for code, req in latest.items() if code not in failed),
+            key=lambda req: levels[req.dept_code],
+        )
+        disp_lvls = {req.dept_code: levels[req.dept_code] for req in accepted}
+
+        # 적용할 부서 아래의 기존 하위 부서: 상위 레벨 + 1 (요청에 있는 부서는 위에서 계산됨)
+        children: dict[str, list[str]] = {}
+        for code, upper in existing_upper_by_code.items():
+            if code not in latest and upper is not None:
+                children.setdefault(upper, []).append(code)
+        stack = [req.dept_code for req in accepted]
+        while stack:
+            parent = stack.pop()
+            for child in children.get(parent, []):
+                if child not in disp_lvls:
+                    disp_lvls[child] = disp_lvls[parent] + 1
+                    stack.append(child)
+
+        failures = [f"dept_code={code}: {failed[code]}" for code in latest if code in failed]
+        return accepted, disp_lvls, failures
+
+    @staticmethod
+    def diff_employee_chunk(
+        employees: list[EmployeeSyncRequest],
+        stored_hashes: dict[str, Optional[str]],
+        stored_concurrent_hashes: dict[tuple[str, str], Optional[str]],
+    ) -> EmployeeSyncDiff:
+        """
+        검증된 직원 청크를 저장된 해시와 비교하여 변경분을 만듭니다.
+
+        해시가 NULL인 기존 행(해시 도입 전 데이터)은 변경으로 봅니다.
+        겸직은 (사번, 부서 코드) 단위로 추가/변경/해제를 구분하며,
+        직원 행 또는 겸직 중 하나라도 바뀐 직원은 updated로 셉니다.
+
+        Args:
+            employees: plan_employee_chunk가 통과시킨 요청 목록
+            stored_hashes: hr_mgnt의 {사번: row_hash}
+            stored_concurrent_hashes: hr_mgnt_concur의 {(사번, 부서 코드): row_hash}
+
+        Returns:
+            EmployeeSyncDiff: 변경분
+        """
+        diff = EmployeeSyncDiff()
+        stored_concurrent_by_emp: dict[str, dict[str, Optional[str]]] = {}
+        for (emp_no, dept_code), row_hash in stored_concurrent_hashes.items():
+            stored_concurrent_by_emp.setdefault(emp_no, {})[dept_code] = row_hash
+
+        for emp in employees:
+            row_hash = SyncCalculator.employee_fingerprint(emp)
+            is_new = emp.emp_no not in stored_hashes
+            changed = is_new or stored_hashes[emp.emp_no] != row_hash
+            if changed:
+                diff.upserts.append(emp)
+                diff.fingerprints[emp.emp_no] = row_hash
+
+            stored_concur = stored_concurrent_by_emp.get(emp.emp_no, {})
+            for concur in emp.concurrent_positions:
+                concur_hash = SyncCalculator.concurrent_fingerprint(concur)
+                if stored_concur.get(concur.dept_code) != concur_hash:
+                    diff.concurrent_upserts.append((emp.emp_no, concur, concur_hash))
+                    changed = True
+            requested = {concur.dept_code for concur in emp.concurrent_positions}
+            for dept_code in sorted(set(stored_concur) - requested):
+                diff.concurrent_deletes.append((emp.emp_no, dept_code))
+                changed = True
+
+            if is_new:
+                diff.inserted.append(emp.emp_no)
+            elif changed:
+                diff.updated.append(emp.emp_no)
+            else:
+                diff.unchanged.append(emp.emp_no)
+        return diff
+
+    @staticmethod
+    def diff_departments(
+        departments: list[DepartmentSyncRequest],
+        disp_lvls: dict[str, int],
+        head_names: dict[str, str],
+        stored: dict[str, tuple[Optional[str], str, Optional[str]]],
+        stored_tree: dict[str, TreeRow],
+    ) -> DepartmentSyncDiff:
+        """
+        검증된 부서 요청을 저장된 해시/조직도 행과 비교하여 변경분을 만듭니다.
+
+        부서 행이 같아도 조직도 행(disp_lvl, 부서장 성명 등)이 다르면 조직도 행만 씁니다.
+        요청에 없는 하위 부서는 저장된 조직도 행의 disp_lvl이 새 레벨과 다를 때만
+        저장된 값으로 조직도 행을 만들어 relevels / tree_upserts에 추가합니다.
+
+        Args:
+            departments: plan_department_sync가 통과시킨 요청 목록 (상위 부서 먼저)
+            disp_lvls: {부서 코드: 표시 레벨} (요청에 없는 하위 부서 포함)
+            head_names: {부서장 사번: 성명} (하위 부서 부서장 포함)
+            stored: cm_department의 {부서 코드: (상위 부서 코드, 사용 여부, row_hash)}
+            stored_tree: 기준 연도 cm_department_tree의 {부서 코드: TreeRow}
+
+        Returns:
+            DepartmentSyncDiff: 변경분
+        """
+        diff = DepartmentSyncDiff()
+        for dept in departments:
+            row_hash = SyncCalculator.department_fingerprint(dept)
+            current = stored.get(dept.dept_code)
+            dept_changed = current is None or current[2] != row_hash
+            if dept_changed:
+                diff.upserts.append(dept)
+                diff.fingerprints[dept.dept_code] = row_hash
+                if current is None or current[:2] != (dept.upper_dept_code, dept.use_yn):
+                    diff.hierarchy_changed = True
+
+            tree_row: TreeRow = (
+                dept.upper_dept_code,
+                dept.dept_name,
+                disp_lvls[dept.dept_code],
+                dept.dept_head_emp_no,
+                head_names.get(dept.dept_head_emp_no) if dept.dept_head_emp_no else None,
+            )
+            tree_changed = stored_tree.get(dept.dept_code) != tree_row
+            if tree_changed:
+                diff.tree_upserts.append(dept)
+
+            if current is None:
+                diff.inserted.append(dept.dept_code)
+            elif dept_changed or tree_changed:
+                diff.updated.append(dept.dept_code)
+            else:
+                diff.unchanged.append(dept.dept_code)
+
+        requested = {dept.dept_code for dept in departments}
+        for dept_code, disp_lvl in disp_lvls.items():
+            tree = stored_tree.get(dept_code)
+            if dept_code in requested or tree is None or tree[2] == disp_lvl:
+                continue
+            upper_dept_code, dept_name, _, dept_head_emp_no, _ = tree
+            relevel = DepartmentSyncRequest(
+                dept_code=dept_code,
+                dept_name=dept_name,
+                upper_dept_code=upper_dept_code,
+                dept_head_emp_no=dept_head_emp_no,
+                use_yn=stored[dept_code][1] if dept_code in stored else "Y",
+            )
+            diff.relevels.append(relevel)
+            diff.tree_upserts.append(relevel)
+        return diff
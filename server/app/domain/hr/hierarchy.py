@@ -0,0 +1,158 @@
+"""
+HR 도메인 - 부서 계층 조회 (프로세스 캐시)
+
+cm_department_closure 전체를 메모리에 올려 하위 부서, 상위 부서, 직속 상위 부서를
+DB 조회 없이 응답합니다. HR, R&R, 코칭 도메인이 함께 사용합니다.
+
+갱신:
+    - sync_departments가 클로저 테이블을 재구성한 뒤 invalidate() 호출
+    - 다른 워커 프로세스에는 DEPARTMENT_HIERARCHY_CHANNEL 이벤트로 전달 → 다음 조회 때 다시 적재
+
+사용 예:
+    hierarchy = await department_hierarchy.get(db)
+    dept_codes = hierarchy.descendants(leader_dept_code)
+"""
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.core.events import EventHub, event_hub
+from server.app.core.logging import get_logger
+from server.app.domain.hr.repositories import DepartmentDBRepository
+
+logger = get_logger(__name__)
+
+# 부서 계층 무효화 이벤트 채널 (이벤트 허브 / 프로세스 간 NOTIFY)
+DEPARTMENT_HIERARCHY_CHANNEL = "hr:department_hierarchy"
+
+
+class DepartmentHierarchy:
+    """
+    부서 계층 스냅샷 (읽기 전용)
+
+    하위/상위 부서 목록은 클로저 행에서 미리 계산해 두므로 조회는 dict 조회 한 번입니다.
+    사용 중인 부서(use_yn='Y')만 포함합니다.
+    """
+
+    def __init__(self, closure_rows: list[tuple[str, str, int]]) -> None:
+        """
+        Args:
+            closure_rows: (상위 부서 코드, 하위 부서 코드, 거리) 목록
+        """
+        ordered = sorted(closure_rows, key=lambda row: (row[2], row[1]))
+        self._descendants: dict[str, list[str]] = {}
+        self._ancestors: dict[str, list[str]] = {}
+        for ancestor, descendant, depth in ordered:
+            self._descendants.setdefault(ancestor, []).append(descendant)
+            if depth > 0:
+                self._ancestors.setdefault(descendant, []).append(ancestor)
+
+    def __contains__(self, dept_code: str) -> bool:
+        """계층에 포함된 (사용 중인) 부서인지 여부"""
+        return dept_code in self._descendants
+
+    def __len__(self) -> int:
+        """계층에 포함된 부서 수"""
+        return len(self._descendants)
+
+    def descendants(self, dept_code: str, include_self: bool = True) -> list[str]:
+        """
+        하위 부서 코드 목록 (거리, 부서 코드 순)
+
+        Returns:
+            list[str]: 하위 부서 코드 (계층에 없는 부서면 빈 목록)
+        """
+        codes = self._descendants.get(dept_code, [])
+        return list(codes) if include_self else codes[1:]
+
+    def ancestors(self, dept_code: str) -> list[str]:
+        """상위 부서 코드 목록 (가까운 순)"""
+        return list(self._ancestors.get(dept_code, []))
+
+    def upper_dept_code(self, dept_code: str) -> Optional[str]:
+        """직속 상위 부서 코드 (최상위이거나 계층에 없으면 None)"""
+        ancestors = self._ancestors.get(dept_code)
+        return ancestors[0] if ancestors else None
+
+
+class DepartmentHierarchyCache:
+    """
+    부서 계층 스냅샷 캐시 (워커 프로세스 단위)
+
+    처음 조회하거나 무효화된 뒤 조회할 때만 클로저 테이블을 읽습니다.
+    """
+
+    def __init__(
+        self, hub: EventHub = event_hub, channel: str = DEPARTMENT_HIERARCHY_CHANNEL
+    ) -> None:
+        """
+        Args:
+            hub: 무효화 이벤트를 받을 이벤트 허브
+            channel: 무효화 이벤트 채널
+        """
+        self._version = 0
+        self._hierarchy: Optional[DepartmentHierarchy] = None
+        self._lock = asyncio.Lock()
+        self._invalidations = hub.subscribe(channel)
+
+    @property
+    def version(self) -> int:
+        """현재 데이터 버전 (부서 동기화마다 +1)"""
+        self._apply_remote_invalidations()
+        return self._version
+
+    async def get(self, db: AsyncSession) -> DepartmentHierarchy:
+        """
+        부서 계층 스냅샷을 조회합니다. (캐시 미스일 때만 클로저 테이블 조회)
+
+        Args:
+            db: 비동기 데이터베이스 세션
+
+        Returns:
+            DepartmentHierarchy: 부서 계층 스냅샷
+        """
+        self._apply_remote_invalidations()
+        if self._hierarchy is not None:
+            return self._hierarchy
+
+        async with self._lock:
+            if self._hierarchy is not None:
+                return self._hierarchy
+
+            version = self._version
+            rows = await DepartmentDBRepository(db).find_department_closure()
+            hierarchy = DepartmentHierarchy(rows)
+            if version == self._version:
+                self._hierarchy = hierarchy
+
+            logger.info(
+                "부서 계층 적재 완료",
+                extra={"dept_count": len(hierarchy), "closure_rows": len(rows)},
+            )
+            return hierarchy
+
+    def invalidate(self) -> int:
+        """
+        데이터 버전을 올리고 스냅샷을 버립니다.
+
+        Returns:
+            int: 새 데이터 버전
+        """
+        self._version += 1
+        self._hierarchy = None
+        return self._version
+
+    def _apply_remote_invalidations(self) -> None:
+        """다른 프로세스에서 받은 무효화 이벤트를 반영합니다. (non-blocking)"""
+        received = False
+        while not self._invalidations.empty():
+            self._invalidations.get_nowait()
+            received = True
+        if received:
+            self.invalidate()
+
+
+# 프로세스 전역 부서 계층 캐시
+department_hierarchy = DepartmentHierarchyCache()
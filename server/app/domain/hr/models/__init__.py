@@ -8,8 +8,12 @@ HR 도메인 모델
 from server.app.domain.user.models import User as CMUser
 from server.app.domain.hr.models.employee import HRMgnt
 from server.app.domain.hr.models.concurrent_position import HRMgntConcur
-from server.app.domain.hr.models.department import CMDepartment, CMDepartmentTree
-from server.app.domain.hr.models.sync_history import HRSyncHistory
+from server.app.domain.hr.models.department import (
+    CMDepartment,
+    CMDepartmentClosure,
+    CMDepartmentTree,
+)
+from server.app.domain.hr.models.sync_history import HRSyncHistory, HRSyncSourceState
 
 __all__ = [
     "CMUser",
@@ -17,5 +21,7 @@ __all__ = [
     "HRMgntConcur",
     "CMDepartment",
     "CMDepartmentTree",
+    "CMDepartmentClosure",
     "HRSyncHistory",
+    "HRSyncSourceState",
 ]
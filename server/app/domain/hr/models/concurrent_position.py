@@ -52,6 +52,13 @@ class HRMgntConcur(Base):
         comment="직책 코드"
     )
 
+    # 변경 감지
+    row_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="동기화 내용 해시 (본직 여부/직책, SHA-256)"
+    )
+
     # 이력 관리
     in_user: Mapped[Optional[str]] = mapped_column(
         String(50),
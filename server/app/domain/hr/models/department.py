@@ -3,12 +3,13 @@ HR 도메인 - 부서 정보 모델
 
 CM_DEPARTMENT: 부서 마스터 정보를 관리합니다.
 CM_DEPARTMENT_TREE: 조직도 뷰 데이터를 관리합니다.
+CM_DEPARTMENT_CLOSURE: 부서 계층 클로저(상위-하위 전체 쌍)를 관리합니다.
 """
 
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import String, CHAR, Integer, DateTime, ForeignKey
+from sqlalchemy import String, CHAR, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from server.app.core.database import Base
@@ -58,6 +59,13 @@ class CMDepartment(Base):
         comment="사용 여부"
     )
 
+    # 변경 감지
+    row_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="동기화 내용 해시 (부서명/상위 부서/부서장/사용 여부, SHA-256)"
+    )
+
     # 이력 관리
     in_user: Mapped[Optional[str]] = mapped_column(
         String(50),
@@ -193,3 +201,48 @@ class CMDepartmentTree(Base):
 
     def __repr__(self) -> str:
         return f"<CMDepartmentTree(std_year='{self.std_year}', dept_code='{self.dept_code}', disp_lvl={self.disp_lvl})>"
+
+
+class CMDepartmentClosure(Base):
+    """
+    부서 계층 클로저 테이블 (cm_department_closure)
+
+    사용 중인 부서(use_yn='Y')의 모든 (상위 부서, 하위 부서, 거리) 쌍을 저장합니다.
+    자기 자신도 depth=0 행으로 포함합니다.
+    sync_departments 실행 시 cm_department 기준으로 전체 재구성됩니다.
+
+    조회 예:
+        - 하위 부서 전체: WHERE ancestor_dept_code = :dept_code
+        - 상위 부서 전체: WHERE descendant_dept_code = :dept_code ORDER BY depth
+        - 직속 상위 부서: WHERE descendant_dept_code = :dept_code AND depth = 1
+    """
+
+    __tablename__ = "cm_department_closure"
+    __table_args__ = (
+        Index("idx_cm_dept_closure_descendant", "descendant_dept_code", "depth"),
+    )
+
+    # Composite Primary Key
+    ancestor_dept_code: Mapped[str] = mapped_column(
+        String(20),
+        primary_key=True,
+        comment="상위 부서 코드"
+    )
+
+    descendant_dept_code: Mapped[str] = mapped_column(
+        String(20),
+        primary_key=True,
+        comment="하위 부서 코드"
+    )
+
+    depth: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="계층 거리 (0: 자기 자신, 1: 직속 하위)"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CMDepartmentClosure(ancestor='{self.ancestor_dept_code}', "
+            f"descendant='{self.descendant_dept_code}', depth={self.depth})>"
+        )
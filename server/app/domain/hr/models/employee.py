@@ -66,6 +66,13 @@ class HRMgnt(Base):
         comment="재직 여부 (Y: 재직, N: 퇴직)"
     )
 
+    # 변경 감지
+    row_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="동기화 내용 해시 (user_id/성명/부서/직책/재직 여부, SHA-256)"
+    )
+
     # 이력 관리
     in_user: Mapped[Optional[str]] = mapped_column(
         String(50),
@@ -7,7 +7,7 @@ HR_SYNC_HISTORY 테이블: 외부 시스템과의 데이터 동기화 이력을
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, Text, DateTime
+from sqlalchemy import String, Integer, Float, Text, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 
 from server.app.core.database import Base
@@ -65,6 +65,61 @@ class HRSyncHistory(Base):
         comment="실패 건수"
     )
 
+    # 변경 감지 결과
+    inserted_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="신규 등록 건수"
+    )
+
+    updated_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="변경 건수"
+    )
+
+    unchanged_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="변경 없음 건수 (쓰기 생략)"
+    )
+
+    deleted_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="삭제 건수 (해제된 겸직 등)"
+    )
+
+    # 처리량
+    elapsed_ms: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="반영 소요 시간(ms)"
+    )
+
+    rows_per_second: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="처리 속도 (건/초)"
+    )
+
+    # 원천 데이터
+    source_name: Mapped[Optional[str]] = mapped_column(
+        String(50),
+        nullable=True,
+        comment="수집 커넥터 이름 (NULL: API 호출)"
+    )
+
+    source_watermark: Mapped[Optional[str]] = mapped_column(
+        String(300),
+        nullable=True,
+        comment="이 동기화로 반영한 변경분의 워터마크"
+    )
+
     # 에러 로그
     error_message: Mapped[Optional[str]] = mapped_column(
         Text,
@@ -100,3 +155,52 @@ class HRSyncHistory(Base):
 
     def __repr__(self) -> str:
         return f"<HRSyncHistory(sync_id={self.sync_id}, sync_type='{self.sync_type}', sync_status='{self.sync_status}')>"
+
+
+class HRSyncSourceState(Base):
+    """
+    동기화 원천 수집 상태 테이블 (hr_sync_source_state)
+
+    커넥터/동기화 타입별로 마지막으로 반영한 변경분의 워터마크(high-water mark)를 기록합니다.
+    주기 수집은 이 워터마크 이후 변경분만 가져옵니다.
+    """
+
+    __tablename__ = "hr_sync_source_state"
+
+    # Composite Primary Key
+    source_name: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        comment="수집 커넥터 이름"
+    )
+
+    sync_type: Mapped[str] = mapped_column(
+        String(20),
+        primary_key=True,
+        comment="동기화 타입 (employees/departments)"
+    )
+
+    watermark: Mapped[Optional[str]] = mapped_column(
+        String(300),
+        nullable=True,
+        comment="마지막으로 반영한 변경분의 워터마크 (수정 시각/순번 등 커넥터 정의)"
+    )
+
+    last_sync_id: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="마지막 동기화 이력 ID"
+    )
+
+    up_date: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        comment="수정일시"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<HRSyncSourceState(source_name='{self.source_name}', "
+            f"sync_type='{self.sync_type}', watermark='{self.watermark}')>"
+        )
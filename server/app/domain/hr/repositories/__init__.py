@@ -15,6 +15,7 @@ from server.app.domain.hr.repositories.employee_db_repository import (
 from server.app.domain.hr.repositories.department_db_repository import (
     DepartmentDBRepository,
 )
+from server.app.domain.hr.repositories.sync_db_repository import SyncDBRepository
 
 # Mock 구현체
 from server.app.domain.hr.repositories.mock import (
@@ -29,6 +30,7 @@ __all__ = [
     # DB 구현체
     "EmployeeDBRepository",
     "DepartmentDBRepository",
+    "SyncDBRepository",
     # Mock 구현체
     "EmployeeMockRepository",
     "DepartmentMockRepository",
@@ -4,13 +4,18 @@ HR 도메인 - 부서 정보 DB Repository
 SQLAlchemy를 사용하여 실제 DB에 접근하는 Repository 구현체입니다.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy import and_, select, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from server.app.domain.hr.repositories.department_repository import IDepartmentRepository
-from server.app.domain.hr.models import CMDepartment, CMDepartmentTree, HRMgnt
+from server.app.domain.hr.models import (
+    CMDepartment,
+    CMDepartmentClosure,
+    CMDepartmentTree,
+    HRMgnt,
+)
 from server.app.domain.common.models import CodeDetail
 
 
@@ -159,3 +164,13 @@ class DepartmentDBRepository(IDepartmentRepository):
             "dept_head_name": row.dept_head_name,
             "dept_head_position": row.dept_head_position,
         }
+
+    async def find_department_closure(self) -> List[Tuple[str, str, int]]:
+        """부서 계층 클로저 전체를 조회합니다"""
+        stmt = select(
+            CMDepartmentClosure.ancestor_dept_code,
+            CMDepartmentClosure.descendant_dept_code,
+            CMDepartmentClosure.depth,
+        )
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
@@ -6,7 +6,7 @@ Mock Repository와 Real Repository가 이 인터페이스를 구현합니다.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from server.app.domain.hr.models import CMDepartment, CMDepartmentTree
 
@@ -128,3 +128,13 @@ class IDepartmentRepository(ABC):
             } 또는 None
         """
         pass
+
+    @abstractmethod
+    async def find_department_closure(self) -> List[Tuple[str, str, int]]:
+        """
+        부서 계층 클로저 전체를 조회합니다. (cm_department_closure)
+
+        Returns:
+            List[Tuple[str, str, int]]: (상위 부서 코드, 하위 부서 코드, 거리) 목록
+        """
+        pass
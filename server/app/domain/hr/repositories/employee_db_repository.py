@@ -5,7 +5,7 @@ SQLAlchemy를 사용하여 실제 DB에 접근하는 Repository 구현체입니
 """
 
 from typing import Any, Dict, List, Optional, Tuple
-from sqlalchemy import and_, func, literal, or_, select, union_all
+from sqlalchemy import and_, distinct, func, literal, or_, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
@@ -297,11 +297,15 @@ class EmployeeDBRepository(IEmployeeRepository):
         return list(result.scalars().all())
 
     async def find_by_dept_code(
-        self, dept_code: str, include_concurrent: bool = True
+        self,
+        dept_code: str,
+        include_concurrent: bool = True,
+        dept_codes: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """부서 코드로 소속 직원을 조회합니다 (직책명 포함)"""
+        """부서 코드로 소속 직원을 조회합니다 (직책명 포함, dept_codes 지정 시 목록 전체)"""
+        target_codes = dept_codes or [dept_code]
 
-        def _build_emp_query(dept_code_filter: str | None = None, emp_nos: list | None = None):
+        def _build_emp_query(dept_code_filter: list | None = None, emp_nos: list | None = None):
             """직책명(CodeDetail) JOIN 포함 직원 조회 쿼리 생성 헬퍼"""
             q = (
                 select(
@@ -318,7 +322,7 @@ class EmployeeDBRepository(IEmployeeRepository):
                 )
             )
             if dept_code_filter is not None:
-                q = q.where(HRMgnt.dept_code == dept_code_filter)
+                q = q.where(HRMgnt.dept_code.in_(dept_code_filter))
             if emp_nos is not None:
                 q = q.where(HRMgnt.emp_no.in_(emp_nos))
             return q
@@ -336,13 +340,13 @@ class EmployeeDBRepository(IEmployeeRepository):
             }
 
         # 주소속 직원 조회
-        result = await self.db.execute(_build_emp_query(dept_code_filter=dept_code))
+        result = await self.db.execute(_build_emp_query(dept_code_filter=target_codes))
         employees = [_row_to_dict(row) for row in result.all()]
 
         # 겸직자 포함
         if include_concurrent:
-            concurrent_stmt = select(HRMgntConcur.emp_no).where(
-                HRMgntConcur.dept_code == dept_code, HRMgntConcur.is_main == "N"
+            concurrent_stmt = select(distinct(HRMgntConcur.emp_no)).where(
+                HRMgntConcur.dept_code.in_(target_codes), HRMgntConcur.is_main == "N"
             )
             concurrent_result = await self.db.execute(concurrent_stmt)
             concurrent_emp_nos = [row[0] for row in concurrent_result.all()]
@@ -350,7 +354,7 @@ class EmployeeDBRepository(IEmployeeRepository):
             if concurrent_emp_nos:
                 concurrent_employees_result = await self.db.execute(
                     _build_emp_query(emp_nos=concurrent_emp_nos).where(
-                        HRMgnt.dept_code != dept_code
+                        HRMgnt.dept_code.not_in(target_codes)
                     )
                 )
                 employees.extend([_row_to_dict(row) for row in concurrent_employees_result.all()])
@@ -401,3 +405,41 @@ class EmployeeDBRepository(IEmployeeRepository):
         )
         result = await self.db.execute(stmt)
         return result.scalar_one()
+
+    async def count_headcounts_by_dept(self) -> Dict[str, Tuple[int, int]]:
+        """
+        전체 부서의 주소속/겸직 직원 수를 한 번에 집계합니다.
+
+        hr_mgnt(주소속)와 hr_mgnt_concur(겸직)를 UNION ALL 후 dept_code로 GROUP BY 하여
+        부서 수와 무관하게 쿼리 1회로 처리합니다.
+        """
+        main_q = select(
+            HRMgnt.dept_code.label("dept_code"),
+            literal(1).label("main_cnt"),
+            literal(0).label("concur_cnt"),
+        )
+        concur_q = (
+            select(
+                HRMgntConcur.dept_code.label("dept_code"),
+                literal(0).label("main_cnt"),
+                literal(1).label("concur_cnt"),
+            )
+            .join(HRMgnt, HRMgntConcur.emp_no == HRMgnt.emp_no)
+            .where(
+                HRMgntConcur.is_main == "N",
+                HRMgnt.dept_code != HRMgntConcur.dept_code,
+            )
+        )
+        union_subq = union_all(main_q, concur_q).subquery()
+
+        stmt = select(
+            union_subq.c.dept_code,
+            func.sum(union_subq.c.main_cnt).label("main_cnt"),
+            func.sum(union_subq.c.concur_cnt).label("concur_cnt"),
+        ).group_by(union_subq.c.dept_code)
+
+        result = await self.db.execute(stmt)
+        return {
+            row.dept_code: (int(row.main_cnt), int(row.concur_cnt))
+            for row in result.all()
+        }
@@ -77,7 +77,10 @@ class IEmployeeRepository(ABC):
 
     @abstractmethod
     async def find_by_dept_code(
-        self, dept_code: str, include_concurrent: bool = True
+        self,
+        dept_code: str,
+        include_concurrent: bool = True,
+        dept_codes: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         부서 코드로 소속 직원을 조회합니다 (직책명 포함).
@@ -85,6 +88,7 @@ class IEmployeeRepository(ABC):
         Args:
             dept_code: 부서 코드
             include_concurrent: 겸직자 포함 여부
+            dept_codes: 조회 부서 코드 목록 (지정 시 dept_code 대신 사용, 하위 부서 포함 조회용)
 
         Returns:
             List[Dict[str, Any]]: 소속 직원 리스트 (position_name 포함)
@@ -135,3 +139,17 @@ class IEmployeeRepository(ABC):
             int: 겸직 직원 수
         """
         pass
+
+    @abstractmethod
+    async def count_headcounts_by_dept(self) -> Dict[str, Tuple[int, int]]:
+        """
+        전체 부서의 주소속/겸직 직원 수를 한 번에 집계합니다.
+
+        겸직 기준은 count_concurrent_by_dept_code와 같습니다.
+        (is_main='N'이며 주소속 부서가 해당 부서가 아닌 경우)
+
+        Returns:
+            Dict[str, Tuple[int, int]]: {dept_code: (주소속 직원 수, 겸직 직원 수)}
+                                        직원이 없는 부서는 포함되지 않음
+        """
+        pass
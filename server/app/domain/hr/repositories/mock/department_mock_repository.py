@@ -6,9 +6,10 @@ JSON 파일을 데이터 소스로 사용하는 Mock 구현체입니다.
 
 import json
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
+from server.app.domain.hr.calculators import OrgTreeCalculator
 from server.app.domain.hr.repositories.department_repository import IDepartmentRepository
 from server.app.domain.hr.models import CMDepartment, CMDepartmentTree
 
@@ -194,3 +195,12 @@ class DepartmentMockRepository(IDepartmentRepository):
             "dept_head_name": dept_head_name,
             "dept_head_position": dept_head_position,
         }
+
+    async def find_department_closure(self) -> List[Tuple[str, str, int]]:
+        """부서 계층 클로저 전체를 조회합니다 (Mock 구현: 사용 중인 부서로 계산)"""
+        upper_by_code = {
+            dept["dept_code"]: dept.get("upper_dept_code")
+            for dept in self.departments
+            if dept.get("use_yn", "Y") == "Y"
+        }
+        return OrgTreeCalculator.build_closure(upper_by_code)
@@ -166,14 +166,18 @@ class EmployeeMockRepository(IEmployeeRepository):
         }
 
     async def find_by_dept_code(
-        self, dept_code: str, include_concurrent: bool = True
+        self,
+        dept_code: str,
+        include_concurrent: bool = True,
+        dept_codes: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """부서 코드로 소속 직원을 조회합니다 (직책명 포함)"""
+        """부서 코드로 소속 직원을 조회합니다 (직책명 포함, dept_codes 지정 시 목록 전체)"""
+        target_codes = set(dept_codes or [dept_code])
         result: List[Dict[str, Any]] = []
 
         # 주소속 직원 조회
         for emp_data in self.employees:
-            if emp_data["dept_code"] == dept_code:
+            if emp_data["dept_code"] in target_codes:
                 result.append(self._emp_data_to_dict(emp_data))
 
         # 겸직자 포함
@@ -181,14 +185,14 @@ class EmployeeMockRepository(IEmployeeRepository):
             concurrent_emp_nos = set()
             for concurrent_data in self.concurrent_positions:
                 if (
-                    concurrent_data["dept_code"] == dept_code
+                    concurrent_data["dept_code"] in target_codes
                     and concurrent_data["is_main"] == "N"
                 ):
                     concurrent_emp_nos.add(concurrent_data["emp_no"])
 
             for emp_no in concurrent_emp_nos:
                 for emp_data in self.employees:
-                    if emp_data["emp_no"] == emp_no and emp_data["dept_code"] != dept_code:
+                    if emp_data["emp_no"] == emp_no and emp_data["dept_code"] not in target_codes:
                         result.append(self._emp_data_to_dict(emp_data))
 
         return result
@@ -217,3 +221,19 @@ class EmployeeMockRepository(IEmployeeRepository):
             for emp in self.employees
             if emp["emp_no"] in concurrent_emp_nos and emp["dept_code"] != dept_code
         )
+
+    async def count_headcounts_by_dept(self) -> Dict[str, Tuple[int, int]]:
+        """전체 부서의 주소속/겸직 직원 수를 한 번에 집계합니다"""
+        main_dept_by_emp = {emp["emp_no"]: emp["dept_code"] for emp in self.employees}
+        headcounts: Dict[str, List[int]] = {}
+
+        for emp in self.employees:
+            headcounts.setdefault(emp["dept_code"], [0, 0])[0] += 1
+
+        # 겸직 (is_main='N', 주소속 부서 != 겸직 부서)
+        for c in self.concurrent_positions:
+            main_dept = main_dept_by_emp.get(c["emp_no"])
+            if c["is_main"] == "N" and main_dept is not None and main_dept != c["dept_code"]:
+                headcounts.setdefault(c["dept_code"], [0, 0])[1] += 1
+
+        return {dept_code: (main, concur) for dept_code, (main, concur) in headcounts.items()}
@@ -0,0 +1,537 @@
+"""
+HR 도메인 - 동기화 DB Repository
+
+외부 시스템 동기화(Bulk Upsert)용 집합 단위 조회/쓰기를 담당합니다.
+행 단위 SELECT/flush 없이 청크마다 고정된 수의 statement만 실행하며,
+저장된 내용 해시(row_hash)와 다른 행만 씁니다. (변경 판단은 SyncCalculator)
+
+메서드 목록:
+    - find_existing_dept_codes     : 요청 부서 코드 중 cm_department에 존재하는 코드
+    - find_existing_user_ids       : 요청 사용자 ID 중 cm_user에 존재하는 ID
+    - find_user_id_owners          : 요청 사용자 ID를 이미 사용 중인 사번
+    - find_employee_fingerprints   : hr_mgnt {사번: row_hash}
+    - find_concurrent_fingerprints : hr_mgnt_concur {(사번, 부서 코드): row_hash}
+    - upsert_employees             : hr_mgnt 다중 행 INSERT ... ON CONFLICT (emp_no) DO UPDATE
+    - upsert_concurrent_positions  : hr_mgnt_concur 다중 행 INSERT ... ON CONFLICT (emp_no, dept_code) DO UPDATE
+    - delete_concurrent_positions  : hr_mgnt_concur 해제된 (사번, 부서 코드) 삭제
+    - find_department_states       : cm_department 전체 {부서 코드: (상위 부서 코드, 사용 여부, row_hash)}
+    - find_department_tree_rows    : 기준 연도 cm_department_tree 비교 값
+    - find_employee_names          : 사번 목록의 {사번: 성명} (부서장 성명)
+    - upsert_departments           : cm_department 다중 행 INSERT ... ON CONFLICT (dept_code) DO UPDATE
+    - upsert_department_tree       : cm_department_tree 다중 행 INSERT ... ON CONFLICT (std_year, dept_code) DO UPDATE
+    - update_sync_history          : hr_sync_history 진행 현황 갱신
+    - fail_stale_sync_histories    : in_progress로 고착된 hr_sync_history를 failure로 전환 (워커 비정상 종료)
+    - try_lock_source              : 수집 커넥터 세션 advisory lock (워커 간 중복 수집 방지)
+    - unlock_source                : 수집 커넥터 advisory lock 해제
+    - find_source_watermark        : hr_sync_source_state 마지막 반영 워터마크
+    - save_source_watermark        : hr_sync_source_state 워터마크 INSERT ... ON CONFLICT DO UPDATE
+
+트랜잭션 커밋은 호출자(SyncService)가 청크 단위로 수행합니다.
+다중 행 statement는 bind parameter 한도(asyncpg 32767개) 이내로 나누어 실행합니다. (_bind_param_batches)
+"""
+
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.domain.hr.models import (
+    CMDepartment,
+    CMDepartmentTree,
+    CMUser,
+    HRMgnt,
+    HRMgntConcur,
+    HRSyncHistory,
+    HRSyncSourceState,
+)
+from server.app.domain.hr.schemas.sync import (
+    ConcurrentPositionSyncRequest,
+    DepartmentSyncRequest,
+    EmployeeSyncRequest,
+)
+
+# 한 statement의 bind parameter 상한 (asyncpg / PostgreSQL wire protocol: Int16)
+_MAX_BIND_PARAMS: int = 32767
+
+# ON CONFLICT SET / WHERE 절에 쓰이는 행 외 파라미터 여유분
+_RESERVED_BIND_PARAMS: int = 100
+
+
+def _bind_param_batches(rows: list[Any], params_per_row: int) -> Iterator[list[Any]]:
+    """
+    다중 행 statement를 bind parameter 한도 이내 크기로 나눕니다.
+
+    Args:
+        rows: 행 목록
+        params_per_row: 행당 bind parameter 수 (INSERT 컬럼 수)
+
+    Yields:
+        list: 한 statement로 실행할 행 목록
+    """
+    per_statement = max(1, (_MAX_BIND_PARAMS - _RESERVED_BIND_PARAMS) // params_per_row)
+    for start in range(0, len(rows), per_statement):
+        yield rows[start:start + per_statement]
+
+
+class SyncDBRepository:
+    """
+    HR 동기화 DB Repository
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Args:
+            db: 비동기 데이터베이스 세션
+        """
+        self.db = db
+
+    async def find_existing_dept_codes(self, dept_codes: Iterable[str]) -> set[str]:
+        """요청 부서 코드 중 cm_department에 존재하는 코드를 조회합니다"""
+        codes = set(dept_codes)
+        if not codes:
+            return set()
+        result = await self.db.execute(
+            select(CMDepartment.dept_code).where(CMDepartment.dept_code.in_(codes))
+        )
+        return set(result.scalars().all())
+
+    async def find_existing_user_ids(self, user_ids: Iterable[str]) -> set[str]:
+        """요청 사용자 ID 중 cm_user에 존재하는 ID를 조회합니다"""
+        ids = set(user_ids)
+        if not ids:
+            return set()
+        result = await self.db.execute(select(CMUser.user_id).where(CMUser.user_id.in_(ids)))
+        return set(result.scalars().all())
+
+    async def find_user_id_owners(self, user_ids: Iterable[str]) -> dict[str, str]:
+        """요청 사용자 ID를 이미 사용 중인 직원의 {user_id: emp_no}를 조회합니다"""
+        ids = set(user_ids)
+        if not ids:
+            return {}
+        result = await self.db.execute(
+            select(HRMgnt.user_id, HRMgnt.emp_no).where(HRMgnt.user_id.in_(ids))
+        )
+        return {row.user_id: row.emp_no for row in result.all()}
+
+    async def find_employee_fingerprints(self, emp_nos: Iterable[str]) -> dict[str, Optional[str]]:
+        """요청 사번 중 hr_mgnt에 존재하는 직원의 {사번: row_hash}를 조회합니다"""
+        codes = set(emp_nos)
+        if not codes:
+            return {}
+        result = await self.db.execute(
+            select(HRMgnt.emp_no, HRMgnt.row_hash).where(HRMgnt.emp_no.in_(codes))
+        )
+        return {row.emp_no: row.row_hash for row in result.all()}
+
+    async def find_concurrent_fingerprints(
+        self, emp_nos: Iterable[str]
+    ) -> dict[tuple[str, str], Optional[str]]:
+        """요청 사번의 겸직 {(사번, 부서 코드): row_hash}를 조회합니다"""
+        codes = set(emp_nos)
+        if not codes:
+            return {}
+        result = await self.db.execute(
+            select(HRMgntConcur.emp_no, HRMgntConcur.dept_code, HRMgntConcur.row_hash).where(
+                HRMgntConcur.emp_no.in_(codes)
+            )
+        )
+        return {(row.emp_no, row.dept_code): row.row_hash for row in result.all()}
+
+    async def upsert_employees(
+        self,
+        employees: list[EmployeeSyncRequest],
+        fingerprints: dict[str, str],
+        in_user: str | None,
+    ) -> None:
+        """
+        직원 정보를 다중 행 statement로 Insert/Update 합니다. (ON CONFLICT (emp_no) DO UPDATE)
+
+        해시가 같은 기존 행은 UPDATE하지 않습니다. (동시 동기화 대비)
+        행이 많으면 bind parameter 한도 이내의 여러 statement로 나누어 실행합니다.
+
+        Args:
+            employees: 사번 중복이 없는 변경 요청 목록
+            fingerprints: {사번: row_hash}
+            in_user: 실행자
+        """
+        if not employees:
+            return
+
+        now = datetime.utcnow()
+        values = [
+            {
+                "emp_no": emp.emp_no,
+                "user_id": emp.user_id,
+                "name_kor": emp.name_kor,
+                "dept_code": emp.dept_code,
+                "position_code": emp.position_code,
+                "on_work_yn": emp.on_work_yn,
+                "row_hash": fingerprints[emp.emp_no],
+                "in_user": in_user,
+                "in_date": now,
+            }
+            for emp in employees
+        ]
+        for batch in _bind_param_batches(values, len(values[0])):
+            stmt = pg_insert(HRMgnt).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[HRMgnt.emp_no],
+                set_={
+                    "user_id": stmt.excluded.user_id,
+                    "name_kor": stmt.excluded.name_kor,
+                    "dept_code": stmt.excluded.dept_code,
+                    "position_code": stmt.excluded.position_code,
+                    "on_work_yn": stmt.excluded.on_work_yn,
+                    "row_hash": stmt.excluded.row_hash,
+                    "up_user": in_user,
+                    "up_date": now,
+                },
+                where=HRMgnt.row_hash.is_distinct_from(stmt.excluded.row_hash),
+            )
+            await self.db.execute(stmt)
+
+    async def upsert_concurrent_positions(
+        self,
+        rows: list[tuple[str, ConcurrentPositionSyncRequest, str]],
+        in_user: str | None,
+    ) -> None:
+        """
+        겸직 정보를 다중 행 statement로 Insert/Update 합니다. (ON CONFLICT (emp_no, dept_code) DO UPDATE)
+
+        행이 많으면 bind parameter 한도 이내의 여러 statement로 나누어 실행합니다.
+
+        Args:
+            rows: (사번, 겸직 요청, row_hash) 목록 — (사번, 부서 코드) 중복 없음
+            in_user: 실행자
+        """
+        if not rows:
+            return
+
+        now = datetime.utcnow()
+        values = [
+            {
+                "emp_no": emp_no,
+                "dept_code": concur.dept_code,
+                "is_main": concur.is_main,
+                "position_code": concur.position_code,
+                "row_hash": row_hash,
+                "in_user": in_user,
+                "in_date": now,
+            }
+            for emp_no, concur, row_hash in rows
+        ]
+        for batch in _bind_param_batches(values, len(values[0])):
+            stmt = pg_insert(HRMgntConcur).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[HRMgntConcur.emp_no, HRMgntConcur.dept_code],
+                set_={
+                    "is_main": stmt.excluded.is_main,
+                    "position_code": stmt.excluded.position_code,
+                    "row_hash": stmt.excluded.row_hash,
+                    "up_user": in_user,
+                    "up_date": now,
+                },
+                where=HRMgntConcur.row_hash.is_distinct_from(stmt.excluded.row_hash),
+            )
+            await self.db.execute(stmt)
+
+    async def delete_concurrent_positions(self, keys: list[tuple[str, str]]) -> None:
+        """
+        해제된 겸직을 삭제합니다. (겸직→비겸직 전환 등)
+
+        Args:
+            keys: (사번, 부서 코드) 목록
+        """
+        for batch in _bind_param_batches(keys, 2):
+            await self.db.execute(
+                delete(HRMgntConcur).where(
+                    tuple_(HRMgntConcur.emp_no, HRMgntConcur.dept_code).in_(batch)
+                )
+            )
+
+    async def find_department_states(
+        self,
+    ) -> dict[str, tuple[Optional[str], str, Optional[str]]]:
+        """cm_department 전체의 {부서 코드: (상위 부서 코드, 사용 여부, row_hash)}를 조회합니다"""
+        result = await self.db.execute(
+            select(
+                CMDepartment.dept_code,
+                CMDepartment.upper_dept_code,
+                CMDepartment.use_yn,
+                CMDepartment.row_hash,
+            )
+        )
+        return {
+            row.dept_code: (row.upper_dept_code, row.use_yn, row.row_hash)
+            for row in result.all()
+        }
+
+    async def find_department_tree_rows(
+        self, std_year: str
+    ) -> dict[str, tuple[Optional[str], str, int, Optional[str], Optional[str]]]:
+        """
+        기준 연도 조직도 행의 비교 값을 조회합니다.
+
+        Returns:
+            dict: {부서 코드: (상위 부서 코드, 부서명, disp_lvl, 부서장 사번, 부서장 성명)}
+        """
+        result = await self.db.execute(
+            select(
+                CMDepartmentTree.dept_code,
+                CMDepartmentTree.upper_dept_code,
+                CMDepartmentTree.dept_name,
+                CMDepartmentTree.disp_lvl,
+                CMDepartmentTree.dept_head_emp_no,
+                CMDepartmentTree.name_kor,
+            ).where(CMDepartmentTree.std_year == std_year)
+        )
+        return {
+            row.dept_code: (
+                row.upper_dept_code,
+                row.dept_name,
+                row.disp_lvl,
+                row.dept_head_emp_no,
+                row.name_kor,
+            )
+            for row in result.all()
+        }
+
+    async def find_employee_names(self, emp_nos: Iterable[str]) -> dict[str, str]:
+        """사번 목록의 {사번: 성명}을 조회합니다"""
+        codes = set(emp_nos)
+        if not codes:
+            return {}
+        result = await self.db.execute(
+            select(HRMgnt.emp_no, HRMgnt.name_kor).where(HRMgnt.emp_no.in_(codes))
+        )
+        return {row.emp_no: row.name_kor for row in result.all()}
+
+    async def upsert_departments(
+        self,
+        departments: list[DepartmentSyncRequest],
+        fingerprints: dict[str, str],
+        in_user: str | None,
+    ) -> None:
+        """
+        부서 정보를 다중 행 statement로 Insert/Update 합니다. (ON CONFLICT (dept_code) DO UPDATE)
+
+        해시가 같은 기존 행은 UPDATE하지 않습니다. (동시 동기화 대비)
+        행이 많으면 bind parameter 한도 이내의 여러 statement로 나누어 실행합니다.
+
+        Args:
+            departments: 부서 코드 중복이 없는 변경 요청 목록
+            fingerprints: {부서 코드: row_hash}
+            in_user: 실행자
+        """
+        if not departments:
+            return
+
+        now = datetime.utcnow()
+        values = [
+            {
+                "dept_code": dept.dept_code,
+                "dept_name": dept.dept_name,
+                "upper_dept_code": dept.upper_dept_code,
+                "dept_head_emp_no": dept.dept_head_emp_no,
+                "use_yn": dept.use_yn,
+                "row_hash": fingerprints[dept.dept_code],
+                "in_user": in_user,
+                "in_date": now,
+            }
+            for dept in departments
+        ]
+        for batch in _bind_param_batches(values, len(values[0])):
+            stmt = pg_insert(CMDepartment).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[CMDepartment.dept_code],
+                set_={
+                    "dept_name": stmt.excluded.dept_name,
+                    "upper_dept_code": stmt.excluded.upper_dept_code,
+                    "dept_head_emp_no": stmt.excluded.dept_head_emp_no,
+                    "use_yn": stmt.excluded.use_yn,
+                    "row_hash": stmt.excluded.row_hash,
+                    "up_user": in_user,
+                    "up_date": now,
+                },
+                where=CMDepartment.row_hash.is_distinct_from(stmt.excluded.row_hash),
+            )
+            await self.db.execute(stmt)
+
+    async def upsert_department_tree(
+        self,
+        std_year: str,
+        departments: list[DepartmentSyncRequest],
+        disp_lvls: dict[str, int],
+        head_names: dict[str, str],
+        in_user: str | None,
+    ) -> None:
+        """
+        조직도 행을 다중 행 statement로 Insert/Update 합니다. (ON CONFLICT (std_year, dept_code) DO UPDATE)
+
+        행이 많으면 bind parameter 한도 이내의 여러 statement로 나누어 실행합니다.
+
+        Args:
+            std_year: 기준 연도
+            departments: 부서 코드 중복이 없는 동기화 요청 목록
+            disp_lvls: {부서 코드: 표시 레벨}
+            head_names: {부서장 사번: 성명}
+            in_user: 실행자
+        """
+        if not departments:
+            return
+
+        now = datetime.utcnow()
+        values = [
+            {
+                "std_year": std_year,
+                "dept_code": dept.dept_code,
+                "upper_dept_code": dept.upper_dept_code,
+                "dept_name": dept.dept_name,
+                "disp_lvl": disp_lvls[dept.dept_code],
+                "dept_head_emp_no": dept.dept_head_emp_no,
+                "name_kor": head_names.get(dept.dept_head_emp_no) if dept.dept_head_emp_no else None,
+                "in_user": in_user,
+                "in_date": now,
+            }
+            for dept in departments
+        ]
+        for batch in _bind_param_batches(values, len(values[0])):
+            stmt = pg_insert(CMDepartmentTree).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[CMDepartmentTree.std_year, CMDepartmentTree.dept_code],
+                set_={
+                    "upper_dept_code": stmt.excluded.upper_dept_code,
+                    "dept_name": stmt.excluded.dept_name,
+                    "disp_lvl": stmt.excluded.disp_lvl,
+                    "dept_head_emp_no": stmt.excluded.dept_head_emp_no,
+                    "name_kor": stmt.excluded.name_kor,
+                    "up_user": in_user,
+                    "up_date": now,
+                },
+            )
+            await self.db.execute(stmt)
+
+    async def update_sync_history(self, sync_id: int, **values: Any) -> None:
+        """
+        동기화 이력의 진행 현황을 갱신합니다.
+
+        Args:
+            sync_id: 동기화 이력 ID
+            **values: 갱신할 컬럼 값 (success_count, failure_count, sync_status 등)
+        """
+        await self.db.execute(
+            update(HRSyncHistory).where(HRSyncHistory.sync_id == sync_id).values(**values)
+        )
+
+    async def fail_stale_sync_histories(
+        self,
+        started_before: datetime,
+        exclude_sync_ids: list[int],
+        reason: str,
+    ) -> list[int]:
+        """
+        started_before 이전에 시작되어 in_progress로 남은 동기화 이력을 failure로 전환합니다.
+
+        조건부 UPDATE 한 번으로 처리하므로 그 사이 완료된 작업은 덮어쓰지 않습니다.
+
+        Args:
+            started_before: 고착 기준 시작 시각
+            exclude_sync_ids: 실행 중이라 제외할 동기화 이력 ID
+            reason: error_message에 덧붙일 사유
+
+        Returns:
+            list[int]: failure로 전환된 동기화 이력 ID
+        """
+        stmt = (
+            update(HRSyncHistory)
+            .where(
+                HRSyncHistory.sync_status == "in_progress",
+                HRSyncHistory.sync_start_time < started_before,
+            )
+            .values(
+                sync_status="failure",
+                error_message=func.concat_ws("\n", HRSyncHistory.error_message, reason),
+                sync_end_time=datetime.utcnow(),
+            )
+            .returning(HRSyncHistory.sync_id)
+        )
+        if exclude_sync_ids:
+            stmt = stmt.where(HRSyncHistory.sync_id.not_in(exclude_sync_ids))
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def try_lock_source(self, source_name: str) -> bool:
+        """
+        수집 커넥터 세션 수준 advisory lock을 시도합니다. (unlock_source로 해제)
+
+        여러 워커의 스케줄러가 같은 커넥터를 동시에 수집하지 않도록 합니다.
+        잠금은 커넥션에 묶이므로, 호출자는 해제할 때까지 이 세션의 커넥션을 고정해야 합니다.
+
+        Args:
+            source_name: 수집 커넥터 이름
+
+        Returns:
+            bool: 잠금 획득 여부
+        """
+        result = await self.db.execute(
+            select(func.pg_try_advisory_lock(func.hashtext(f"hr_sync_source:{source_name}")))
+        )
+        return bool(result.scalar())
+
+    async def unlock_source(self, source_name: str) -> None:
+        """
+        try_lock_source로 얻은 수집 커넥터 advisory lock을 해제합니다.
+
+        Args:
+            source_name: 수집 커넥터 이름
+        """
+        await self.db.execute(
+            select(func.pg_advisory_unlock(func.hashtext(f"hr_sync_source:{source_name}")))
+        )
+
+    async def find_source_watermark(self, source_name: str, sync_type: str) -> Optional[str]:
+        """
+        수집 커넥터의 마지막 반영 워터마크를 조회합니다.
+
+        Returns:
+            Optional[str]: 워터마크 (처음 수집이면 None)
+        """
+        result = await self.db.execute(
+            select(HRSyncSourceState.watermark).where(
+                HRSyncSourceState.source_name == source_name,
+                HRSyncSourceState.sync_type == sync_type,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def save_source_watermark(
+        self, source_name: str, sync_type: str, watermark: str, sync_id: int
+    ) -> None:
+        """
+        수집 커넥터의 반영 워터마크를 저장합니다.
+
+        Args:
+            source_name: 수집 커넥터 이름
+            sync_type: 동기화 타입 (employees/departments)
+            watermark: 반영을 마친 변경분의 워터마크
+            sync_id: 해당 변경분을 반영한 동기화 이력 ID
+        """
+        now = datetime.utcnow()
+        stmt = pg_insert(HRSyncSourceState).values(
+            source_name=source_name,
+            sync_type=sync_type,
+            watermark=watermark,
+            last_sync_id=sync_id,
+            up_date=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[HRSyncSourceState.source_name, HRSyncSourceState.sync_type],
+            set_={
+                "watermark": stmt.excluded.watermark,
+                "last_sync_id": stmt.excluded.last_sync_id,
+                "up_date": now,
+            },
+        )
+        await self.db.execute(stmt)
@@ -4,10 +4,11 @@ HR API 라우터
 직원 및 부서 정보 조회 엔드포인트를 제공합니다.
 """
 
-from typing import Union
+from typing import AsyncIterator, Union
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import UploadFile
 
 from server.app.core.database import get_db
 from server.app.core.logging import get_logger
@@ -16,6 +17,7 @@ from server.app.domain.hr.schemas.department import (
     DepartmentEmployeesResponse,
     DepartmentInfo,
     DepartmentListResponse,
+    OrgSubtreeResponse,
     OrgTreeResponse,
 )
 from server.app.domain.hr.schemas.employee import (
@@ -29,13 +31,20 @@ from server.app.domain.hr.schemas.sync import (
     EmployeeSyncRequest,
     SyncExecutionResponse,
     SyncHistoryListResponse,
+    SyncJobResponse,
+    SyncProgressResponse,
 )
 from server.app.domain.hr.service import DepartmentService, EmployeeService, SyncService
+from server.app.domain.hr.sync_jobs import spool_ndjson, start_sync_job
+from server.app.shared.exceptions import ValidationException
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/hr", tags=["hr"])
 
+# 업로드 파일 읽기 단위 (바이트)
+SYNC_UPLOAD_READ_BYTES = 1024 * 1024
+
 
 # =============================================
 # 직원 정보 API
@@ -259,30 +268,45 @@ async def get_department(
 # =============================================
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인합니다. (목록, W/ 접두사, * 지원)"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get(
     "/org-tree",
     response_model=OrgTreeResponse,
     summary="조직도 트리 조회",
     description=(
         "조직도를 계층형 트리 구조로 조회합니다. "
-        "기준 연도를 지정하지 않으면 최신 연도를 자동으로 조회합니다."
+        "기준 연도를 지정하지 않으면 최신 연도를 자동으로 조회합니다. "
+        "응답에 ETag가 포함되며, If-None-Match가 일치하면 304를 반환합니다. "
+        "(HR 동기화 시 갱신)"
     ),
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "조직도 변경 없음"}},
 )
 async def get_org_tree(
     std_year: str | None = Query(
         None, description="기준 연도 (YYYY). 미지정 시 최신 연도 자동 조회"
     ),
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
     db: AsyncSession = Depends(get_db),
-) -> OrgTreeResponse:
+) -> Response:
     """
     조직도 트리를 조회합니다.
 
+    동기화 이후 처음 조회할 때만 트리를 구성하고, 이후에는 직렬화된 스냅샷을 그대로 반환합니다.
+
     Args:
         std_year: 기준 연도 (YYYY)
+        if_none_match: 클라이언트가 보관 중인 ETag
         db: 데이터베이스 세션
 
     Returns:
-        OrgTreeResponse: 조직도 트리
+        Response: 조직도 트리 JSON (OrgTreeResponse) 또는 304
 
     Raises:
         HTTPException(404): 조직도 데이터가 없는 경우
@@ -290,7 +314,54 @@ async def get_org_tree(
     logger.info("조직도 트리 조회", extra={"std_year": std_year})
 
     service = DepartmentService(db)
-    return await service.get_org_tree(std_year=std_year)
+    snapshot = await service.get_org_tree_snapshot(std_year=std_year)
+
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/org-tree/{dept_code}",
+    response_model=OrgSubtreeResponse,
+    summary="조직도 하위 트리 조회",
+    description=(
+        "부서 기준 하위 트리를 depth 단계까지 조회합니다. "
+        "그 아래 부서는 has_children/child_count로 표시되므로 펼칠 때 다시 조회합니다. "
+        "기준 연도를 지정하지 않으면 최신 연도를 조회합니다."
+    ),
+)
+async def get_org_subtree(
+    dept_code: str,
+    depth: int = Query(1, ge=0, le=20, description="포함할 하위 단계 수 (0: 요청 부서만)"),
+    std_year: str | None = Query(
+        None, description="기준 연도 (YYYY). 미지정 시 최신 연도 자동 조회"
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> OrgSubtreeResponse:
+    """
+    조직도 하위 트리를 조회합니다.
+
+    Args:
+        dept_code: 기준 부서 코드
+        depth: 포함할 하위 단계 수
+        std_year: 기준 연도 (YYYY)
+        db: 데이터베이스 세션
+
+    Returns:
+        OrgSubtreeResponse: 하위 트리 (상위 부서 경로 포함)
+
+    Raises:
+        HTTPException(404): 조직도 데이터가 없거나 조직도에 없는 부서인 경우
+    """
+    logger.info(
+        "조직도 하위 트리 조회",
+        extra={"dept_code": dept_code, "depth": depth, "std_year": std_year},
+    )
+
+    service = DepartmentService(db)
+    return await service.get_org_subtree(dept_code, std_year=std_year, depth=depth)
 
 
 @router.get(
@@ -329,13 +400,17 @@ async def get_department_info(
     "/departments/{dept_code}/employees",
     response_model=DepartmentEmployeesResponse,
     summary="부서별 직원 목록 조회",
-    description=("특정 부서에 소속된 직원 목록을 조회합니다. " "기본적으로 겸직자도 포함됩니다."),
+    description=(
+        "특정 부서에 소속된 직원 목록을 조회합니다. "
+        "기본적으로 겸직자도 포함되며, include_sub_depts=true이면 하위 부서 직원도 포함됩니다."
+    ),
 )
 async def get_department_employees(
     dept_code: str,
     include_concurrent: bool = Query(
         True, description="겸직자 포함 여부 (True: 포함, False: 주소속만)"
     ),
+    include_sub_depts: bool = Query(False, description="하위 부서 직원 포함 여부"),
     db: AsyncSession = Depends(get_db),
 ) -> DepartmentEmployeesResponse:
     """
@@ -344,6 +419,7 @@ async def get_department_employees(
     Args:
         dept_code: 부서 코드
         include_concurrent: 겸직자 포함 여부
+        include_sub_depts: 하위 부서 직원 포함 여부
         db: 데이터베이스 세션
 
     Returns:
@@ -354,11 +430,19 @@ async def get_department_employees(
     """
     logger.info(
         "부서별 직원 목록 조회",
-        extra={"dept_code": dept_code, "include_concurrent": include_concurrent},
+        extra={
+            "dept_code": dept_code,
+            "include_concurrent": include_concurrent,
+            "include_sub_depts": include_sub_depts,
+        },
     )
 
     service = DepartmentService(db)
-    employees = await service.get_department_employees(dept_code, include_concurrent=include_concurrent)
+    employees = await service.get_department_employees(
+        dept_code,
+        include_concurrent=include_concurrent,
+        include_sub_depts=include_sub_depts,
+    )
 
     return DepartmentEmployeesResponse(
         items=employees,
@@ -453,6 +537,108 @@ async def sync_departments(
     return result
 
 
+async def _ndjson_body_chunks(request: Request) -> AsyncIterator[bytes]:
+    """
+    NDJSON 요청 본문 또는 multipart 업로드 파일(file 필드)을 청크 단위로 읽습니다.
+
+    Raises:
+        ValidationException: multipart 요청에 file 필드가 없을 때
+    """
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if not isinstance(upload, UploadFile):
+            raise ValidationException("업로드 파일(file 필드)이 없습니다")
+        while chunk := await upload.read(SYNC_UPLOAD_READ_BYTES):
+            yield chunk
+        return
+
+    async for chunk in request.stream():
+        yield chunk
+
+
+@router.post(
+    "/sync/employees/jobs",
+    response_model=SyncJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="직원 정보 동기화 작업 접수 (NDJSON 스트리밍)",
+    description=(
+        "직원 데이터를 NDJSON(`application/x-ndjson`, 한 줄에 직원 1명) 본문 또는 "
+        "multipart 업로드(`file` 필드)로 받아 백그라운드 작업으로 동기화합니다. "
+        "업로드가 끝나면 즉시 sync_id를 반환하며, 진행 현황은 GET /hr/sync/jobs/{sync_id}로 조회합니다."
+    ),
+)
+async def start_employee_sync_job(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> SyncJobResponse:
+    """
+    직원 정보 동기화 작업을 접수합니다. (업로드 → 임시 파일 → 백그라운드 반영)
+
+    Args:
+        request: NDJSON 본문 또는 multipart 업로드 요청
+        db: 데이터베이스 세션
+
+    Returns:
+        SyncJobResponse: 작업 접수 결과 (sync_id)
+    """
+    spool_path, line_count = await spool_ndjson(_ndjson_body_chunks(request))
+    return await start_sync_job(db, "employees", spool_path, line_count, in_user="system")
+
+
+@router.post(
+    "/sync/departments/jobs",
+    response_model=SyncJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="부서 정보 동기화 작업 접수 (NDJSON 스트리밍)",
+    description=(
+        "부서 데이터를 NDJSON(`application/x-ndjson`, 한 줄에 부서 1개) 본문 또는 "
+        "multipart 업로드(`file` 필드)로 받아 백그라운드 작업으로 동기화합니다. "
+        "업로드가 끝나면 즉시 sync_id를 반환하며, 진행 현황은 GET /hr/sync/jobs/{sync_id}로 조회합니다."
+    ),
+)
+async def start_department_sync_job(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> SyncJobResponse:
+    """
+    부서 정보 동기화 작업을 접수합니다. (업로드 → 임시 파일 → 백그라운드 반영)
+
+    Args:
+        request: NDJSON 본문 또는 multipart 업로드 요청
+        db: 데이터베이스 세션
+
+    Returns:
+        SyncJobResponse: 작업 접수 결과 (sync_id)
+    """
+    spool_path, line_count = await spool_ndjson(_ndjson_body_chunks(request))
+    return await start_sync_job(db, "departments", spool_path, line_count, in_user="system")
+
+
+@router.get(
+    "/sync/jobs/{sync_id}",
+    response_model=SyncProgressResponse,
+    summary="동기화 작업 진행 현황 조회",
+    description="처리 건수, 진행률, 처리 속도(건/초), 지금까지의 오류를 반환합니다. 청크 커밋마다 갱신됩니다.",
+)
+async def get_sync_progress(
+    sync_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> SyncProgressResponse:
+    """
+    동기화 작업 진행 현황을 조회합니다.
+
+    Args:
+        sync_id: 동기화 이력 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        SyncProgressResponse: 진행 현황
+    """
+    service = SyncService(db)
+    return await service.get_sync_progress(sync_id)
+
+
 @router.get(
     "/sync/history",
     response_model=SyncHistoryListResponse,
@@ -21,6 +21,7 @@ from server.app.domain.hr.schemas.department import (
     DepartmentListResponse,
     OrgTreeNode,
     OrgTreeResponse,
+    OrgSubtreeResponse,
     DepartmentSearchParams,
     DepartmentDetailResponse,
     DepartmentEmployeesResponse,
@@ -32,6 +33,8 @@ from server.app.domain.hr.schemas.sync import (
     SyncHistoryResponse,
     SyncHistoryListResponse,
     SyncExecutionResponse,
+    SyncJobResponse,
+    SyncProgressResponse,
 )
 
 __all__ = [
@@ -50,6 +53,7 @@ __all__ = [
     "DepartmentListResponse",
     "OrgTreeNode",
     "OrgTreeResponse",
+    "OrgSubtreeResponse",
     "DepartmentSearchParams",
     "DepartmentDetailResponse",
     "DepartmentEmployeesResponse",
@@ -59,4 +63,6 @@ __all__ = [
     "SyncHistoryResponse",
     "SyncHistoryListResponse",
     "SyncExecutionResponse",
+    "SyncJobResponse",
+    "SyncProgressResponse",
 ]
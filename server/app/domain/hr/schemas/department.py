@@ -80,7 +80,17 @@ class OrgTreeNode(BaseModel):
     dept_head_name: Optional[str] = Field(None, description="부서장 성명")
 
     # 통계 정보
-    employee_count: int = Field(default=0, description="소속 직원 수")
+    employee_count: int = Field(default=0, description="소속 직원 수 (주소속 + 겸직)")
+    main_employee_count: int = Field(default=0, description="주소속 직원 수")
+    concurrent_employee_count: int = Field(default=0, description="겸직 직원 수")
+    subtree_employee_count: int = Field(
+        default=0, description="하위 부서 포함 누적 직원 수 (부서별 employee_count 합계)"
+    )
+
+    # 하위 부서 정보 (지연 펼치기용 — children이 비어 있어도 채워짐)
+    has_children: bool = Field(default=False, description="하위 부서 존재 여부")
+    child_count: int = Field(default=0, description="직속 하위 부서 수")
+    subtree_dept_count: int = Field(default=1, description="자기 자신 포함 하위 트리 부서 수")
 
     # 하위 부서 (재귀 구조)
     children: List["OrgTreeNode"] = Field(
@@ -98,6 +108,23 @@ class OrgTreeResponse(BaseModel):
     tree: List[OrgTreeNode] = Field(..., description="조직도 트리 (최상위 부서 리스트)")
 
 
+class OrgSubtreeResponse(BaseModel):
+    """
+    조직도 하위 트리 조회 응답 스키마
+
+    depth 단계까지의 children만 포함하며, 그 아래는 has_children/child_count로 표시합니다.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    std_year: str = Field(..., description="기준 연도")
+    depth: int = Field(..., description="포함된 하위 단계 수")
+    ancestor_codes: List[str] = Field(
+        default_factory=list, description="상위 부서 코드 (최상위부터 직속 상위까지)"
+    )
+    node: OrgTreeNode = Field(..., description="요청 부서 노드 (depth 단계까지 children 포함)")
+
+
 class DepartmentSearchParams(BaseModel):
     """부서 검색 파라미터 스키마"""
 
@@ -97,6 +97,14 @@ class SyncHistoryResponse(BaseModel):
     total_count: int = Field(..., description="전체 건수")
     success_count: int = Field(..., description="성공 건수")
     failure_count: int = Field(..., description="실패 건수")
+    inserted_count: int = Field(0, description="신규 등록 건수")
+    updated_count: int = Field(0, description="변경 건수")
+    unchanged_count: int = Field(0, description="변경 없음 건수 (쓰기 생략)")
+    deleted_count: int = Field(0, description="삭제 건수 (해제된 겸직 등)")
+    elapsed_ms: Optional[int] = Field(None, description="반영 소요 시간(ms)")
+    rows_per_second: Optional[float] = Field(None, description="처리 속도 (건/초)")
+    source_name: Optional[str] = Field(None, description="수집 커넥터 이름 (API 호출은 null)")
+    source_watermark: Optional[str] = Field(None, description="반영한 변경분의 워터마크")
     error_message: Optional[str] = Field(None, description="에러 메시지")
     sync_start_time: datetime = Field(..., description="동기화 시작 시간")
     sync_end_time: Optional[datetime] = Field(None, description="동기화 종료 시간")
@@ -131,4 +139,52 @@ class SyncExecutionResponse(BaseModel):
     total_count: int = Field(..., description="전체 건수")
     success_count: int = Field(..., description="성공 건수")
     failure_count: int = Field(..., description="실패 건수")
+    inserted_count: int = Field(0, description="신규 등록 건수")
+    updated_count: int = Field(0, description="변경 건수")
+    unchanged_count: int = Field(0, description="변경 없음 건수 (쓰기 생략)")
+    deleted_count: int = Field(0, description="삭제 건수 (해제된 겸직 등)")
     message: str = Field(..., description="결과 메시지")
+
+
+# =============================================
+# 동기화 작업 (비동기 실행) 스키마
+# =============================================
+
+
+class SyncJobResponse(BaseModel):
+    """
+    동기화 작업 접수 응답
+
+    업로드를 받은 즉시 반환하며, 실제 반영은 백그라운드 작업으로 진행됩니다.
+    진행 현황은 GET /hr/sync/jobs/{sync_id}로 조회합니다.
+    """
+
+    sync_id: int = Field(..., description="동기화 이력 ID")
+    sync_type: str = Field(..., description="동기화 타입 (employees/departments)")
+    sync_status: str = Field(..., description="동기화 상태 (in_progress)")
+    total_count: int = Field(..., description="업로드 줄 수 기준 예상 건수")
+    message: str = Field(..., description="결과 메시지")
+
+
+class SyncProgressResponse(BaseModel):
+    """
+    동기화 작업 진행 현황 응답
+    """
+
+    sync_id: int = Field(..., description="동기화 이력 ID")
+    sync_type: str = Field(..., description="동기화 타입")
+    sync_status: str = Field(..., description="동기화 상태 (in_progress/success/partial/failure)")
+    total_count: int = Field(..., description="전체 건수 (진행 중에는 업로드 줄 수 기준 예상치)")
+    processed_count: int = Field(..., description="처리 건수 (성공 + 실패)")
+    success_count: int = Field(..., description="성공 건수")
+    failure_count: int = Field(..., description="실패 건수")
+    inserted_count: int = Field(0, description="신규 등록 건수")
+    updated_count: int = Field(0, description="변경 건수")
+    unchanged_count: int = Field(0, description="변경 없음 건수 (쓰기 생략)")
+    deleted_count: int = Field(0, description="삭제 건수 (해제된 겸직 등)")
+    progress_rate: float = Field(..., description="진행률 (%)")
+    elapsed_seconds: float = Field(..., description="경과 시간 (초)")
+    rows_per_second: float = Field(..., description="처리 속도 (건/초)")
+    error_message: Optional[str] = Field(None, description="지금까지의 에러 메시지")
+    sync_start_time: datetime = Field(..., description="동기화 시작 시간")
+    sync_end_time: Optional[datetime] = Field(None, description="동기화 종료 시간")
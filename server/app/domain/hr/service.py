@@ -7,29 +7,55 @@ HR 도메인 서비스
     - Service: 흐름 제어 및 트랜잭션 관리
     - Repository: DB 조회 로직
     - Calculator: 순수 비즈니스 로직 (조직도 트리 변환 등)
+
+조직도 스냅샷 캐시:
+    조직도는 HR 동기화(sync_employees / sync_departments) 때만 바뀌므로
+    직렬화된 응답 JSON을 std_year별로 보관하고 ETag로 재검증합니다.
+    동기화가 끝나면 버전을 올려 무효화하고 최신 연도 스냅샷을 다시 채웁니다.
+    하위 트리 조회(get_org_subtree)용 배열 트리(CompactOrgTree)도 같은 버전으로 보관합니다.
+    다른 워커 프로세스에는 PgEventBridge로 무효화 이벤트를 보냅니다.
+
+부서 계층 클로저:
+    sync_departments는 cm_department_closure를 전체 재구성하고
+    프로세스 부서 계층 캐시(hierarchy.department_hierarchy)를 무효화합니다.
 """
 
+import hashlib
+import time
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
+from typing import AsyncIterator, Optional
 
-from sqlalchemy import delete as sa_delete, select
+from sqlalchemy import delete as sa_delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from server.app.domain.hr.calculators import OrgTreeCalculator
+from server.app.core.config import settings
+from server.app.core.events import EventHub, event_hub, pg_event_bridge
+from server.app.core.logging import get_logger
+from server.app.domain.hr.calculators import (
+    CompactOrgTree,
+    DepartmentSyncDiff,
+    EmployeeSyncDiff,
+    OrgTreeCalculator,
+    SyncCalculator,
+)
+from server.app.domain.hr.hierarchy import DEPARTMENT_HIERARCHY_CHANNEL, department_hierarchy
 from server.app.domain.hr.models import (
     CMDepartment,
-    CMDepartmentTree,
-    HRMgnt,
-    HRMgntConcur,
+    CMDepartmentClosure,
     HRSyncHistory,
 )
 from server.app.domain.hr.repositories import (
     DepartmentDBRepository,
     EmployeeDBRepository,
+    SyncDBRepository,
 )
 from server.app.domain.hr.schemas.department import (
     DepartmentDetailResponse,
     DepartmentInfo,
     DepartmentListResponse,
+    OrgSubtreeResponse,
     OrgTreeResponse,
 )
 from server.app.domain.hr.schemas.employee import (
@@ -46,9 +72,153 @@ from server.app.domain.hr.schemas.sync import (
     SyncExecutionResponse,
     SyncHistoryListResponse,
     SyncHistoryResponse,
+    SyncProgressResponse,
 )
 from server.app.shared.exceptions import NotFoundException
 
+logger = get_logger(__name__)
+
+# 조직도 스냅샷 무효화 이벤트 채널 (이벤트 허브 / 프로세스 간 NOTIFY)
+ORG_TREE_CHANNEL = "hr:org_tree"
+
+# 부서 계층 클로저 INSERT 청크 크기 (행 수)
+CLOSURE_INSERT_CHUNK = 5000
+
+
+@dataclass(frozen=True)
+class OrgTreeSnapshot:
+    """직렬화된 조직도 응답 스냅샷"""
+
+    std_year: str
+    version: int
+    etag: str
+    body: bytes
+
+
+class OrgTreeSnapshotCache:
+    """
+    조직도 트리 스냅샷 캐시 (워커 프로세스 단위)
+
+    캐시 적중 시 조직도 조회는 dict 조회 한 번이며, 트리 구성과 Pydantic 직렬화를 생략합니다.
+    하위 트리 조회용 CompactOrgTree도 std_year별로 함께 보관합니다.
+
+    무효화:
+        - 같은 프로세스: invalidate() 호출 (SyncService)
+        - 다른 프로세스: ORG_TREE_CHANNEL 이벤트 수신 → 다음 조회 시 반영
+    """
+
+    def __init__(self, hub: EventHub = event_hub, channel: str = ORG_TREE_CHANNEL) -> None:
+        """
+        Args:
+            hub: 무효화 이벤트를 받을 이벤트 허브
+            channel: 무효화 이벤트 채널
+        """
+        self._version = 0
+        self._snapshots: dict[Optional[str], OrgTreeSnapshot] = {}
+        self._trees: dict[Optional[str], tuple[str, CompactOrgTree]] = {}
+        self._invalidations = hub.subscribe(channel)
+
+    @property
+    def version(self) -> int:
+        """현재 데이터 버전 (동기화마다 +1)"""
+        self._apply_remote_invalidations()
+        return self._version
+
+    def get(self, std_year: Optional[str]) -> Optional[OrgTreeSnapshot]:
+        """
+        스냅샷을 조회합니다.
+
+        Args:
+            std_year: 기준 연도 (None이면 최신 연도)
+
+        Returns:
+            OrgTreeSnapshot | None: 현재 버전의 스냅샷 (없으면 None)
+        """
+        self._apply_remote_invalidations()
+        return self._snapshots.get(std_year)
+
+    def put(
+        self, std_year: Optional[str], version: int, response: OrgTreeResponse
+    ) -> OrgTreeSnapshot:
+        """
+        조직도 응답을 직렬화하여 저장합니다.
+
+        조회 시작 후 무효화되었으면(version 불일치) 반환만 하고 저장하지 않습니다.
+
+        Args:
+            std_year: 요청 기준 연도 (None이면 최신 연도 키로도 저장)
+            version: 조회 시작 시점의 데이터 버전
+            response: 조직도 응답
+
+        Returns:
+            OrgTreeSnapshot: 직렬화된 스냅샷
+        """
+        body = response.model_dump_json().encode()
+        snapshot = OrgTreeSnapshot(
+            std_year=response.std_year,
+            version=version,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            body=body,
+        )
+        if version == self._version:
+            self._snapshots[std_year] = snapshot
+            self._snapshots[response.std_year] = snapshot
+        return snapshot
+
+    def get_tree(self, std_year: Optional[str]) -> Optional[tuple[str, CompactOrgTree]]:
+        """
+        배열 트리를 조회합니다.
+
+        Args:
+            std_year: 기준 연도 (None이면 최신 연도)
+
+        Returns:
+            tuple | None: (기준 연도, CompactOrgTree), 없으면 None
+        """
+        self._apply_remote_invalidations()
+        return self._trees.get(std_year)
+
+    def put_tree(
+        self, std_year: Optional[str], version: int, resolved_year: str, tree: CompactOrgTree
+    ) -> None:
+        """
+        배열 트리를 저장합니다. (조회 시작 후 무효화되었으면 저장하지 않음)
+
+        Args:
+            std_year: 요청 기준 연도 (None이면 최신 연도 키로도 저장)
+            version: 조회 시작 시점의 데이터 버전
+            resolved_year: 실제 기준 연도
+            tree: 배열 트리
+        """
+        if version == self._version:
+            self._trees[std_year] = (resolved_year, tree)
+            self._trees[resolved_year] = (resolved_year, tree)
+
+    def invalidate(self) -> int:
+        """
+        데이터 버전을 올리고 스냅샷을 모두 버립니다.
+
+        Returns:
+            int: 새 데이터 버전
+        """
+        self._version += 1
+        self._snapshots.clear()
+        self._trees.clear()
+        return self._version
+
+    def _apply_remote_invalidations(self) -> None:
+        """다른 프로세스에서 받은 무효화 이벤트를 반영합니다. (non-blocking)"""
+        received = False
+        while not self._invalidations.empty():
+            self._invalidations.get_nowait()
+            received = True
+        if received:
+            self.invalidate()
+
+
+# 프로세스 전역 조직도 스냅샷 캐시
+org_tree_cache = OrgTreeSnapshotCache()
+
 
 class EmployeeService:
     """
@@ -335,12 +505,88 @@ class DepartmentService:
         """
         조직도 트리를 조회합니다
 
+        구성한 배열 트리는 하위 트리 조회용으로 캐시에 함께 저장합니다.
+
         Args:
             std_year: 기준 연도 (YYYY). None이면 최신 연도 자동 조회
 
         Returns:
             OrgTreeResponse: 조직도 트리
 
+        Raises:
+            NotFoundException: 조직도 데이터가 없는 경우
+        """
+        version = org_tree_cache.version
+        resolved_year, tree = await self._build_compact_org_tree(std_year)
+        org_tree_cache.put_tree(std_year, version, resolved_year, tree)
+
+        return OrgTreeResponse(std_year=resolved_year, tree=tree.to_nodes())
+
+    async def get_org_subtree(
+        self, dept_code: str, std_year: str | None = None, depth: int = 1
+    ) -> OrgSubtreeResponse:
+        """
+        부서 기준 하위 트리를 depth 단계까지 조회합니다.
+
+        캐시된 배열 트리에서 요청 범위의 노드만 생성합니다. (재귀 SQL 없음)
+        depth 아래 부서는 has_children/child_count로만 표시되어 클라이언트가 지연 펼치기합니다.
+
+        Args:
+            dept_code: 부서 코드
+            std_year: 기준 연도 (YYYY). None이면 최신 연도
+            depth: 포함할 하위 단계 수 (0이면 요청 부서만)
+
+        Returns:
+            OrgSubtreeResponse: 하위 트리
+
+        Raises:
+            NotFoundException: 조직도 데이터가 없거나 조직도에 없는 부서인 경우
+        """
+        resolved_year, tree = await self.get_compact_org_tree(std_year)
+        if dept_code not in tree:
+            raise NotFoundException(f"조직도에서 부서를 찾을 수 없습니다: {dept_code}")
+
+        [node] = tree.to_nodes([dept_code], max_depth=depth)
+        return OrgSubtreeResponse(
+            std_year=resolved_year,
+            depth=depth,
+            ancestor_codes=tree.ancestors(dept_code)[::-1],
+            node=node,
+        )
+
+    async def get_compact_org_tree(
+        self, std_year: str | None = None
+    ) -> tuple[str, CompactOrgTree]:
+        """
+        배열 트리를 조회합니다. (캐시 미스일 때만 DB 조회 후 구성)
+
+        Args:
+            std_year: 기준 연도 (YYYY). None이면 최신 연도
+
+        Returns:
+            tuple: (기준 연도, CompactOrgTree)
+
+        Raises:
+            NotFoundException: 조직도 데이터가 없는 경우
+        """
+        cached = org_tree_cache.get_tree(std_year)
+        if cached is not None:
+            return cached
+
+        version = org_tree_cache.version
+        resolved_year, tree = await self._build_compact_org_tree(std_year)
+        org_tree_cache.put_tree(std_year, version, resolved_year, tree)
+        return resolved_year, tree
+
+    async def _build_compact_org_tree(
+        self, std_year: str | None = None
+    ) -> tuple[str, CompactOrgTree]:
+        """
+        DB에서 조직도와 직원 수를 조회하여 배열 트리를 구성합니다.
+
+        Returns:
+            tuple: (기준 연도, CompactOrgTree)
+
         Raises:
             NotFoundException: 조직도 데이터가 없는 경우
         """
@@ -355,16 +601,32 @@ class DepartmentService:
         if not flat_nodes:
             raise NotFoundException(f"해당 연도의 조직도 데이터가 없습니다: {std_year}")
 
-        # 부서별 직원 수 집계
-        employee_counts: dict[str, int] = {}
-        for node in flat_nodes:
-            count = await self.employee_repo.count_by_dept_code(node.dept_code)
-            employee_counts[node.dept_code] = count
+        # 부서별 주소속/겸직 직원 수 일괄 집계 (부서 수와 무관하게 쿼리 1회)
+        headcounts = await self.employee_repo.count_headcounts_by_dept()
 
-        # Calculator로 트리 변환
-        tree = OrgTreeCalculator.build_tree(flat_nodes, employee_counts)
+        # 배열 트리 구성 (하위 부서 누적 직원 수 포함)
+        return std_year, CompactOrgTree.build(flat_nodes, headcounts)
+
+    async def get_org_tree_snapshot(self, std_year: str | None = None) -> OrgTreeSnapshot:
+        """
+        직렬화된 조직도 스냅샷을 조회합니다. (캐시 미스일 때만 get_org_tree 실행)
+
+        Args:
+            std_year: 기준 연도 (YYYY). None이면 최신 연도
+
+        Returns:
+            OrgTreeSnapshot: 응답 JSON bytes + ETag
+
+        Raises:
+            NotFoundException: 조직도 데이터가 없는 경우
+        """
+        snapshot = org_tree_cache.get(std_year)
+        if snapshot is not None:
+            return snapshot
 
-        return OrgTreeResponse(std_year=std_year, tree=tree)
+        version = org_tree_cache.version
+        response = await self.get_org_tree(std_year=std_year)
+        return org_tree_cache.put(std_year, version, response)
 
     async def get_department_info(self, dept_code: str) -> DepartmentInfo:
         """
@@ -412,13 +674,17 @@ class DepartmentService:
         self,
         dept_code: str,
         include_concurrent: bool = True,
+        include_sub_depts: bool = False,
     ) -> list[EmployeeDetailResponse]:
         """
         부서별 소속 직원 목록을 조회합니다
 
+        하위 부서 포함 시 부서 계층 캐시(cm_department_closure)로 부서 목록을 구해 한 번에 조회합니다.
+
         Args:
             dept_code: 부서 코드
             include_concurrent: 겸직자 포함 여부
+            include_sub_depts: 하위 부서 포함 여부
 
         Returns:
             List[EmployeeDetailResponse]: 소속 직원 목록
@@ -431,9 +697,14 @@ class DepartmentService:
         if not department:
             raise NotFoundException(f"부서를 찾을 수 없습니다: {dept_code}")
 
+        dept_codes: list[str] | None = None
+        if include_sub_depts:
+            hierarchy = await department_hierarchy.get(self.db)
+            dept_codes = hierarchy.descendants(dept_code) or None
+
         # 소속 직원 조회 (position_name JOIN 포함)
         employees = await self.employee_repo.find_by_dept_code(
-            dept_code, include_concurrent=include_concurrent
+            dept_code, include_concurrent=include_concurrent, dept_codes=dept_codes
         )
 
         return [
@@ -457,9 +728,10 @@ class SyncService:
     외부 시스템(오라클)과의 데이터 동기화 기능을 제공합니다.
 
     책임:
-        - 직원 정보 Bulk Insert/Update
+        - 직원 정보 Bulk Upsert (청크 단위 커밋)
         - 부서 정보 Bulk Insert/Update
         - 동기화 이력 기록 및 조회
+        - 동기화 후 조직도 스냅샷 무효화/재구성
         - 트랜잭션 관리
     """
 
@@ -469,6 +741,43 @@ class SyncService:
             db: 비동기 데이터베이스 세션
         """
         self.db = db
+        self.sync_repo = SyncDBRepository(db)
+
+    async def create_sync_history(
+        self,
+        sync_type: str,
+        total_count: int,
+        in_user: str | None,
+        source_name: str | None = None,
+        source_watermark: str | None = None,
+    ) -> int:
+        """
+        동기화 이력 레코드를 in_progress 상태로 만들고 커밋합니다. (이후 반영 롤백과 무관하게 남음)
+
+        Args:
+            sync_type: 동기화 타입 (employees/departments)
+            total_count: 전체 건수 (스트리밍 작업은 업로드 줄 수 기준 예상치)
+            in_user: 실행자
+            source_name: 주기 수집 커넥터 이름 (API 호출은 None)
+            source_watermark: 이 동기화로 반영할 변경분의 워터마크
+
+        Returns:
+            int: 동기화 이력 ID
+        """
+        sync_history = HRSyncHistory(
+            sync_type=sync_type,
+            sync_status="in_progress",
+            total_count=total_count,
+            success_count=0,
+            failure_count=0,
+            source_name=source_name,
+            source_watermark=source_watermark,
+            sync_start_time=datetime.utcnow(),
+            in_user=in_user,
+        )
+        self.db.add(sync_history)
+        await self.db.commit()
+        return sync_history.sync_id
 
     async def sync_employees(
         self,
@@ -478,7 +787,13 @@ class SyncService:
         """
         직원 정보 동기화 (Bulk Insert/Update)
 
-        외부 시스템에서 전달받은 직원 데이터를 Bulk로 업데이트합니다.
+        외부 시스템에서 전달받은 직원 데이터를 HR_SYNC_CHUNK_SIZE 단위로 나누어 반영합니다.
+        청크마다 검증 조회 3회 + 해시 조회 2회 후, 저장된 row_hash와 다른 행만
+        hr_mgnt / hr_mgnt_concur에 ON CONFLICT UPSERT(해제된 겸직은 DELETE)하고 커밋합니다.
+        (행 단위 SELECT/flush 없음, 바뀐 행이 없으면 쓰기 없음)
+
+        검증(부서/사용자 존재, user_id 중복)에 걸린 행은 실패로 기록되고 나머지는 반영됩니다.
+        청크 일괄 적용이 DB 오류로 실패하면 해당 청크만 행 단위로 다시 적용하여 실패 행을 찾아냅니다.
 
         Args:
             employees: 동기화할 직원 목록
@@ -487,107 +802,159 @@ class SyncService:
         Returns:
             SyncExecutionResponse: 동기화 실행 결과
         """
-        sync_start_time = datetime.utcnow()
-        total_count = len(employees)
+        sync_id = await self.create_sync_history("employees", len(employees), in_user)
+        chunk_size = settings.HR_SYNC_CHUNK_SIZE
+
+        async def _batches() -> AsyncIterator[tuple[list[EmployeeSyncRequest], list[str]]]:
+            for start in range(0, len(employees), chunk_size):
+                yield employees[start:start + chunk_size], []
+
+        return await self.run_employee_sync(sync_id, _batches(), in_user)
+
+    async def run_employee_sync(
+        self,
+        sync_id: int,
+        batches: AsyncIterator[tuple[list[EmployeeSyncRequest], list[str]]],
+        in_user: str | None = None,
+    ) -> SyncExecutionResponse:
+        """
+        생성된 동기화 이력(sync_id)에 대해 직원 배치를 차례로 반영합니다.
+
+        배치마다 커밋하고 진행 현황(성공/실패/변경 건수)을 이력에 기록하므로
+        동기화 도중에도 get_sync_progress로 진행률을 조회할 수 있습니다.
+        배치는 한 번에 하나만 메모리에 올립니다. (스트리밍 작업은 파일에서 배치 단위로 읽음)
+
+        Args:
+            sync_id: 동기화 이력 ID (create_sync_history)
+            batches: (직원 요청 배치, 파싱 실패 메시지 목록) 비동기 이터레이터
+            in_user: 실행자
+
+        Returns:
+            SyncExecutionResponse: 동기화 실행 결과
+        """
+        started = time.perf_counter()
         success_count = 0
         failure_count = 0
         error_messages: list[str] = []
+        counts: Counter = Counter()
 
-        # 동기화 이력 레코드 생성
-        sync_history = HRSyncHistory(
-            sync_type="employees",
-            sync_status="in_progress",
-            total_count=total_count,
-            success_count=0,
-            failure_count=0,
-            sync_start_time=sync_start_time,
-            in_user=in_user,
-        )
-        self.db.add(sync_history)
-        await self.db.flush()  # sync_id 생성
-
-        # Bulk Insert/Update
-        for emp_req in employees:
-            try:
-                # 기존 직원 조회
-                result = await self.db.execute(
-                    select(HRMgnt).where(HRMgnt.emp_no == emp_req.emp_no)
-                )
-                existing = result.scalar_one_or_none()
-
-                if existing:
-                    # Update
-                    existing.user_id = emp_req.user_id
-                    existing.name_kor = emp_req.name_kor
-                    existing.dept_code = emp_req.dept_code
-                    existing.position_code = emp_req.position_code
-                    existing.on_work_yn = emp_req.on_work_yn
-                    existing.up_user = in_user
-                    existing.up_date = datetime.utcnow()
-                else:
-                    # Insert
-                    new_employee = HRMgnt(
-                        emp_no=emp_req.emp_no,
-                        user_id=emp_req.user_id,
-                        name_kor=emp_req.name_kor,
-                        dept_code=emp_req.dept_code,
-                        position_code=emp_req.position_code,
-                        on_work_yn=emp_req.on_work_yn,
-                        in_user=in_user,
-                    )
-                    self.db.add(new_employee)
-
-                # =============================================
-                # 겸직 정보 동기화 (HR_MGNT_CONCUR) - Full Replace 방식
-                # concurrent_positions 값에 관계없이 항상 기존 레코드를 삭제 후 재삽입
-                # - 빈 배열([])이면 기존 겸직 레코드만 삭제 (겸직→비겸직 전환 처리)
-                # - 값이 있으면 삭제 후 새 레코드 삽입
-                # =============================================
-                await self.db.flush()  # hr_mgnt PK가 먼저 저장되어야 FK 제약 통과
-
-                # 기존 겸직 레코드 전체 삭제 (Full Replace)
-                await self.db.execute(
-                    sa_delete(HRMgntConcur).where(
-                        HRMgntConcur.emp_no == emp_req.emp_no
-                    )
-                )
-
-                # 새 겸직 레코드 삽입 (concurrent_positions가 있을 때만)
-                for concur in emp_req.concurrent_positions:
-                    new_concur = HRMgntConcur(
-                        emp_no=emp_req.emp_no,
-                        dept_code=concur.dept_code,
-                        is_main=concur.is_main,
-                        position_code=concur.position_code,
-                        in_user=in_user,
-                    )
-                    self.db.add(new_concur)
+        async for chunk, parse_errors in batches:
+            chunk_counts, chunk_errors = await self._apply_employee_chunk(chunk, in_user)
+            chunk_errors = parse_errors + chunk_errors
 
-                success_count += 1
+            failure_count += len(chunk_errors)
+            success_count += len(chunk) + len(parse_errors) - len(chunk_errors)
+            error_messages.extend(chunk_errors)
+            counts.update(chunk_counts)
 
-            except Exception as e:
-                failure_count += 1
-                error_messages.append(f"emp_no={emp_req.emp_no}: {str(e)}")
+            # 진행 현황 갱신 (청크 단위 커밋)
+            progress: dict = {"success_count": success_count, "failure_count": failure_count, **counts}
+            if chunk_errors:
+                progress["error_message"] = "\n".join(error_messages)
+            await self.sync_repo.update_sync_history(sync_id, **progress)
+            await self.db.commit()
 
         # 동기화 결과 업데이트
-        sync_history.success_count = success_count
-        sync_history.failure_count = failure_count
-        sync_history.sync_status = "success" if failure_count == 0 else "partial" if success_count > 0 else "failure"
-        sync_history.error_message = "\n".join(error_messages) if error_messages else None
-        sync_history.sync_end_time = datetime.utcnow()
-
+        total_count = success_count + failure_count
+        sync_status = "success" if failure_count == 0 else "partial" if success_count > 0 else "failure"
+        await self.sync_repo.update_sync_history(
+            sync_id,
+            total_count=total_count,
+            sync_status=sync_status,
+            error_message="\n".join(error_messages) if error_messages else None,
+            sync_end_time=datetime.utcnow(),
+            **self._throughput(total_count, started),
+        )
         await self.db.commit()
+        if counts["inserted_count"] or counts["updated_count"]:
+            await self._refresh_org_tree_cache()
+
+        logger.info(
+            "직원 정보 Bulk 동기화 완료",
+            extra={"sync_id": sync_id, "total_count": total_count, "failure_count": failure_count, **counts},
+        )
 
         return SyncExecutionResponse(
-            sync_id=sync_history.sync_id,
+            sync_id=sync_id,
             sync_type="employees",
-            sync_status=sync_history.sync_status,
+            sync_status=sync_status,
             total_count=total_count,
             success_count=success_count,
             failure_count=failure_count,
+            **counts,
             message=f"직원 정보 동기화 완료: 성공 {success_count}건, 실패 {failure_count}건",
         )
 
+    @staticmethod
+    def _throughput(row_count: int, started: float) -> dict:
+        """반영 소요 시간(ms)과 처리 속도(건/초) — hr_sync_history 처리량 컬럼 값"""
+        elapsed = time.perf_counter() - started
+        return {
+            "elapsed_ms": int(elapsed * 1000),
+            "rows_per_second": round(row_count / elapsed, 1) if elapsed > 0 else None,
+        }
+
+    async def _apply_employee_chunk(
+        self, chunk: list[EmployeeSyncRequest], in_user: str | None
+    ) -> tuple[Counter, list[str]]:
+        """
+        직원 동기화 청크 하나를 검증하고 바뀐 행만 일괄 반영한 뒤 커밋합니다.
+
+        Args:
+            chunk: 동기화 요청 청크
+            in_user: 실행자
+
+        Returns:
+            tuple: (반영 건수 Counter — inserted/updated/unchanged/deleted_count, 실패 메시지 목록)
+        """
+        dept_codes = {emp.dept_code for emp in chunk} | {
+            concur.dept_code for emp in chunk for concur in emp.concurrent_positions
+        }
+        user_ids = {emp.user_id for emp in chunk}
+
+        accepted, errors = SyncCalculator.plan_employee_chunk(
+            chunk,
+            known_dept_codes=await self.sync_repo.find_existing_dept_codes(dept_codes),
+            known_user_ids=await self.sync_repo.find_existing_user_ids(user_ids),
+            user_id_owners=await self.sync_repo.find_user_id_owners(user_ids),
+        )
+        emp_nos = [emp.emp_no for emp in accepted]
+        diff = SyncCalculator.diff_employee_chunk(
+            accepted,
+            stored_hashes=await self.sync_repo.find_employee_fingerprints(emp_nos),
+            stored_concurrent_hashes=await self.sync_repo.find_concurrent_fingerprints(emp_nos),
+        )
+
+        try:
+            await self._write_employee_diff(diff, in_user)
+            await self.db.commit()
+            return diff.counts(), errors
+        except Exception as exc:
+            await self.db.rollback()
+            logger.warning(
+                "직원 청크 일괄 반영 실패 — 행 단위로 재시도",
+                extra={"chunk_size": len(diff.upserts), "error": str(exc)},
+            )
+
+        # 청크 일괄 반영 실패: 행 단위로 다시 적용하여 실패 행만 기록
+        counts: Counter = Counter()
+        for emp_no in emp_nos:
+            emp_diff = diff.for_employee(emp_no)
+            try:
+                await self._write_employee_diff(emp_diff, in_user)
+                await self.db.commit()
+                counts.update(emp_diff.counts())
+            except Exception as exc:
+                await self.db.rollback()
+                errors.append(f"emp_no={emp_no}: {str(exc)}")
+        return counts, errors
+
+    async def _write_employee_diff(self, diff: EmployeeSyncDiff, in_user: str | None) -> None:
+        """직원 변경분을 씁니다. (커밋은 호출자, 바뀐 행이 없으면 statement 없음)"""
+        await self.sync_repo.upsert_employees(diff.upserts, diff.fingerprints, in_user)
+        await self.sync_repo.delete_concurrent_positions(diff.concurrent_deletes)
+        await self.sync_repo.upsert_concurrent_positions(diff.concurrent_upserts, in_user)
+
     async def sync_departments(
         self,
         departments: list[DepartmentSyncRequest],
@@ -596,7 +963,14 @@ class SyncService:
         """
         부서 정보 동기화 (Bulk Insert/Update)
 
-        외부 시스템에서 전달받은 부서 데이터를 Bulk로 업데이트합니다.
+        외부 시스템에서 전달받은 부서 데이터를 집합 단위로 반영합니다.
+            1. 기존 부서(계층/해시) 1회 조회 → 계층 검증 + disp_lvl(실제 깊이) 계산 (메모리, 이동한 부서의 하위 부서 포함)
+            2. 부서장 성명 1회, 기준 연도 조직도 행 1회 조회 → 바뀐 행만 골라냄
+            3. HR_SYNC_CHUNK_SIZE 단위로 cm_department / cm_department_tree ON CONFLICT UPSERT
+            4. 상위 부서/사용 여부가 바뀐 경우에만 부서 계층 클로저 재구성 후 한 번에 커밋
+
+        상위 부서가 없거나 순환 참조인 부서(및 그 하위 부서)는 실패로 기록되고 나머지는 반영됩니다.
+        일괄 반영이 DB 오류로 실패하면 상위 부서부터 행 단위로 다시 적용하여 실패 행을 찾아냅니다.
 
         Args:
             departments: 동기화할 부서 목록
@@ -605,135 +979,231 @@ class SyncService:
         Returns:
             SyncExecutionResponse: 동기화 실행 결과
         """
-        sync_start_time = datetime.utcnow()
-        total_count = len(departments)
-        success_count = 0
-        failure_count = 0
-        error_messages: list[str] = []
+        sync_id = await self.create_sync_history("departments", len(departments), in_user)
+        return await self.run_department_sync(sync_id, departments, in_user)
 
-        # 동기화 이력 레코드 생성
-        sync_history = HRSyncHistory(
-            sync_type="departments",
-            sync_status="in_progress",
-            total_count=total_count,
-            success_count=0,
-            failure_count=0,
-            sync_start_time=sync_start_time,
-            in_user=in_user,
-        )
-        self.db.add(sync_history)
-        await self.db.flush()  # sync_id 생성
+    async def run_department_sync(
+        self,
+        sync_id: int,
+        departments: list[DepartmentSyncRequest],
+        in_user: str | None = None,
+        parse_errors: Optional[list[str]] = None,
+    ) -> SyncExecutionResponse:
+        """
+        생성된 동기화 이력(sync_id)에 대해 부서 목록을 반영합니다.
+
+        계층 검증(순환 참조, disp_lvl)에 전체 부서 그래프가 필요하므로 배치로 나누지 않습니다.
+
+        Args:
+            sync_id: 동기화 이력 ID (create_sync_history)
+            departments: 동기화할 부서 목록
+            in_user: 실행자
+            parse_errors: 스트리밍 작업의 파싱 실패 메시지 (실패 건수에 포함)
+
+        Returns:
+            SyncExecutionResponse: 동기화 실행 결과
+        """
+        started = time.perf_counter()
+        parse_errors = parse_errors or []
+        total_count = len(departments) + len(parse_errors)
 
         # 현재 연도 (조직도 기준 연도)
         current_year = str(datetime.utcnow().year)
 
-        # Bulk Insert/Update
-        for dept_req in departments:
-            try:
-                # =============================================
-                # 1. cm_department INSERT/UPDATE
-                # =============================================
-                result = await self.db.execute(
-                    select(CMDepartment).where(CMDepartment.dept_code == dept_req.dept_code)
-                )
-                existing_dept = result.scalar_one_or_none()
-
-                if existing_dept:
-                    # Update
-                    existing_dept.dept_name = dept_req.dept_name
-                    existing_dept.upper_dept_code = dept_req.upper_dept_code
-                    existing_dept.dept_head_emp_no = dept_req.dept_head_emp_no
-                    existing_dept.use_yn = dept_req.use_yn
-                    existing_dept.up_user = in_user
-                    existing_dept.up_date = datetime.utcnow()
-                else:
-                    # Insert
-                    new_department = CMDepartment(
-                        dept_code=dept_req.dept_code,
-                        dept_name=dept_req.dept_name,
-                        upper_dept_code=dept_req.upper_dept_code,
-                        dept_head_emp_no=dept_req.dept_head_emp_no,
-                        use_yn=dept_req.use_yn,
-                        in_user=in_user,
-                    )
-                    self.db.add(new_department)
-
-                await self.db.flush()  # cm_department 먼저 저장
-
-                # =============================================
-                # 2. 부서장 정보 조회 (hr_mgnt 테이블)
-                # =============================================
-                dept_head_name = None
-                if dept_req.dept_head_emp_no:
-                    head_result = await self.db.execute(
-                        select(HRMgnt.name_kor).where(
-                            HRMgnt.emp_no == dept_req.dept_head_emp_no
-                        )
-                    )
-                    dept_head_name = head_result.scalar_one_or_none()
-
-                # =============================================
-                # 3. cm_department_tree INSERT/UPDATE (조직도 표시용)
-                # =============================================
-                tree_result = await self.db.execute(
-                    select(CMDepartmentTree).where(
-                        CMDepartmentTree.std_year == current_year,
-                        CMDepartmentTree.dept_code == dept_req.dept_code,
-                    )
-                )
-                existing_tree = tree_result.scalar_one_or_none()
-
-                # disp_lvl 계산: upper_dept_code가 NULL이면 1 (최상위), 아니면 2
-                disp_lvl = 1 if dept_req.upper_dept_code is None else 2
-
-                if existing_tree:
-                    # Update
-                    existing_tree.dept_name = dept_req.dept_name
-                    existing_tree.upper_dept_code = dept_req.upper_dept_code
-                    existing_tree.disp_lvl = disp_lvl
-                    existing_tree.dept_head_emp_no = dept_req.dept_head_emp_no
-                    existing_tree.name_kor = dept_head_name
-                    existing_tree.up_user = in_user
-                    existing_tree.up_date = datetime.utcnow()
-                else:
-                    # Insert
-                    new_tree = CMDepartmentTree(
-                        std_year=current_year,
-                        dept_code=dept_req.dept_code,
-                        upper_dept_code=dept_req.upper_dept_code,
-                        dept_name=dept_req.dept_name,
-                        disp_lvl=disp_lvl,
-                        dept_head_emp_no=dept_req.dept_head_emp_no,
-                        name_kor=dept_head_name,
-                        in_user=in_user,
-                    )
-                    self.db.add(new_tree)
-
-                success_count += 1
-
-            except Exception as e:
-                failure_count += 1
-                error_messages.append(f"dept_code={dept_req.dept_code}: {str(e)}")
-
-        # 동기화 결과 업데이트
-        sync_history.success_count = success_count
-        sync_history.failure_count = failure_count
-        sync_history.sync_status = "success" if failure_count == 0 else "partial" if success_count > 0 else "failure"
-        sync_history.error_message = "\n".join(error_messages) if error_messages else None
-        sync_history.sync_end_time = datetime.utcnow()
+        stored = await self.sync_repo.find_department_states()
+        accepted, disp_lvls, error_messages = SyncCalculator.plan_department_sync(
+            departments, {code: state[0] for code, state in stored.items()}
+        )
+        stored_tree = await self.sync_repo.find_department_tree_rows(current_year)
+        # 부서장 성명: 요청 부서 + disp_lvl을 다시 쓸 수 있는 기존 하위 부서
+        head_emp_nos = {dept.dept_head_emp_no for dept in accepted if dept.dept_head_emp_no}
+        head_emp_nos.update(
+            stored_tree[code][3] for code in disp_lvls if code in stored_tree and stored_tree[code][3]
+        )
+        head_names = await self.sync_repo.find_employee_names(head_emp_nos)
+        diff = SyncCalculator.diff_departments(
+            accepted,
+            disp_lvls,
+            head_names,
+            stored=stored,
+            stored_tree=stored_tree,
+        )
+        counts, apply_errors = await self._apply_departments(
+            diff, disp_lvls, head_names, current_year, in_user
+        )
+        error_messages = parse_errors + error_messages + apply_errors
 
+        failure_count = len(error_messages)
+        success_count = total_count - failure_count
+        sync_status = "success" if failure_count == 0 else "partial" if success_count > 0 else "failure"
+        await self.sync_repo.update_sync_history(
+            sync_id,
+            total_count=total_count,
+            success_count=success_count,
+            failure_count=failure_count,
+            **counts,
+            sync_status=sync_status,
+            error_message="\n".join(error_messages) if error_messages else None,
+            sync_end_time=datetime.utcnow(),
+            **self._throughput(total_count, started),
+        )
         await self.db.commit()
+        if diff.hierarchy_changed:
+            await self._refresh_department_hierarchy()
+        if diff.upserts or diff.tree_upserts:
+            await self._refresh_org_tree_cache()
+
+        logger.info(
+            "부서 정보 Bulk 동기화 완료",
+            extra={"sync_id": sync_id, "total_count": total_count, "failure_count": failure_count, **counts},
+        )
 
         return SyncExecutionResponse(
-            sync_id=sync_history.sync_id,
+            sync_id=sync_id,
             sync_type="departments",
-            sync_status=sync_history.sync_status,
+            sync_status=sync_status,
             total_count=total_count,
             success_count=success_count,
             failure_count=failure_count,
+            **counts,
             message=f"부서 정보 동기화 완료: 성공 {success_count}건, 실패 {failure_count}건",
         )
 
+    async def _apply_departments(
+        self,
+        diff: DepartmentSyncDiff,
+        disp_lvls: dict[str, int],
+        head_names: dict[str, str],
+        std_year: str,
+        in_user: str | None,
+    ) -> tuple[Counter, list[str]]:
+        """
+        부서 변경분을 일괄 반영하고 (계층이 바뀌었으면) 클로저를 재구성한 뒤 커밋합니다.
+
+        Args:
+            diff: 부서 변경분 (상위 부서 먼저)
+            disp_lvls: {부서 코드: 표시 레벨}
+            head_names: {부서장 사번: 성명}
+            std_year: 조직도 기준 연도
+            in_user: 실행자
+
+        Returns:
+            tuple: (반영 건수 Counter — inserted/updated/unchanged/deleted_count, 실패 메시지 목록)
+        """
+        chunk_size = settings.HR_SYNC_CHUNK_SIZE
+        try:
+            for start in range(0, len(diff.upserts), chunk_size):
+                chunk = diff.upserts[start:start + chunk_size]
+                await self.sync_repo.upsert_departments(chunk, diff.fingerprints, in_user)
+            for start in range(0, len(diff.tree_upserts), chunk_size):
+                chunk = diff.tree_upserts[start:start + chunk_size]
+                await self.sync_repo.upsert_department_tree(std_year, chunk, disp_lvls, head_names, in_user)
+            if diff.hierarchy_changed:
+                await self._rebuild_department_closure()
+            await self.db.commit()
+            return diff.counts(), []
+        except Exception as exc:
+            await self.db.rollback()
+            logger.warning(
+                "부서 일괄 반영 실패 — 행 단위로 재시도",
+                extra={"dept_count": len(diff.upserts), "error": str(exc)},
+            )
+
+        # 일괄 반영 실패: 상위 부서부터 행 단위로 다시 적용하여 실패 행만 기록
+        counts: Counter = Counter(unchanged_count=len(diff.unchanged))
+        errors: list[str] = []
+        for dept_code in diff.inserted + diff.updated:
+            dept_diff = diff.for_department(dept_code)
+            try:
+                await self.sync_repo.upsert_departments(dept_diff.upserts, dept_diff.fingerprints, in_user)
+                await self.sync_repo.upsert_department_tree(
+                    std_year, dept_diff.tree_upserts, disp_lvls, head_names, in_user
+                )
+                await self.db.commit()
+                counts.update(dept_diff.counts())
+            except Exception as exc:
+                await self.db.rollback()
+                errors.append(f"dept_code={dept_code}: {str(exc)}")
+
+        # 요청에 없는 하위 부서의 disp_lvl 갱신 (요청 행이 아니므로 실패는 건수에 넣지 않고 기록만)
+        if diff.relevels:
+            try:
+                await self.sync_repo.upsert_department_tree(
+                    std_year, diff.relevels, disp_lvls, head_names, in_user
+                )
+                await self.db.commit()
+            except Exception as exc:
+                await self.db.rollback()
+                logger.warning(
+                    "하위 부서 disp_lvl 갱신 실패",
+                    extra={"dept_count": len(diff.relevels), "error": str(exc)},
+                )
+
+        if diff.hierarchy_changed:
+            await self._rebuild_department_closure()
+            await self.db.commit()
+        return counts, errors
+
+    async def _rebuild_department_closure(self) -> None:
+        """
+        cm_department 기준으로 cm_department_closure를 전체 재구성합니다. (커밋은 호출자)
+
+        사용 중인 부서(use_yn='Y') 사이의 경로만 포함합니다.
+        """
+        result = await self.db.execute(
+            select(CMDepartment.dept_code, CMDepartment.upper_dept_code).where(
+                CMDepartment.use_yn == "Y"
+            )
+        )
+        upper_by_code = {row.dept_code: row.upper_dept_code for row in result.all()}
+        rows = OrgTreeCalculator.build_closure(upper_by_code)
+
+        await self.db.execute(sa_delete(CMDepartmentClosure))
+        for start in range(0, len(rows), CLOSURE_INSERT_CHUNK):
+            await self.db.execute(
+                insert(CMDepartmentClosure),
+                [
+                    {"ancestor_dept_code": ancestor, "descendant_dept_code": descendant, "depth": depth}
+                    for ancestor, descendant, depth in rows[start:start + CLOSURE_INSERT_CHUNK]
+                ],
+            )
+
+        logger.info(
+            "부서 계층 클로저 재구성 완료",
+            extra={"dept_count": len(upper_by_code), "closure_rows": len(rows)},
+        )
+
+    async def _refresh_department_hierarchy(self) -> None:
+        """부서 계층 캐시를 무효화하고 다른 워커 프로세스에 알립니다."""
+        version = department_hierarchy.invalidate()
+        await pg_event_bridge.notify(
+            DEPARTMENT_HIERARCHY_CHANNEL,
+            {"type": "invalidated", "state_version": version},
+        )
+
+    async def _refresh_org_tree_cache(self) -> None:
+        """
+        조직도 스냅샷을 무효화하고 최신 연도 스냅샷을 다시 채웁니다.
+
+        다른 워커 프로세스에는 무효화 이벤트를 보냅니다. (다음 조회 시 각자 다시 구성)
+        캐시 갱신 실패는 동기화 결과에 영향을 주지 않도록 로그만 남깁니다.
+        """
+        version = org_tree_cache.invalidate()
+        await pg_event_bridge.notify(
+            ORG_TREE_CHANNEL, {"type": "invalidated", "state_version": version}
+        )
+
+        try:
+            await DepartmentService(self.db).get_org_tree_snapshot()
+        except NotFoundException:
+            # 조직도 데이터가 아직 없음 — 첫 조회 시 구성
+            pass
+        except Exception as exc:
+            logger.warning(
+                "조직도 스냅샷 갱신 실패",
+                extra={"version": version, "error": str(exc)},
+            )
+
     async def get_sync_history(
         self,
         sync_type: str | None = None,
@@ -765,6 +1235,14 @@ class SyncService:
                 total_count=history.total_count,
                 success_count=history.success_count,
                 failure_count=history.failure_count,
+                inserted_count=history.inserted_count,
+                updated_count=history.updated_count,
+                unchanged_count=history.unchanged_count,
+                deleted_count=history.deleted_count,
+                elapsed_ms=history.elapsed_ms,
+                rows_per_second=history.rows_per_second,
+                source_name=history.source_name,
+                source_watermark=history.source_watermark,
                 error_message=history.error_message,
                 sync_start_time=history.sync_start_time,
                 sync_end_time=history.sync_end_time,
@@ -775,3 +1253,48 @@ class SyncService:
         ]
 
         return SyncHistoryListResponse(items=items, total=len(items))
+
+    async def get_sync_progress(self, sync_id: int) -> SyncProgressResponse:
+        """
+        동기화 작업의 진행 현황을 조회합니다. (청크 커밋마다 갱신된 이력 기준)
+
+        Args:
+            sync_id: 동기화 이력 ID
+
+        Returns:
+            SyncProgressResponse: 진행 현황 (처리 건수, 처리 속도, 오류)
+
+        Raises:
+            NotFoundException: 동기화 이력이 없을 때
+        """
+        history = await self.db.get(HRSyncHistory, sync_id)
+        if history is None:
+            raise NotFoundException(f"동기화 이력을 찾을 수 없습니다: {sync_id}")
+
+        processed_count = history.success_count + history.failure_count
+        finished_at = history.sync_end_time or datetime.utcnow()
+        elapsed_seconds = max((finished_at - history.sync_start_time).total_seconds(), 0.0)
+
+        return SyncProgressResponse(
+            sync_id=history.sync_id,
+            sync_type=history.sync_type,
+            sync_status=history.sync_status,
+            total_count=history.total_count,
+            processed_count=processed_count,
+            success_count=history.success_count,
+            failure_count=history.failure_count,
+            inserted_count=history.inserted_count,
+            updated_count=history.updated_count,
+            unchanged_count=history.unchanged_count,
+            deleted_count=history.deleted_count,
+            progress_rate=(
+                min(round(processed_count * 100 / history.total_count, 1), 100.0)
+                if history.total_count
+                else 0.0
+            ),
+            elapsed_seconds=round(elapsed_seconds, 1),
+            rows_per_second=round(processed_count / elapsed_seconds, 1) if elapsed_seconds else 0.0,
+            error_message=history.error_message,
+            sync_start_time=history.sync_start_time,
+            sync_end_time=history.sync_end_time,
+        )
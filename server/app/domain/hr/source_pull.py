@@ -0,0 +1,126 @@
+"""
+HR 도메인 - 원천 주기 수집 (pull)
+
+스케줄러가 HR_SOURCE_PULL_INTERVAL_MINUTES마다 실행합니다.
+    1. 커넥터 advisory lock 획득 (다른 워커가 수집 중이면 이번 주기는 건너뜀, 수집 후 해제)
+    2. 동기화 타입별(부서 → 사원 순) 저장된 워터마크 이후 변경분 조회
+    3. 변경분마다 동기화 이력(source_name, source_watermark)을 만들고 배치 단위로 반영
+    4. 반영이 끝난 변경분의 워터마크 저장 → 다음 주기는 그 이후부터
+
+반영 중 예외가 나면 해당 이력을 failure로 기록하고 워터마크를 올리지 않으며,
+같은 타입의 이후 변경분도 다음 주기로 미룹니다. (변경 순서 보장)
+행 단위 검증 실패는 이력에 남기고 워터마크를 올립니다. (다시 읽어도 결과가 같음)
+
+사용 예:
+    connector = get_hr_source()
+    if connector is not None:
+        await pull_hr_source(connector)
+"""
+
+import contextlib
+
+from server.app.core.config import settings
+from server.app.core.database import AsyncSessionLocal
+from server.app.core.logging import get_logger
+from server.app.domain.hr.repositories import SyncDBRepository
+from server.app.domain.hr.service import SyncService
+from server.app.domain.hr.sources import HRSourceConnector
+from server.app.domain.hr.sync_jobs import SYNC_JOB_MODELS, apply_sync_batches, mark_sync_failed
+
+logger = get_logger(__name__)
+
+# 수집 순서 (사원의 부서 코드 검증이 최신 부서를 보도록 부서 먼저)
+SOURCE_SYNC_TYPES = ("departments", "employees")
+
+# 원천 수집 동기화의 실행자
+SOURCE_PULL_USER = "system"
+
+
+async def pull_hr_source(connector: HRSourceConnector) -> dict[str, int]:
+    """
+    원천 변경분을 수집해 동기화합니다.
+
+    Args:
+        connector: HR 원천 수집 커넥터
+
+    Returns:
+        dict: 동기화 타입별 반영을 마친 변경분 수 (잠금을 얻지 못하면 빈 dict)
+    """
+    async with AsyncSessionLocal() as lock_db:
+        # 세션 수준 잠금은 커넥션에 묶이므로 수집 동안 커넥션을 고정
+        # (AUTOCOMMIT이라 수집 중 lock_db가 idle in transaction으로 남지 않음)
+        await lock_db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        lock_repo = SyncDBRepository(lock_db)
+        if not await lock_repo.try_lock_source(connector.source_name):
+            logger.info(
+                "HR 원천 수집 건너뜀 (다른 워커에서 수집 중)",
+                extra={"source_name": connector.source_name},
+            )
+            return {}
+
+        try:
+            applied: dict[str, int] = {}
+            for sync_type in SOURCE_SYNC_TYPES:
+                applied[sync_type] = await _pull_sync_type(connector, sync_type)
+            return applied
+        finally:
+            await lock_repo.unlock_source(connector.source_name)
+
+
+async def _pull_sync_type(connector: HRSourceConnector, sync_type: str) -> int:
+    """
+    한 동기화 타입의 변경분을 오래된 순으로 반영합니다.
+
+    Returns:
+        int: 반영을 마친 변경분 수
+    """
+    source_name = connector.source_name
+    async with AsyncSessionLocal() as db:
+        service = SyncService(db)
+        repo = SyncDBRepository(db)
+        watermark = await repo.find_source_watermark(source_name, sync_type)
+        changes = await connector.list_changes(sync_type, watermark)
+
+        applied = 0
+        for change in changes:
+            sync_id = await service.create_sync_history(
+                sync_type,
+                change.estimated_count,
+                SOURCE_PULL_USER,
+                source_name=source_name,
+                source_watermark=change.watermark,
+            )
+            batches = connector.read_batches(
+                change, SYNC_JOB_MODELS[sync_type], settings.HR_SYNC_CHUNK_SIZE
+            )
+            try:
+                async with contextlib.aclosing(batches):
+                    await apply_sync_batches(service, sync_type, sync_id, batches, SOURCE_PULL_USER)
+                await repo.save_source_watermark(source_name, sync_type, change.watermark, sync_id)
+                await db.commit()
+            except Exception as exc:
+                await db.rollback()
+                logger.error(
+                    "HR 원천 변경분 반영 실패 (워터마크 유지)",
+                    extra={
+                        "source_name": source_name,
+                        "sync_type": sync_type,
+                        "sync_id": sync_id,
+                        "change": change.key,
+                        "error": str(exc),
+                    },
+                )
+                await mark_sync_failed(sync_id, str(exc))
+                break
+
+            applied += 1
+            logger.info(
+                "HR 원천 변경분 반영 완료",
+                extra={
+                    "source_name": source_name,
+                    "sync_type": sync_type,
+                    "sync_id": sync_id,
+                    "watermark": change.watermark,
+                },
+            )
+        return applied
@@ -0,0 +1,34 @@
+"""
+HR 원천 수집 커넥터
+
+HR 원천 시스템 변경분을 주기적으로 가져오는(pull) 커넥터를 제공합니다.
+- HRSourceConnector        : 커넥터 공통 인터페이스
+- HRSourceChange           : 원천 변경분 한 건
+- DirectorySourceConnector : 추출 파일 디렉토리 (HR_SOURCE_CONNECTOR=directory)
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from server.app.core.config import settings
+
+from .base import HRSourceChange, HRSourceConnector
+from .directory import DirectorySourceConnector
+
+
+@lru_cache()
+def get_hr_source() -> Optional[HRSourceConnector]:
+    """
+    HR 원천 수집 커넥터 싱글톤 반환
+
+    HR_SOURCE_CONNECTOR가 비어 있으면 주기 수집을 하지 않습니다. (API 동기화만 사용)
+
+    Returns:
+        Optional[HRSourceConnector]: 커넥터 인스턴스 (미설정이면 None)
+    """
+    if settings.HR_SOURCE_CONNECTOR == "directory":
+        return DirectorySourceConnector(settings.HR_SOURCE_DIR)
+    return None
+
+
+__all__ = ["DirectorySourceConnector", "HRSourceChange", "HRSourceConnector", "get_hr_source"]
@@ -0,0 +1,77 @@
+"""
+HR 원천 수집 커넥터 인터페이스
+
+HR 원천 시스템의 변경분을 주기적으로 가져와(pull) 동기화에 넘깁니다.
+원천이 API를 호출해 밀어 넣는(push) 방식과 달리, 커넥터별 워터마크(hr_sync_source_state) 이후
+변경분만 읽으므로 수집이 실패해도 다음 주기에 같은 변경분부터 다시 시도합니다.
+
+구현체:
+    - DirectorySourceConnector : 원천이 내려 두는 추출 파일 디렉토리 (HR_SOURCE_CONNECTOR=directory)
+
+워터마크는 커넥터가 정의하는 문자열이며, 문자열 비교로 순서가 정해져야 합니다.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@dataclass(frozen=True)
+class HRSourceChange:
+    """
+    원천 변경분 한 건 (추출 파일, 변경 배치 등)
+
+    Attributes:
+        sync_type: 동기화 타입 (employees/departments)
+        key: 커넥터 내부 식별자 (파일 경로 등)
+        watermark: 이 변경분을 반영한 뒤 저장할 워터마크
+        estimated_count: 예상 건수 (진행률 계산용)
+    """
+
+    sync_type: str
+    key: str
+    watermark: str
+    estimated_count: int
+
+
+class HRSourceConnector(ABC):
+    """
+    HR 원천 수집 커넥터 공통 인터페이스
+
+    source_name은 워터마크와 동기화 이력(source_name)에 기록되는 커넥터 이름입니다.
+    """
+
+    source_name: str
+
+    @abstractmethod
+    async def list_changes(self, sync_type: str, watermark: str | None) -> list[HRSourceChange]:
+        """
+        워터마크 이후의 변경분 목록을 조회합니다.
+
+        Args:
+            sync_type: 동기화 타입 (employees/departments)
+            watermark: 마지막으로 반영한 워터마크 (처음 수집이면 None)
+
+        Returns:
+            list[HRSourceChange]: 반영할 변경분 (오래된 순)
+        """
+
+    @abstractmethod
+    def read_batches(
+        self, change: HRSourceChange, model: type[ModelT], batch_size: int
+    ) -> AsyncIterator[tuple[list[ModelT], list[str]]]:
+        """
+        변경분을 batch_size 건씩 읽어 요청 스키마로 변환합니다.
+
+        Args:
+            change: list_changes가 돌려준 변경분
+            model: 한 건의 요청 스키마
+            batch_size: 한 번에 읽을 건수
+
+        Yields:
+            tuple: (변환된 요청 목록, 실패 메시지 목록)
+        """
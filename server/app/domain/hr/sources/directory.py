@@ -0,0 +1,194 @@
+"""
+HR 원천 수집 커넥터 - 추출 파일 디렉토리
+
+원천 시스템(또는 ETL)이 동기화 타입별 하위 디렉토리에 내려 두는 추출 파일을 수집합니다.
+
+    {HR_SOURCE_DIR}/employees/20260101_0100.ndjson
+    {HR_SOURCE_DIR}/departments/20260101_0100.csv
+
+파일 형식:
+    - .ndjson / .jsonl : 한 줄에 요청 스키마 JSON 하나 (POST /hr/sync/*/jobs 업로드와 동일)
+    - .csv             : 헤더가 요청 스키마 필드명인 CSV (빈 값은 미입력, concurrent_positions는 JSON 문자열)
+
+워터마크는 파일명이며, 파일명 순서가 곧 반영 순서입니다. (원천은 시각/일련번호로 파일명을 지어야 함)
+복사 과정에서 예전 수정 시각이 보존된 채 늦게 도착한 파일도 파일명이 워터마크 이후면 수집합니다.
+파일명이 워터마크 이전인데 늦게 나타난 파일은 반영하지 않고 경고 로그로 남깁니다.
+아직 쓰는 중일 수 있는 최근 파일(settle_seconds 이내 수정)은 다음 주기로 미룹니다.
+"""
+
+import asyncio
+import csv
+import json
+import time
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from pydantic import ValidationError
+
+from server.app.core.logging import get_logger
+from server.app.domain.hr.sync_jobs import describe_validation_error, iter_ndjson_batches
+
+from .base import HRSourceChange, HRSourceConnector, ModelT
+
+logger = get_logger(__name__)
+
+# 수집 대상 확장자
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+CSV_SUFFIX = ".csv"
+
+
+class DirectorySourceConnector(HRSourceConnector):
+    """
+    추출 파일 디렉토리 수집 커넥터
+
+    반영을 마친 파일은 지우지 않습니다. (보관/정리는 원천 측 책임, 워터마크로 재수집 방지)
+    """
+
+    def __init__(
+        self, root_dir: str, source_name: str = "directory", settle_seconds: float = 5.0
+    ) -> None:
+        """
+        Args:
+            root_dir: 추출 파일 루트 디렉토리
+            source_name: 커넥터 이름 (워터마크 키)
+            settle_seconds: 이 시간 안에 수정된 파일은 쓰는 중으로 보고 건너뜀
+        """
+        self.root_dir = Path(root_dir)
+        self.source_name = source_name
+        self.settle_seconds = settle_seconds
+        # 동기화 타입별로 이 프로세스가 지난 조회에서 본 파일명 (늦게 도착한 파일 감지용)
+        self._seen_names: dict[str, set[str]] = {}
+
+    async def list_changes(self, sync_type: str, watermark: Optional[str]) -> list[HRSourceChange]:
+        """
+        워터마크(파일명) 이후의 추출 파일 목록을 조회합니다. (파일명 순)
+
+        쓰는 중인 파일을 만나면 그 뒤 파일도 모두 다음 주기로 미룹니다. (순서 보장)
+        """
+        return await asyncio.to_thread(self._scan, sync_type, watermark)
+
+    def _scan(self, sync_type: str, watermark: Optional[str]) -> list[HRSourceChange]:
+        """하위 디렉토리를 훑어 변경분 목록을 만듭니다. (스레드에서 실행)"""
+        directory = self.root_dir / sync_type
+        if not directory.is_dir():
+            return []
+
+        candidates: list[Path] = []
+        before_watermark: set[str] = set()
+        for path in directory.iterdir():
+            if not path.is_file() or path.suffix.lower() not in (*NDJSON_SUFFIXES, CSV_SUFFIX):
+                continue
+            if watermark is None or path.name > watermark:
+                candidates.append(path)
+            else:
+                before_watermark.add(path.name)
+        self._warn_late_files(sync_type, watermark, before_watermark)
+        self._seen_names[sync_type] = before_watermark | {path.name for path in candidates}
+
+        settled_before_ns = time.time_ns() - int(self.settle_seconds * 1_000_000_000)
+        changes: list[HRSourceChange] = []
+        for path in sorted(candidates, key=lambda candidate: candidate.name):
+            if path.stat().st_mtime_ns > settled_before_ns:
+                break
+            changes.append(
+                HRSourceChange(
+                    sync_type=sync_type,
+                    key=str(path),
+                    watermark=path.name,
+                    estimated_count=self._count_rows(path),
+                )
+            )
+        return changes
+
+    def _warn_late_files(self, sync_type: str, watermark: Optional[str], names: set[str]) -> None:
+        """
+        지난 조회 이후 워터마크 이전 파일명으로 새로 나타난 파일을 경고 로그로 남깁니다.
+
+        이 파일들은 반영하지 않습니다. (프로세스 시작 후 첫 조회는 비교 기준이 없어 건너뜀)
+        """
+        seen = self._seen_names.get(sync_type)
+        late_files = sorted(names - seen) if seen is not None else []
+        if late_files:
+            logger.warning(
+                "HR 원천 추출 파일 건너뜀 (파일명이 워터마크 이전)",
+                extra={
+                    "source_name": self.source_name,
+                    "sync_type": sync_type,
+                    "watermark": watermark,
+                    "files": late_files,
+                },
+            )
+
+    @staticmethod
+    def _count_rows(path: Path) -> int:
+        """파일의 데이터 줄 수 (CSV는 헤더 제외)"""
+        with open(path, "rb") as file:
+            count = sum(1 for line in file if line.strip())
+        if path.suffix.lower() == CSV_SUFFIX:
+            count = max(0, count - 1)
+        return count
+
+    def read_batches(
+        self, change: HRSourceChange, model: type[ModelT], batch_size: int
+    ) -> AsyncIterator[tuple[list[ModelT], list[str]]]:
+        """추출 파일을 batch_size 건씩 읽습니다. (NDJSON/CSV)"""
+        path = Path(change.key)
+        if path.suffix.lower() == CSV_SUFFIX:
+            return self._iter_csv_batches(path, model, batch_size)
+        return iter_ndjson_batches(path, model, batch_size)
+
+    async def _iter_csv_batches(
+        self, path: Path, model: type[ModelT], batch_size: int
+    ) -> AsyncIterator[tuple[list[ModelT], list[str]]]:
+        """
+        CSV 추출 파일을 batch_size 행씩 읽어 요청 스키마로 변환합니다.
+
+        오류 행은 실패 메시지("line=N: 사유", N은 헤더를 포함한 파일 줄 번호)로 돌려줍니다.
+        """
+        batch_size = max(1, batch_size)
+        file = await asyncio.to_thread(open, path, "r", encoding="utf-8-sig", newline="")
+        try:
+            reader = csv.DictReader(file)
+            while True:
+                records = await asyncio.to_thread(_read_records, reader, batch_size)
+                if not records:
+                    break
+
+                rows: list[ModelT] = []
+                errors: list[str] = []
+                for line_no, record in records:
+                    try:
+                        rows.append(model.model_validate(_clean_csv_record(record)))
+                    except json.JSONDecodeError as exc:
+                        errors.append(f"line={line_no}: JSON 형식 오류 ({exc.msg})")
+                    except ValidationError as exc:
+                        errors.append(f"line={line_no}: {describe_validation_error(exc)}")
+                yield rows, errors
+        finally:
+            file.close()
+
+
+def _read_records(reader: csv.DictReader, limit: int) -> list[tuple[int, dict]]:
+    """CSV에서 최대 limit 행을 (줄 번호, 행) 목록으로 읽습니다. (스레드에서 실행)"""
+    records: list[tuple[int, dict]] = []
+    for record in reader:
+        records.append((reader.line_num, record))
+        if len(records) >= limit:
+            break
+    return records
+
+
+def _clean_csv_record(record: dict) -> dict:
+    """
+    CSV 행을 요청 스키마 입력으로 변환합니다.
+
+    빈 값과 헤더에 없는 값은 미입력으로 보고, concurrent_positions는 JSON 배열로 해석합니다.
+    """
+    cleaned = {
+        key: value.strip()
+        for key, value in record.items()
+        if key and isinstance(value, str) and value.strip()
+    }
+    if "concurrent_positions" in cleaned:
+        cleaned["concurrent_positions"] = json.loads(cleaned["concurrent_positions"])
+    return cleaned
@@ -0,0 +1,346 @@
+"""
+HR 도메인 - 동기화 작업 (백그라운드 실행)
+
+대용량 동기화를 HTTP 요청과 분리해 실행합니다.
+    1. 라우터가 NDJSON 본문(또는 업로드 파일)을 임시 파일로 스트리밍 저장 (spool_ndjson)
+    2. 동기화 이력(sync_id)을 in_progress로 만들고 즉시 202 응답
+    3. 백그라운드 작업이 임시 파일을 HR_SYNC_CHUNK_SIZE 줄씩 읽어 반영 (iter_ndjson_batches)
+       → 메모리는 배치 하나 크기로 일정, 로드밸런서 타임아웃이 동기화를 끊지 않음
+
+진행 현황은 청크 커밋마다 hr_sync_history에 기록됩니다. (GET /hr/sync/jobs/{sync_id})
+작업은 워커 프로세스 안에서 실행되며, 워커 종료 시 남은 작업은 failure로 기록됩니다.
+워커가 비정상 종료되어 in_progress로 남은 이력은 스케줄러가 failure로 정리합니다. (reap_stale_sync_jobs)
+
+사용 예:
+    spool_path, line_count = await spool_ndjson(request.stream())
+    response = await start_sync_job(db, "employees", spool_path, line_count, in_user="system")
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, AsyncIterator, Coroutine, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.core.config import settings
+from server.app.core.database import AsyncSessionLocal
+from server.app.core.logging import get_logger
+from server.app.domain.hr.models import HRSyncHistory
+from server.app.domain.hr.repositories import SyncDBRepository
+from server.app.domain.hr.schemas.sync import (
+    DepartmentSyncRequest,
+    EmployeeSyncRequest,
+    SyncJobResponse,
+)
+from server.app.domain.hr.service import SyncService
+
+logger = get_logger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# 동기화 타입별 NDJSON 한 줄의 요청 스키마
+SYNC_JOB_MODELS: dict[str, type[BaseModel]] = {
+    "employees": EmployeeSyncRequest,
+    "departments": DepartmentSyncRequest,
+}
+
+
+async def spool_ndjson(chunks: AsyncIterator[bytes]) -> tuple[Path, int]:
+    """
+    NDJSON 업로드 스트림을 임시 파일에 저장합니다. (본문 전체를 메모리에 올리지 않음)
+
+    Args:
+        chunks: 요청 본문(또는 업로드 파일) 청크
+
+    Returns:
+        tuple: (임시 파일 경로, 줄 수 — 진행률 계산용 예상 건수)
+    """
+    fd, name = await asyncio.to_thread(tempfile.mkstemp, prefix="hr-sync-", suffix=".ndjson")
+    path = Path(name)
+    line_count = 0
+    last_byte = b"\n"
+    file = os.fdopen(fd, "wb")
+    try:
+        async for chunk in chunks:
+            if chunk:
+                await asyncio.to_thread(file.write, chunk)
+                line_count += chunk.count(b"\n")
+                last_byte = chunk[-1:]
+    except BaseException:
+        file.close()
+        path.unlink(missing_ok=True)
+        raise
+    file.close()
+
+    # 마지막 줄에 개행이 없는 경우
+    if last_byte != b"\n":
+        line_count += 1
+    return path, line_count
+
+
+def _read_lines(file: IO[str], limit: int) -> list[str]:
+    """파일에서 최대 limit 줄을 읽습니다. (스레드에서 실행)"""
+    lines: list[str] = []
+    while len(lines) < limit:
+        line = file.readline()
+        if not line:
+            break
+        lines.append(line)
+    return lines
+
+
+def describe_validation_error(exc: ValidationError) -> str:
+    """검증 오류를 한 줄 메시지로 만듭니다."""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in exc.errors()
+    )
+
+
+async def iter_ndjson_batches(
+    path: Path, model: type[ModelT], batch_size: int
+) -> AsyncIterator[tuple[list[ModelT], list[str]]]:
+    """
+    NDJSON 파일을 batch_size 줄씩 읽어 요청 스키마로 변환합니다.
+
+    빈 줄은 건너뛰고, JSON/스키마 오류 줄은 실패 메시지("line=N: 사유")로 돌려줍니다.
+
+    Args:
+        path: NDJSON 파일 경로
+        model: 한 줄의 요청 스키마
+        batch_size: 한 번에 읽을 줄 수
+
+    Yields:
+        tuple: (변환된 요청 목록, 실패 메시지 목록)
+    """
+    batch_size = max(1, batch_size)
+    line_no = 0
+    file = await asyncio.to_thread(open, path, "r", encoding="utf-8")
+    try:
+        while True:
+            lines = await asyncio.to_thread(_read_lines, file, batch_size)
+            if not lines:
+                break
+
+            rows: list[ModelT] = []
+            errors: list[str] = []
+            for line in lines:
+                line_no += 1
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(model.model_validate(json.loads(line)))
+                except json.JSONDecodeError as exc:
+                    errors.append(f"line={line_no}: JSON 형식 오류 ({exc.msg})")
+                except ValidationError as exc:
+                    errors.append(f"line={line_no}: {describe_validation_error(exc)}")
+            yield rows, errors
+    finally:
+        file.close()
+
+
+class SyncJobRunner:
+    """
+    동기화 백그라운드 작업 관리 (워커 프로세스 단위)
+
+    실행 중인 작업의 참조를 보관하고(GC 방지), 워커 종료 시 마무리를 기다립니다.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[int, asyncio.Task] = {}
+
+    def submit(self, sync_id: int, job: Coroutine) -> None:
+        """
+        동기화 작업을 백그라운드로 시작합니다.
+
+        Args:
+            sync_id: 동기화 이력 ID
+            job: 실행할 작업 코루틴
+        """
+        task = asyncio.create_task(job, name=f"hr-sync-{sync_id}")
+        self._tasks[sync_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(sync_id, None))
+
+    def is_running(self, sync_id: int) -> bool:
+        """이 워커에서 실행 중인 작업인지 여부"""
+        return sync_id in self._tasks
+
+    def running_sync_ids(self) -> set[int]:
+        """이 워커에서 실행 중인 작업의 동기화 이력 ID"""
+        return set(self._tasks)
+
+    async def stop(self, timeout_seconds: float = settings.HR_SYNC_JOB_SHUTDOWN_SECONDS) -> None:
+        """
+        실행 중인 작업이 끝나기를 기다리고, 제한 시간이 지나면 취소합니다. (워커 종료 시)
+
+        취소된 작업은 failure로 기록됩니다. (이미 커밋된 청크는 유지)
+        """
+        tasks = list(self._tasks.values())
+        if not tasks:
+            return
+
+        _, pending = await asyncio.wait(tasks, timeout=timeout_seconds)
+        for task in pending:
+            task.cancel()
+        for task in pending:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+# 프로세스 전역 동기화 작업 관리자
+sync_job_runner = SyncJobRunner()
+
+
+async def start_sync_job(
+    db: AsyncSession,
+    sync_type: str,
+    spool_path: Path,
+    line_count: int,
+    in_user: Optional[str] = None,
+) -> SyncJobResponse:
+    """
+    동기화 이력을 만들고 스풀 파일 반영 작업을 백그라운드로 시작합니다.
+
+    스풀 파일은 시작된 작업이 삭제하며, 작업을 시작하지 못하면(이력 생성 실패 등) 여기서 삭제합니다.
+
+    Args:
+        db: 비동기 데이터베이스 세션 (요청 세션, 이력 생성용)
+        sync_type: 동기화 타입 (employees/departments)
+        spool_path: spool_ndjson로 저장한 파일
+        line_count: 업로드 줄 수 (예상 건수)
+        in_user: 실행자
+
+    Returns:
+        SyncJobResponse: 작업 접수 결과 (sync_id)
+    """
+    try:
+        sync_id = await SyncService(db).create_sync_history(sync_type, line_count, in_user)
+        sync_job_runner.submit(sync_id, run_sync_job(sync_type, sync_id, spool_path, in_user))
+    except BaseException:
+        await asyncio.to_thread(spool_path.unlink, missing_ok=True)
+        raise
+
+    logger.info(
+        "동기화 작업 접수",
+        extra={"sync_id": sync_id, "sync_type": sync_type, "line_count": line_count},
+    )
+    return SyncJobResponse(
+        sync_id=sync_id,
+        sync_type=sync_type,
+        sync_status="in_progress",
+        total_count=line_count,
+        message=f"동기화 작업이 접수되었습니다: sync_id={sync_id}",
+    )
+
+
+async def run_sync_job(
+    sync_type: str, sync_id: int, spool_path: Path, in_user: Optional[str] = None
+) -> None:
+    """
+    스풀 파일을 배치 단위로 읽어 동기화를 실행합니다. (독립 DB 세션)
+
+    예외나 취소로 중단되면 이력을 failure로 기록합니다. 스풀 파일은 항상 삭제합니다.
+
+    Args:
+        sync_type: 동기화 타입 (employees/departments)
+        sync_id: 동기화 이력 ID
+        spool_path: NDJSON 스풀 파일
+        in_user: 실행자
+    """
+    batches = iter_ndjson_batches(
+        spool_path, SYNC_JOB_MODELS[sync_type], settings.HR_SYNC_CHUNK_SIZE
+    )
+    try:
+        async with contextlib.aclosing(batches), AsyncSessionLocal() as db:
+            await apply_sync_batches(SyncService(db), sync_type, sync_id, batches, in_user)
+    except BaseException as exc:
+        reason = "작업 취소 (워커 종료)" if isinstance(exc, asyncio.CancelledError) else str(exc)
+        logger.error(
+            "동기화 작업 중단",
+            extra={"sync_id": sync_id, "sync_type": sync_type, "error": reason},
+        )
+        await mark_sync_failed(sync_id, reason)
+        if not isinstance(exc, Exception):
+            raise
+    finally:
+        await asyncio.to_thread(spool_path.unlink, missing_ok=True)
+
+
+async def apply_sync_batches(
+    service: SyncService,
+    sync_type: str,
+    sync_id: int,
+    batches: AsyncIterator[tuple[list[BaseModel], list[str]]],
+    in_user: Optional[str] = None,
+) -> None:
+    """
+    배치 스트림을 동기화 타입에 맞게 반영합니다. (업로드 작업, 원천 주기 수집 공용)
+
+    부서는 계층 검증에 전체 부서 그래프가 필요하므로 모두 모은 뒤 한 번에 반영합니다.
+
+    Args:
+        service: 동기화 서비스
+        sync_type: 동기화 타입 (employees/departments)
+        sync_id: 동기화 이력 ID
+        batches: (요청 목록, 실패 메시지 목록) 배치 스트림
+        in_user: 실행자
+    """
+    if sync_type == "employees":
+        await service.run_employee_sync(sync_id, batches, in_user)
+        return
+
+    departments: list[DepartmentSyncRequest] = []
+    parse_errors: list[str] = []
+    async for rows, errors in batches:
+        departments.extend(rows)
+        parse_errors.extend(errors)
+    await service.run_department_sync(sync_id, departments, in_user, parse_errors)
+
+
+async def reap_stale_sync_jobs(stale_minutes: Optional[int] = None) -> list[int]:
+    """
+    워커 비정상 종료로 in_progress에 남은 동기화 이력을 failure로 기록합니다. (스케줄러 주기 실행)
+
+    시작 후 stale_minutes가 지난 in_progress 이력 중 이 워커에서 실행 중이 아닌 것만 대상입니다.
+    (정상 종료 시에는 SyncJobRunner.stop이 failure를 기록하므로, 크래시로 남은 이력 방어용)
+
+    Args:
+        stale_minutes: in_progress 고착 기준 시간(분, 기본: HR_SYNC_STALE_MINUTES)
+
+    Returns:
+        list[int]: failure로 기록한 동기화 이력 ID
+    """
+    stale_minutes = stale_minutes or settings.HR_SYNC_STALE_MINUTES
+    threshold = datetime.utcnow() - timedelta(minutes=stale_minutes)
+    async with AsyncSessionLocal() as db:
+        reaped = await SyncDBRepository(db).fail_stale_sync_histories(
+            started_before=threshold,
+            exclude_sync_ids=list(sync_job_runner.running_sync_ids()),
+            reason=f"작업 중단: {stale_minutes}분 이상 진행 중 (워커 비정상 종료)",
+        )
+        await db.commit()
+    return reaped
+
+
+async def mark_sync_failed(sync_id: int, reason: str) -> None:
+    """중단된 동기화 이력을 failure로 기록합니다. (기존 행 단위 오류 메시지는 유지)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            await SyncDBRepository(db).update_sync_history(
+                sync_id,
+                sync_status="failure",
+                error_message=func.concat_ws("\n", HRSyncHistory.error_message, f"작업 중단: {reason}"),
+                sync_end_time=datetime.utcnow(),
+            )
+            await db.commit()
+    except Exception as exc:
+        logger.error(
+            "동기화 작업 실패 기록 실패",
+            extra={"sync_id": sync_id, "error": str(exc)},
+        )
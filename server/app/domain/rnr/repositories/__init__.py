@@ -13,7 +13,7 @@ R&R 도메인 Repository
     - find_employee_position : 직원 직책 코드 조회
     - create_rr              : R&R 등록 (tb_rr INSERT)
     - create_rr_periods      : 기간 등록 (tb_rr_period INSERT)
-    - find_sub_dept_codes    : 리더 부서 + 하위 부서 코드 목록 재귀 조회
+    - find_sub_dept_codes    : 리더 부서 + 하위 부서 코드 목록 조회 (부서 계층 캐시)
     - find_team_rr_list      : 팀원별 R&R 목록 조회 (조회조건 필터 포함)
     - find_team_filter_options : 팀 R&R 조회조건 선택 목록 (부서/직책)
 """
@@ -21,11 +21,12 @@ R&R 도메인 Repository
 import uuid
 from datetime import datetime
 
-from sqlalchemy import delete, select, text, distinct
+from sqlalchemy import delete, select, distinct
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from server.app.core.logging import get_logger
+from server.app.domain.hr.hierarchy import department_hierarchy
 from server.app.domain.hr.models.concurrent_position import HRMgntConcur
 from server.app.domain.hr.models.department import CMDepartment
 from server.app.domain.hr.models.employee import HRMgnt
@@ -621,7 +622,11 @@ class RrRepository:
 
     async def _find_upper_dept_code(self, dept_code: str) -> str | None:
         """
-        상위 부서 코드를 조회합니다 (cm_department.upper_dept_code).
+        상위 부서 코드를 조회합니다.
+
+        부서 계층 캐시(cm_department_closure)에서 조회하며, 계층에 상위 부서가 없으면
+        cm_department.upper_dept_code를 직접 조회합니다.
+        (계층은 사용 부서만 담으므로 미사용 부서나 상위가 미사용인 부서는 계층에서 최상위로 보임)
 
         Args:
             dept_code: 현재 부서 코드
@@ -629,6 +634,11 @@ class RrRepository:
         Returns:
             Optional[str]: 상위 부서 코드 (최상위인 경우 None)
         """
+        hierarchy = await department_hierarchy.get(self.db)
+        upper_dept_code = hierarchy.upper_dept_code(dept_code)
+        if upper_dept_code is not None:
+            return upper_dept_code
+
         stmt = select(CMDepartment.upper_dept_code).where(
             CMDepartment.dept_code == dept_code
         )
@@ -684,9 +694,9 @@ class RrRepository:
 
     async def find_sub_dept_codes(self, emp_no: str) -> list[str]:
         """
-        리더 사번 기준으로 소속 부서 및 모든 하위 부서 코드를 재귀 조회합니다.
+        리더 사번 기준으로 소속 부서 및 모든 하위 부서 코드를 조회합니다.
 
-        PostgreSQL WITH RECURSIVE CTE를 활용합니다.
+        부서 계층 캐시(cm_department_closure)를 사용하며 재귀 SQL을 실행하지 않습니다.
         최상위 부서(리더 소속)를 포함하여 모든 하위 부서를 반환합니다.
 
         Args:
@@ -713,24 +723,9 @@ class RrRepository:
 
         root_dept_code: str = dept_row.dept_code
 
-        # PostgreSQL 재귀 CTE로 하위 부서 전체 조회
-        cte_sql = text("""
-            WITH RECURSIVE sub_depts AS (
-                SELECT dept_code
-                FROM cm_department
-                WHERE dept_code = :root_dept_code
-                  AND use_yn = 'Y'
-                UNION ALL
-                SELECT d.dept_code
-                FROM cm_department d
-                INNER JOIN sub_depts sd ON d.upper_dept_code = sd.dept_code
-                WHERE d.use_yn = 'Y'
-            )
-            SELECT dept_code FROM sub_depts
-        """)
-
-        result = await self.db.execute(cte_sql, {"root_dept_code": root_dept_code})
-        dept_codes = [row.dept_code for row in result.all()]
+        # 부서 계층 캐시로 하위 부서 전체 조회 (사용 중인 부서만)
+        hierarchy = await department_hierarchy.get(self.db)
+        dept_codes = hierarchy.descendants(root_dept_code)
 
         logger.info(
             "find_sub_dept_codes 완료",
@@ -66,15 +66,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     시작 시:
         - 데이터베이스 연결 확인
         - 세션 정리 스케줄러 시작
+        - 메모 자동 저장 버퍼 주기 flush 시작
+        - 프로세스 간 이벤트 LISTEN 시작 (Postgres NOTIFY → 이벤트 허브)
         - 필요한 초기화 작업 수행
 
     종료 시:
         - 스케줄러 중지
+        - 메모 자동 저장 버퍼 flush
+        - 실행 중인 HR 동기화 작업 완료 대기 (제한 시간 초과 시 취소)
+        - 이벤트 LISTEN 종료
         - 데이터베이스 연결 종료
         - 리소스 정리
     """
     # 시작 시 실행
+    from server.app.core.events import pg_event_bridge
     from server.app.core.scheduler import start_scheduler, stop_scheduler
+    from server.app.domain.coaching.service import memo_autosave_buffer
+    from server.app.domain.hr.sync_jobs import sync_job_runner
 
     logger.info("🚀 Starting application...")
     logger.info(f"📦 Environment: {settings.ENVIRONMENT}")
@@ -87,6 +95,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     except Exception as e:
         logger.warning(f"⚠️  Failed to start scheduler: {e}")
 
+    # 메모 자동 저장 버퍼 주기 flush 시작
+    memo_autosave_buffer.start()
+
+    # 다른 프로세스(AI 파이프라인 등) 이벤트 수신
+    pg_event_bridge.start()
+
     # TODO: 필요한 초기화 작업
     # - 데이터베이스 마이그레이션 확인
     # - 캐시 워밍업
@@ -109,6 +123,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     except Exception as e:
         logger.warning(f"⚠️  Failed to stop scheduler: {e}")
 
+    # 메모 자동 저장 버퍼에 남은 메모 저장 (DB 연결 종료 전)
+    try:
+        await memo_autosave_buffer.stop()
+        logger.info("📝 Memo autosave buffer flushed")
+    except Exception as e:
+        logger.warning(f"⚠️  Failed to flush memo autosave buffer: {e}")
+
+    # 실행 중인 HR 동기화 작업 마무리 (DB 연결 종료 전)
+    try:
+        await sync_job_runner.stop()
+        logger.info("🔄 HR sync jobs finished")
+    except Exception as e:
+        logger.warning(f"⚠️  Failed to stop HR sync jobs: {e}")
+
+    await pg_event_bridge.stop()
+
     await DatabaseManager.close_connections()
     logger.info("✅ Application shutdown complete")
 
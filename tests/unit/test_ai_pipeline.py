@@ -0,0 +1,148 @@
+"""
+AI 파이프라인 진입점 단위 테스트
+
+단계 진행 이벤트가 실제로 발행되고, 실패 시 FAILED 종료 이벤트로 끝나는지 검증합니다.
+"""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from server.app.core import database
+from server.app.domain.coaching import calculators
+from server.app.domain.coaching import service as coaching_service
+
+MEETING_ID = "00000000-0000-0000-0000-000000000001"
+
+
+class _StubSession:
+    """AsyncSessionLocal() 대체 세션"""
+
+    def __init__(self) -> None:
+        self.rolled_back = False
+
+    async def __aenter__(self) -> "_StubSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+
+class _StubPipeline:
+    """CoachingPipelineService 호출을 기록하는 테스트용 서비스"""
+
+    def __init__(self, db, *, active: bool = True, load_error: Exception | None = None) -> None:
+        self.calls: list[tuple] = []
+        self._active = active
+        self._load_error = load_error
+
+    async def report_stage(self, meeting_id: str, stage: str) -> bool:
+        self.calls.append(("stage", stage))
+        return self._active
+
+    async def load_audio(self, meeting_id: str) -> bytes:
+        self.calls.append(("load_audio",))
+        if self._load_error is not None:
+            raise self._load_error
+        return b"audio"
+
+    async def save_transcript(self, meeting_id: str, segments: list) -> int:
+        self.calls.append(("save_transcript", len(segments)))
+        return len(segments)
+
+    async def fail_meeting(self, meeting_id: str) -> None:
+        self.calls.append(("fail_meeting",))
+
+
+@pytest.fixture
+def pipeline_env(monkeypatch):
+    """세션/서비스/STT를 대체하고 생성된 스텁을 반환하는 fixture"""
+    created: dict = {}
+
+    def install(**options):
+        session = _StubSession()
+
+        def _factory(db):
+            created["pipeline"] = _StubPipeline(db, **options)
+            return created["pipeline"]
+
+        async def _fake_stt(audio_bytes: bytes) -> list[dict]:
+            return [{"start": 0.0, "end": 1.0, "text": "안녕하세요", "speaker": None}]
+
+        monkeypatch.setattr(database, "AsyncSessionLocal", lambda: session)
+        monkeypatch.setattr(coaching_service, "CoachingPipelineService", _factory)
+        monkeypatch.setattr(calculators, "run_stt", _fake_stt)
+        return created, session
+
+    return install
+
+
+@pytest.mark.unit
+class TestRunAiPipeline:
+    """run_ai_pipeline 단계 진행 / 실패 처리"""
+
+    async def test_publishes_stages_and_saves_transcript(self, pipeline_env):
+        """DOWNLOAD → STT 단계를 발행하고 STT 구간을 저장한다"""
+        created, _ = pipeline_env()
+
+        await calculators.run_ai_pipeline(MEETING_ID)
+
+        assert created["pipeline"].calls == [
+            ("stage", "DOWNLOAD"),
+            ("load_audio",),
+            ("stage", "STT"),
+            ("save_transcript", 1),
+        ]
+
+    async def test_stops_when_meeting_no_longer_processing(self, pipeline_env):
+        """report_stage가 False(이미 FAILED 등)면 이후 단계를 실행하지 않는다"""
+        created, _ = pipeline_env(active=False)
+
+        await calculators.run_ai_pipeline(MEETING_ID)
+
+        assert created["pipeline"].calls == [("stage", "DOWNLOAD")]
+
+    async def test_failure_rolls_back_and_fails_meeting(self, pipeline_env):
+        """단계 실패 시 롤백 후 FAILED 전환(종료 이벤트 발행)으로 끝난다"""
+        created, session = pipeline_env(load_error=RuntimeError("storage down"))
+
+        await calculators.run_ai_pipeline(MEETING_ID)
+
+        assert session.rolled_back
+        assert created["pipeline"].calls[-1] == ("fail_meeting",)
+        assert ("stage", "STT") not in created["pipeline"].calls
+
+
+@pytest.mark.unit
+class TestFailMeeting:
+    """CoachingPipelineService.fail_meeting 종료 이벤트"""
+
+    @pytest.mark.parametrize("transitioned", [True, False])
+    async def test_broadcasts_failed_only_when_transitioned(self, monkeypatch, transitioned):
+        """FAILED로 전환된 경우에만 status_changed(FAILED)를 발행한다"""
+        meeting_uuid = uuid.UUID(MEETING_ID)
+        failed = SimpleNamespace(meeting_id=meeting_uuid, state_version=7, status="FAILED")
+
+        class _Repo:
+            async def mark_meeting_failed(self, meeting_id):
+                return failed if transitioned else None
+
+        broadcasts: list[tuple] = []
+
+        async def _broadcast(meeting_id, event_type, state_version, data):
+            broadcasts.append((meeting_id, event_type, state_version, data))
+
+        monkeypatch.setattr(coaching_service, "broadcast_meeting_event", _broadcast)
+        pipeline = coaching_service.CoachingPipelineService.__new__(
+            coaching_service.CoachingPipelineService
+        )
+        pipeline.repo = _Repo()
+
+        await pipeline.fail_meeting(MEETING_ID)
+
+        expected = [(meeting_uuid, "status_changed", 7, {"status": "FAILED"})]
+        assert broadcasts == (expected if transitioned else [])
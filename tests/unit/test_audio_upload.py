@@ -0,0 +1,134 @@
+"""
+녹음 분할 업로드 단위 테스트
+
+파트 계획 계산과 미팅 종료 시 업로드 검증(파트 누락, 크기 불일치, 경로 불일치)을 검증합니다.
+"""
+
+import pytest
+
+from server.app.core.storage.local import LocalStorageBackend
+from server.app.domain.coaching.calculators import plan_upload_parts
+from server.app.domain.coaching.service import CoachingCompleteMeetingService
+from server.app.shared.exceptions import BusinessLogicException
+
+LEADER_EMP_NO = "E001"
+MEETING_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest.fixture
+def storage(tmp_path) -> LocalStorageBackend:
+    """임시 디렉토리를 루트로 하는 local 백엔드"""
+    return LocalStorageBackend(root=str(tmp_path), public_url="http://testserver")
+
+
+@pytest.fixture
+def service(storage) -> CoachingCompleteMeetingService:
+    """DB 없이 스토리지만 연결한 미팅 종료 서비스"""
+    service = CoachingCompleteMeetingService.__new__(CoachingCompleteMeetingService)
+    service.storage = storage
+    return service
+
+
+def _audio_path(storage: LocalStorageBackend) -> str:
+    return storage.build_audio_path(LEADER_EMP_NO, MEETING_ID)
+
+
+def _write_part(storage: LocalStorageBackend, part_number: int, data: bytes) -> None:
+    path = storage.resolve_path(storage.build_part_path(_audio_path(storage), part_number))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+async def _verify(service, storage, total_bytes=None, part_bytes=None, gcs_path=None) -> int:
+    return await service._verify_uploaded_audio(
+        leader_emp_no=LEADER_EMP_NO,
+        meeting_id=MEETING_ID,
+        gcs_path=gcs_path or _audio_path(storage),
+        total_bytes=total_bytes,
+        part_bytes=part_bytes,
+    )
+
+
+@pytest.mark.unit
+class TestPlanUploadParts:
+    """파트 번호별 기대 크기 계산"""
+
+    def test_last_part_is_remainder(self):
+        """마지막 파트만 나머지 크기"""
+        assert plan_upload_parts(25, 10) == {1: 10, 2: 10, 3: 5}
+
+    def test_exact_multiple(self):
+        """파트 크기의 배수면 모든 파트가 같은 크기"""
+        assert plan_upload_parts(30, 10) == {1: 10, 2: 10, 3: 10}
+
+    def test_smaller_than_one_part(self):
+        """파트 크기보다 작으면 파트 하나"""
+        assert plan_upload_parts(3, 10) == {1: 3}
+
+    def test_sizes_sum_to_total(self):
+        """파트 크기 합은 전체 크기와 같다"""
+        parts = plan_upload_parts(10_000_019, 1_048_576)
+        assert sum(parts.values()) == 10_000_019
+        assert list(parts) == list(range(1, len(parts) + 1))
+
+
+@pytest.mark.unit
+class TestVerifyUploadedAudio:
+    """미팅 종료 시 업로드 검증"""
+
+    async def test_composes_complete_parts(self, service, storage):
+        """모든 파트가 기대 크기로 도착하면 조립 후 최종 크기를 반환한다"""
+        _write_part(storage, 1, b"a" * 10)
+        _write_part(storage, 2, b"b" * 10)
+        _write_part(storage, 3, b"c" * 5)
+
+        size = await _verify(service, storage, total_bytes=25, part_bytes=10)
+
+        assert size == 25
+        final = storage.resolve_path(_audio_path(storage)).read_bytes()
+        assert final == b"a" * 10 + b"b" * 10 + b"c" * 5
+        assert await storage.list_uploaded_parts(_audio_path(storage)) == {}
+
+    async def test_missing_part(self, service, storage):
+        """빠진 파트나 크기가 다른(중단된) 파트는 missing_parts로 거부한다"""
+        _write_part(storage, 1, b"a" * 10)
+        _write_part(storage, 3, b"c" * 4)
+
+        with pytest.raises(BusinessLogicException) as exc_info:
+            await _verify(service, storage, total_bytes=25, part_bytes=10)
+
+        assert exc_info.value.details["missing_parts"] == [2, 3]
+        assert not storage.resolve_path(_audio_path(storage)).exists()
+
+    async def test_size_mismatch(self, service, storage):
+        """단일 PUT 업로드 크기가 세션 전체 크기와 다르면 거부한다"""
+        path = storage.resolve_path(_audio_path(storage))
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"x" * 20)
+
+        with pytest.raises(BusinessLogicException) as exc_info:
+            await _verify(service, storage, total_bytes=25, part_bytes=10)
+
+        assert exc_info.value.details["actual_bytes"] == 20
+
+    async def test_missing_object(self, service, storage):
+        """업로드된 객체가 없으면 거부한다"""
+        with pytest.raises(BusinessLogicException):
+            await _verify(service, storage)
+
+    async def test_wrong_path(self, service, storage):
+        """다른 미팅의 경로는 거부한다"""
+        other_path = storage.build_audio_path(LEADER_EMP_NO, "other-meeting")
+
+        with pytest.raises(BusinessLogicException) as exc_info:
+            await _verify(service, storage, gcs_path=other_path)
+
+        assert exc_info.value.details["gcs_path"] == other_path
+
+    async def test_single_upload_without_session(self, service, storage):
+        """분할 업로드 세션이 없으면 단일 PUT 객체 크기를 반환한다"""
+        path = storage.resolve_path(_audio_path(storage))
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"x" * 7)
+
+        assert await _verify(service, storage) == 7
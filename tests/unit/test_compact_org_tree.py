@@ -0,0 +1,171 @@
+"""
+배열 기반 조직도 트리(CompactOrgTree) 단위 테스트
+
+기존 OrgTreeNode 트리와 같은 결과를 내는지, 하위/상위 부서 질의가 올바른지,
+10만 부서 규모에서 구성과 부분 생성이 빠른지, 하위 트리 조회 API가 캐시된 트리를 쓰는지 검증합니다.
+"""
+
+import time
+
+import pytest
+
+from server.app.core.events import EventHub
+from server.app.domain.hr.calculators import CompactOrgTree
+from server.app.domain.hr.models import CMDepartmentTree
+from server.app.domain.hr.service import DepartmentService, OrgTreeSnapshotCache
+from server.app.shared.exceptions import NotFoundException
+
+
+def _build_org(dept_count: int, fan_out: int = 5) -> list[CMDepartmentTree]:
+    """fan_out 갈래의 완전 트리 형태 조직도 (dept_count개 부서, 역순으로 반환)"""
+    nodes: list[CMDepartmentTree] = []
+    for i in range(dept_count):
+        upper = None if i == 0 else f"D{(i - 1) // fan_out:06d}"
+        nodes.append(
+            CMDepartmentTree(
+                std_year="2026",
+                dept_code=f"D{i:06d}",
+                upper_dept_code=upper,
+                dept_name=f"부서{i}",
+                disp_lvl=1 if upper is None else 2,
+            )
+        )
+    return nodes[::-1]
+
+
+@pytest.mark.unit
+class TestCompactOrgTree:
+    """
+    CompactOrgTree 테스트
+    """
+
+    def test_queries(self):
+        """하위/상위 부서, 깊이, 하위 트리 범위 질의"""
+        tree = CompactOrgTree.build(_build_org(7, fan_out=2))  # D0 → (D1, D2), D1 → (D3, D4), D2 → (D5, D6)
+
+        assert tree.root_codes() == ["D000000"]
+        assert tree.children("D000000") == ["D000001", "D000002"]
+        assert tree.descendants("D000001") == ["D000003", "D000004"]
+        assert tree.descendants("D000000", include_self=True)[:3] == ["D000000", "D000001", "D000003"]
+        assert tree.ancestors("D000006") == ["D000002", "D000000"]
+        assert tree.depth("D000006") == 2
+        assert tree.subtree_size("D000002") == 3
+        assert tree.is_ancestor("D000001", "D000004")
+        assert not tree.is_ancestor("D000001", "D000005")
+        assert tree.child_count("D000003") == 0
+
+    def test_cycle_and_missing_parent(self):
+        """상위 부서가 목록에 없으면 최상위, 순환 참조 부서는 제외"""
+        nodes = [
+            CMDepartmentTree(std_year="2026", dept_code="A", upper_dept_code="GONE", dept_name="A", disp_lvl=1),
+            CMDepartmentTree(std_year="2026", dept_code="X", upper_dept_code="Y", dept_name="X", disp_lvl=2),
+            CMDepartmentTree(std_year="2026", dept_code="Y", upper_dept_code="X", dept_name="Y", disp_lvl=2),
+        ]
+
+        tree = CompactOrgTree.build(nodes)
+
+        assert tree.root_codes() == ["A"]
+        assert len(tree) == 1
+        assert "X" not in tree
+
+    def test_to_nodes_depth_limit(self):
+        """max_depth까지만 OrgTreeNode를 생성한다"""
+        tree = CompactOrgTree.build(_build_org(31, fan_out=2), {"D000030": (1, 1)})
+
+        [root] = tree.to_nodes(max_depth=1)
+        assert [child.dept_code for child in root.children] == ["D000001", "D000002"]
+        assert all(child.children == [] for child in root.children)
+        assert root.subtree_employee_count == 2
+
+        [sub] = tree.to_nodes(["D000014"])
+        assert [child.dept_code for child in sub.children] == ["D000029", "D000030"]
+        assert sub.children[1].employee_count == 2
+
+    @pytest.mark.slow
+    def test_benchmark_100k_departments(self):
+        """10만 부서: 배열 트리 구성과 상위 2단계 생성 결과를 검증하고 소요 시간을 출력한다 (-s로 확인)"""
+        nodes = _build_org(100_000)
+        headcounts = {node.dept_code: (1, 0) for node in nodes}
+
+        started = time.perf_counter()
+        tree = CompactOrgTree.build(nodes, headcounts)
+        top = tree.to_nodes(max_depth=2)
+        elapsed = time.perf_counter() - started
+
+        assert len(tree) == 100_000
+        assert top[0].subtree_employee_count == 100_000
+        assert sum(1 + len(child.children) for child in top[0].children) == 30
+        assert tree.subtree_size("D000001") == len(tree.descendants("D000001")) + 1
+        assert tree.is_ancestor("D000000", "D099999")
+        # 소요 시간은 실행 환경 부하에 좌우되므로 단정하지 않고 보고만 함
+        print(f"10만 부서 구성 + 상위 2단계 생성: {elapsed:.3f}s")
+
+
+class _StubDepartmentRepo:
+    def __init__(self, nodes: list[CMDepartmentTree]) -> None:
+        self._nodes = nodes
+        self.calls = 0
+
+    async def get_latest_year(self) -> str:
+        return "2026"
+
+    async def find_org_tree_by_year(self, std_year: str) -> list[CMDepartmentTree]:
+        self.calls += 1
+        return self._nodes
+
+
+class _StubEmployeeRepo:
+    async def count_headcounts_by_dept(self) -> dict[str, tuple[int, int]]:
+        return {}
+
+
+@pytest.mark.unit
+class TestOrgSubtree:
+    """
+    DepartmentService.get_org_subtree 테스트
+    """
+
+    @pytest.fixture(autouse=True)
+    def cache(self, monkeypatch: pytest.MonkeyPatch) -> OrgTreeSnapshotCache:
+        cache = OrgTreeSnapshotCache(hub=EventHub())
+        monkeypatch.setattr("server.app.domain.hr.service.org_tree_cache", cache)
+        return cache
+
+    def _service(self, nodes: list[CMDepartmentTree]) -> DepartmentService:
+        service = DepartmentService.__new__(DepartmentService)
+        service.department_repo = _StubDepartmentRepo(nodes)
+        service.employee_repo = _StubEmployeeRepo()
+        return service
+
+    async def test_bounded_depth_with_child_counts(self):
+        """depth 단계까지만 children을 채우고, 그 아래는 child_count로 표시한다"""
+        service = self._service(_build_org(31, fan_out=2))
+
+        response = await service.get_org_subtree("D000001", depth=1)
+
+        assert response.std_year == "2026"
+        assert response.ancestor_codes == ["D000000"]
+        assert response.node.subtree_dept_count == 15
+        assert [child.dept_code for child in response.node.children] == ["D000003", "D000004"]
+        grandchild = response.node.children[0]
+        assert grandchild.children == []
+        assert grandchild.has_children and grandchild.child_count == 2
+
+    async def test_tree_is_reused_until_invalidated(self, cache):
+        """배열 트리는 캐시되어 반복 조회 시 DB를 다시 읽지 않는다"""
+        service = self._service(_build_org(31, fan_out=2))
+
+        await service.get_org_subtree("D000000", depth=0)
+        await service.get_org_subtree("D000002", depth=2)
+        assert service.department_repo.calls == 1
+
+        cache.invalidate()
+        await service.get_org_subtree("D000002")
+        assert service.department_repo.calls == 2
+
+    async def test_unknown_department(self):
+        """조직도에 없는 부서는 NotFoundException"""
+        service = self._service(_build_org(3))
+
+        with pytest.raises(NotFoundException):
+            await service.get_org_subtree("NOPE")
@@ -0,0 +1,214 @@
+"""
+부서 Bulk 동기화 단위 테스트
+
+실제 계층 깊이(disp_lvl) 계산, 순환 참조/상위 부서 누락 검출,
+부서 수와 무관하게 청크당 고정된 statement만 실행하는지 검증합니다.
+"""
+
+import pytest
+
+from server.app.domain.hr.calculators import SyncCalculator
+from server.app.domain.hr.schemas.sync import DepartmentSyncRequest
+from server.app.domain.hr.service import SyncService
+
+
+def _dept(code: str, upper: str | None, head: str | None = None) -> DepartmentSyncRequest:
+    return DepartmentSyncRequest(
+        dept_code=code, dept_name=f"부서{code}", upper_dept_code=upper, dept_head_emp_no=head
+    )
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    def add(self, obj) -> None:
+        obj.sync_id = 1
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
+class _StubSyncRepo:
+    """statement 실행 내용을 기록하는 테스트용 Repository"""
+
+    def __init__(self, existing: dict[str, tuple[str | None, str, str | None]]) -> None:
+        self.existing = existing
+        self.dept_upserts: list[int] = []
+        self.tree_rows: dict[str, tuple[int, str | None]] = {}
+        self.history: dict = {}
+
+    async def find_department_states(self) -> dict[str, tuple[str | None, str, str | None]]:
+        return dict(self.existing)
+
+    async def find_department_tree_rows(self, std_year: str) -> dict:
+        return {}
+
+    async def find_employee_names(self, emp_nos) -> dict[str, str]:
+        return {emp_no: f"성명{emp_no}" for emp_no in emp_nos}
+
+    async def upsert_departments(self, departments, fingerprints, in_user) -> None:
+        self.dept_upserts.append(len(departments))
+
+    async def upsert_department_tree(self, std_year, departments, disp_lvls, head_names, in_user) -> None:
+        for dept in departments:
+            self.tree_rows[dept.dept_code] = (disp_lvls[dept.dept_code], head_names.get(dept.dept_head_emp_no))
+
+    async def update_sync_history(self, sync_id: int, **values) -> None:
+        self.history.update(values)
+
+
+@pytest.mark.unit
+class TestDepartmentBulkSync:
+    """
+    SyncService.sync_departments Bulk 경로 테스트
+    """
+
+    def test_disp_lvl_is_true_depth(self):
+        """요청 순서와 무관하게 기존 계층을 포함한 실제 깊이를 계산하고 상위 부서를 먼저 반환한다"""
+        accepted, disp_lvls, failures = SyncCalculator.plan_department_sync(
+            [_dept("C", "B"), _dept("D", "C"), _dept("B", "A")],
+            existing_upper_by_code={"ROOT": None, "A": "ROOT"},
+        )
+
+        assert failures == []
+        assert disp_lvls == {"B": 3, "C": 4, "D": 5}
+        assert [dept.dept_code for dept in accepted] == ["B", "C", "D"]
+
+    def test_cycle_and_missing_upper_rejected_with_descendants(self):
+        """순환 참조, 없는 상위 부서, 그 하위 부서는 실패로 기록된다"""
+        accepted, _, failures = SyncCalculator.plan_department_sync(
+            [_dept("X", "Y"), _dept("Y", "X"), _dept("X1", "X"), _dept("S", "S"), _dept("M", "GONE"), _dept("OK", None)],
+            existing_upper_by_code={},
+        )
+
+        assert [dept.dept_code for dept in accepted] == ["OK"]
+        assert failures == [
+            "dept_code=X: 상위 부서 순환 참조: X → Y → X",
+            "dept_code=Y: 상위 부서 순환 참조: X → Y → X",
+            "dept_code=X1: 상위 부서 동기화 실패: X",
+            "dept_code=S: 상위 부서 순환 참조: S → S",
+            "dept_code=M: 상위 부서 코드가 존재하지 않습니다: GONE",
+        ]
+
+    async def test_one_upsert_per_chunk(self, monkeypatch: pytest.MonkeyPatch):
+        """부서 수와 무관하게 청크당 UPSERT 1회, 부서장 성명은 한 번에 조회한다"""
+        monkeypatch.setattr("server.app.domain.hr.service.settings.HR_SYNC_CHUNK_SIZE", 1000)
+        repo = _StubSyncRepo(existing={})
+        service = SyncService.__new__(SyncService)
+        service.db = _FakeSession()
+        service.sync_repo = repo
+
+        async def _noop() -> None:
+            return None
+
+        service._rebuild_department_closure = _noop
+        service._refresh_department_hierarchy = _noop
+        service._refresh_org_tree_cache = _noop
+
+        departments = [_dept("D00000", None, head="E1")] + [
+            _dept(f"D{i:05d}", f"D{(i - 1) // 3:05d}") for i in range(1, 2500)
+        ]
+        result = await service.sync_departments(departments[::-1])
+
+        assert result.sync_status == "success"
+        assert repo.dept_upserts == [1000, 1000, 500]
+        assert repo.tree_rows["D00000"] == (1, "성명E1")
+        assert repo.tree_rows["D02499"][0] == 8
+        assert repo.history["success_count"] == 2500
+
+    def test_diff_skips_unchanged_and_detects_hierarchy_change(self):
+        """해시가 같은 부서는 쓰지 않고, 이름만 바뀌면 클로저 재구성이 필요 없다"""
+        root, child = _dept("ROOT", None), _dept("A", "ROOT")
+        stored = {
+            "ROOT": (None, "Y", SyncCalculator.department_fingerprint(root)),
+            "A": ("ROOT", "Y", SyncCalculator.department_fingerprint(child)),
+        }
+        stored_tree = {"ROOT": (None, "부서ROOT", 1, None, None), "A": ("ROOT", "부서A", 2, None, None)}
+        renamed = child.model_copy(update={"dept_name": "새 이름"})
+
+        diff = SyncCalculator.diff_departments([root, renamed], {"ROOT": 1, "A": 2}, {}, stored, stored_tree)
+
+        assert [dept.dept_code for dept in diff.upserts] == ["A"]
+        assert [dept.dept_code for dept in diff.tree_upserts] == ["A"]
+        assert (diff.unchanged, diff.updated, diff.hierarchy_changed) == (["ROOT"], ["A"], False)
+
+        moved = SyncCalculator.diff_departments(
+            [root, _dept("A", None)], {"ROOT": 1, "A": 1}, {}, stored, stored_tree
+        )
+        assert moved.hierarchy_changed
+
+    def test_reparent_relevels_existing_descendants(self):
+        """상위 부서를 옮기면 요청에 없는 기존 하위 부서도 새 깊이를 받는다"""
+        accepted, disp_lvls, failures = SyncCalculator.plan_department_sync(
+            [_dept("B", "A")],
+            existing_upper_by_code={"ROOT": None, "A": "ROOT", "B": "ROOT", "B1": "B", "B2": "B1", "C": "ROOT"},
+        )
+
+        assert failures == []
+        assert [dept.dept_code for dept in accepted] == ["B"]
+        assert disp_lvls == {"B": 3, "B1": 4, "B2": 5}
+
+    def test_diff_adds_stale_descendant_tree_rows(self):
+        """저장된 조직도 행의 disp_lvl이 다른 하위 부서만 저장된 값으로 tree_upserts에 추가한다"""
+        moved = _dept("B", "A")
+        stored = {
+            "A": ("ROOT", "Y", None),
+            "B": ("ROOT", "Y", None),
+            "B1": ("B", "Y", None),
+            "B2": ("B1", "N", None),
+        }
+        stored_tree = {
+            "B": ("ROOT", "부서B", 2, None, None),
+            "B1": ("B", "부서B1", 3, "E9", "성명E9"),
+            "B2": ("B1", "부서B2", 5, None, None),
+        }
+
+        diff = SyncCalculator.diff_departments(
+            [moved], {"B": 3, "B1": 4, "B2": 5}, {}, stored, stored_tree
+        )
+
+        assert [dept.dept_code for dept in diff.relevels] == ["B1"]
+        assert [dept.dept_code for dept in diff.tree_upserts] == ["B", "B1"]
+        relevel = diff.relevels[0]
+        assert (relevel.dept_name, relevel.upper_dept_code, relevel.dept_head_emp_no) == ("부서B1", "B", "E9")
+        assert diff.updated == ["B"]
+        assert diff.counts()["updated_count"] == 1
+
+    async def test_reparent_writes_descendant_disp_lvl(self):
+        """부서 이동 동기화는 하위 부서 조직도 행의 disp_lvl과 부서장 성명을 함께 쓴다"""
+        existing = {
+            "ROOT": (None, "Y", None),
+            "A": ("ROOT", "Y", None),
+            "B": ("ROOT", "Y", None),
+            "B1": ("B", "Y", None),
+        }
+        repo = _StubSyncRepo(existing=existing)
+
+        async def _tree_rows(std_year: str) -> dict:
+            return {
+                "ROOT": (None, "부서ROOT", 1, None, None),
+                "A": ("ROOT", "부서A", 2, None, None),
+                "B": ("ROOT", "부서B", 2, None, None),
+                "B1": ("B", "부서B1", 3, "E9", None),
+            }
+
+        repo.find_department_tree_rows = _tree_rows
+        service = SyncService.__new__(SyncService)
+        service.db = _FakeSession()
+        service.sync_repo = repo
+
+        async def _noop() -> None:
+            return None
+
+        service._rebuild_department_closure = _noop
+        service._refresh_department_hierarchy = _noop
+        service._refresh_org_tree_cache = _noop
+
+        result = await service.sync_departments([_dept("B", "A")])
+
+        assert result.success_count == 1
+        assert repo.tree_rows == {"B": (3, None), "B1": (4, "성명E9")}
@@ -0,0 +1,121 @@
+"""
+부서 계층 클로저 / 계층 캐시 단위 테스트
+
+클로저 행 계산, 하위/상위 부서 조회, 캐시 재사용과 무효화,
+상위 부서가 계층 밖(미사용)일 때의 상위 부서 조회를 검증합니다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from server.app.core.events import EventHub
+from server.app.domain.hr.calculators import OrgTreeCalculator
+from server.app.domain.hr.hierarchy import (
+    DEPARTMENT_HIERARCHY_CHANNEL,
+    DepartmentHierarchy,
+    DepartmentHierarchyCache,
+)
+from server.app.domain.rnr import repositories as rnr_repositories
+
+# ROOT → (A, B), A → (A1, A2), A1 → A1X
+UPPER_BY_CODE: dict[str, str | None] = {
+    "ROOT": None,
+    "A": "ROOT",
+    "B": "ROOT",
+    "A1": "A",
+    "A2": "A",
+    "A1X": "A1",
+}
+
+
+class _StubDepartmentRepo:
+    """클로저 조회 횟수를 기록하는 테스트용 Repository"""
+
+    calls = 0
+
+    def __init__(self, db: object) -> None:
+        pass
+
+    async def find_department_closure(self) -> list[tuple[str, str, int]]:
+        type(self).calls += 1
+        return OrgTreeCalculator.build_closure(UPPER_BY_CODE)
+
+
+@pytest.mark.unit
+class TestDepartmentHierarchy:
+    """
+    부서 계층 테스트
+    """
+
+    def test_closure_rows(self):
+        """자기 자신(depth=0)과 모든 상위 부서 쌍을 만든다"""
+        rows = set(OrgTreeCalculator.build_closure(UPPER_BY_CODE))
+
+        assert ("A1X", "A1X", 0) in rows
+        assert ("A1", "A1X", 1) in rows
+        assert ("ROOT", "A1X", 3) in rows
+        assert len(rows) == 6 + 5 + 3 + 1  # depth 0, 1, 2, 3
+
+    def test_closure_stops_at_missing_parent_and_cycle(self):
+        """미사용(목록에 없는) 상위 부서에서 경로가 끊기고, 순환 참조는 멈춘다"""
+        rows = OrgTreeCalculator.build_closure({"C": "GONE", "X": "Y", "Y": "X"})
+
+        assert sorted(rows) == [("C", "C", 0), ("X", "X", 0), ("X", "Y", 1), ("Y", "X", 1), ("Y", "Y", 0)]
+
+    def test_queries(self):
+        """하위 부서(거리순), 상위 부서(가까운 순), 직속 상위 부서"""
+        hierarchy = DepartmentHierarchy(OrgTreeCalculator.build_closure(UPPER_BY_CODE))
+
+        assert hierarchy.descendants("A") == ["A", "A1", "A2", "A1X"]
+        assert hierarchy.descendants("A", include_self=False) == ["A1", "A2", "A1X"]
+        assert hierarchy.ancestors("A1X") == ["A1", "A", "ROOT"]
+        assert hierarchy.upper_dept_code("A2") == "A"
+        assert hierarchy.upper_dept_code("ROOT") is None
+        assert hierarchy.descendants("NOPE") == []
+        assert "NOPE" not in hierarchy
+
+    async def test_cache_reuse_and_invalidation(self, monkeypatch: pytest.MonkeyPatch):
+        """무효화 전까지 클로저 테이블을 다시 읽지 않고, 원격 무효화 이벤트도 반영한다"""
+        monkeypatch.setattr("server.app.domain.hr.hierarchy.DepartmentDBRepository", _StubDepartmentRepo)
+        _StubDepartmentRepo.calls = 0
+        hub = EventHub()
+        cache = DepartmentHierarchyCache(hub=hub)
+
+        first = await cache.get(db=None)
+        assert await cache.get(db=None) is first
+        assert _StubDepartmentRepo.calls == 1
+
+        cache.invalidate()
+        await cache.get(db=None)
+        assert _StubDepartmentRepo.calls == 2
+
+        hub.publish(DEPARTMENT_HIERARCHY_CHANNEL, {"type": "invalidated", "state_version": 1})
+        await cache.get(db=None)
+        assert _StubDepartmentRepo.calls == 3
+
+    @pytest.mark.parametrize(
+        ("dept_code", "expected", "queried"),
+        [("A1", "A", False), ("C", "GONE", True), ("ROOT", None, True)],
+    )
+    async def test_rnr_upper_dept_falls_back_to_department_table(
+        self, monkeypatch: pytest.MonkeyPatch, dept_code, expected, queried
+    ):
+        """계층에 상위 부서가 없으면(상위가 미사용 부서) cm_department.upper_dept_code를 조회한다"""
+        upper_by_code = {**UPPER_BY_CODE, "C": "GONE"}
+        hierarchy = DepartmentHierarchy(OrgTreeCalculator.build_closure(upper_by_code))
+        queries: list[object] = []
+
+        class _Session:
+            async def execute(self, stmt):
+                queries.append(stmt)
+                return SimpleNamespace(first=lambda: SimpleNamespace(upper_dept_code=upper_by_code[dept_code]))
+
+        async def _get(db) -> DepartmentHierarchy:
+            return hierarchy
+
+        monkeypatch.setattr(rnr_repositories.department_hierarchy, "get", _get)
+        repo = rnr_repositories.RrRepository(_Session())
+
+        assert await repo._find_upper_dept_code(dept_code) == expected
+        assert bool(queries) is queried
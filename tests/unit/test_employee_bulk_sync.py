@@ -0,0 +1,228 @@
+"""
+직원 Bulk 동기화 단위 테스트
+
+청크 단위로 고정된 횟수의 statement만 실행하는지,
+검증 실패 행과 일괄 반영 실패 시 행 단위 재시도 결과가 이력에 기록되는지,
+내용 해시가 같은 행은 쓰지 않는지, 다중 행 statement가 bind parameter 한도를 넘지 않는지 검증합니다.
+"""
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from server.app.core.config import Settings
+from server.app.domain.hr.calculators import SyncCalculator
+from server.app.domain.hr.repositories.sync_db_repository import (
+    _MAX_BIND_PARAMS,
+    SyncDBRepository,
+    _bind_param_batches,
+)
+from server.app.domain.hr.schemas.sync import (
+    ConcurrentPositionSyncRequest,
+    EmployeeSyncRequest,
+)
+from server.app.domain.hr.service import SyncService
+
+
+def _employee(i: int, dept_code: str = "D1", user_id: str | None = None) -> EmployeeSyncRequest:
+    return EmployeeSyncRequest(
+        emp_no=f"E{i:05d}",
+        user_id=user_id or f"u{i}",
+        name_kor=f"직원{i}",
+        dept_code=dept_code,
+        position_code="P005",
+        on_work_yn="Y",
+        concurrent_positions=[
+            ConcurrentPositionSyncRequest(dept_code=dept_code, is_main="Y", position_code="P005")
+        ],
+    )
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.commits = 0
+        self.rollbacks = 0
+
+    def add(self, obj) -> None:
+        obj.sync_id = 1
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+class _StubSyncRepo:
+    """저장된 해시를 메모리에 두고 statement 실행 횟수를 기록하는 테스트용 Repository"""
+
+    def __init__(self, fail_emp_no: str | None = None) -> None:
+        self.upserts: list[int] = []
+        self.concurrent_writes = 0
+        self.history: dict = {}
+        self.fail_emp_no = fail_emp_no
+        self.hashes: dict[str, str] = {}
+        self.concurrent_hashes: dict[tuple[str, str], str] = {}
+
+    async def find_existing_dept_codes(self, dept_codes) -> set[str]:
+        return set(dept_codes) - {"GONE"}
+
+    async def find_existing_user_ids(self, user_ids) -> set[str]:
+        return set(user_ids)
+
+    async def find_user_id_owners(self, user_ids) -> dict[str, str]:
+        return {}
+
+    async def find_employee_fingerprints(self, emp_nos) -> dict[str, str]:
+        return {emp_no: self.hashes[emp_no] for emp_no in emp_nos if emp_no in self.hashes}
+
+    async def find_concurrent_fingerprints(self, emp_nos) -> dict[tuple[str, str], str]:
+        wanted = set(emp_nos)
+        return {key: value for key, value in self.concurrent_hashes.items() if key[0] in wanted}
+
+    async def upsert_employees(self, employees, fingerprints, in_user) -> None:
+        if not employees:
+            return
+        self.upserts.append(len(employees))
+        if any(emp.emp_no == self.fail_emp_no for emp in employees):
+            raise RuntimeError("constraint violation")
+        self.hashes.update(fingerprints)
+
+    async def delete_concurrent_positions(self, keys) -> None:
+        for key in keys:
+            self.concurrent_writes += 1
+            del self.concurrent_hashes[key]
+
+    async def upsert_concurrent_positions(self, rows, in_user) -> None:
+        for emp_no, concur, row_hash in rows:
+            self.concurrent_writes += 1
+            self.concurrent_hashes[(emp_no, concur.dept_code)] = row_hash
+
+    async def update_sync_history(self, sync_id: int, **values) -> None:
+        self.history.update(values)
+
+
+def _service(repo: _StubSyncRepo) -> SyncService:
+    service = SyncService.__new__(SyncService)
+    service.db = _FakeSession()
+    service.sync_repo = repo
+
+    async def _no_refresh() -> None:
+        return None
+
+    service._refresh_org_tree_cache = _no_refresh
+    return service
+
+
+@pytest.mark.unit
+class TestEmployeeBulkSync:
+    """
+    SyncService.sync_employees Bulk 경로 테스트
+    """
+
+    async def test_one_upsert_per_chunk(self, monkeypatch: pytest.MonkeyPatch):
+        """1만 명 동기화는 청크당 UPSERT 1회 (행 단위 statement 없음)"""
+        monkeypatch.setattr("server.app.domain.hr.service.settings.HR_SYNC_CHUNK_SIZE", 1000)
+        repo = _StubSyncRepo()
+        service = _service(repo)
+
+        result = await service.sync_employees([_employee(i) for i in range(10_000)])
+
+        assert repo.upserts == [1000] * 10
+        assert result.success_count == 10_000
+        assert result.sync_status == "success"
+        assert service.db.commits == 1 + 10 * 2 + 1  # 이력 생성 + (청크 반영 + 진행 현황) + 완료
+
+    async def test_validation_and_row_fallback_failures_recorded(self):
+        """검증 실패 행과 일괄 반영 실패 시 행 단위 재시도에서 실패한 행만 실패로 기록된다"""
+        repo = _StubSyncRepo(fail_emp_no="E00002")
+        service = _service(repo)
+
+        result = await service.sync_employees(
+            [_employee(0), _employee(1, dept_code="GONE"), _employee(2), _employee(3)]
+        )
+
+        assert result.sync_status == "partial"
+        assert (result.success_count, result.failure_count) == (2, 2)
+        assert repo.upserts == [3, 1, 1, 1]
+        assert repo.history["inserted_count"] == 2
+        assert "emp_no=E00001: 부서 코드가 존재하지 않습니다: GONE" in repo.history["error_message"]
+        assert "emp_no=E00002: constraint violation" in repo.history["error_message"]
+
+    async def test_unchanged_rows_are_not_written(self):
+        """같은 내용을 다시 동기화하면 쓰기 없이 unchanged로만 기록하고, 바뀐 행만 쓴다"""
+        repo = _StubSyncRepo()
+        service = _service(repo)
+        employees = [_employee(i) for i in range(10)]
+        await service.sync_employees(employees)
+        repo.upserts.clear()
+        repo.concurrent_writes = 0
+
+        result = await service.sync_employees(employees)
+        assert (repo.upserts, repo.concurrent_writes) == ([], 0)
+        assert (result.unchanged_count, result.updated_count) == (10, 0)
+
+        employees[3] = employees[3].model_copy(update={"name_kor": "개명"})
+        employees[5] = employees[5].model_copy(update={"concurrent_positions": []})
+        result = await service.sync_employees(employees)
+        assert repo.upserts == [1]
+        assert repo.concurrent_writes == 1
+        assert (result.updated_count, result.unchanged_count, result.deleted_count) == (2, 8, 1)
+
+    def test_plan_rejects_user_id_conflicts_and_keeps_last_duplicate(self):
+        """다른 사번이 쓰는 user_id는 실패, 같은 사번이 여러 번 오면 마지막 행만 적용"""
+        chunk = [_employee(1), _employee(1, dept_code="D2"), _employee(2, user_id="taken")]
+
+        accepted, errors = SyncCalculator.plan_employee_chunk(
+            chunk,
+            known_dept_codes={"D1", "D2"},
+            known_user_ids={"u1", "taken"},
+            user_id_owners={"taken": "E09999"},
+        )
+
+        assert [(emp.emp_no, emp.dept_code) for emp in accepted] == [("E00001", "D2")]
+        assert errors == ["emp_no=E00002: 사용자 ID가 다른 사번에 이미 사용 중입니다: taken (E09999)"]
+
+
+class _RecordingSession:
+    """실행된 statement를 기록하는 세션"""
+
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    async def execute(self, stmt) -> None:
+        self.statements.append(stmt)
+
+
+@pytest.mark.unit
+class TestBindParamLimit:
+    """다중 행 upsert의 bind parameter 한도 분할"""
+
+    def test_batches_stay_under_limit(self):
+        """행당 파라미터 수로 statement 크기를 나누고 순서를 유지한다"""
+        rows = list(range(10_000))
+
+        batches = list(_bind_param_batches(rows, 9))
+
+        assert [row for batch in batches for row in batch] == rows
+        assert all(len(batch) * 9 <= _MAX_BIND_PARAMS for batch in batches)
+        assert len(batches) == 3
+
+    async def test_upsert_employees_splits_statements(self):
+        """대량 직원 upsert는 각 statement가 한도 이내인 여러 statement로 실행된다"""
+        session = _RecordingSession()
+        employees = [_employee(i) for i in range(5_000)]
+        fingerprints = {emp.emp_no: "h" for emp in employees}
+
+        await SyncDBRepository(session).upsert_employees(employees, fingerprints, "tester")
+
+        assert len(session.statements) > 1
+        dialect = postgresql.dialect()
+        param_counts = [len(stmt.compile(dialect=dialect).params) for stmt in session.statements]
+        assert all(count <= _MAX_BIND_PARAMS for count in param_counts)
+
+    def test_chunk_size_is_validated(self):
+        """HR_SYNC_CHUNK_SIZE는 1~10000만 허용한다"""
+        for invalid in (0, 50_000):
+            with pytest.raises(ValidationError):
+                Settings(HR_SYNC_CHUNK_SIZE=invalid)
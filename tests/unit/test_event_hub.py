@@ -0,0 +1,66 @@
+"""
+프로세스 내 이벤트 허브 단위 테스트
+
+재연결 재전송 버퍼와 버퍼 수명(마지막 이벤트, 채널 수 상한)을 검증합니다.
+"""
+
+import pytest
+
+from server.app.core.events import EventHub
+from server.app.domain.coaching.service import meeting_channel, publish_meeting_event
+
+
+def _event(version: int) -> dict:
+    return {"type": "agenda_updated", "state_version": version, "data": {}}
+
+
+@pytest.mark.unit
+class TestEventHub:
+    """
+    EventHub 테스트
+    """
+
+    def test_replay_since_version(self):
+        """버퍼에 연속으로 남은 이벤트만 재전송하고, 끊겼으면 None(스냅샷 필요)"""
+        hub = EventHub(history_size=3)
+        for version in range(1, 6):
+            hub.publish("c", _event(version))
+
+        assert [e["state_version"] for e in hub.replay("c", 3)] == [4, 5]
+        assert hub.replay("c", 1) is None
+        assert hub.replay("unknown", 0) is None
+
+    def test_final_event_is_delivered_and_clears_history(self):
+        """마지막 이벤트는 구독자에게 전달되고 채널 버퍼를 비운다"""
+        hub = EventHub()
+        queue = hub.subscribe("c")
+        hub.publish("c", _event(1))
+
+        assert hub.publish("c", _event(2), final=True) == 1
+        assert [queue.get_nowait()["state_version"] for _ in range(2)] == [1, 2]
+        assert hub.replay("c", 0) is None
+
+    def test_idle_channels_are_evicted(self):
+        """채널 수가 상한을 넘으면 구독자 없는, 가장 오래 조용한 채널부터 버퍼를 정리한다"""
+        hub = EventHub(max_channels=2)
+        hub.subscribe("watched")
+        hub.publish("watched", _event(1))
+        hub.publish("idle", _event(1))
+        hub.publish("watched", _event(2))
+        hub.publish("new", _event(1))
+
+        assert hub.replay("idle", 0) is None
+        assert hub.replay("watched", 0) is not None
+        assert hub.replay("new", 0) is not None
+
+    def test_terminal_meeting_status_is_final(self, monkeypatch: pytest.MonkeyPatch):
+        """미팅 COMPLETED/FAILED 전환 이벤트는 채널의 마지막 이벤트로 발행된다"""
+        hub = EventHub()
+        monkeypatch.setattr("server.app.domain.coaching.service.event_hub", hub)
+        channel = meeting_channel("m1")
+
+        publish_meeting_event("m1", "status_changed", 1, {"status": "PROCESSING"})
+        assert hub.replay(channel, 0) is not None
+
+        publish_meeting_event("m1", "status_changed", 2, {"status": "FAILED"})
+        assert hub.replay(channel, 0) is None
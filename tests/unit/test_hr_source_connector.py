@@ -0,0 +1,206 @@
+"""
+HR 원천 주기 수집 단위 테스트
+
+directory 커넥터의 워터마크(파일명 순서)/쓰기 중 파일 처리, CSV 파싱,
+수집 실행기의 워터마크 저장(성공한 변경분까지만)과 잠금 해제를 검증합니다.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from server.app.domain.hr import source_pull
+from server.app.domain.hr.schemas.sync import EmployeeSyncRequest
+from server.app.domain.hr.sources import DirectorySourceConnector, HRSourceChange, HRSourceConnector
+
+
+def _write(path: Path, content: str, age_seconds: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+
+
+class _FakeSession:
+    async def connection(self, execution_options=None) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+
+class _StubSourceRepo:
+    """워터마크를 메모리에 보관하는 테스트용 Repository"""
+
+    locked = True
+    unlocked: list[str] = []
+    watermarks: dict[tuple[str, str], str] = {}
+
+    def __init__(self, db) -> None:
+        pass
+
+    async def try_lock_source(self, source_name: str) -> bool:
+        return type(self).locked
+
+    async def unlock_source(self, source_name: str) -> None:
+        type(self).unlocked.append(source_name)
+
+    async def find_source_watermark(self, source_name: str, sync_type: str):
+        return type(self).watermarks.get((source_name, sync_type))
+
+    async def save_source_watermark(self, source_name, sync_type, watermark, sync_id) -> None:
+        type(self).watermarks[(source_name, sync_type)] = watermark
+
+
+class _StubSyncService:
+    created: list[tuple[str, str]] = []
+
+    def __init__(self, db) -> None:
+        pass
+
+    async def create_sync_history(self, sync_type, total_count, in_user, source_name=None, source_watermark=None) -> int:
+        type(self).created.append((sync_type, source_watermark))
+        return len(type(self).created)
+
+
+class _MemoryConnector(HRSourceConnector):
+    """워터마크 이후 변경분을 돌려주는 테스트용 커넥터"""
+
+    source_name = "memory"
+
+    def __init__(self, watermarks: dict[str, list[str]]) -> None:
+        self.watermarks = watermarks
+
+    async def list_changes(self, sync_type, watermark):
+        return [
+            HRSourceChange(sync_type, key=mark, watermark=mark, estimated_count=1)
+            for mark in self.watermarks[sync_type]
+            if watermark is None or mark > watermark
+        ]
+
+    async def read_batches(self, change, model, batch_size):
+        yield [], []
+
+
+@pytest.mark.unit
+class TestHRSourceConnector:
+    """
+    원천 수집 테스트
+    """
+
+    async def test_directory_changes_after_watermark(self, tmp_path: Path):
+        """워터마크 이후 파일만 오래된 순으로 돌려주고, 쓰는 중인 파일부터는 다음 주기로 미룬다"""
+        directory = tmp_path / "employees"
+        _write(directory / "a.ndjson", "{}\n", age_seconds=300)
+        _write(directory / "b.csv", "emp_no\nE1\nE2\n", age_seconds=200)
+        _write(directory / "c.jsonl", "{}\n", age_seconds=0)
+        _write(directory / "d.ndjson", "{}\n", age_seconds=-60)
+        _write(directory / "notes.txt", "skip", age_seconds=100)
+        connector = DirectorySourceConnector(str(tmp_path), settle_seconds=5)
+
+        changes = await connector.list_changes("employees", None)
+        assert [Path(change.key).name for change in changes] == ["a.ndjson", "b.csv"]
+        assert changes[1].estimated_count == 2
+        assert changes[0].watermark < changes[1].watermark
+
+        after = await connector.list_changes("employees", changes[0].watermark)
+        assert [Path(change.key).name for change in after] == ["b.csv"]
+        assert await connector.list_changes("departments", None) == []
+
+    async def test_directory_orders_by_file_name(self, tmp_path: Path, caplog: pytest.LogCaptureFixture):
+        """늦게 도착한 파일은 수정 시각이 오래되어도 파일명이 워터마크 이후면 수집하고, 이전이면 경고만 남긴다"""
+        directory = tmp_path / "employees"
+        _write(directory / "20260101_0100.ndjson", "{}\n", age_seconds=100)
+        connector = DirectorySourceConnector(str(tmp_path))
+        [first] = await connector.list_changes("employees", None)
+        assert await connector.list_changes("employees", first.watermark) == []
+
+        _write(directory / "20260101_0200.ndjson", "{}\n", age_seconds=3600)
+        _write(directory / "20251231_2300.ndjson", "{}\n", age_seconds=60)
+        changes = await connector.list_changes("employees", first.watermark)
+
+        assert [change.watermark for change in changes] == ["20260101_0200.ndjson"]
+        late = [record.files for record in caplog.records if hasattr(record, "files")]
+        assert late == [["20251231_2300.ndjson"]]
+
+    async def test_directory_reads_csv(self, tmp_path: Path):
+        """CSV 빈 값은 미입력, concurrent_positions는 JSON으로 해석하고 오류 행은 줄 번호와 함께 실패로 돌려준다"""
+        positions = json.dumps([{"dept_code": "D2", "is_main": "N", "position_code": "P003"}]).replace('"', '""')
+        _write(
+            tmp_path / "employees" / "e.csv",
+            "emp_no,user_id,name_kor,dept_code,position_code,on_work_yn,concurrent_positions\n"
+            f'E1,u1,직원1,D1,P005,Y,"{positions}"\n'
+            "E2,u2,직원2,D1,P005,Y,\n"
+            "E3,,직원3,D1,P005,Y,\n",
+            age_seconds=60,
+        )
+        connector = DirectorySourceConnector(str(tmp_path))
+        [change] = await connector.list_changes("employees", None)
+
+        batches = [batch async for batch in connector.read_batches(change, EmployeeSyncRequest, 2)]
+
+        rows = [row for batch_rows, _ in batches for row in batch_rows]
+        errors = [error for _, batch_errors in batches for error in batch_errors]
+        assert [row.emp_no for row in rows] == ["E1", "E2"]
+        assert rows[0].concurrent_positions[0].dept_code == "D2"
+        assert rows[1].concurrent_positions == []
+        assert errors == ["line=4: user_id: Field required"]
+
+    async def test_pull_advances_watermark_until_failure(self, monkeypatch: pytest.MonkeyPatch):
+        """부서 → 직원 순으로 반영하고, 실패한 변경분부터는 워터마크를 올리지 않는다"""
+        _StubSourceRepo.locked = True
+        _StubSourceRepo.unlocked = []
+        _StubSourceRepo.watermarks = {("memory", "employees"): "e1"}
+        _StubSyncService.created = []
+        failed: list[tuple[int, str]] = []
+
+        async def _apply(service, sync_type, sync_id, batches, in_user) -> None:
+            async for _ in batches:
+                pass
+            if sync_id == 4:
+                raise ConnectionError("db gone")
+
+        async def _record(sync_id: int, reason: str) -> None:
+            failed.append((sync_id, reason))
+
+        monkeypatch.setattr(source_pull, "AsyncSessionLocal", _FakeSession)
+        monkeypatch.setattr(source_pull, "SyncDBRepository", _StubSourceRepo)
+        monkeypatch.setattr(source_pull, "SyncService", _StubSyncService)
+        monkeypatch.setattr(source_pull, "apply_sync_batches", _apply)
+        monkeypatch.setattr(source_pull, "mark_sync_failed", _record)
+        connector = _MemoryConnector({"departments": ["d1", "d2"], "employees": ["e1", "e2", "e3", "e4"]})
+
+        applied = await source_pull.pull_hr_source(connector)
+
+        assert applied == {"departments": 2, "employees": 1}
+        assert _StubSyncService.created == [
+            ("departments", "d1"), ("departments", "d2"), ("employees", "e2"), ("employees", "e3"),
+        ]
+        assert failed == [(4, "db gone")]
+        assert _StubSourceRepo.watermarks == {("memory", "departments"): "d2", ("memory", "employees"): "e2"}
+        assert _StubSourceRepo.unlocked == ["memory"]
+
+    async def test_pull_skips_when_locked(self, monkeypatch: pytest.MonkeyPatch):
+        """다른 워커가 잠금을 잡고 있으면 수집하지 않는다"""
+        _StubSourceRepo.locked = False
+        _StubSourceRepo.unlocked = []
+        _StubSyncService.created = []
+        monkeypatch.setattr(source_pull, "AsyncSessionLocal", _FakeSession)
+        monkeypatch.setattr(source_pull, "SyncDBRepository", _StubSourceRepo)
+        monkeypatch.setattr(source_pull, "SyncService", _StubSyncService)
+
+        assert await source_pull.pull_hr_source(_MemoryConnector({})) == {}
+        assert _StubSyncService.created == []
+        assert _StubSourceRepo.unlocked == []
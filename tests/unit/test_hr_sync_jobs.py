@@ -0,0 +1,188 @@
+"""
+HR 동기화 작업(NDJSON 스트리밍) 단위 테스트
+
+업로드 스풀링, 배치 단위 파싱, 백그라운드 작업의 진행 기록과 중단 처리를 검증합니다.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from server.app.domain.hr import sync_jobs
+from server.app.domain.hr.schemas.sync import EmployeeSyncRequest
+from server.app.domain.hr.service import SyncService
+
+
+def _employee_line(i: int) -> bytes:
+    row = {
+        "emp_no": f"E{i:05d}",
+        "user_id": f"u{i}",
+        "name_kor": f"직원{i}",
+        "dept_code": "D1",
+        "position_code": "P005",
+        "on_work_yn": "Y",
+    }
+    return (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+async def _chunks(payload: bytes, size: int):
+    for start in range(0, len(payload), size):
+        yield payload[start:start + size]
+
+
+class _FakeSession:
+    def add(self, obj) -> None:
+        obj.sync_id = 7
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+
+class _StubSyncRepo:
+    """배치 크기와 진행 기록을 남기는 테스트용 Repository"""
+
+    instances: list["_StubSyncRepo"] = []
+    fail = False
+
+    def __init__(self, db) -> None:
+        self.batches: list[int] = []
+        self.history: dict = {}
+        type(self).instances.append(self)
+
+    async def find_existing_dept_codes(self, dept_codes) -> set[str]:
+        return set(dept_codes)
+
+    async def find_existing_user_ids(self, user_ids) -> set[str]:
+        return set(user_ids)
+
+    async def find_user_id_owners(self, user_ids) -> dict[str, str]:
+        if type(self).fail:
+            raise ConnectionError("db gone")
+        return {}
+
+    async def find_employee_fingerprints(self, emp_nos) -> dict:
+        self.batches.append(len(emp_nos))
+        return {}
+
+    async def find_concurrent_fingerprints(self, emp_nos) -> dict:
+        return {}
+
+    async def upsert_employees(self, employees, fingerprints, in_user) -> None:
+        pass
+
+    async def delete_concurrent_positions(self, keys) -> None:
+        pass
+
+    async def upsert_concurrent_positions(self, rows, in_user) -> None:
+        pass
+
+    async def update_sync_history(self, sync_id: int, **values) -> None:
+        self.history.update(values)
+
+
+@pytest.mark.unit
+class TestHRSyncJobs:
+    """
+    동기화 작업 테스트
+    """
+
+    @pytest.fixture(autouse=True)
+    def stub_db(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        _StubSyncRepo.instances = []
+        _StubSyncRepo.fail = False
+        monkeypatch.setattr("server.app.domain.hr.service.SyncDBRepository", _StubSyncRepo)
+        monkeypatch.setattr(sync_jobs, "AsyncSessionLocal", _FakeSession)
+
+        async def _no_refresh(self) -> None:
+            return None
+
+        monkeypatch.setattr(SyncService, "_refresh_org_tree_cache", _no_refresh)
+
+    async def test_spool_and_parse_in_batches(self):
+        """청크 경계와 무관하게 줄 단위로 저장/파싱하고, 오류 줄은 줄 번호와 함께 실패로 돌려준다"""
+        payload = b"".join(_employee_line(i) for i in range(5)) + b"{broken\n\n" + b'{"emp_no": "X"}'
+        path, line_count = await sync_jobs.spool_ndjson(_chunks(payload, 7))
+
+        try:
+            assert line_count == 8
+            batches = [batch async for batch in sync_jobs.iter_ndjson_batches(path, EmployeeSyncRequest, 3)]
+        finally:
+            path.unlink()
+
+        assert [len(rows) for rows, _ in batches] == [3, 2, 0]
+        errors = [error for _, batch_errors in batches for error in batch_errors]
+        assert errors[0].startswith("line=6: JSON 형식 오류")
+        assert errors[1].startswith("line=8: user_id: Field required")
+
+    async def test_job_applies_batches_and_removes_spool(self, monkeypatch: pytest.MonkeyPatch):
+        """작업은 HR_SYNC_CHUNK_SIZE 배치로 반영하고 진행 현황을 기록한 뒤 스풀 파일을 지운다"""
+        monkeypatch.setattr("server.app.domain.hr.sync_jobs.settings.HR_SYNC_CHUNK_SIZE", 4)
+        payload = b"".join(_employee_line(i) for i in range(10)) + b"not json\n"
+        path, _ = await sync_jobs.spool_ndjson(_chunks(payload, 1024))
+
+        await sync_jobs.run_sync_job("employees", 7, path)
+
+        [repo] = _StubSyncRepo.instances
+        assert repo.batches == [4, 4, 2]
+        assert repo.history["sync_status"] == "partial"
+        assert (repo.history["total_count"], repo.history["success_count"]) == (11, 10)
+        assert not Path(path).exists()
+
+    async def test_job_failure_is_recorded(self, monkeypatch: pytest.MonkeyPatch):
+        """작업이 예외로 중단되면 이력을 failure로 기록하고 스풀 파일을 지운다"""
+        failed: list[tuple[int, str]] = []
+
+        async def _record(sync_id: int, reason: str) -> None:
+            failed.append((sync_id, reason))
+
+        monkeypatch.setattr(sync_jobs, "mark_sync_failed", _record)
+        _StubSyncRepo.fail = True
+        path, _ = await sync_jobs.spool_ndjson(_chunks(_employee_line(1), 1024))
+
+        await sync_jobs.run_sync_job("employees", 7, path)
+
+        assert failed == [(7, "db gone")]
+        assert not Path(path).exists()
+
+    async def test_start_failure_removes_spool(self, monkeypatch: pytest.MonkeyPatch):
+        """이력 생성에 실패해 작업을 시작하지 못하면 스풀 파일을 지운다"""
+
+        async def _fail(self, *args) -> int:
+            raise ConnectionError("db gone")
+
+        monkeypatch.setattr(SyncService, "create_sync_history", _fail)
+        path, line_count = await sync_jobs.spool_ndjson(_chunks(_employee_line(1), 1024))
+
+        with pytest.raises(ConnectionError):
+            await sync_jobs.start_sync_job(_FakeSession(), "employees", path, line_count)
+
+        assert not Path(path).exists()
+
+    async def test_reap_excludes_running_jobs(self, monkeypatch: pytest.MonkeyPatch):
+        """고착 이력 정리는 이 워커에서 실행 중인 작업을 제외한다"""
+        calls: list[dict] = []
+
+        class _ReapRepo:
+            def __init__(self, db) -> None:
+                pass
+
+            async def fail_stale_sync_histories(self, **kwargs) -> list[int]:
+                calls.append(kwargs)
+                return [3]
+
+        monkeypatch.setattr(sync_jobs, "SyncDBRepository", _ReapRepo)
+        monkeypatch.setattr(sync_jobs.sync_job_runner, "_tasks", {5: None})
+
+        assert await sync_jobs.reap_stale_sync_jobs(stale_minutes=30) == [3]
+        assert calls[0]["exclude_sync_ids"] == [5]
+        assert "30분" in calls[0]["reason"]
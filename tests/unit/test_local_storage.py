@@ -0,0 +1,204 @@
+"""
+local 스토리지 백엔드 단위 테스트
+
+Range 해석, 서명 URL 검증, 루트 밖 경로 차단과 /core/storage 업로드·재생 엔드포인트를 검증합니다.
+"""
+
+import time
+import urllib.parse
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from server.app.core import routers as core_routers
+from server.app.core.storage.local import (
+    LocalStorageBackend,
+    _signature,
+    parse_range,
+    verify_signature,
+)
+from server.app.shared.exceptions import NotFoundException
+
+OBJECT_PATH = "meetings/E001/meeting-1/original_audio.webm"
+
+
+@pytest.fixture
+def storage(tmp_path) -> LocalStorageBackend:
+    """임시 디렉토리를 루트로 하는 local 백엔드"""
+    return LocalStorageBackend(root=str(tmp_path / "storage"), public_url="http://testserver")
+
+
+@pytest.fixture
+def client(storage, monkeypatch) -> TestClient:
+    """core 라우터만 등록한 테스트 클라이언트 (get_storage → local 백엔드)"""
+    monkeypatch.setattr(core_routers, "get_storage", lambda: storage)
+    app = FastAPI()
+    app.include_router(core_routers.router)
+    return TestClient(app)
+
+
+def _relative(url: str) -> str:
+    """서명 URL에서 경로 + 쿼리만 추출"""
+    parsed = urllib.parse.urlsplit(url)
+    return f"{parsed.path}?{parsed.query}"
+
+
+@pytest.mark.unit
+class TestParseRange:
+    """HTTP Range 헤더 해석"""
+
+    def test_missing_header(self):
+        """Range 헤더가 없으면 None (전체 응답)"""
+        assert parse_range(None, 100) is None
+        assert parse_range("", 100) is None
+
+    def test_closed_range(self):
+        """bytes=start-end는 포함 구간, 파일 끝을 넘는 end는 잘린다"""
+        assert parse_range("bytes=0-9", 100) == (0, 9)
+        assert parse_range("bytes=90-200", 100) == (90, 99)
+
+    def test_open_ended_range(self):
+        """bytes=start- 는 파일 끝까지"""
+        assert parse_range("bytes=40-", 100) == (40, 99)
+
+    def test_suffix_range(self):
+        """bytes=-N 은 마지막 N 바이트, 파일보다 크면 전체"""
+        assert parse_range("bytes=-10", 100) == (90, 99)
+        assert parse_range("bytes=-500", 100) == (0, 99)
+
+    def test_multiple_ranges_use_first(self):
+        """다중 구간은 첫 구간만 사용한다"""
+        assert parse_range("bytes=0-9, 20-29", 100) == (0, 9)
+
+    @pytest.mark.parametrize(
+        "header",
+        ["items=0-9", "bytes=", "bytes=abc-", "bytes=-0", "bytes=5-x"],
+    )
+    def test_invalid_range(self, header):
+        """해석할 수 없는 Range는 ValueError"""
+        with pytest.raises(ValueError):
+            parse_range(header, 100)
+
+    @pytest.mark.parametrize("header", ["bytes=100-", "bytes=150-200", "bytes=50-10"])
+    def test_unsatisfiable_range(self, header):
+        """파일 밖 시작 위치나 역순 구간은 ValueError (416)"""
+        with pytest.raises(ValueError):
+            parse_range(header, 100)
+
+
+@pytest.mark.unit
+class TestSignature:
+    """서명 URL 검증"""
+
+    def test_valid_signature(self):
+        """만료 전 올바른 서명은 통과한다"""
+        expires = int(time.time()) + 60
+        assert verify_signature(OBJECT_PATH, "GET", expires, _signature("GET", OBJECT_PATH, expires))
+
+    def test_expired_signature(self):
+        """만료된 서명은 거부한다"""
+        expires = int(time.time()) - 1
+        assert not verify_signature(OBJECT_PATH, "GET", expires, _signature("GET", OBJECT_PATH, expires))
+
+    def test_tampered_signature(self):
+        """서명 값·경로·만료 시각이 바뀌면 거부한다"""
+        expires = int(time.time()) + 60
+        signature = _signature("GET", OBJECT_PATH, expires)
+
+        flipped = signature[:-1] + ("1" if signature[-1] == "0" else "0")
+
+        assert not verify_signature(OBJECT_PATH, "GET", expires, flipped)
+        assert not verify_signature(f"{OBJECT_PATH}x", "GET", expires, signature)
+        assert not verify_signature(OBJECT_PATH, "GET", expires + 1, signature)
+
+    def test_method_mismatch(self):
+        """GET 서명으로 PUT을 할 수 없다"""
+        expires = int(time.time()) + 60
+        assert not verify_signature(OBJECT_PATH, "PUT", expires, _signature("GET", OBJECT_PATH, expires))
+
+
+@pytest.mark.unit
+class TestResolvePath:
+    """객체 경로 → 로컬 경로 변환"""
+
+    def test_inside_root(self, storage, tmp_path):
+        """루트 아래 경로는 그대로 변환한다"""
+        assert storage.resolve_path(OBJECT_PATH) == (tmp_path / "storage" / OBJECT_PATH).resolve()
+
+    @pytest.mark.parametrize("object_path", ["../secret", "meetings/../../secret", "/etc/passwd"])
+    def test_outside_root_rejected(self, storage, object_path):
+        """루트 밖을 가리키는 경로는 NotFoundException"""
+        with pytest.raises(NotFoundException):
+            storage.resolve_path(object_path)
+
+
+@pytest.mark.unit
+class TestStorageRoutes:
+    """/core/storage 업로드·재생 엔드포인트"""
+
+    def test_upload_then_range_download(self, client, storage):
+        """서명 URL로 업로드한 파일을 전체/부분 재생할 수 있다"""
+        body = bytes(range(256)) * 4
+        put_url, _ = storage.sign_url(OBJECT_PATH, "PUT", 60)
+        get_url, _ = storage.sign_url(OBJECT_PATH, "GET", 60)
+
+        assert client.put(_relative(put_url), content=body).status_code == 200
+
+        full = client.get(_relative(get_url))
+        assert full.status_code == 200
+        assert full.content == body
+        assert full.headers["accept-ranges"] == "bytes"
+
+        partial = client.get(_relative(get_url), headers={"Range": "bytes=10-19"})
+        assert partial.status_code == 206
+        assert partial.content == body[10:20]
+        assert partial.headers["content-range"] == f"bytes 10-19/{len(body)}"
+
+        suffix = client.get(_relative(get_url), headers={"Range": "bytes=-4"})
+        assert suffix.status_code == 206
+        assert suffix.content == body[-4:]
+
+    def test_unsatisfiable_range_returns_416(self, client, storage):
+        """만족할 수 없는 Range는 416과 전체 크기를 반환한다"""
+        storage.resolve_path(OBJECT_PATH).parent.mkdir(parents=True)
+        storage.resolve_path(OBJECT_PATH).write_bytes(b"0123456789")
+        get_url, _ = storage.sign_url(OBJECT_PATH, "GET", 60)
+
+        response = client.get(_relative(get_url), headers={"Range": "bytes=50-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+    def test_missing_object_returns_404(self, client, storage):
+        """서명은 유효하지만 파일이 없으면 404"""
+        get_url, _ = storage.sign_url(OBJECT_PATH, "GET", 60)
+        assert client.get(_relative(get_url)).status_code == 404
+
+    def test_method_mismatch_returns_403(self, client, storage):
+        """GET 서명 URL로 업로드하면 403"""
+        get_url, _ = storage.sign_url(OBJECT_PATH, "GET", 60)
+        assert client.put(_relative(get_url), content=b"x").status_code == 403
+
+    def test_expired_or_tampered_returns_403(self, client, storage):
+        """만료되었거나 서명이 없거나 위변조된 URL은 403"""
+        expired_url, _ = storage.sign_url(OBJECT_PATH, "GET", -10)
+        get_url, _ = storage.sign_url(OBJECT_PATH, "GET", 60)
+        tampered = _relative(get_url).replace("original_audio", "other_audio")
+
+        assert client.get(_relative(expired_url)).status_code == 403
+        assert client.get(f"/core/storage/{OBJECT_PATH}").status_code == 403
+        assert client.get(tampered).status_code == 403
+
+    def test_path_outside_root_returns_404(self, client, tmp_path):
+        """서명이 있어도 루트 밖 경로(../)는 404"""
+        object_path = "../outside.webm"
+        expires = int(time.time()) + 60
+        query = urllib.parse.urlencode(
+            {"method": "PUT", "expires": expires, "signature": _signature("PUT", object_path, expires)}
+        )
+
+        response = client.put(f"/core/storage/%2E%2E%2Foutside.webm?{query}", content=b"x")
+
+        assert response.status_code == 404
+        assert not (tmp_path / "outside.webm").exists()
@@ -0,0 +1,117 @@
+"""
+미팅 전문 검색 단위 테스트
+
+스니펫 정리/하이라이트 구간 계산과, 검색 범위(리더 또는 팀원으로 참여한 미팅) 조건을 검증합니다.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from server.app.domain.coaching.formatters import format_search_snippet
+from server.app.domain.coaching.repositories import CoachingRepository
+from server.app.domain.coaching.service import CoachingHistoryService
+
+
+class _EmptyResult:
+    def all(self) -> list:
+        return []
+
+
+class _RecordingSession:
+    """실행한 statement를 기록하는 테스트용 세션"""
+
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    async def execute(self, stmt) -> _EmptyResult:
+        self.statements.append(stmt)
+        return _EmptyResult()
+
+
+class _StubSearchRepo:
+    """검색 호출 인자를 기록하는 테스트용 Repository"""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    async def find_emp_no_by_user_id(self, user_id: str) -> str:
+        return {"leader": "L001", "member": "M001"}[user_id]
+
+    async def search_meetings(self, **kwargs) -> list[dict]:
+        self.calls.append(kwargs)
+        return [
+            {
+                "meeting_id": uuid.uuid4(),
+                "leader_emp_no": "L001",
+                "member_emp_no": "M001",
+                "member_name": "팀원",
+                "completed_at": datetime(2026, 3, 1),
+                "score": 0.5,
+                "snippet": "  분기   목표는\n매출 목표 달성 ",
+            }
+        ]
+
+
+@pytest.mark.unit
+class TestMeetingSearch:
+    """
+    미팅 검색 테스트
+    """
+
+    def test_snippet_offsets_follow_whitespace_cleanup(self):
+        """공백을 정리한 뒤의 오프셋으로, 대소문자 구분 없이 모든 등장 위치를 돌려준다"""
+        text, spans = format_search_snippet("  OKR\n\n리뷰   okr  ", ["okr"])
+
+        assert text == "OKR 리뷰 okr"
+        assert spans == [(0, 3), (7, 10)]
+
+    def test_snippet_boundaries(self):
+        """스니펫 처음/끝의 검색어는 포함하고, 경계에서 잘린 검색어는 하이라이트하지 않는다"""
+        text, spans = format_search_snippet("목표 설정과 목표", ["목표"])
+        assert spans == [(0, 2), (len(text) - 2, len(text))]
+
+        _, cut = format_search_snippet("표 설정", ["목표"])
+        assert cut == []
+
+    def test_snippet_merges_overlaps_and_ignores_empty_terms(self):
+        """겹치거나 맞닿은 구간은 하나로 합치고 빈 검색어는 무시한다"""
+        text, spans = format_search_snippet("목표달성 계획", ["목표", "표달", "달성", ""])
+
+        assert spans == [(0, 4)]
+        assert text[0:4] == "목표달성"
+
+    async def test_repository_scopes_to_leader_or_member(self):
+        """요청자가 리더 또는 팀원인 문서만, 모든 검색어(AND, LIKE 이스케이프)로 조회한다"""
+        session = _RecordingSession()
+
+        await CoachingRepository(session).search_meetings("E001", ["목표", "100%"], 10, 40)
+
+        [stmt] = session.statements
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        where = str(compiled).split("WHERE", 1)[1]
+        assert (
+            "(tb_meeting_search_document.leader_emp_no = %(leader_emp_no_1)s::VARCHAR "
+            "OR tb_meeting_search_document.member_emp_no = %(member_emp_no_1)s::VARCHAR)"
+        ) in where
+        assert where.count("ILIKE") == 2
+        params = compiled.params
+        assert (params["leader_emp_no_1"], params["member_emp_no_1"]) == ("E001", "E001")
+        assert (params["search_text_1"], params["search_text_2"]) == ("목표", "100/%")
+
+    @pytest.mark.parametrize("user_id, emp_no", [("leader", "L001"), ("member", "M001")])
+    async def test_service_searches_with_requester_scope(self, user_id: str, emp_no: str):
+        """로그인 사용자의 사번으로 검색하고, 중복 검색어는 대소문자 구분 없이 합친다"""
+        service = CoachingHistoryService.__new__(CoachingHistoryService)
+        service.repo = _StubSearchRepo()
+
+        response = await service.search_meetings(user_id, "목표 OKR okr", limit=20)
+
+        [call] = service.repo.calls
+        assert call["requester_emp_no"] == emp_no
+        assert call["terms"] == ["목표", "OKR"]
+        [item] = response.items
+        assert item.snippet == "분기 목표는 매출 목표 달성"
+        assert item.highlights == [(3, 5), (10, 12)]
@@ -0,0 +1,256 @@
+"""
+메모 자동 저장 버퍼 단위 테스트
+
+잦은 자동 저장 요청이 미팅별 마지막 값 하나의 쓰기로 합쳐지고,
+종료/명시 저장 이후 늦게 도착한 자동 저장이 최종 메모를 덮어쓰지 않는지 검증합니다.
+"""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy.dialects import postgresql
+
+from server.app.domain.coaching import service as coaching_service
+from server.app.domain.coaching.repositories import CoachingRepository
+from server.app.domain.coaching.schemas import CompleteMeetingRequest
+from server.app.domain.coaching.service import CoachingCompleteMeetingService, MemoAutosaveBuffer
+from server.app.shared.exceptions import BusinessLogicException
+
+
+class _RecordingWriter:
+    """writer 호출을 기록하는 테스트용 writer"""
+
+    def __init__(self, fail_times: int = 0) -> None:
+        self.calls: list[dict[uuid.UUID, str]] = []
+        self._fail_times = fail_times
+
+    async def __call__(self, memos: dict[uuid.UUID, str]) -> int:
+        if self._fail_times > 0:
+            self._fail_times -= 1
+            raise RuntimeError("db unavailable")
+        self.calls.append(dict(memos))
+        return len(memos)
+
+
+class _StubCompleteRepo:
+    """complete_meeting 결과를 지정하는 테스트용 Repository"""
+
+    def __init__(self, meeting_id: uuid.UUID, outcome) -> None:
+        self.meeting_id = meeting_id
+        self.outcome = outcome
+        self.saved_memos: list = []
+
+    async def find_emp_no_by_user_id(self, user_id: str) -> str:
+        return "L001"
+
+    async def find_meeting_by_id(self, meeting_id: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            meeting_id=self.meeting_id,
+            leader_emp_no="L001",
+            member_emp_no="M001",
+            status="IN_PROGRESS",
+            upload_total_bytes=None,
+            upload_part_bytes=None,
+        )
+
+    async def complete_meeting(self, private_memo, **kwargs):
+        self.saved_memos.append(private_memo)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+@pytest.mark.unit
+class TestMemoAutosaveBuffer:
+    """
+    MemoAutosaveBuffer 테스트
+    """
+
+    async def test_rapid_updates_coalesce_into_single_write(self):
+        """N번의 연속 자동 저장은 flush 한 번, 쓰기 한 번으로 합쳐진다"""
+        writer = _RecordingWriter()
+        buffer = MemoAutosaveBuffer(writer=writer, flush_interval_seconds=3600)
+        meeting_id = uuid.uuid4()
+
+        for seq in range(1, 101):
+            assert buffer.submit(meeting_id, seq, f"memo v{seq}") is True
+
+        assert await buffer.flush() == 1
+        assert writer.calls == [{meeting_id: "memo v100"}]
+
+        # 새 변경이 없으면 추가 쓰기 없음
+        assert await buffer.flush() == 0
+        assert len(writer.calls) == 1
+
+    async def test_multiple_meetings_share_one_write(self):
+        """여러 미팅의 변경도 flush 한 번에 함께 기록된다"""
+        writer = _RecordingWriter()
+        buffer = MemoAutosaveBuffer(writer=writer, flush_interval_seconds=3600)
+        meeting_ids = [uuid.uuid4() for _ in range(3)]
+
+        for seq in range(1, 21):
+            for meeting_id in meeting_ids:
+                buffer.submit(meeting_id, seq, f"{meeting_id} v{seq}")
+
+        assert await buffer.flush() == 3
+        assert writer.calls == [{mid: f"{mid} v20" for mid in meeting_ids}]
+
+    async def test_stale_seq_is_ignored(self):
+        """이미 받은 seq 이하의 요청은 무시된다 (last-writer-wins)"""
+        writer = _RecordingWriter()
+        buffer = MemoAutosaveBuffer(writer=writer, flush_interval_seconds=3600)
+        meeting_id = uuid.uuid4()
+
+        assert buffer.submit(meeting_id, 5, "newer") is True
+        assert buffer.submit(meeting_id, 3, "older") is False
+        assert buffer.submit(meeting_id, 5, "duplicate") is False
+        assert buffer.peek(meeting_id) == "newer"
+
+        await buffer.flush()
+        # flush 이후에도 오래된 seq는 거부
+        assert buffer.submit(meeting_id, 4, "late") is False
+        assert writer.calls == [{meeting_id: "newer"}]
+
+    async def test_failed_flush_is_retried_with_latest_value(self):
+        """flush 실패 시 다음 flush에서 최신 값으로 재시도한다"""
+        writer = _RecordingWriter(fail_times=1)
+        buffer = MemoAutosaveBuffer(writer=writer, flush_interval_seconds=3600)
+        meeting_id = uuid.uuid4()
+
+        buffer.submit(meeting_id, 1, "first")
+        assert await buffer.flush() == 0
+
+        buffer.submit(meeting_id, 2, "second")
+        assert await buffer.flush() == 1
+        assert writer.calls == [{meeting_id: "second"}]
+
+    async def test_pop_and_stop_drain_buffer(self):
+        """미팅 종료(pop)는 버퍼에서 꺼내고, 워커 종료(stop)는 남은 값을 저장한다"""
+        writer = _RecordingWriter()
+        buffer = MemoAutosaveBuffer(writer=writer, flush_interval_seconds=3600)
+        completed_id, active_id = uuid.uuid4(), uuid.uuid4()
+
+        buffer.submit(completed_id, 1, "final memo")
+        buffer.submit(active_id, 1, "draft")
+
+        assert await buffer.pop(completed_id) == "final memo"
+        assert buffer.peek(completed_id) is None
+
+        buffer.start()
+        await buffer.stop()
+        assert writer.calls == [{active_id: "draft"}]
+
+    async def test_pop_keeps_seq_high_water_mark(self):
+        """명시 저장/종료(pop) 후에도 이전 seq의 늦은 자동 저장은 거부한다"""
+        writer = _RecordingWriter()
+        buffer = MemoAutosaveBuffer(writer=writer, flush_interval_seconds=3600)
+        meeting_id = uuid.uuid4()
+
+        buffer.submit(meeting_id, 5, "draft")
+        await buffer.pop(meeting_id)
+
+        assert buffer.submit(meeting_id, 4, "late") is False
+        assert buffer.submit(meeting_id, 6, "after save") is True
+        assert buffer.peek(meeting_id) == "after save"
+
+    async def test_idle_seq_records_are_pruned(self):
+        """기록을 마치고 idle_seconds 동안 요청이 없는 미팅의 seq 기록은 flush 때 정리된다"""
+        writer = _RecordingWriter()
+        buffer = MemoAutosaveBuffer(writer=writer, flush_interval_seconds=3600, idle_seconds=0)
+        flushed_id, pending_id = uuid.uuid4(), uuid.uuid4()
+
+        buffer.submit(flushed_id, 1, "saved")
+        await buffer.flush()
+
+        # 기록 대기 중(flush 실패)인 미팅의 seq 기록은 유지
+        writer._fail_times = 1
+        buffer.submit(pending_id, 1, "pending")
+        await buffer.flush()
+
+        assert set(buffer._last_seq) == {pending_id}
+        assert buffer.submit(flushed_id, 1, "after idle") is True
+
+    async def test_restore_keeps_newer_value(self):
+        """되돌린 메모는 다시 flush되고, 그 사이 들어온 새 값이 있으면 새 값을 유지한다"""
+        writer = _RecordingWriter()
+        buffer = MemoAutosaveBuffer(writer=writer, flush_interval_seconds=3600)
+        restored_id, updated_id = uuid.uuid4(), uuid.uuid4()
+
+        buffer.submit(restored_id, 1, "buffered")
+        buffer.restore(restored_id, await buffer.pop(restored_id))
+        buffer.submit(updated_id, 1, "old")
+        old = await buffer.pop(updated_id)
+        buffer.submit(updated_id, 2, "new")
+        buffer.restore(updated_id, old)
+        buffer.restore(uuid.uuid4(), None)
+
+        assert await buffer.flush() == 2
+        assert writer.calls == [{restored_id: "buffered", updated_id: "new"}]
+
+    @pytest.mark.parametrize("outcome", [RuntimeError("db gone"), None])
+    async def test_complete_meeting_keeps_buffered_memo_when_not_applied(
+        self, monkeypatch: pytest.MonkeyPatch, outcome
+    ):
+        """미팅 종료가 실패하거나 동시 요청이 먼저 종료하면 버퍼의 메모를 잃지 않는다"""
+        buffer = MemoAutosaveBuffer(writer=_RecordingWriter(), flush_interval_seconds=3600)
+        monkeypatch.setattr(coaching_service, "memo_autosave_buffer", buffer)
+
+        async def _verified(self, **kwargs) -> int:
+            return 1024
+
+        monkeypatch.setattr(CoachingCompleteMeetingService, "_verify_uploaded_audio", _verified)
+        meeting_id = uuid.uuid4()
+        service = CoachingCompleteMeetingService.__new__(CoachingCompleteMeetingService)
+        service.repo = _StubCompleteRepo(meeting_id, outcome)
+        buffer.submit(meeting_id, 3, "autosaved memo")
+        body = CompleteMeetingRequest(actual_duration_seconds=60, gcs_path="meetings/L001/x/original_audio.webm")
+
+        if outcome is None:
+            await service.complete_meeting("u1", str(meeting_id), body, BackgroundTasks())
+        else:
+            with pytest.raises(RuntimeError):
+                await service.complete_meeting("u1", str(meeting_id), body, BackgroundTasks())
+
+        assert service.repo.saved_memos == ["autosaved memo"]
+        assert buffer.peek(meeting_id) == "autosaved memo"
+
+    @pytest.mark.parametrize("status", ["PROCESSING", "COMPLETED"])
+    async def test_autosave_rejected_after_meeting_ends(self, monkeypatch: pytest.MonkeyPatch, status):
+        """종료된 미팅의 자동 저장은 버퍼에 넣지 않고 거부한다"""
+        buffer = MemoAutosaveBuffer(writer=_RecordingWriter(), flush_interval_seconds=3600)
+        monkeypatch.setattr(coaching_service, "memo_autosave_buffer", buffer)
+        meeting_id = uuid.uuid4()
+        repo = _StubCompleteRepo(meeting_id, None)
+
+        async def _ended_meeting(meeting_id: str) -> SimpleNamespace:
+            return SimpleNamespace(meeting_id=repo.meeting_id, leader_emp_no="L001", status=status)
+
+        repo.find_meeting_by_id = _ended_meeting
+        service = coaching_service.CoachingActiveMeetingService.__new__(
+            coaching_service.CoachingActiveMeetingService
+        )
+        service.repo = repo
+
+        with pytest.raises(BusinessLogicException):
+            await service.autosave_memo("u1", str(meeting_id), 9, "stale memo")
+
+        assert buffer.peek(meeting_id) is None
+
+    async def test_memo_flush_updates_only_in_progress_meetings(self):
+        """일괄 저장 UPDATE는 IN_PROGRESS 미팅만 갱신한다"""
+        captured: list = []
+
+        class _Session:
+            async def execute(self, stmt, params=None):
+                captured.append(stmt)
+                return SimpleNamespace(rowcount=0)
+
+            async def commit(self) -> None:
+                pass
+
+        await CoachingRepository(_Session()).save_meeting_memos({uuid.uuid4(): "memo"})
+
+        sql = str(captured[0].compile(dialect=postgresql.dialect()))
+        assert "tb_meeting.status = " in sql
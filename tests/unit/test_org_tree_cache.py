@@ -0,0 +1,95 @@
+"""
+조직도 스냅샷 캐시 단위 테스트
+
+동기화 전까지는 조직도를 다시 구성하지 않고, 무효화 후에는 새로 구성하는지 검증합니다.
+"""
+
+import pytest
+
+from server.app.core.events import EventHub
+from server.app.domain.hr.router import _etag_matches
+from server.app.domain.hr.schemas.department import OrgTreeResponse
+from server.app.domain.hr.service import (
+    ORG_TREE_CHANNEL,
+    DepartmentService,
+    OrgTreeSnapshotCache,
+)
+
+
+class _CountingDepartmentService(DepartmentService):
+    """get_org_tree 호출 횟수를 기록하는 테스트용 서비스"""
+
+    def __init__(self) -> None:
+        self.builds = 0
+
+    async def get_org_tree(self, std_year: str | None = None) -> OrgTreeResponse:
+        self.builds += 1
+        return OrgTreeResponse(std_year=std_year or "2026", tree=[])
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> OrgTreeSnapshotCache:
+    """테스트 전용 허브를 구독하는 캐시로 전역 캐시를 교체"""
+    cache = OrgTreeSnapshotCache(hub=EventHub())
+    monkeypatch.setattr("server.app.domain.hr.service.org_tree_cache", cache)
+    return cache
+
+
+@pytest.mark.unit
+class TestOrgTreeSnapshotCache:
+    """
+    OrgTreeSnapshotCache 테스트
+    """
+
+    async def test_repeated_requests_reuse_snapshot(self, cache):
+        """무효화 전까지 반복 조회는 트리를 다시 구성하지 않는다 (최신 연도 키 포함)"""
+        service = _CountingDepartmentService()
+
+        first = await service.get_org_tree_snapshot()
+        for _ in range(10):
+            assert await service.get_org_tree_snapshot() is first
+        assert await service.get_org_tree_snapshot("2026") is first
+
+        assert service.builds == 1
+        assert first.body == OrgTreeResponse(std_year="2026", tree=[]).model_dump_json().encode()
+
+    async def test_invalidate_rebuilds_with_same_etag_for_same_content(self, cache):
+        """동기화 후에는 다시 구성하며, 내용이 같으면 ETag도 같다 (클라이언트 304 유지)"""
+        service = _CountingDepartmentService()
+        before = await service.get_org_tree_snapshot()
+
+        cache.invalidate()
+        after = await service.get_org_tree_snapshot()
+
+        assert service.builds == 2
+        assert after.version == before.version + 1
+        assert after.etag == before.etag
+
+    async def test_stale_build_is_not_stored(self, cache):
+        """구성 도중 무효화되면 이전 버전 결과는 저장하지 않는다"""
+        version = cache.version
+        cache.invalidate()
+
+        cache.put(None, version, OrgTreeResponse(std_year="2026", tree=[]))
+
+        assert cache.get(None) is None
+
+    async def test_remote_invalidation_event(self):
+        """다른 프로세스의 무효화 이벤트(허브 publish)는 다음 조회 때 반영된다"""
+        hub = EventHub()
+        cache = OrgTreeSnapshotCache(hub=hub)
+        cache.put(None, cache.version, OrgTreeResponse(std_year="2026", tree=[]))
+
+        hub.publish(ORG_TREE_CHANNEL, {"type": "invalidated", "state_version": 1})
+
+        assert cache.get(None) is None
+        assert cache.version == 1
+
+    def test_etag_matching(self):
+        """If-None-Match 목록, 약한 ETag, * 처리"""
+        etag = '"abc"'
+        assert _etag_matches('"abc"', etag)
+        assert _etag_matches('"x", W/"abc"', etag)
+        assert _etag_matches("*", etag)
+        assert not _etag_matches('"x"', etag)
+        assert not _etag_matches(None, etag)
@@ -0,0 +1,98 @@
+"""
+조직도 직원 수 집계 단위 테스트
+
+get_org_tree가 부서 수와 무관하게 직원 수 집계를 한 번만 호출하고,
+하위 부서 누적 직원 수를 올바르게 계산하는지 검증합니다.
+"""
+
+import pytest
+
+from server.app.domain.hr.calculators import OrgTreeCalculator
+from server.app.domain.hr.models import CMDepartmentTree
+from server.app.domain.hr.service import DepartmentService
+
+
+def _build_org(dept_count: int, fan_out: int = 5) -> list[CMDepartmentTree]:
+    """fan_out 갈래의 완전 트리 형태 조직도 (dept_count개 부서)"""
+    nodes: list[CMDepartmentTree] = []
+    for i in range(dept_count):
+        upper = None if i == 0 else f"D{(i - 1) // fan_out:05d}"
+        nodes.append(
+            CMDepartmentTree(
+                std_year="2026",
+                dept_code=f"D{i:05d}",
+                upper_dept_code=upper,
+                dept_name=f"부서{i}",
+                disp_lvl=1 if upper is None else 2,
+            )
+        )
+    return nodes
+
+
+class _StubDepartmentRepo:
+    def __init__(self, nodes: list[CMDepartmentTree]) -> None:
+        self._nodes = nodes
+
+    async def get_latest_year(self) -> str:
+        return "2026"
+
+    async def find_org_tree_by_year(self, std_year: str) -> list[CMDepartmentTree]:
+        return self._nodes
+
+
+class _CountingEmployeeRepo:
+    """직원 수 집계 호출 횟수를 기록하는 테스트용 Repository (부서당 주소속 2명, 겸직 1명)"""
+
+    def __init__(self, nodes: list[CMDepartmentTree]) -> None:
+        self._headcounts = {node.dept_code: (2, 1) for node in nodes}
+        self.calls = 0
+
+    async def count_headcounts_by_dept(self) -> dict[str, tuple[int, int]]:
+        self.calls += 1
+        return self._headcounts
+
+    async def count_by_dept_code(self, dept_code: str, include_concurrent: bool = True) -> int:
+        raise AssertionError("get_org_tree는 부서별 집계를 호출하면 안 됩니다")
+
+
+def _service(nodes: list[CMDepartmentTree]) -> tuple[DepartmentService, _CountingEmployeeRepo]:
+    service = DepartmentService.__new__(DepartmentService)
+    service.department_repo = _StubDepartmentRepo(nodes)
+    service.employee_repo = _CountingEmployeeRepo(nodes)
+    return service, service.employee_repo
+
+
+@pytest.mark.unit
+class TestOrgTreeHeadcount:
+    """
+    get_org_tree 직원 수 집계 테스트
+    """
+
+    @pytest.mark.parametrize("dept_count", [10, 500, 5000])
+    async def test_single_aggregate_regardless_of_department_count(self, dept_count: int):
+        """부서 수와 무관하게 직원 수 집계는 1회"""
+        service, employee_repo = _service(_build_org(dept_count))
+
+        response = await service.get_org_tree()
+
+        assert employee_repo.calls == 1
+        root = response.tree[0]
+        assert root.employee_count == 3
+        assert root.main_employee_count == 2
+        assert root.concurrent_employee_count == 1
+        assert root.subtree_employee_count == dept_count * 3
+
+    async def test_subtree_counts_roll_up_each_level(self):
+        """누적 직원 수는 자기 부서 + 모든 하위 부서의 합"""
+        nodes = _build_org(7, fan_out=2)  # D0 → (D1, D2), D1 → (D3, D4), D2 → (D5, D6)
+        headcounts = {node.dept_code: (1, 0) for node in nodes}
+        headcounts["D00003"] = (4, 2)
+
+        tree = OrgTreeCalculator.build_tree(nodes, headcounts)
+
+        root = tree[0]
+        left, right = root.children
+        assert left.children[0].subtree_employee_count == 6
+        assert left.subtree_employee_count == 1 + 6 + 1
+        assert right.subtree_employee_count == 3
+        assert root.subtree_employee_count == 1 + 8 + 3
@@ -0,0 +1,251 @@
+"""
+외부 호출 복원력 모듈 단위 테스트
+
+Circuit Breaker 상태 전환, deadline 전파, bulkhead 슬롯 관리를 검증합니다.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from server.app.core.resilience import CircuitBreaker, Dependency, deadline, remaining_seconds
+from server.app.shared.exceptions import ExternalServiceException, UnauthorizedException
+
+
+def _dependency(**options) -> Dependency:
+    """테스트용 의존성 (기본: 임계치 2회, open 유지 0.05초)"""
+    params = {
+        "timeout_seconds": 1.0,
+        "max_concurrency": 2,
+        "failure_threshold": 2,
+        "reset_timeout_seconds": 0.05,
+    }
+    params.update(options)
+    return Dependency("test", **params)
+
+
+async def _fail() -> None:
+    raise RuntimeError("boom")
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """closed → open → half_open → closed/open 전환"""
+
+    def test_opens_after_consecutive_failures(self):
+        """연속 실패가 임계치에 도달하면 open으로 전환되고 호출을 거부한다"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60)
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        """중간에 성공하면 연속 실패 수가 초기화된다"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == "closed"
+
+    def test_half_open_allows_single_trial(self):
+        """open 유지 시간이 지나면 half_open이 되어 시험 호출 한 건만 허용한다"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+
+    def test_trial_success_closes(self):
+        """시험 호출이 성공하면 closed로 복귀한다"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        breaker.allow()
+
+        breaker.record_success()
+
+        assert breaker.state == "closed"
+        assert breaker.allow()
+
+    def test_trial_failure_reopens(self):
+        """시험 호출이 실패하면 다시 open으로 전환된다"""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=0.01)
+        for _ in range(3):
+            breaker.record_failure()
+        time.sleep(0.02)
+        breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+
+    def test_release_trial_allows_next_trial(self):
+        """판정 없이 끝난 시험 호출은 다음 시험을 막지 않는다"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        breaker.allow()
+
+        breaker.release_trial()
+
+        assert breaker.allow()
+
+
+@pytest.mark.unit
+class TestDependencyCall:
+    """Dependency.call 정책 적용"""
+
+    async def test_open_circuit_fails_fast(self):
+        """연속 실패 후에는 func를 호출하지 않고 즉시 실패한다"""
+        dependency = _dependency()
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await dependency.call(_fail)
+
+        calls: list[int] = []
+
+        async def _tracked() -> None:
+            calls.append(1)
+
+        with pytest.raises(ExternalServiceException) as exc_info:
+            await dependency.call(_tracked)
+
+        assert exc_info.value.details["circuit"] == "open"
+        assert calls == []
+
+    async def test_half_open_trial_success_closes(self):
+        """open 유지 시간 후 시험 호출이 성공하면 closed로 복귀한다"""
+        dependency = _dependency()
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await dependency.call(_fail)
+        await asyncio.sleep(0.06)
+
+        assert dependency.breaker.state == "half_open"
+        assert await dependency.call(_ok) == "ok"
+        assert dependency.breaker.state == "closed"
+
+    async def test_ignored_exception_does_not_count(self):
+        """ignored_exceptions는 실패로 집계하지 않는다"""
+        dependency = _dependency(ignored_exceptions=(UnauthorizedException,))
+
+        async def _unauthorized() -> None:
+            raise UnauthorizedException("invalid code")
+
+        for _ in range(3):
+            with pytest.raises(UnauthorizedException):
+                await dependency.call(_unauthorized)
+
+        assert dependency.breaker.state == "closed"
+
+    async def test_timeout_counts_as_failure(self):
+        """제한 시간 초과는 타임아웃 예외로 변환되고 실패로 집계된다"""
+        dependency = _dependency()
+
+        with pytest.raises(ExternalServiceException) as exc_info:
+            await dependency.call(lambda: asyncio.sleep(1), timeout=0.01)
+
+        assert "timeout" in exc_info.value.details
+        assert dependency.breaker.snapshot()["consecutive_failures"] == 1
+
+
+@pytest.mark.unit
+class TestDeadline:
+    """deadline 전파"""
+
+    def test_nested_deadline_never_extends_outer(self):
+        """중첩 deadline은 상위 마감을 늘리지 않는다"""
+        assert remaining_seconds() is None
+        with deadline(0.5):
+            with deadline(10):
+                assert remaining_seconds() <= 0.5
+        assert remaining_seconds() is None
+
+    async def test_call_uses_outer_deadline(self):
+        """호출 제한 시간이 길어도 상위 deadline 남은 시간 안에 끝난다"""
+        dependency = _dependency()
+
+        started_at = time.monotonic()
+        with deadline(0.05):
+            with pytest.raises(ExternalServiceException) as exc_info:
+                await dependency.call(lambda: asyncio.sleep(1), timeout=10)
+
+        assert time.monotonic() - started_at < 0.5
+        assert exc_info.value.details["timeout"] <= 0.05
+
+    async def test_expired_deadline_is_bulkhead_timeout(self):
+        """대기 후 남은 예산이 없으면 func를 호출하지 않고 대기 초과로 실패한다 (실패 미집계)"""
+        dependency = _dependency(failure_threshold=1)
+        calls: list[int] = []
+
+        async def _tracked() -> None:
+            calls.append(1)
+
+        with deadline(0):
+            with pytest.raises(ExternalServiceException) as exc_info:
+                await dependency.call(_tracked)
+
+        assert "bulkhead" in exc_info.value.details
+        assert calls == []
+        assert dependency.breaker.state == "closed"
+        assert dependency.snapshot()["in_flight"] == 0
+
+
+@pytest.mark.unit
+class TestBulkhead:
+    """동시 호출 슬롯 관리"""
+
+    async def test_saturated_bulkhead_times_out_without_failure(self):
+        """슬롯이 모두 사용 중이면 대기 초과로 실패하고 circuit 실패로 집계하지 않는다"""
+        dependency = _dependency(max_concurrency=1, failure_threshold=1)
+        release = asyncio.Event()
+
+        async def _hold() -> None:
+            await release.wait()
+
+        holder = asyncio.create_task(dependency.call(_hold))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ExternalServiceException) as exc_info:
+            await dependency.call(_ok, timeout=0.02)
+
+        release.set()
+        await holder
+        assert "bulkhead" in exc_info.value.details
+        assert dependency.breaker.state == "closed"
+
+    async def test_blocking_call_holds_slot_until_thread_returns(self):
+        """call_blocking은 타임아웃 후에도 스레드가 끝날 때까지 슬롯을 반환하지 않는다"""
+        dependency = _dependency(max_concurrency=1, failure_threshold=5)
+        release = threading.Event()
+
+        with pytest.raises(ExternalServiceException):
+            await dependency.call_blocking(lambda: release.wait(5), timeout=0.02)
+
+        assert dependency.snapshot()["in_flight"] == 1
+        with pytest.raises(ExternalServiceException) as exc_info:
+            await dependency.call(_ok, timeout=0.02)
+        assert "bulkhead" in exc_info.value.details
+
+        release.set()
+        for _ in range(100):
+            if dependency.snapshot()["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+
+        assert dependency.snapshot()["in_flight"] == 0
+        assert await dependency.call(_ok) == "ok"
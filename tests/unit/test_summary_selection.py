@@ -0,0 +1,67 @@
+"""
+프롬프트 이전 미팅 요약 선택 단위 테스트
+
+TF-IDF 유사도 순위, 최신 요약 우선 포함, 토큰 예산/최대 건수 제한을 검증합니다.
+"""
+
+import pytest
+
+from server.app.domain.coaching.calculators import select_relevant_summaries
+
+# 최신순
+SUMMARIES = [
+    "최근 면담: 주간 업무 공유와 휴가 일정 확인",
+    "점심 메뉴와 사무실 자리 배치 이야기",
+    "클라우드 자격증 취득 계획과 AWS 학습 일정 점검",
+    "자격증 시험 일정 확정, AWS 실습 환경 준비",
+    "팀 회식 장소 논의",
+]
+
+
+@pytest.mark.unit
+class TestSummarySelection:
+    """
+    select_relevant_summaries 테스트
+    """
+
+    def test_latest_first_then_by_relevance(self):
+        """최신 요약은 항상 먼저, 나머지는 맥락(R&R, Action Item)과의 유사도 순으로 고른다"""
+        selected = select_relevant_summaries(
+            ["AWS 자격증 취득"], SUMMARIES, top_k=3, token_budget=10_000
+        )
+
+        assert selected[0] == SUMMARIES[0]
+        assert set(selected[1:]) == {SUMMARIES[2], SUMMARIES[3]}
+
+    def test_hangul_particles_still_match(self):
+        """조사가 붙은 어절도 2-gram으로 매칭된다"""
+        selected = select_relevant_summaries(
+            ["자격증을 준비"], SUMMARIES, top_k=2, token_budget=10_000
+        )
+
+        assert selected[1] in (SUMMARIES[2], SUMMARIES[3])
+
+    def test_token_budget_skips_oversized_summaries(self):
+        """예산을 넘는 요약은 건너뛰고, 그 뒤의 작은 요약은 계속 담는다"""
+        long_relevant = "AWS 자격증 " * 200
+        summaries = ["최근 면담 요약", long_relevant, "AWS 자격증 스터디 참여"]
+
+        selected = select_relevant_summaries(
+            ["AWS 자격증"], summaries, top_k=3, token_budget=40
+        )
+
+        assert selected == ["최근 면담 요약", "AWS 자격증 스터디 참여"]
+
+    def test_latest_summary_also_respects_budget(self):
+        """최신 요약도 예산을 넘으면 제외된다"""
+        selected = select_relevant_summaries(
+            ["AWS"], ["가" * 100, "AWS 학습"], top_k=3, token_budget=10
+        )
+
+        assert selected == ["AWS 학습"]
+
+    def test_top_k_and_empty_inputs(self):
+        """최대 건수를 넘지 않고, 요약이 없거나 top_k가 0이면 빈 목록"""
+        assert len(select_relevant_summaries([], SUMMARIES, top_k=2, token_budget=10_000)) == 2
+        assert select_relevant_summaries(["AWS"], [], top_k=3, token_budget=100) == []
+        assert select_relevant_summaries(["AWS"], SUMMARIES, top_k=0, token_budget=100) == []
@@ -0,0 +1,98 @@
+"""
+트랜스크립트 구간 페이지 조회 단위 테스트
+
+(start_time, seq) keyset 커서가 시작 시각이 같은 구간을 중복/누락 없이 이어 주는지
+실제 CoachingRepository 조회문을 인메모리 SQLite에 실행해 검증합니다.
+"""
+
+import uuid
+from collections.abc import AsyncGenerator
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from server.app.domain.coaching.models import TbMeetingTranscriptSegment
+from server.app.domain.coaching.repositories import CoachingRepository
+from server.app.domain.coaching.service import CoachingHistoryService
+
+MEETING_ID = uuid.uuid4()
+OTHER_MEETING_ID = uuid.uuid4()
+
+# 시작 시각 누락(0.0) 구간이 페이지 크기보다 많은 경우
+START_TIMES = [0.0] * 7 + [3.0, 3.0, 5.0]
+
+
+class _TranscriptRepo(CoachingRepository):
+    """권한 확인 조회만 대체하고 구간 조회는 실제 Repository를 쓰는 테스트용 Repository"""
+
+    async def find_emp_no_by_user_id(self, user_id: str) -> str:
+        return "L001"
+
+    async def find_meeting_by_id(self, meeting_id: str) -> SimpleNamespace:
+        return SimpleNamespace(meeting_id=MEETING_ID, leader_emp_no="L001", member_emp_no="M001")
+
+
+@pytest.fixture
+async def transcript_db() -> AsyncGenerator[AsyncSession, None]:
+    """트랜스크립트 구간 테이블만 만든 인메모리 SQLite 세션 (다른 미팅 구간 포함)"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(TbMeetingTranscriptSegment.__table__.create)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.add_all(
+            TbMeetingTranscriptSegment(
+                meeting_id=meeting_id, seq=seq, start_time=start, text=f"s{seq}"
+            )
+            for meeting_id in (MEETING_ID, OTHER_MEETING_ID)
+            for seq, start in enumerate(START_TIMES)
+        )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestTranscriptPaging:
+    """
+    트랜스크립트 페이지 커서 테스트
+    """
+
+    async def test_cursor_walks_equal_start_times_without_duplicates(self, transcript_db):
+        """시작 시각이 같은 구간이 페이지 경계에 걸쳐도 모든 구간을 한 번씩 돌려준다"""
+        service = CoachingHistoryService.__new__(CoachingHistoryService)
+        service.repo = _TranscriptRepo(transcript_db)
+
+        seen: list[int] = []
+        from_sec, after_seq = 0.0, None
+        for _ in range(10):
+            page = await service.get_transcript("u1", str(MEETING_ID), from_sec, after_seq, None, 3)
+            seen.extend(item.seq for item in page.items)
+            if not page.has_more:
+                break
+            from_sec, after_seq = page.next_from, page.next_after_seq
+
+        assert seen == list(range(len(START_TIMES)))
+        assert page.next_from is None and page.next_after_seq is None
+
+    @pytest.mark.parametrize(
+        ("from_sec", "after_seq", "to_sec", "expected"),
+        [
+            (0.0, None, None, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]),
+            (3.0, None, None, [7, 8, 9]),
+            (0.0, 5, None, [6, 7, 8, 9]),
+            (3.0, 7, None, [8, 9]),
+            (0.0, 6, 5.0, [7, 8]),
+            (5.0, 9, None, []),
+        ],
+    )
+    async def test_keyset_condition(self, transcript_db, from_sec, after_seq, to_sec, expected):
+        """(start_time, seq) > (from_sec, after_seq) 와 [from_sec, to_sec) 범위를 미팅 안에서 적용한다"""
+        repo = CoachingRepository(transcript_db)
+
+        rows = await repo.find_transcript_segments(MEETING_ID, from_sec, after_seq, to_sec, limit=20)
+
+        assert [row.seq for row in rows] == expected
+        assert {row.meeting_id for row in rows} <= {MEETING_ID}